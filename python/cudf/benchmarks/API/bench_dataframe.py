@@ -330,6 +330,20 @@ def bench_groupby_quantile(benchmark, dataframe, num_key_cols, q):
     benchmark(grouper.quantile, q)
 
 
+@benchmark_with_object(cls="dataframe", dtype="float", nulls=False, cols=3)
+@pytest.mark.parametrize("engine", ["vectorized", "jit"])
+def bench_groupby_apply(benchmark, dataframe, engine):
+    grouper = dataframe.groupby(dataframe.columns[0])
+
+    def func(group):
+        return (
+            group[dataframe.columns[1]].sum()
+            / group[dataframe.columns[2]].max()
+        )
+
+    benchmark(grouper.apply, func, engine=engine)
+
+
 @benchmark_with_object(cls="dataframe", dtype="int")
 @pytest.mark.parametrize("num_cols_to_sort", [1])
 def bench_sort_values(benchmark, dataframe, num_cols_to_sort):
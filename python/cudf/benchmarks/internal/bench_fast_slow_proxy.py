@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-"""Benchmarks of cudf.pandas proxy argument transformation."""
+"""Benchmarks of cudf.pandas proxy types."""
+
+import subprocess
+import sys
 
 import pytest
 
@@ -57,3 +60,40 @@ def bench_transform_arg_dict_with_proxy(benchmark, proxy_object, size):
     arg = {i: i for i in range(size - 1)}
     arg["proxy"] = proxy_object
     benchmark(lambda: _transform_arg(arg, "_fsproxy_slow", set()))
+
+
+def bench_make_final_proxy_type(benchmark):
+    # Proxy types for wide slow types (e.g. DataFrame) dominate the cost of
+    # building all the proxy types on import.
+    Slow = type(
+        "Slow", (), {f"method_{i}": lambda self: None for i in range(500)}
+    )
+    Fast = type("Fast", (), {})
+    benchmark(
+        lambda: make_final_proxy_type(
+            "Pxy",
+            Fast,
+            Slow,
+            fast_to_slow=lambda fast: Slow(),
+            slow_to_fast=lambda slow: Fast(),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import cudf.pandas; cudf.pandas.install(); import pandas",
+        "import cudf.pandas; cudf.pandas.install(); "
+        "import pandas; pandas.DataFrame({'a': [1]}).sum()",
+    ],
+    ids=["import", "first_operation"],
+)
+def bench_import_time(benchmark, statement):
+    # Run in a new interpreter: imports are cached in this one.
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs={"check": True},
+        rounds=5,
+    )
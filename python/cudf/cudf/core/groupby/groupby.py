@@ -48,6 +48,7 @@ from cudf.core.join._join_helpers import _match_join_keys
 from cudf.core.mixins import GetAttrGetItemMixin, Reducible, Scannable
 from cudf.core.multiindex import MultiIndex
 from cudf.core.reshape import concat
+from cudf.core.udf.groupby_tracing import vectorized_groupby_apply
 from cudf.core.udf.groupby_utils import _can_be_jitted, jit_groupby_apply
 from cudf.options import get_option
 from cudf.utils.dtypes import (
@@ -2428,6 +2429,19 @@ class GroupBy(Serializable, Reducible, Scannable):
             chunk_results, group_names, group_keys, grouped_values
         )
 
+    @_performance_tracking
+    def _vectorized_groupby_apply(
+        self, function, group_names, offsets, group_keys, grouped_values, *args
+    ):
+        chunk_results = vectorized_groupby_apply(
+            offsets, grouped_values, function, *args
+        )
+        if chunk_results is None:
+            return None
+        return self._post_process_chunk_results(
+            chunk_results, group_names, group_keys, grouped_values
+        )
+
     @_performance_tracking
     def _iterative_groupby_apply(
         self, function, group_names, offsets, group_keys, grouped_values, *args
@@ -2586,8 +2600,17 @@ class GroupBy(Serializable, Reducible, Scannable):
           on the grouped chunk.
         args : tuple
             Optional positional arguments to pass to the function.
-        engine: 'auto', 'cudf', or 'jit', default 'auto'
-          Selects the GroupBy.apply implementation. Use `jit` to
+        engine: 'auto', 'vectorized', 'cudf', or 'jit', default 'auto'
+          Selects the GroupBy.apply implementation. Use `vectorized` to
+          call the function once on a stand-in for the first group and
+          record what it does. If it only selects numeric columns without
+          missing values, combines them elementwise, reduces (sum, min,
+          max, mean, prod, count, var, std, median, nunique, size) or
+          scans (cumsum, cummin, cummax, cumprod) them, and does arithmetic
+          with the reductions, the recording is replayed for all groups at
+          once as groupby aggregations. Other functions are applied to each
+          group in turn, as with `cudf`, after the extra traced call. Use
+          `jit` to
           select the numba JIT pipeline. Only certain operations are allowed
           within the function when using this option: min, max, sum, mean, var,
           std, idxmax, and idxmin and any arithmetic formula involving them are
@@ -2599,7 +2622,8 @@ class GroupBy(Serializable, Reducible, Scannable):
           to provide maximum flexibility at the expense of performance.
           The default value `auto` will attempt to use the numba JIT pipeline
           where possible and will fall back to the iterative algorithm if
-          necessary.
+          necessary. It never uses `vectorized`, which must be requested
+          explicitly because it calls the function one extra time.
         include_groups : bool, default False
             Only ``False`` is accepted (matching pandas 3.0, where
             ``include_groups=True`` raises a ``ValueError``).
@@ -2681,6 +2705,19 @@ class GroupBy(Serializable, Reducible, Scannable):
         3    1
         dtype: int64
 
+        ``engine='vectorized'`` computes functions made of reductions with
+        one aggregation over the whole frame instead of one call per group:
+
+        >>> df.groupby('a').apply(
+        ...   lambda group: group['b'].sum() / group['b'].max(),
+        ...   engine='vectorized'
+        ... )
+        a
+        1    1.500000
+        2    1.750000
+        3    1.833333
+        dtype: float64
+
         """
         if include_groups:
             # matches pandas 3.0
@@ -2739,7 +2776,17 @@ class GroupBy(Serializable, Reducible, Scannable):
             np.cumsum(sizes[group_order], out=new_offsets[1:])
             offsets = new_offsets.tolist()
 
-        if engine == "auto":
+        result = None
+        if engine == "vectorized":
+            result = self._vectorized_groupby_apply(
+                func,
+                group_names,
+                offsets,
+                group_keys,
+                grouped_values,
+                *args,
+            )
+        elif engine == "auto":
             if _can_be_jitted(grouped_values, func, args):
                 engine = "jit"
             else:
@@ -2753,7 +2800,9 @@ class GroupBy(Serializable, Reducible, Scannable):
                 grouped_values,
                 *args,
             )
-        elif engine == "cudf":
+        elif engine == "cudf" or (engine == "vectorized" and result is None):
+            # Functions the vectorized engine cannot trace run group by
+            # group.
             result = self._iterative_groupby_apply(
                 func,
                 group_names,
@@ -2762,7 +2811,7 @@ class GroupBy(Serializable, Reducible, Scannable):
                 grouped_values,
                 *args,
             )
-        else:
+        elif engine != "vectorized":
             raise ValueError(f"Unsupported engine '{engine}'")
 
         # No final sort: group-keyed results are already produced in
@@ -0,0 +1,386 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Vectorized ``GroupBy.apply`` for functions built from reductions.
+
+The user function is called once on a stand-in for the first group.
+Every operation the function performs is evaluated on that group's real
+data and recorded. If the function only selects numeric columns,
+combines them elementwise, scans or reduces them and does arithmetic
+with the reductions, the recording is replayed over all groups at once
+as segmented libcudf groupby aggregations and scans. For example
+
+    def f(group):
+        return group["x"].sum() / group["y"].max()
+
+becomes one groupby aggregation (a sum and a max) and one division of
+the two result columns.
+"""
+
+from __future__ import annotations
+
+import operator
+
+import cupy as cp
+import numpy as np
+
+import pylibcudf as plc
+
+from cudf.core._internals import aggregation
+from cudf.core.column import access_columns, as_column
+from cudf.core.column.column import ColumnBase
+from cudf.utils.dtypes import SIZE_TYPE_DTYPE
+from cudf.utils.performance_tracking import _performance_tracking
+
+# Series methods that reduce each group to a scalar, with the name of
+# the matching groupby aggregation. Only calls without arguments are
+# traced, so the defaults (e.g. ``ddof=1``) are what both sides use.
+_REDUCTIONS = {
+    "count": "count",
+    "max": "max",
+    "mean": "mean",
+    "median": "median",
+    "min": "min",
+    "nunique": "nunique",
+    "prod": "product",
+    "product": "product",
+    "std": "std",
+    "sum": "sum",
+    "var": "var",
+}
+
+_SCANS = {"cummax", "cummin", "cumprod", "cumsum"}
+
+_SEGMENTED = _SCANS | set(_REDUCTIONS.values())
+
+
+def _dtype(node):
+    """The dtype the loop gives ``node``, inferred from its traced value."""
+    return node.value.dtype if node.per_row else as_column([node.value]).dtype
+
+
+class _Untraceable(Exception):
+    """The function did something the replay cannot reproduce."""
+
+
+class _TracedValue:
+    """
+    A value computed by the user function from the traced group.
+
+    ``value`` is the result on the representative group and ``per_row``
+    tells whether the value has one entry per row of the group (a
+    column, or a scan or elementwise result of columns) or is a single
+    scalar for the group (a reduction, or arithmetic on reductions).
+    """
+
+    __slots__ = ("args", "op", "per_row", "value")
+
+    # Make numpy scalars defer to the reflected operators below instead
+    # of trying to convert the traced value to an array.
+    __array_ufunc__ = None
+
+    def __init__(self, value, op, args, per_row):
+        self.value = value
+        self.op = op
+        self.args = args
+        self.per_row = per_row
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self.per_row and name == "size":
+            return _TracedValue(self.value.size, "size", (self,), False)
+        if self.per_row and (name in _REDUCTIONS or name in _SCANS):
+
+            def method(*args, **kwargs):
+                if args or kwargs:
+                    raise _Untraceable(f"{name} with arguments")
+                return _TracedValue(
+                    getattr(self.value, name)(),
+                    _REDUCTIONS.get(name, name),
+                    (self,),
+                    name in _SCANS,
+                )
+
+            return method
+        raise _Untraceable(f"attribute {name!r}")
+
+    def abs(self):
+        return self._unary(operator.abs)
+
+    def _unary(self, op):
+        return _TracedValue(op(self.value), op, (self,), self.per_row)
+
+    def _binary(self, op, other, reflect=False):
+        if isinstance(other, _TracedValue):
+            other_value, per_row = other.value, other.per_row
+        elif np.isscalar(other):
+            other_value, per_row = other, False
+        else:
+            raise _Untraceable(f"operand of type {type(other).__name__}")
+        if reflect:
+            args = (other, self)
+            value = op(other_value, self.value)
+        else:
+            args = (self, other)
+            value = op(self.value, other_value)
+        return _TracedValue(value, op, args, self.per_row or per_row)
+
+    def __bool__(self):
+        raise _Untraceable("control flow on a traced value")
+
+    def __len__(self):
+        raise _Untraceable("len of a traced value")
+
+    def __iter__(self):
+        raise _Untraceable("iteration over a traced value")
+
+    def __int__(self):
+        raise _Untraceable("conversion of a traced value")
+
+    __float__ = __index__ = __int__
+
+    def __neg__(self):
+        return self._unary(operator.neg)
+
+    def __pos__(self):
+        return self._unary(operator.pos)
+
+    __abs__ = abs
+
+
+def _add_binary_operators():
+    for name in (
+        "add",
+        "sub",
+        "mul",
+        "truediv",
+        "floordiv",
+        "mod",
+        "pow",
+    ):
+        op = getattr(operator, name)
+        setattr(
+            _TracedValue,
+            f"__{name}__",
+            lambda self, other, op=op: self._binary(op, other),
+        )
+        setattr(
+            _TracedValue,
+            f"__r{name}__",
+            lambda self, other, op=op: self._binary(op, other, reflect=True),
+        )
+    for name in ("eq", "ne", "lt", "le", "gt", "ge"):
+        op = getattr(operator, name)
+        setattr(
+            _TracedValue,
+            f"__{name}__",
+            lambda self, other, op=op: self._binary(op, other),
+        )
+
+
+_add_binary_operators()
+
+
+class _TracedGroup:
+    """Stand-in for a DataFrame group that hands out traced columns."""
+
+    def __init__(self, group, grouped_values):
+        self._group = group
+        self._grouped_values = grouped_values
+
+    def _column(self, name):
+        return _traced_column(self._group, self._grouped_values, name)
+
+    def __getitem__(self, key):
+        return self._column(key)
+
+    def __getattr__(self, name):
+        from cudf.core.dataframe import DataFrame
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if hasattr(DataFrame, name):
+            raise _Untraceable(f"DataFrame.{name}")
+        return self._column(name)
+
+    def __len__(self):
+        raise _Untraceable("len of the group")
+
+    def __iter__(self):
+        raise _Untraceable("iteration over the group")
+
+
+def _traced_column(group, grouped_values, name):
+    """Trace selecting column ``name`` (``None`` for a Series group)."""
+    if name is None:
+        value, column = group, grouped_values._column
+    elif name in grouped_values._column_names:
+        value, column = group[name], grouped_values._data[name]
+    else:
+        raise _Untraceable(f"unknown column {name!r}")
+    if column.dtype.kind not in "iuf" or column.has_nulls(include_nan=True):
+        raise _Untraceable(f"column {name!r} is not non-null numeric")
+    return _TracedValue(value, "column", (name,), True)
+
+
+def _trace(function, group, grouped_values, args):
+    """
+    Call ``function`` on a stand-in for ``group`` and return the traced
+    per-group result.
+    """
+    from cudf.core.series import Series
+
+    if isinstance(grouped_values, Series):
+        stand_in = _traced_column(group, grouped_values, None)
+    else:
+        stand_in = _TracedGroup(group, grouped_values)
+    result = function(stand_in, *args)
+    if not isinstance(result, _TracedValue) or result.per_row:
+        # Per-row results are assembled from the index of each group,
+        # which the loop handles.
+        raise _Untraceable("the result is not a reduction")
+    return result
+
+
+class _Replay:
+    """Evaluate a traced result over every group at once."""
+
+    def __init__(self, offsets, grouped_values):
+        self.offsets = offsets
+        self.grouped_values = grouped_values
+        # Group ids are sorted because grouped_values is ordered by group.
+        starts = cp.zeros(len(grouped_values), dtype=SIZE_TYPE_DTYPE)
+        starts[cp.asarray(offsets[1:-1], dtype=SIZE_TYPE_DTYPE)] = 1
+        self.labels = as_column(cp.cumsum(starts, dtype=SIZE_TYPE_DTYPE))
+        self.columns = {}
+
+    def _segmented(self, nodes):
+        """
+        Compute the reductions or scans ``nodes`` in one libcudf call.
+        """
+        values = [self.evaluate(node.args[0]) for node in nodes]
+        for col in values:
+            if col.has_nulls(include_nan=True):
+                # Groupby aggregations and Series reductions disagree on
+                # how to skip missing values in all-missing groups.
+                raise _Untraceable("missing values in an aggregated column")
+        requests = [
+            plc.groupby.GroupByRequest(
+                col.plc_column,
+                [aggregation.make_aggregation(node.op).plc_obj],
+            )
+            for col, node in zip(values, nodes, strict=True)
+        ]
+        with access_columns(
+            self.labels, *values, mode="read", scope="internal"
+        ):
+            plc_groupby = plc.groupby.GroupBy(
+                plc.Table([self.labels.plc_column]),
+                plc.types.NullPolicy.EXCLUDE,
+                plc.types.Sorted.YES,
+            )
+            _, results = (
+                plc_groupby.scan(requests)
+                if nodes[0].op in _SCANS
+                else plc_groupby.aggregate(requests)
+            )
+        for node, result in zip(nodes, results, strict=True):
+            (col,) = result.columns()
+            self.columns[id(node)] = ColumnBase.from_pylibcudf(col).astype(
+                _dtype(node)
+            )
+
+    def prefetch(self, root):
+        """
+        Batch the reductions, and separately the scans, that do not
+        depend on any other reduction or scan into one call each.
+        """
+        reductions: dict[int, _TracedValue] = {}
+        scans: dict[int, _TracedValue] = {}
+
+        def visit(node):
+            independent = True
+            for arg in node.args:
+                if isinstance(arg, _TracedValue):
+                    independent &= visit(arg)
+            if node.op in _SEGMENTED:
+                if independent:
+                    (scans if node.per_row else reductions)[id(node)] = node
+                return False
+            return independent
+
+        visit(root)
+        for nodes in (reductions, scans):
+            if nodes:
+                self._segmented(list(nodes.values()))
+
+    def evaluate(self, node):
+        """Return ``node`` as a column over all rows or all groups."""
+        from cudf.core.series import Series
+
+        if id(node) in self.columns:
+            return self.columns[id(node)]
+        if node.op in _SEGMENTED:
+            self._segmented([node])
+            return self.columns[id(node)]
+        if node.op == "column":
+            (name,) = node.args
+            col = (
+                self.grouped_values._column
+                if name is None
+                else self.grouped_values._data[name]
+            )
+        elif node.op == "size":
+            col = as_column(np.diff(self.offsets)).astype(_dtype(node))
+        else:
+            operands = []
+            for arg in node.args:
+                if not isinstance(arg, _TracedValue):
+                    operands.append(arg)
+                    continue
+                col = self.evaluate(arg)
+                if node.per_row and not arg.per_row:
+                    col = col.take(self.labels)
+                operands.append(Series._from_column(col))
+            col = node.op(*operands)._column
+        self.columns[id(node)] = col
+        return col
+
+
+@_performance_tracking
+def vectorized_groupby_apply(offsets, grouped_values, function, *args):
+    """
+    Entrypoint for vectorized Groupby.apply.
+
+    Parameters
+    ----------
+    offsets : list
+        A list of integers denoting the indices of the group
+        boundaries in grouped_values
+    grouped_values : DataFrame or Series
+        The source data sorted by group keys
+    function : callable
+        The user-defined function to execute
+
+    Returns
+    -------
+    ColumnBase or None
+        One result per group, or ``None`` if ``function`` cannot be
+        traced and must be called on each group instead.
+    """
+    if len(offsets) < 2:
+        return None
+    group = grouped_values[offsets[0] : offsets[1]]
+    try:
+        root = _trace(function, group, grouped_values, args)
+        replay = _Replay(offsets, grouped_values)
+        replay.prefetch(root)
+        result = replay.evaluate(root)
+        if result.has_nulls(include_nan=True):
+            raise _Untraceable("missing values in the result")
+    except Exception:
+        # Anything the function raises is raised again, with its usual
+        # traceback, when the loop calls it on each group.
+        return None
+    return result.astype(_dtype(root))
@@ -15,9 +15,10 @@ from .fast_slow_proxy import (
     is_proxy_object,
 )
 from .magics import load_ipython_extension
-from .profiler import Profiler
+from .profiler import CountingProfiler, Profiler
 
 __all__ = [
+    "CountingProfiler",
     "Profiler",
     "as_proxy_object",
     "install",
@@ -33,10 +34,12 @@ LOADED = False
 def install():
     """Enable Pandas Accelerator Mode."""
     from .module_accelerator import ModuleAccelerator
+    from .profiler import _enable_counting_profiler_from_env
 
     loader = ModuleAccelerator.install("pandas", "cudf", "pandas")
     global LOADED
     LOADED = loader is not None
+    _enable_counting_profiler_from_env()
     if (
         "RAPIDS_NO_INITIALIZE" in os.environ
         or "CUDF_NO_INITIALIZE" in os.environ
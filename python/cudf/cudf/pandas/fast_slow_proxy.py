@@ -5,13 +5,23 @@ from __future__ import annotations
 
 import datetime
 import functools
+import importlib.metadata
 import inspect
+import json
 import operator
+import os
 import pickle
+import sys
+import threading
+import time
 import types
 import warnings
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from enum import IntEnum
+from itertools import islice
 from typing import Any, Literal
 
 import numpy as np
@@ -20,7 +30,7 @@ from rmm import RMMError
 
 import cudf
 
-from ..options import _env_get_bool
+from ..options import _env_get_bool, _env_get_int
 from ..testing import assert_eq
 from .annotation import nvtx
 from .proxy_base import ProxyNDarrayBase
@@ -64,7 +74,7 @@ _WRAPPER_ASSIGNMENTS = tuple(
     # be lazy. On 3.14 specifically, simply reading ``__annotate__`` causes
     # ``__annotate_func__`` to materialize on the source class, which then
     # shows up in ``dir()`` and diverges from the cached ``_fsproxy_slow_dir``
-    # captured a few lines earlier.
+    # captured when the proxy type's attributes are installed.
     if attr not in ("__annotations__", "__annotate__", "__doc__")
 )
 
@@ -124,12 +134,405 @@ class _PickleConstructor:
         self._type = type_
 
     def __call__(self):
-        return object.__new__(get_final_type_map().get(self._type, self._type))
+        cls = get_final_type_map().get(self._type, self._type)
+        if getattr(cls, "_fsproxy_lazy_attrs", None) is not None:
+            _materialize_fsproxy_attrs(cls)
+        return object.__new__(cls)
 
 
 _DELETE = object()
 
 
+# Methods that modify the object they are called on, in addition to any
+# method called with ``inplace=True``. pandas uses copy-on-write, so writes
+# through views do not modify a frame, but an object obtained from one of
+# its attributes (e.g. ``df.index``) may be shared with it: modifying such
+# an object also marks the proxy it was obtained from as modified (see
+# ``_FastSlowProxy._fsproxy_mark_mutated``).
+_MUTATING_METHODS = frozenset(
+    {
+        "__delattr__",
+        "__delitem__",
+        "__iadd__",
+        "__iand__",
+        "__ifloordiv__",
+        "__imod__",
+        "__imul__",
+        "__ior__",
+        "__ipow__",
+        "__isub__",
+        "__itruediv__",
+        "__ixor__",
+        "__setattr__",
+        "__setitem__",
+        "__setstate__",
+        "_set_value",
+        "insert",
+        "isetitem",
+        "pop",
+        "update",
+    }
+)
+
+
+def _nbytes(obj: Any) -> int | None:
+    """The size of a fast or slow object, or None if it is not known."""
+    try:
+        usage = obj.memory_usage(deep=False)
+    except Exception:
+        nbytes = getattr(obj, "nbytes", None)
+        return nbytes if isinstance(nbytes, int) else None
+    if not isinstance(usage, int):
+        # DataFrame.memory_usage returns the usage of every column
+        usage = usage.sum()
+    return int(usage)
+
+
+@dataclass(slots=True)
+class _ResidentCopy:
+    """The inactive copy of the object wrapped by a final proxy."""
+
+    proxy: weakref.ref
+    copy: Any
+    state: _State
+    nbytes: int
+    # The proxy's version and wrapped object when the copy was made. The
+    # copy is stale once either changes.
+    version: int
+    wrapped_id: int
+
+
+class _DualResidencyCache:
+    """
+    Keep both the fast and the slow copy of the objects of final proxies.
+
+    A proxy wraps one object at a time, so code that alternates between
+    operations that run on the GPU and operations that fall back to the
+    CPU converts the same object back and forth on every call. With the
+    ``CUDF_PANDAS_DUAL_RESIDENCY`` environment variable set, a proxy that
+    switches between fast and slow keeps the object it switched away
+    from, and switching back reuses it as long as the proxy was not
+    modified in between (see ``_FastSlowProxy._fsproxy_mark_mutated``).
+
+    The kept copies are bounded by ``CUDF_PANDAS_DUAL_RESIDENCY_DEVICE_LIMIT``
+    (fast copies) and ``CUDF_PANDAS_DUAL_RESIDENCY_HOST_LIMIT`` (slow
+    copies) bytes, evicting the least recently used copies first.
+    """
+
+    def __init__(self) -> None:
+        # Re-entrant: a proxy that is garbage collected while the lock is
+        # held discards its copy from a weakref callback.
+        self._lock = threading.RLock()
+        # Keyed by the id of the proxy, least recently used first.
+        self._copies: OrderedDict[int, _ResidentCopy] = OrderedDict()
+        self._nbytes = {_State.FAST: 0, _State.SLOW: 0}
+
+    def __len__(self) -> int:
+        return len(self._copies)
+
+    def _pop(self, key: int) -> _ResidentCopy | None:
+        resident = self._copies.pop(key, None)
+        if resident is not None:
+            self._nbytes[resident.state] -= resident.nbytes
+        return resident
+
+    def discard(self, key: int) -> None:
+        """Drop the copy kept for the proxy with id *key*."""
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        """Drop all the copies."""
+        with self._lock:
+            self._copies.clear()
+            self._nbytes = {_State.FAST: 0, _State.SLOW: 0}
+
+    def switch(self, proxy: _FinalProxy, state: _State) -> Any:
+        """
+        Return the object of a proxy converted to *state*.
+
+        The object the proxy currently wraps is kept so that switching
+        back does not need to convert it again.
+
+        Parameters
+        ----------
+        proxy
+            The proxy, which must not already be in *state*.
+        state
+            The state to switch to.
+        """
+        key = id(proxy)
+        wrapped = proxy._fsproxy_wrapped
+        version = proxy._fsproxy_version
+        with self._lock:
+            resident = self._pop(key)
+        if (
+            resident is not None
+            and resident.state is state
+            and resident.version == version
+            and resident.wrapped_id == id(wrapped)
+        ):
+            result = resident.copy
+        elif state is _State.FAST:
+            result = proxy._fsproxy_slow_to_fast()
+        else:
+            result = proxy._fsproxy_fast_to_slow()
+
+        other = _State.SLOW if state is _State.FAST else _State.FAST
+        nbytes = _nbytes(wrapped)
+        limit = (
+            _env_get_int("CUDF_PANDAS_DUAL_RESIDENCY_DEVICE_LIMIT", 2**30)
+            if other is _State.FAST
+            else _env_get_int("CUDF_PANDAS_DUAL_RESIDENCY_HOST_LIMIT", 2**30)
+        )
+        if nbytes is None or nbytes > limit:
+            return result
+        resident = _ResidentCopy(
+            weakref.ref(proxy, lambda _: self.discard(key)),
+            wrapped,
+            other,
+            nbytes,
+            version,
+            id(result),
+        )
+        with self._lock:
+            self._pop(key)
+            self._copies[key] = resident
+            self._nbytes[other] += nbytes
+            while self._nbytes[other] > limit:
+                lru = next(
+                    k for k, r in self._copies.items() if r.state is other
+                )
+                self._pop(lru)
+        return result
+
+
+_dual_residency_cache = _DualResidencyCache()
+
+
+# Failures of the fast path that recur for the same function and types of
+# arguments. Out-of-memory errors may succeed later and are never cached.
+_DETERMINISTIC_FAILURES = (NotImplementedError, TypeError, AttributeError)
+
+
+def _dtype_signature(obj: Any) -> Any:
+    """The dtype(s) of a DataFrame, Series or Index, else None."""
+    if isinstance(obj, cudf.DataFrame):
+        return tuple(dtype for _, dtype in obj._dtypes)
+    if (dtype := getattr(obj, "dtype", None)) is not None:
+        return dtype
+    if hasattr(dtypes := getattr(obj, "dtypes", None), "tolist"):
+        # pandas.DataFrame
+        return tuple(dtypes.tolist())
+    return None
+
+
+# Containers with more elements than this (typically data, e.g. the list
+# passed to ``pd.Series``) are summarized by the distinct signatures of
+# their first elements, so that the summary does not grow with their length.
+_MAX_SIGNATURE_ELEMENTS = 8
+
+
+def _container_signature(arg: Any, elements: Iterator[Any]) -> Any:
+    """A hashable summary of the types of the elements of a container."""
+    if len(arg) <= _MAX_SIGNATURE_ELEMENTS:
+        return (type(arg), *elements)
+    return (
+        type(arg),
+        Ellipsis,
+        *dict.fromkeys(islice(elements, _MAX_SIGNATURE_ELEMENTS)),
+    )
+
+
+def _signature(arg: Any) -> Any:
+    """
+    A hashable summary of the types of an argument of a proxied call.
+
+    Proxies are summarized by their type and dtypes, containers by the
+    signatures of (at most ``_MAX_SIGNATURE_ELEMENTS`` of) their elements,
+    and strings, booleans and None (which usually select an option, e.g.
+    ``how="left"``) by their value.
+    """
+    if isinstance(arg, _IntermediateProxy):
+        return (type(arg), *map(_signature, arg._fsproxy_parents))
+    elif isinstance(arg, _FastSlowProxy):
+        return (type(arg), _dtype_signature(arg._fsproxy_wrapped))
+    elif isinstance(arg, _FunctionProxy):
+        slow = arg._fsproxy_slow
+        return (
+            getattr(slow, "__func__", slow),
+            type(getattr(slow, "__self__", None)),
+        )
+    elif isinstance(arg, type):
+        return arg
+    elif isinstance(arg, (list, tuple)):
+        return _container_signature(arg, map(_signature, arg))
+    elif isinstance(arg, dict):
+        return _container_signature(
+            arg, ((k, _signature(v)) for k, v in arg.items())
+        )
+    elif arg is None or isinstance(arg, (str, bytes, bool)):
+        return arg
+    elif isinstance(arg, types.FunctionType):
+        return arg.__code__
+    elif isinstance(arg, np.ndarray):
+        return (type(arg), arg.dtype, arg.ndim)
+    return type(arg)
+
+
+def _function_key(func: Callable, args: tuple) -> Any:
+    """The function called by `_fast_slow_function_call(func, *args)`."""
+    if func is call_operator and args and isinstance(args[0], _FunctionProxy):
+        slow = args[0]._fsproxy_slow
+        return getattr(slow, "__func__", slow)
+    # Calls through a lambda (e.g. in ``_FinalProxy.__init__``) create a
+    # new function object every time, but share its code.
+    return getattr(func, "__code__", func)
+
+
+class _FallbackCache:
+    """
+    Remember proxied calls whose fast path failed deterministically.
+
+    When cuDF does not support an operation, every call to it converts
+    all the arguments to cuDF, fails, and converts them back to pandas.
+    This cache records failures raised by the fast function itself with
+    one of the ``_DETERMINISTIC_FAILURES``, keyed by the function and the
+    signature of its arguments (see ``_signature``), and subsequent calls
+    with the same key go straight to pandas.
+
+    The cache holds the ``CUDF_PANDAS_FALLBACK_CACHE_SIZE`` (default 1024)
+    most recently used failures; a size of 0 disables it. It is also
+    disabled with ``CUDF_PANDAS_FAIL_ON_FALLBACK`` or ``LOG_FAST_FALLBACK``
+    set, which need the exception of every fallback.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # The failures, least recently used first. The values are whether
+        # the result must stay on the slow path (see MixedTypeError) and
+        # the name of the type of the exception the fast path raised.
+        self._failures: OrderedDict[tuple[Any, Any], tuple[bool, str]] = (
+            OrderedDict()
+        )
+        # The number of failures of every function. Calls to functions
+        # that never failed skip computing the signature of the arguments.
+        self._functions: dict[Any, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._failures)
+
+    def clear(self) -> None:
+        """Drop all the failures and reset the counters."""
+        with self._lock:
+            self._failures.clear()
+            self._functions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _size() -> int:
+        if _env_get_bool("CUDF_PANDAS_FAIL_ON_FALLBACK", False) or (
+            _env_get_bool("LOG_FAST_FALLBACK", False)
+        ):
+            return 0
+        return _env_get_int("CUDF_PANDAS_FALLBACK_CACHE_SIZE", 1024)
+
+    def lookup(
+        self, func: Callable, args: tuple, kwargs: dict
+    ) -> tuple[tuple[Any, Any] | None, tuple[bool, str] | None]:
+        """
+        Look up a call in the cache.
+
+        Returns
+        -------
+        The key of the call (None if it was not computed), and if the call
+        is a known failure whether the result must stay on the slow path
+        and the name of the exception type of the failure (None otherwise).
+        """
+        if self._size() <= 0:
+            return None, None
+        try:
+            function = _function_key(func, args)
+            with self._lock:
+                failed = function in self._functions
+            if not failed:
+                self.misses += 1
+                return None, None
+            key = (function, _signature((args, kwargs)))
+            with self._lock:
+                failure = self._failures.get(key)
+                if failure is None:
+                    self.misses += 1
+                else:
+                    self._failures.move_to_end(key)
+                    self.hits += 1
+            return key, failure
+        except Exception:
+            # Unhashable or otherwise unusual arguments
+            return None, None
+
+    def record(
+        self,
+        key: tuple[Any, Any] | None,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        block_transfer_to_fast: bool,
+        reason: str,
+    ) -> None:
+        """
+        Record a deterministic failure of the fast path of a call.
+
+        Parameters
+        ----------
+        key
+            The key returned by `lookup`, or None to compute it.
+        func, args, kwargs
+            The call.
+        block_transfer_to_fast
+            Whether the result must stay on the slow path.
+        reason
+            The name of the type of the exception the fast path raised.
+        """
+        if (size := self._size()) <= 0:
+            return
+        try:
+            if key is None:
+                key = (_function_key(func, args), _signature((args, kwargs)))
+            with self._lock:
+                if key not in self._failures:
+                    function = key[0]
+                    self._functions[function] = (
+                        self._functions.get(function, 0) + 1
+                    )
+                self._failures[key] = (block_transfer_to_fast, reason)
+                self._failures.move_to_end(key)
+                while len(self._failures) > size:
+                    (function, _), _ = self._failures.popitem(last=False)
+                    self._functions[function] -= 1
+                    if not self._functions[function]:
+                        del self._functions[function]
+        except Exception:
+            pass
+
+
+_fallback_cache = _FallbackCache()
+
+
+class _CachedFallback(Exception):
+    """Raised to take the slow path of a call known to fail on the fast."""
+
+    def __init__(self, block_transfer_to_fast: bool, reason: str):
+        super().__init__("cuDF previously failed on the same call")
+        self.block_transfer_to_fast = block_transfer_to_fast
+        # The exception type name of the original failure, reported as the
+        # reason of the fallback.
+        self.reason = reason
+
+
 def _make_proxy_getattr():
     """
     Create an optimized ``__getattr__`` for proxy types.
@@ -195,6 +598,138 @@ def _make_proxy_getattr():
     return __getattr__
 
 
+# The class dictionary of a type, without installing the attributes of a
+# lazily built proxy type (see ``_FastSlowProxyMeta.__dict__``).
+_class_dict = type.__dict__["__dict__"].__get__
+
+
+def _has_class_attribute(typ: type, name: str) -> bool:
+    """Return whether ``name in dir(typ)``, without computing the dir."""
+    if type(typ).__dir__ is not type.__dir__:
+        return name in dir(typ)
+    return any(name in _class_dict(klass) for klass in typ.__mro__)
+
+
+def _qualified_name(typ: type) -> str:
+    return f"{typ.__module__}.{typ.__qualname__}"
+
+
+def _manifest_versions() -> dict[str, str]:
+    """The versions that determine the attributes of the slow types."""
+    return {
+        "python": "{}.{}".format(*sys.version_info[:2]),
+        "pandas": importlib.metadata.version("pandas"),
+        "numpy": np.__version__,
+    }
+
+
+@functools.cache
+def _attribute_manifest() -> dict[str, list[str]]:
+    """
+    Return the ``dir()`` of the slow types recorded in the manifest named
+    by the ``CUDF_PANDAS_ATTRIBUTE_MANIFEST`` environment variable, keyed
+    by the qualified name of the type (see `write_attribute_manifest`).
+
+    The manifest is ignored, with a warning, if it cannot be read or was
+    written with other versions of Python, pandas or NumPy.
+    """
+    path = os.environ.get("CUDF_PANDAS_ATTRIBUTE_MANIFEST")
+    if not path:
+        return {}
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        versions = _manifest_versions()
+        if manifest["versions"] != versions:
+            raise ValueError(
+                f"it was written for {manifest['versions']}, not {versions}"
+            )
+        return manifest["types"]
+    except (OSError, ValueError, KeyError, TypeError) as err:
+        warnings.warn(f"Ignoring the attribute manifest {path}: {err}")
+        return {}
+
+
+def write_attribute_manifest(path: str | os.PathLike) -> None:
+    """
+    Write the ``dir()`` of the slow types of all the proxy types to a
+    manifest, to be read through ``CUDF_PANDAS_ATTRIBUTE_MANIFEST``.
+
+    Listing the attributes of a slow type is most of the cost of building
+    a proxy type. The manifest records them for the current versions of
+    Python, pandas and NumPy, so call this with ``cudf.pandas`` installed
+    in the same environment as the one that will read it.
+    """
+    proxy_types = {
+        *get_final_type_map().values(),
+        *get_intermediate_type_map().values(),
+    }
+    types = {
+        _qualified_name(slow): dir(slow)
+        for slow in (proxy._fsproxy_slow_type for proxy in proxy_types)
+    }
+    with open(path, "w") as f:
+        json.dump({"versions": _manifest_versions(), "types": types}, f)
+
+
+def _slow_type_dir(slow_type: type) -> list[str]:
+    """Return ``dir(slow_type)``, from the attribute manifest if possible."""
+    names = _attribute_manifest().get(_qualified_name(slow_type))
+    return list(names) if names is not None else dir(slow_type)
+
+
+_materialize_lock = threading.RLock()
+
+
+def _materialize_fsproxy_attrs(cls: type) -> bool:
+    """
+    Install the delegating attributes of the lazily built proxy types in
+    the MRO of `cls`.
+
+    ``make_final_proxy_type`` and ``make_intermediate_proxy_type`` only
+    install the special methods and the attributes they are given. A
+    `_FastSlowAttribute` for every other attribute of the slow type is
+    installed on first use of the proxy type: when it is instantiated or
+    subclassed, or when a class attribute it does not have yet is looked
+    up or assigned. Most proxy types are never used by a given program,
+    which saves listing and wrapping their attributes on import.
+
+    Returns
+    -------
+    Whether any attributes were installed.
+    """
+    installed = False
+    for klass in cls.__mro__:
+        if _class_dict(klass).get("_fsproxy_lazy_attrs") is None:
+            continue
+        with _materialize_lock:
+            cls_dict = _class_dict(klass)
+            extra_names = cls_dict.get("_fsproxy_lazy_attrs")
+            if extra_names is None:
+                # Installed by another thread
+                continue
+            slow = klass._fsproxy_slow_type  # type: ignore[attr-defined]
+            slow_dir = _slow_type_dir(slow)
+            pristine = cls_dict.get("_fsproxy_pristine_attrs", {})
+            for name in (
+                *(name for name in slow_dir if not name.startswith("__")),
+                *extra_names,
+            ):
+                if name in cls_dict:
+                    continue
+                attr = _FastSlowAttribute(name, private=name.startswith("_"))
+                type.__setattr__(klass, name, attr)
+                if not name.startswith("_"):
+                    pristine[name] = (
+                        attr,
+                        slow.__dict__.get(name, _SLOW_ABSENT),
+                    )
+            type.__setattr__(klass, "_fsproxy_slow_dir", slow_dir)
+            type.__setattr__(klass, "_fsproxy_lazy_attrs", None)
+        installed = True
+    return installed
+
+
 def make_final_proxy_type(
     name: str,
     fast_type: type,
@@ -269,7 +804,16 @@ def make_final_proxy_type(
         # if we are wrapping a slow object,
         # convert it to a fast one
         if self._fsproxy_state is _State.SLOW:
-            return slow_to_fast(self._fsproxy_wrapped)
+            if (profiler := _counting_profiler) is None:
+                return slow_to_fast(self._fsproxy_wrapped)
+            start = time.perf_counter()
+            result = slow_to_fast(self._fsproxy_wrapped)
+            profiler._record_transfer(
+                "host_to_device",
+                _nbytes(self._fsproxy_wrapped),
+                time.perf_counter() - start,
+            )
+            return result
         return self._fsproxy_wrapped
 
     @nvtx.annotate(
@@ -281,7 +825,16 @@ def make_final_proxy_type(
         # if we are wrapping a fast object,
         # convert it to a slow one
         if self._fsproxy_state is _State.FAST:
-            return fast_to_slow(self._fsproxy_wrapped)
+            if (profiler := _counting_profiler) is None:
+                return fast_to_slow(self._fsproxy_wrapped)
+            start = time.perf_counter()
+            result = fast_to_slow(self._fsproxy_wrapped)
+            profiler._record_transfer(
+                "device_to_host",
+                _nbytes(self._fsproxy_wrapped),
+                time.perf_counter() - start,
+            )
+            return result
         return self._fsproxy_wrapped
 
     def as_gpu_object(self):
@@ -298,11 +851,9 @@ def make_final_proxy_type(
             else _State.SLOW
         )
 
-    slow_dir = dir(slow_type)
     cls_dict = {
         "__init__": __init__,
         "__doc__": inspect.getdoc(slow_type),
-        "_fsproxy_slow_dir": slow_dir,
         "_fsproxy_fast_type": fast_type,
         "_fsproxy_slow_type": slow_type,
         "_fsproxy_slow_to_fast": _fsproxy_slow_to_fast,
@@ -310,13 +861,17 @@ def make_final_proxy_type(
         "as_gpu_object": as_gpu_object,
         "as_cpu_object": as_cpu_object,
         "_fsproxy_state": _fsproxy_state,
+        # The other attributes of the slow type are installed on first use
+        # (see _materialize_fsproxy_attrs)
+        "_fsproxy_lazy_attrs": (),
     }
 
     if additional_attributes is None:
         additional_attributes = {}
-    slow_type_dir = dir(slow_type)
     for method in _SPECIAL_METHODS:
-        if method in slow_type_dir and getattr(slow_type, method, False):
+        if _has_class_attribute(slow_type, method) and getattr(
+            slow_type, method, False
+        ):
             cls_dict[method] = _FastSlowAttribute(method)
 
     if hasattr(slow_type, "__getattr__"):
@@ -328,14 +883,6 @@ def make_final_proxy_type(
         elif v is not _DELETE:
             cls_dict[k] = v
 
-    for slow_name in slow_type_dir:
-        if slow_name in cls_dict or slow_name.startswith("__"):
-            continue
-        else:
-            cls_dict[slow_name] = _FastSlowAttribute(
-                slow_name, private=slow_name.startswith("_")
-            )
-
     metaclass = _FastSlowProxyMeta
     if metaclasses:
         metaclass = types.new_class(  # type: ignore[assignment]
@@ -458,19 +1005,22 @@ def make_intermediate_proxy_type(
             return result
         return self._fsproxy_wrapped
 
-    slow_dir = dir(slow_type)
     cls_dict = {
         "__init__": __init__,
         "__doc__": inspect.getdoc(slow_type),
-        "_fsproxy_slow_dir": slow_dir,
         "_fsproxy_fast_type": fast_type,
         "_fsproxy_slow_type": slow_type,
         "_fsproxy_slow_to_fast": _fsproxy_slow_to_fast,
         "_fsproxy_fast_to_slow": _fsproxy_fast_to_slow,
         "_fsproxy_state": _fsproxy_state,
+        # The other attributes of the slow type are installed on first use
+        # (see _materialize_fsproxy_attrs)
+        "_fsproxy_lazy_attrs": tuple(getattr(slow_type, "_attributes", ())),
     }
     for method in _SPECIAL_METHODS:
-        if method in slow_dir and getattr(slow_type, method, False):
+        if _has_class_attribute(slow_type, method) and getattr(
+            slow_type, method, False
+        ):
             cls_dict[method] = _FastSlowAttribute(method)
 
     if hasattr(slow_type, "__getattr__"):
@@ -481,22 +1031,6 @@ def make_intermediate_proxy_type(
     for k, v in additional_attributes.items():
         cls_dict[k] = v
 
-    for slow_name in dir(slow_type):
-        if slow_name in cls_dict or slow_name.startswith("__"):
-            continue
-        else:
-            cls_dict[slow_name] = _FastSlowAttribute(
-                slow_name, private=slow_name.startswith("_")
-            )
-
-    for slow_name in getattr(slow_type, "_attributes", []):
-        if slow_name in cls_dict:
-            continue
-        else:
-            cls_dict[slow_name] = _FastSlowAttribute(
-                slow_name, private=slow_name.startswith("_")
-            )
-
     cls = types.new_class(
         name,
         (_IntermediateProxy,),
@@ -589,7 +1123,7 @@ def _enable_fsproxy_mirroring(cls: type) -> None:
     slow = cls._fsproxy_slow_type  # type: ignore[attr-defined]
     pristine = {
         name: (value, slow.__dict__.get(name, _SLOW_ABSENT))
-        for name, value in cls.__dict__.items()
+        for name, value in _class_dict(cls).items()
         if not name.startswith("_")
     }
     type.__setattr__(cls, "_fsproxy_pristine_attrs", pristine)
@@ -650,9 +1184,40 @@ class _FastSlowProxyMeta(type):
         # ``ABCMeta.__new__`` assigns ``__abstractmethods__``, dispatching
         # to ``__setattr__`` below before ``__init__`` ever runs.
         type.__setattr__(cls, "_fsproxy_mirror_slow_overrides", False)
+        namespace = args[2] if len(args) > 2 else kwargs.get("namespace", {})
+        if "_fsproxy_slow_type" not in namespace:
+            # A subclass of proxy types defined outside ``make_*_proxy_type``
+            # (e.g. ``class MyFrame(pd.DataFrame)``) may access attributes of
+            # its bases without a lookup on itself, e.g. through ``super()``.
+            _materialize_fsproxy_attrs(cls)
         return cls
 
+    @property
+    def __dict__(cls):
+        # Code inspecting the class dictionary (e.g. ``mock.patch``) must
+        # see the attributes of lazily built proxy types.
+        if _class_dict(cls).get("_fsproxy_lazy_attrs") is not None:
+            _materialize_fsproxy_attrs(cls)
+        return _class_dict(cls)
+
+    def __getattr__(cls, name):
+        if not name.startswith("__") and _materialize_fsproxy_attrs(cls):
+            return getattr(cls, name)
+        raise AttributeError(
+            f"type object {cls.__name__!r} has no attribute {name!r}"
+        )
+
+    def __call__(cls, *args, **kwargs):
+        if cls._fsproxy_lazy_attrs is not None:
+            _materialize_fsproxy_attrs(cls)
+        return super().__call__(*args, **kwargs)
+
     def __setattr__(cls, name, value):
+        if not name.startswith("__") and (
+            _class_dict(cls).get("_fsproxy_lazy_attrs") is not None
+        ):
+            # Patches apply to (and save) the installed attributes
+            _materialize_fsproxy_attrs(cls)
         # Class-level attribute assignments on a proxy type (e.g.
         # ``monkeypatch.setattr(pd.ExcelFile, "parse", fn)``) must also be
         # mirrored onto the underlying "slow" (real) type. Code that runs
@@ -757,6 +1322,10 @@ class _FastSlowProxyMeta(type):
         # (real) type as well, for the same reason as ``__setattr__``: after
         # ``del cls.name`` the attribute is gone from the proxy, so it must
         # also be gone from the real type seen by fallback code.
+        if not name.startswith("__") and (
+            _class_dict(cls).get("_fsproxy_lazy_attrs") is not None
+        ):
+            _materialize_fsproxy_attrs(cls)
         type.__delattr__(cls, name)
         if not cls._fsproxy_mirror_slow_overrides:
             return
@@ -828,6 +1397,14 @@ class _FastSlowProxy:
     _fsproxy_wrapped: Any
     # Instance-level transfer blocking flag
     _fsproxy_transfer_block: _BlockState | None = None
+    # Incremented whenever the proxy is modified (see _fsproxy_mark_mutated)
+    _fsproxy_version: int = 0
+    # The proxy this proxy was obtained from as an attribute (e.g. the
+    # DataFrame of ``df.index``), if any
+    _fsproxy_owner: weakref.ref | None = None
+    # Attributes of the proxy type still to be installed, or None once they
+    # are (see _materialize_fsproxy_attrs)
+    _fsproxy_lazy_attrs: tuple[str, ...] | None = None
 
     def _fsproxy_fast_to_slow(self) -> Any:
         """
@@ -859,7 +1436,7 @@ class _FastSlowProxy:
         ):
             raise RuntimeError("Fast-to-slow transfer is blocked")
 
-        self._fsproxy_wrapped = self._fsproxy_slow_to_fast()
+        self._fsproxy_wrapped = self._fsproxy_switch(_State.FAST)
         return self._fsproxy_wrapped
 
     @property
@@ -869,9 +1446,34 @@ class _FastSlowProxy:
         type, replaces it with the corresponding "slow" object before
         returning it.
         """
-        self._fsproxy_wrapped = self._fsproxy_fast_to_slow()
+        self._fsproxy_wrapped = self._fsproxy_switch(_State.SLOW)
         return self._fsproxy_wrapped
 
+    def _fsproxy_switch(self, state: _State) -> Any:
+        """
+        Return the wrapped object converted to `state`, to be stored as
+        the new wrapped object.
+        """
+        if state is _State.FAST:
+            return self._fsproxy_slow_to_fast()
+        return self._fsproxy_fast_to_slow()
+
+    def _fsproxy_mark_mutated(self) -> None:
+        """
+        Record that the wrapped object was modified in place, which
+        invalidates any copy of it kept by dual residency.
+
+        An attribute of a proxy may share its object with the proxy (e.g.
+        ``df.index.name = "k"`` renames the index of ``df``), so the proxy
+        it was obtained from is marked as modified too.
+        """
+        object.__setattr__(self, "_fsproxy_version", self._fsproxy_version + 1)
+        if (
+            self._fsproxy_owner is not None
+            and (owner := self._fsproxy_owner()) is not None
+        ):
+            owner._fsproxy_mark_mutated()
+
     def set_transfer_block_state(
         self, transfer_block: _BlockState | None = None
     ):
@@ -976,6 +1578,8 @@ class _FinalProxy(_FastSlowProxy):
         _FinalProxy subclasses can override this classmethod if they
         need particular behaviour when wrapped up.
         """
+        if cls._fsproxy_lazy_attrs is not None:
+            _materialize_fsproxy_attrs(cls)
         # TODO: Replace the if-elif-else using singledispatch helper function
         base_class = _get_proxy_base_class(cls)
         if base_class is object:
@@ -1010,6 +1614,14 @@ class _FinalProxy(_FastSlowProxy):
         proxy._fsproxy_wrapped = value
         return proxy
 
+    def _fsproxy_switch(self, state: _State) -> Any:
+        current = self._fsproxy_state  # type: ignore[attr-defined]
+        if current is not state and _env_get_bool(
+            "CUDF_PANDAS_DUAL_RESIDENCY", False
+        ):
+            return _dual_residency_cache.switch(self, state)
+        return super()._fsproxy_switch(state)
+
     def __reduce__(self):
         """
         In conjunction with `__proxy_setstate__`, this effectively enables
@@ -1095,6 +1707,8 @@ class _IntermediateProxy(_FastSlowProxy):
             and `args` and `kwargs` are the arguments that were passed
             to `func`.
         """
+        if cls._fsproxy_lazy_attrs is not None:
+            _materialize_fsproxy_attrs(cls)
         proxy = object.__new__(cls)
         proxy._fsproxy_wrapped = obj
         proxy._method_chain = method_chain
@@ -1113,6 +1727,13 @@ class _IntermediateProxy(_FastSlowProxy):
             id(parent._fsproxy_wrapped) for parent in self._fsproxy_parents
         ]
 
+    def _fsproxy_mark_mutated(self) -> None:
+        # Modifying an intermediate (e.g. ``df.loc[...] = value``)
+        # modifies the proxies it was derived from.
+        super()._fsproxy_mark_mutated()
+        for parent in self._fsproxy_parents:
+            parent._fsproxy_mark_mutated()
+
     def _fsproxy_parents_changed(self) -> bool:
         """
         Return True if any parent proxy's wrapped object has been replaced
@@ -1366,12 +1987,20 @@ class _FastSlowAttribute:
                         getattr(instance._fsproxy_slow, self._name),
                         None,  # type: ignore[arg-type]
                     )
-                return _fast_slow_function_call(
+                result = _fast_slow_function_call(
                     getattr,
                     None,
                     instance,
                     self._name,
                 )[0]
+                if (
+                    isinstance(result, _FastSlowProxy)
+                    and result is not instance
+                ):
+                    object.__setattr__(
+                        result, "_fsproxy_owner", weakref.ref(instance)
+                    )
+                return result
 
         return self._attr
 
@@ -1407,6 +2036,20 @@ class _MethodProxy(_FunctionProxy):
             _fsproxy_transfer_block=_fsproxy_transfer_block,
         )
 
+    def __call__(self, *args, **kwargs) -> Any:
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            if (
+                args
+                and isinstance(args[0], _FastSlowProxy)
+                and (
+                    kwargs.get("inplace") is True
+                    or self.__name__ in _MUTATING_METHODS
+                )
+            ):
+                args[0]._fsproxy_mark_mutated()
+
     def __dir__(self):
         return self._fsproxy_slow.__dir__()
 
@@ -1500,6 +2143,11 @@ def _slow_function_call():
     return None
 
 
+# The enabled ``cudf.pandas.profiler.CountingProfiler``, if any. A disabled
+# profiler costs a single global lookup per call.
+_counting_profiler: Any = None
+
+
 def _fast_slow_function_call(
     func: Callable,
     transfer_block: _BlockState | None = None,
@@ -1517,17 +2165,28 @@ def _fast_slow_function_call(
     """
     from .module_accelerator import disable_module_accelerator
 
+    if (profiler := _counting_profiler) is not None:
+        start = time.perf_counter()
     fast = False
+    fallback_reason = None
     block_transfer_to_fast = False
+    # Whether the arguments were converted, so that a failure was raised by
+    # the fast function itself and not by the conversion.
+    converted = False
+    key = None
     try:
         if transfer_block is _BlockState.TO_FAST:
             raise Exception("Forcing slow path due to transfer blocking")
+        key, cached = _fallback_cache.lookup(func, args, kwargs)
+        if cached is not None:
+            raise _CachedFallback(*cached)
         with nvtx.annotate(
             "EXECUTE_FAST",
             color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_FAST"],
             domain="cudf_pandas",
         ):
             fast_args, fast_kwargs = _fast_arg(args), _fast_arg(kwargs)
+            converted = True
             result = func(*fast_args, **fast_kwargs)
             if result is NotImplemented:
                 # try slow path
@@ -1566,8 +2225,26 @@ def _fast_slow_function_call(
                             f"The exception was {e}."
                         )
     except Exception as err:
-        if type(err) is cudf.errors.MixedTypeError:
+        fallback_reason = type(err).__name__
+        if isinstance(err, _CachedFallback):
+            block_transfer_to_fast = err.block_transfer_to_fast
+            fallback_reason = err.reason
+        elif type(err) is cudf.errors.MixedTypeError:
             block_transfer_to_fast = True
+        if (
+            not fast
+            and converted
+            and isinstance(err, _DETERMINISTIC_FAILURES)
+            and not isinstance(err, (RMMError, MemoryError))
+        ):
+            _fallback_cache.record(
+                key,
+                func,
+                args,
+                kwargs,
+                block_transfer_to_fast,
+                fallback_reason,
+            )
         with nvtx.annotate(
             "EXECUTE_SLOW",
             color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
@@ -1586,6 +2263,10 @@ def _fast_slow_function_call(
     result = _maybe_wrap_result(result, func, *args, **kwargs)
     if block_transfer_to_fast and isinstance(result, _FastSlowProxy):
         result.force_state(_State.SLOW)
+    if profiler is not None:
+        profiler._record_call(
+            func, args, fast, fallback_reason, time.perf_counter() - start
+        )
     return result, fast
 
 
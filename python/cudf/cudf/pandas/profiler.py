@@ -1,23 +1,31 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import atexit
 import inspect
+import json
 import operator
+import os
 import pickle
 import sys
+import threading
 import time
 from collections import defaultdict
+from dataclasses import asdict, dataclass, field
 
 from rich.console import Console
 from rich.syntax import Syntax
 from rich.table import Table
 
+from ..options import _env_get_int
+from . import fast_slow_proxy
 from .fast_slow_proxy import (
     _FinalProxy,
     _FunctionProxy,
     _IntermediateProxy,
     _MethodProxy,
+    call_operator,
 )
 
 # This text is used in contexts where the profiler is injected into the
@@ -310,3 +318,258 @@ class Profiler:
 def load_stats(file_name):
     with open(file_name, "rb") as f:
         return pickle.load(f)
+
+
+@dataclass
+class FunctionStats:
+    """The calls of one function recorded by a `CountingProfiler`."""
+
+    gpu_calls: int = 0
+    gpu_seconds: float = 0.0
+    cpu_calls: int = 0
+    cpu_seconds: float = 0.0
+    # Number of CPU fallbacks by the name of the exception that caused them
+    fallbacks: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class TransferStats:
+    """The conversions in one direction recorded by a `CountingProfiler`."""
+
+    count: int = 0
+    # Size of the converted objects, when known
+    nbytes: int = 0
+    seconds: float = 0.0
+
+
+def _call_name(func, args) -> str | None:
+    """The name of the function called by ``_fast_slow_function_call``."""
+    if func is call_operator and args:
+        if isinstance(fn := args[0], _MethodProxy):
+            return getattr(fn._fsproxy_slow, "__qualname__", fn.__name__)
+        if isinstance(fn, _FunctionProxy):
+            return fn.__name__
+    elif func is getattr and len(args) == 2:
+        if isinstance(args[0], (_FinalProxy, _IntermediateProxy)):
+            return f"{type(args[0]).__name__}.{args[1]}"
+    elif (
+        args
+        and isinstance(args[0], type)
+        and issubclass(args[0], (_FinalProxy, _IntermediateProxy))
+    ):
+        return args[0].__name__
+    return None
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class CountingProfiler:
+    """
+    Count the calls, CPU fallbacks and conversions of ``cudf.pandas``.
+
+    Unlike `Profiler`, which traces every line executed, this profiler is
+    updated directly by the proxies, so it is cheap enough to leave
+    enabled in production. For every function it records the number of
+    calls and the time spent on the GPU and on the CPU, and why calls
+    fell back to the CPU. It also records the number, size and time of
+    the conversions between GPU and CPU objects.
+
+    Only one profiler records at a time: enabling a profiler disables
+    the one enabled before it.
+
+    Setting the ``CUDF_PANDAS_PROFILE_EXPORT`` environment variable to a
+    path enables a profiler when ``cudf.pandas`` is installed and writes
+    its counters to that path every ``CUDF_PANDAS_PROFILE_EXPORT_INTERVAL``
+    seconds (default 60) and at exit, see `export`.
+
+    Examples
+    --------
+    >>> with CountingProfiler() as profiler:  # doctest: +SKIP
+    ...     df.groupby("a").sum()
+    >>> print(profiler.to_prometheus())  # doctest: +SKIP
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.functions: dict[str, FunctionStats] = {}
+        self.transfers = {
+            "host_to_device": TransferStats(),
+            "device_to_host": TransferStats(),
+        }
+        self._stop_export: threading.Event | None = None
+        self._exporter: threading.Thread | None = None
+
+    def enable(self) -> None:
+        """Start recording."""
+        fast_slow_proxy._counting_profiler = self
+
+    def disable(self) -> None:
+        """Stop recording, and stop any periodic export after a last one."""
+        if fast_slow_proxy._counting_profiler is self:
+            fast_slow_proxy._counting_profiler = None
+        if self._exporter is not None:
+            self._stop_export.set()
+            self._exporter.join()
+            self._exporter = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.disable()
+
+    def reset(self) -> None:
+        """Clear the counters."""
+        with self._lock:
+            self.functions.clear()
+            for direction in self.transfers:
+                self.transfers[direction] = TransferStats()
+
+    def _record_call(self, func, args, fast, fallback_reason, seconds):
+        if (name := _call_name(func, args)) is None:
+            return
+        with self._lock:
+            if (stats := self.functions.get(name)) is None:
+                stats = self.functions[name] = FunctionStats()
+            if fast:
+                stats.gpu_calls += 1
+                stats.gpu_seconds += seconds
+            else:
+                stats.cpu_calls += 1
+                stats.cpu_seconds += seconds
+                if fallback_reason is not None:
+                    stats.fallbacks[fallback_reason] = (
+                        stats.fallbacks.get(fallback_reason, 0) + 1
+                    )
+
+    def _record_transfer(self, direction, nbytes, seconds):
+        with self._lock:
+            stats = self.transfers[direction]
+            stats.count += 1
+            stats.nbytes += nbytes or 0
+            stats.seconds += seconds
+
+    def to_dict(self) -> dict:
+        """Return the counters as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "functions": {
+                    name: asdict(stats)
+                    for name, stats in self.functions.items()
+                },
+                "transfers": {
+                    direction: asdict(stats)
+                    for direction, stats in self.transfers.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        """Return the counters as JSON."""
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self) -> str:
+        """Return the counters in the Prometheus text exposition format."""
+        data = self.to_dict()
+        metrics = {
+            "cudf_pandas_calls_total": "Calls by function and device.",
+            "cudf_pandas_call_seconds_total": (
+                "Time spent in calls by function and device."
+            ),
+            "cudf_pandas_fallbacks_total": (
+                "CPU fallbacks by function and reason."
+            ),
+            "cudf_pandas_transfers_total": "Conversions by direction.",
+            "cudf_pandas_transfer_bytes_total": (
+                "Bytes converted by direction."
+            ),
+            "cudf_pandas_transfer_seconds_total": (
+                "Time spent converting by direction."
+            ),
+        }
+        samples: dict[str, list[str]] = {name: [] for name in metrics}
+        for name, stats in data["functions"].items():
+            function = f'function="{_escape_label(name)}"'
+            for device in ("gpu", "cpu"):
+                labels = f'{{{function},device="{device}"}}'
+                samples["cudf_pandas_calls_total"].append(
+                    f"{labels} {stats[f'{device}_calls']}"
+                )
+                samples["cudf_pandas_call_seconds_total"].append(
+                    f"{labels} {stats[f'{device}_seconds']}"
+                )
+            for reason, count in stats["fallbacks"].items():
+                samples["cudf_pandas_fallbacks_total"].append(
+                    f'{{{function},reason="{_escape_label(reason)}"}} {count}'
+                )
+        for direction, stats in data["transfers"].items():
+            labels = f'{{direction="{direction}"}}'
+            samples["cudf_pandas_transfers_total"].append(
+                f"{labels} {stats['count']}"
+            )
+            samples["cudf_pandas_transfer_bytes_total"].append(
+                f"{labels} {stats['nbytes']}"
+            )
+            samples["cudf_pandas_transfer_seconds_total"].append(
+                f"{labels} {stats['seconds']}"
+            )
+        lines = []
+        for name, help_text in metrics.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{sample}" for sample in samples[name])
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str | os.PathLike) -> None:
+        """
+        Write the counters to a file, replacing it atomically.
+
+        The counters are written in the Prometheus text format if the path
+        ends with ``.prom`` (as read by the node exporter's textfile
+        collector) and as JSON otherwise.
+        """
+        path = os.fspath(path)
+        text = (
+            self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        )
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def export_periodically(
+        self, path: str | os.PathLike, interval: float
+    ) -> None:
+        """
+        Export the counters every `interval` seconds from a background
+        thread until the profiler is disabled, see `export`.
+        """
+        if self._exporter is not None:
+            raise RuntimeError("The counters are already being exported")
+        self._stop_export = stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.export(path)
+            self.export(path)
+
+        self._exporter = threading.Thread(
+            target=run, name="cudf-pandas-profile-export", daemon=True
+        )
+        self._exporter.start()
+
+
+def _enable_counting_profiler_from_env() -> None:
+    """Enable a `CountingProfiler` if ``CUDF_PANDAS_PROFILE_EXPORT`` is set."""
+    if not (path := os.environ.get("CUDF_PANDAS_PROFILE_EXPORT")):
+        return
+    if fast_slow_proxy._counting_profiler is not None:
+        return
+    profiler = CountingProfiler()
+    profiler.enable()
+    profiler.export_periodically(
+        path, _env_get_int("CUDF_PANDAS_PROFILE_EXPORT_INTERVAL", 60)
+    )
+    atexit.register(profiler.disable)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import textwrap
+import warnings
 from functools import partial
 
 import numpy as np
@@ -1024,3 +1025,89 @@ def test_groupby_apply_preserves_inner_index_name():
     )
     assert expect.index.names == got.index.names
     assert_eq(expect, got)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda group: group.x.sum() / group.y.max(),
+        lambda group: group["x"].mean() - group["y"].min() * 2,
+        lambda group: (group.x * group.y).sum() + group.x.size,
+        lambda group: (group.x - group.x.mean()).abs().max(),
+        lambda group: group.y.cumsum().max() > group.x.count(),
+        lambda group: group.x.var() + group.y.nunique(),
+    ],
+)
+@pytest.mark.parametrize("sort", [True, False])
+def test_groupby_apply_vectorized(func, sort):
+    rng = np.random.default_rng(0)
+    pdf = pd.DataFrame(
+        {
+            "key": rng.integers(0, 150, 10_000),
+            "x": rng.integers(-10, 10, 10_000),
+            "y": rng.random(10_000),
+        }
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    expect = pdf.groupby("key", sort=sort).apply(func, include_groups=False)
+    # The loop warns past 100 groups, the vectorized engine does not run it.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        got = gdf.groupby("key", sort=sort).apply(
+            func, engine="vectorized", include_groups=False
+        )
+    assert_eq(expect, got)
+
+
+def test_groupby_apply_vectorized_series():
+    pdf = pd.DataFrame({"key": [1, 2, 1, 2, 3], "x": [1, 2, 3, 4, 5]})
+    gdf = cudf.from_pandas(pdf)
+
+    def func(x):
+        return x.sum() * x.max()
+
+    expect = pdf.groupby("key").x.apply(func)
+    got = gdf.groupby("key").x.apply(func, engine="vectorized")
+    assert_eq(expect, got)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda group: group.x.sum() if group.x.max() > 1 else 0,
+        lambda group: group.x.cumsum(),
+        lambda group: group.x.quantile(0.5),
+        lambda group: len(group) + group.x.sum(),
+        lambda group: group.z.sum(),
+    ],
+)
+def test_groupby_apply_vectorized_fallback(func):
+    pdf = pd.DataFrame(
+        {
+            "key": [1, 2, 1, 2, 3],
+            "x": [1, 2, 3, 4, 5],
+            "z": [1.0, None, 3.0, 4.0, 5.0],
+        }
+    )
+    gdf = cudf.from_pandas(pdf)
+
+    expect = pdf.groupby("key").apply(func, include_groups=False)
+    got = gdf.groupby("key").apply(
+        func, engine="vectorized", include_groups=False
+    )
+    assert_groupby_results_equal(expect, got)
+
+
+def test_groupby_apply_auto_calls_function_once_per_group():
+    # engine="auto" never traces, so a side-effecting function only sees
+    # the real groups
+    gdf = cudf.DataFrame({"key": [1, 2, 1, 2, 3], "x": [1, 2, 3, 4, 5]})
+    seen = []
+
+    def func(group):
+        seen.append(group.x.sum())
+        return group.x.sum()
+
+    gdf.groupby("key").apply(func, include_groups=False)
+    assert seen == [4, 6, 5]
@@ -2250,3 +2250,16 @@ def test_numpy_random_permutation_string(storage, na_value, box):
             data, dtype=xpd.StringDtype(storage=storage, na_value=na_value)
         ),
     )
+
+
+def test_dual_residency_index_name_mutation(monkeypatch):
+    monkeypatch.setenv("CUDF_PANDAS_DUAL_RESIDENCY", "1")
+    df = xpd.DataFrame({"a": [1, 2, 3]})
+    # A CPU call followed by a GPU call keeps a CPU copy of ``df``.
+    df._fsproxy_slow
+    df._fsproxy_fast
+    # Renaming the index through its own proxy modifies ``df``, so the
+    # kept CPU copy (with the old name) must not be reused.
+    df.index.name = "k"
+    assert df._fsproxy_slow.index.name == "k"
+    assert df.index.name == "k"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import json
 from functools import cache, partial
 from io import StringIO
 
@@ -11,6 +12,8 @@ import pytest
 
 import cudf.pandas.fast_slow_proxy
 from cudf.pandas.fast_slow_proxy import (
+    _attribute_manifest,
+    _class_dict,
     _fast_arg,
     _FastSlowAttribute,
     _FunctionProxy,
@@ -20,6 +23,7 @@ from cudf.pandas.fast_slow_proxy import (
     _Unusable,
     make_final_proxy_type,
     make_intermediate_proxy_type,
+    write_attribute_manifest,
 )
 
 
@@ -1086,3 +1090,301 @@ def test_setattr_fsproxy_no_mirror_monkeypatch_roundtrip(monkeypatch):
     monkeypatch.undo()
     assert Pxy.__dict__["existing"] is custom
     assert Slow.__dict__["existing"] is original_slow
+
+
+@pytest.fixture
+def dual_residency_proxy(monkeypatch):
+    monkeypatch.setenv("CUDF_PANDAS_DUAL_RESIDENCY", "1")
+    conversions = {"to_fast": 0, "to_slow": 0}
+
+    class Fast:
+        nbytes = 8
+
+        def __init__(self, x):
+            self.x = x
+
+        def method(self):
+            return "fast"
+
+        def slow_only(self):
+            raise NotImplementedError()
+
+        def update(self, x):
+            self.x = x
+
+    class Slow:
+        nbytes = 8
+
+        def __init__(self, x):
+            self.x = x
+
+        def method(self):
+            return "slow"
+
+        def slow_only(self):
+            return self.x
+
+        def update(self, x):
+            self.x = x
+
+    def to_fast(slow):
+        conversions["to_fast"] += 1
+        return Fast(slow.x)
+
+    def to_slow(fast):
+        conversions["to_slow"] += 1
+        return Slow(fast.x)
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=to_slow,
+        slow_to_fast=to_fast,
+    )
+    yield Pxy, conversions
+    cudf.pandas.fast_slow_proxy._dual_residency_cache.clear()
+
+
+def test_dual_residency_reuses_copies(dual_residency_proxy):
+    Pxy, conversions = dual_residency_proxy
+    pxy = Pxy(1)
+    for _ in range(3):
+        assert pxy.slow_only() == 1
+        assert pxy.method() == "fast"
+    assert conversions == {"to_fast": 0, "to_slow": 1}
+
+
+def test_dual_residency_mutation_invalidates_copy(dual_residency_proxy):
+    Pxy, conversions = dual_residency_proxy
+    pxy = Pxy(1)
+    assert pxy.slow_only() == 1
+    pxy.update(2)
+    assert pxy.slow_only() == 2
+    assert conversions == {"to_fast": 0, "to_slow": 2}
+
+
+def test_dual_residency_limit(dual_residency_proxy, monkeypatch):
+    monkeypatch.setenv("CUDF_PANDAS_DUAL_RESIDENCY_HOST_LIMIT", "4")
+    Pxy, conversions = dual_residency_proxy
+    pxy = Pxy(1)
+    for _ in range(3):
+        assert pxy.slow_only() == 1
+        assert pxy.method() == "fast"
+    # The slow copies are over the limit, the fast copies are kept.
+    assert conversions == {"to_fast": 0, "to_slow": 3}
+
+
+@pytest.fixture
+def fallback_proxy():
+    conversions = {"to_fast": 0}
+
+    class Fast:
+        def __init__(self, x):
+            self.x = x
+
+        def method(self, how):
+            if how == "unsupported":
+                raise NotImplementedError()
+            if how == "oom":
+                raise MemoryError()
+            return "fast"
+
+    class Slow:
+        def __init__(self, x):
+            self.x = x
+
+        def method(self, how):
+            return "slow"
+
+    def to_fast(slow):
+        conversions["to_fast"] += 1
+        return Fast(slow.x)
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(fast.x),
+        slow_to_fast=to_fast,
+    )
+    cache = cudf.pandas.fast_slow_proxy._fallback_cache
+    cache.clear()
+    yield Pxy._fsproxy_wrap(Slow(1), None), conversions
+    cache.clear()
+
+
+def test_fallback_cache(fallback_proxy):
+    pxy, conversions = fallback_proxy
+    cache = cudf.pandas.fast_slow_proxy._fallback_cache
+    for _ in range(3):
+        assert pxy.method("unsupported") == "slow"
+    assert conversions["to_fast"] == 1
+    assert cache.hits == 2
+    assert len(cache) == 1
+
+    # Other values of the arguments are tried on the fast path
+    assert pxy.method("supported") == "fast"
+    assert conversions["to_fast"] == 2
+
+    # Out of memory errors are not cached
+    for _ in range(2):
+        assert pxy.method("oom") == "slow"
+    assert conversions["to_fast"] == 3
+    assert len(cache) == 1
+
+
+def test_fallback_cache_reason(fallback_proxy):
+    from cudf.pandas import CountingProfiler
+
+    pxy, _ = fallback_proxy
+    with CountingProfiler() as profiler:
+        for _ in range(3):
+            assert pxy.method("unsupported") == "slow"
+    # Calls answered by the cache report the original failure
+    fallbacks = [
+        stats.fallbacks
+        for stats in profiler.functions.values()
+        if stats.fallbacks
+    ]
+    assert fallbacks == [{"NotImplementedError": 3}]
+
+
+def test_fallback_cache_disabled(fallback_proxy, monkeypatch):
+    monkeypatch.setenv("CUDF_PANDAS_FALLBACK_CACHE_SIZE", "0")
+    pxy, conversions = fallback_proxy
+    for _ in range(3):
+        assert pxy.method("unsupported") == "slow"
+    assert conversions["to_fast"] == 3
+    assert len(cudf.pandas.fast_slow_proxy._fallback_cache) == 0
+
+
+def test_fallback_cache_long_containers(monkeypatch):
+    class Fast:
+        def __init__(self, x):
+            if x == "unsupported":
+                raise NotImplementedError()
+            self.x = x
+
+    class Slow:
+        def __init__(self, x):
+            self.x = x
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(fast.x),
+        slow_to_fast=lambda slow: Fast(slow.x),
+    )
+    fast_slow_proxy = cudf.pandas.fast_slow_proxy
+    fast_slow_proxy._fallback_cache.clear()
+    # All constructors share a function key, so after this fallback the
+    # arguments of every constructor call are summarized.
+    Pxy("unsupported")
+    calls = 0
+    signature = fast_slow_proxy._signature
+
+    def counting_signature(arg):
+        nonlocal calls
+        calls += 1
+        return signature(arg)
+
+    monkeypatch.setattr(fast_slow_proxy, "_signature", counting_signature)
+    for n in (10, 100_000):
+        assert isinstance(Pxy(list(range(n)))._fsproxy_wrapped, Fast)
+    # Long lists are not walked element by element.
+    assert calls < 100
+    assert signature(list(range(10))) == signature(list(range(100_000)))
+    fast_slow_proxy._fallback_cache.clear()
+
+
+@pytest.fixture
+def lazy_types():
+    class Fast:
+        def __init__(self, x=0):
+            self.x = x
+
+        def method(self):
+            return "fast"
+
+    class Slow:
+        def __init__(self, x=0):
+            self.x = x
+
+        def method(self):
+            return "slow"
+
+        def __eq__(self, other):
+            return self.x == other.x
+
+    def make_proxy_type():
+        return make_final_proxy_type(
+            "Pxy",
+            Fast,
+            Slow,
+            fast_to_slow=lambda fast: Slow(fast.x),
+            slow_to_fast=lambda slow: Fast(slow.x),
+        )
+
+    return Slow, make_proxy_type
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda Pxy: Pxy(1),
+        lambda Pxy: Pxy._fsproxy_wrap(Pxy._fsproxy_slow_type(1), None),
+        lambda Pxy: Pxy.method,
+        lambda Pxy: dir(Pxy),
+        lambda Pxy: Pxy.__dict__,
+    ],
+    ids=["init", "wrap", "getattr", "dir", "dict"],
+)
+def test_proxy_type_attributes_installed_on_use(lazy_types, use):
+    _, make_proxy_type = lazy_types
+    Pxy = make_proxy_type()
+    # Special methods are installed eagerly
+    assert "__eq__" in _class_dict(Pxy)
+    assert "method" not in _class_dict(Pxy)
+    use(Pxy)
+    assert "method" in _class_dict(Pxy)
+    assert "method" in dir(Pxy)
+    assert Pxy(1).method() == "fast"
+
+
+def test_proxy_type_subclass_super(lazy_types):
+    _, make_proxy_type = lazy_types
+    Pxy = make_proxy_type()
+
+    class Sub(Pxy):
+        @classmethod
+        def parent_method(cls):
+            return super().method
+
+    assert Sub.parent_method() is Pxy.method
+
+
+def test_attribute_manifest(lazy_types, tmp_path, monkeypatch):
+    Slow, make_proxy_type = lazy_types
+    make_proxy_type()
+    path = tmp_path / "manifest.json"
+    write_attribute_manifest(path)
+    manifest = json.loads(path.read_text())
+    key = f"{Slow.__module__}.{Slow.__qualname__}"
+    assert manifest["types"][key] == dir(Slow)
+
+    manifest["types"][key] = ["from_manifest"]
+    path.write_text(json.dumps(manifest))
+    monkeypatch.setenv("CUDF_PANDAS_ATTRIBUTE_MANIFEST", str(path))
+    _attribute_manifest.cache_clear()
+    try:
+        assert dir(make_proxy_type()) == ["from_manifest"]
+
+        manifest["versions"]["pandas"] = "0.0.0"
+        path.write_text(json.dumps(manifest))
+        _attribute_manifest.cache_clear()
+        with pytest.warns(UserWarning, match="Ignoring the attribute"):
+            assert dir(make_proxy_type()) == dir(Slow)
+    finally:
+        _attribute_manifest.cache_clear()
@@ -1,12 +1,13 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
 import subprocess
 
 import pytest
 
-from cudf.pandas import LOADED, Profiler
+from cudf.pandas import LOADED, CountingProfiler, Profiler
 
 if not LOADED:
     raise ImportError("These tests must be run with cudf.pandas loaded")
@@ -119,3 +120,52 @@ def test_profiler_commandline():
         "CPU percall",
     ]:
         assert string in output
+
+
+def test_counting_profiler(tmp_path):
+    with CountingProfiler() as profiler:
+        df = pd.DataFrame({"idx": [0, 1, 0], "data": [1.0, 2.0, 3.0]})
+        df.groupby("idx").sum()
+        _ = pd.Timestamp(2020, 1, 1) + pd.Timedelta(1)
+    # Disabled profilers do not record
+    df.sum()
+
+    stats = profiler.functions
+    assert stats["DataFrame.groupby"].gpu_calls == 1
+    assert stats["GroupBy.sum"].gpu_calls == 1
+    assert "DataFrame.sum" not in stats
+    assert stats["Timestamp"].cpu_calls == 1
+    assert sum(stats["Timestamp"].fallbacks.values()) == 1
+
+    text = profiler.to_prometheus()
+    assert "# TYPE cudf_pandas_calls_total counter" in text
+    assert (
+        'cudf_pandas_calls_total{function="GroupBy.sum",device="gpu"} 1'
+        in text
+    )
+    assert json.loads(profiler.to_json()) == profiler.to_dict()
+
+    profiler.export(tmp_path / "profile.prom")
+    assert (tmp_path / "profile.prom").read_text() == text
+    profiler.reset()
+    assert profiler.functions == {}
+
+
+def test_counting_profiler_env(tmp_path):
+    data_directory = os.path.dirname(os.path.abspath(__file__))
+    path = tmp_path / "profile.json"
+    env = os.environ.copy()
+    env["CUDF_PANDAS_PROFILE_EXPORT"] = str(path)
+    sp_completed = subprocess.run(
+        [
+            "python",
+            "-m",
+            "cudf.pandas",
+            data_directory + "/data/profile_basic.py",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert sp_completed.returncode == 0
+    assert json.loads(path.read_text())["functions"]
@@ -140,6 +140,12 @@ class Agg(Expr):
             name == "merge_m2"
         ):  # pragma: no cover; doesn't have a direct polars equivalent
             req = plc.aggregation.merge_m2()
+        elif name == "tdigest":  # pragma: no cover; no direct polars equivalent
+            req = plc.aggregation.tdigest(options)
+        elif (
+            name == "merge_tdigest"
+        ):  # pragma: no cover; doesn't have a direct polars equivalent
+            req = plc.aggregation.merge_tdigest(options)
         elif name == "quantile":
             child, quantile = self.children
             if not isinstance(quantile, Literal):
@@ -212,6 +218,8 @@ class Agg(Expr):
             "std",
             "var",
             "quantile",
+            "tdigest",
+            "merge_tdigest",
         ]
     )
 
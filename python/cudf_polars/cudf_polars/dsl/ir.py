@@ -3274,13 +3274,13 @@ class MergeSorted(IR):
     """Key that is sorted."""
 
     def __init__(self, schema: Schema, key: str, left: IR, right: IR):
-        # Children must be Sort or Repartition(Sort).
-        # The Repartition(Sort) case happens during fallback.
-        left_sort_child = left if isinstance(left, Sort) else left.children[0]
-        right_sort_child = right if isinstance(right, Sort) else right.children[0]
-        assert isinstance(left_sort_child, Sort)
-        assert isinstance(right_sort_child, Sort)
-        assert left_sort_child.order == right_sort_child.order
+        # Children are sorted by the key, either by a Sort node or
+        # already (e.g. a scan of sorted data, which Polars requires to
+        # be in ascending order).
+        if len({c.order for c in (left, right) if isinstance(c, Sort)}) > 1:
+            raise NotImplementedError(
+                "merge_sorted of inputs sorted in different orders"
+            )
         assert len(left.schema.keys()) <= len(right.schema.keys())
         self.schema = schema
         self.key = key
@@ -7,17 +7,20 @@ from __future__ import annotations
 import concurrent.futures
 import contextlib
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypedDict, cast
 
 import pylibcudf as plc
 
 from cudf_polars.dsl.tracing import nvtx_annotate_cudf_polars
-from cudf_polars.dsl.traversal import traversal
-from cudf_polars.streaming.io import Scan, StreamingScan
+from cudf_polars.dsl.traversal import CachingVisitor, traversal
+from cudf_polars.streaming.io import FusedScan, Scan, SplitScan, StreamingScan
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, MutableMapping, Sequence
+
     from cudf_polars.dsl.ir import IR
-    from cudf_polars.streaming.base import StatsCollector
+    from cudf_polars.streaming.base import PartitionInfo, StatsCollector
+    from cudf_polars.typing import GenericTransformer
 
 
 @dataclass(frozen=True)
@@ -175,26 +178,86 @@ def prefetch_parquet_file_metadata_for_ir(
     return cached_parquet_info
 
 
+class _AttachState(TypedDict):
+    """State for attaching prefetched parquet metadata to scan nodes."""
+
+    cached_parquet_info_map: Mapping[str, CachedParquetInfo]
+
+
+def _cached_parquet_info(
+    paths: list[str], cached_parquet_info_map: Mapping[str, CachedParquetInfo]
+) -> list[CachedParquetInfo]:
+    cached = [cached_parquet_info_map[path] for path in paths]
+    Scan._validate_cached_parquet_info(paths, cached)
+    return cached
+
+
+def _attach(node: IR, rec: GenericTransformer[IR, IR, _AttachState]) -> IR:
+    """Copy a node, attaching prefetched metadata to its scans."""
+    if isinstance(node, StreamingScan):
+        info = rec.state["cached_parquet_info_map"]
+        scans: list[SplitScan] | list[FusedScan]
+        if node.scan_type == "split":
+            scans = [
+                SplitScan(
+                    scan.schema,
+                    scan.base_scan,
+                    scan.paths,
+                    scan.split_index,
+                    scan.total_splits,
+                    scan.parquet_options,
+                    _cached_parquet_info(scan.paths, info),
+                )
+                for scan in cast("Sequence[SplitScan]", node.scans)
+            ]
+        else:
+            scans = [
+                FusedScan(
+                    scan.schema,
+                    scan.base_scan,
+                    scan.paths,
+                    scan.parquet_options,
+                    _cached_parquet_info(scan.paths, info),
+                )
+                for scan in cast("Sequence[FusedScan]", node.scans)
+            ]
+        return StreamingScan(scans, node.base_scan, node.scan_type)
+    children = [rec(child) for child in node.children]
+    # Nodes compare equal regardless of their metadata, so compare by
+    # identity to rebuild every ancestor of a copied scan.
+    if all(new is old for new, old in zip(children, node.children, strict=True)):
+        return node
+    return node.reconstruct(children)
+
+
 def attach_cached_parquet_metadata(
     root: IR,
+    partition_info: MutableMapping[IR, PartitionInfo],
     cached_parquet_info_map: dict[str, CachedParquetInfo],
-) -> None:
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
     """
     Attach prefetched metadata to scan nodes.
 
-    This is an optimization only and does not affect IR identity.
+    This is an optimization only and does not affect IR identity. The
+    input graph is left unchanged, since it may be shared by repeated
+    queries (see :mod:`cudf_polars.engine.plan_cache`).
 
     Parameters
     ----------
     root
-        Root of the IR graph to update.
+        Root of the lowered IR graph.
+    partition_info
+        Partitioning information of the lowered IR graph.
     cached_parquet_info_map
         Mapping from file paths to cached parquet metadata.
+
+    Returns
+    -------
+    A copy of the graph with the metadata attached, and its partitioning
+    information.
     """
-    for node in traversal([root]):
-        if isinstance(node, StreamingScan):
-            for scan in node.scans:
-                cached = [cached_parquet_info_map[path] for path in scan.paths]
-                Scan._validate_cached_parquet_info(scan.paths, cached)
-                scan.cached_parquet_info = cached
-                scan._non_child_args = (*scan._non_child_args[:-1], cached)
+    mapper: GenericTransformer[IR, IR, _AttachState] = CachingVisitor(
+        _attach, state=_AttachState(cached_parquet_info_map=cached_parquet_info_map)
+    )
+    new_root = mapper(root)
+    return new_root, {mapper(node): info for node, info in partition_info.items()}
@@ -0,0 +1,375 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Admission control for queries submitted to a shared multi-GPU engine.
+
+A :class:`~cudf_polars.engine.ray.RayEngine` or
+:class:`~cudf_polars.engine.dask.DaskEngine` may serve queries submitted
+from many client threads (for example one per analyst session). Every
+engine owns a :class:`QueryScheduler` that decides, on the client, which
+waiting query runs next:
+
+1. Queries with a higher priority run first (see :func:`query_options`).
+2. Among queries of equal priority, the tenant that has used the engine
+   for the least execution time runs first, so one tenant's batch jobs
+   cannot monopolize the engine.
+3. Otherwise, queries run in submission order.
+
+If ``admission_budget`` is configured, every query is also charged its
+estimated peak memory (see :func:`estimate_query_bytes`), from the
+planner's datasource statistics. A query is only admitted while the
+estimates of the admitted queries fit within the budget, and a query that
+can never fit is rejected immediately instead of failing with an
+out-of-memory error after a long run. ``admission_max_concurrent`` bounds
+the number of queries admitted at the same time, and ``admission_timeout``
+bounds how long a query may wait in the queue before it is rejected.
+
+No more queries are admitted than the cluster can run at the same time
+(the scheduler's ``capacity``). The ranks of a Ray or Dask cluster run one
+query at a time, so an admitted query never queues behind another one
+outside of the scheduler, where its priority and tenant would be ignored.
+
+The ranks of a cluster execute collective operations in submission order,
+so admitted queries are dispatched to the ranks one at a time (see
+:meth:`QueryScheduler.dispatch`): two queries dispatched concurrently
+could otherwise reach the ranks in different orders and deadlock.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import contextvars
+import dataclasses
+import itertools
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from cudf_polars.dsl.ir import DataFrameScan, Scan
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.streaming.statistics import collect_statistics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.streaming.base import StatsCollector
+    from cudf_polars.utils.config import ConfigOptions, StreamingExecutor
+
+
+class QueryRejectedError(RuntimeError):
+    """A query was not admitted by a :class:`QueryScheduler`."""
+
+
+@dataclasses.dataclass(frozen=True)
+class QueryClass:
+    """The scheduling priority and tenant of a query."""
+
+    priority: int = 0
+    """Queries with a higher priority are admitted first."""
+    tenant: str = "default"
+    """Name of the user or workload the query is accounted to."""
+
+
+_query_class: contextvars.ContextVar[QueryClass | None] = contextvars.ContextVar(
+    "cudf_polars_query_class", default=None
+)
+
+
+@contextlib.contextmanager
+def query_options(*, priority: int = 0, tenant: str = "default") -> Iterator[None]:
+    """
+    Set the scheduling class of the queries collected in this context.
+
+    Parameters
+    ----------
+    priority
+        Queries with a higher priority are admitted first.
+    tenant
+        Name of the user or workload the queries are accounted to. Tenants
+        of equal priority share the engine fairly.
+
+    Examples
+    --------
+    >>> with query_options(priority=10, tenant="dashboard"):
+    ...     df = lf.collect(engine=engine)  # doctest: +SKIP
+    """
+    token = _query_class.set(QueryClass(priority=priority, tenant=tenant))
+    try:
+        yield
+    finally:
+        _query_class.reset(token)
+
+
+@dataclasses.dataclass
+class _Request:
+    """A query waiting for admission."""
+
+    query_class: QueryClass
+    nbytes: int
+    sequence: int
+
+
+class QueryScheduler:
+    """
+    Admit queries against a shared memory budget.
+
+    Parameters
+    ----------
+    nranks
+        Number of ranks of the engine's cluster.
+    capacity
+        Number of queries the cluster can run at the same time. At most
+        this many queries are admitted at once.
+    """
+
+    def __init__(self, *, nranks: int = 1, capacity: int = 1) -> None:
+        self.nranks = nranks
+        self.capacity = capacity
+        self._condition = threading.Condition()
+        self._dispatch_lock = threading.Lock()
+        self._waiting: list[_Request] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self._reserved = 0
+        # Execution time (in seconds) used by every tenant.
+        self._usage: defaultdict[str, float] = defaultdict(float)
+        self.admitted = 0
+        self.rejected = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of queries waiting for admission."""
+        with self._condition:
+            return len(self._waiting)
+
+    @property
+    def running(self) -> int:
+        """Number of admitted queries that are still running."""
+        with self._condition:
+            return self._running
+
+    def _next(self) -> _Request:
+        """Return the waiting query to admit next."""
+        return min(
+            self._waiting,
+            key=lambda request: (
+                -request.query_class.priority,
+                self._usage[request.query_class.tenant],
+                request.sequence,
+            ),
+        )
+
+    def _can_admit(
+        self, request: _Request, budget: int | None, max_concurrent: int
+    ) -> bool:
+        return (
+            self._next() is request
+            and self._running < max_concurrent
+            and (budget is None or self._reserved + request.nbytes <= budget)
+        )
+
+    @contextlib.contextmanager
+    def admit(
+        self,
+        nbytes: int,
+        *,
+        query_class: QueryClass | None = None,
+        budget: int | None = None,
+        max_concurrent: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[None]:
+        """
+        Wait until a query may run, and account for it while it runs.
+
+        Parameters
+        ----------
+        nbytes
+            Estimated peak memory of the query, in bytes.
+        query_class
+            Scheduling class of the query. Defaults to the class set by the
+            innermost :func:`query_options` context.
+        budget
+            Maximum total estimated memory of the running queries, in bytes.
+            ``None`` means unlimited.
+        max_concurrent
+            Maximum number of queries admitted at the same time. It never
+            exceeds ``capacity``, which ``None`` means.
+        timeout
+            Maximum number of seconds to wait for admission. ``None`` waits
+            indefinitely.
+
+        Raises
+        ------
+        QueryRejectedError
+            If the query can never fit within ``budget``, or is not admitted
+            within ``timeout`` seconds.
+        """
+        if budget is not None and nbytes > budget:
+            with self._condition:
+                self.rejected += 1
+            raise QueryRejectedError(
+                f"Query is estimated to need {nbytes} bytes, which exceeds "
+                f"the admission budget of {budget} bytes."
+            )
+        if max_concurrent is None or max_concurrent > self.capacity:
+            max_concurrent = self.capacity
+        request = _Request(
+            query_class or _query_class.get() or QueryClass(),
+            nbytes,
+            next(self._sequence),
+        )
+        with self._condition:
+            self._waiting.append(request)
+            admitted = self._condition.wait_for(
+                lambda: self._can_admit(request, budget, max_concurrent),
+                timeout=timeout,
+            )
+            self._waiting.remove(request)
+            if not admitted:
+                self.rejected += 1
+                # A different query may now be first in line.
+                self._condition.notify_all()
+                raise QueryRejectedError(
+                    f"Query was not admitted within {timeout} seconds "
+                    f"({self._running} running, {len(self._waiting)} waiting)."
+                )
+            self.admitted += 1
+            self._running += 1
+            self._reserved += nbytes
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._reserved -= nbytes
+                self._usage[request.query_class.tenant] += time.monotonic() - start
+                self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def dispatch(self) -> Iterator[None]:
+        """
+        Dispatch an admitted query to the ranks of the cluster.
+
+        Queries are dispatched one at a time, so every rank receives the
+        admitted queries in the same order.
+        """
+        with self._dispatch_lock:
+            yield
+
+
+def estimate_query_bytes(
+    ir: IR,
+    stats: StatsCollector,
+    config_options: ConfigOptions[StreamingExecutor],
+    *,
+    nranks: int = 1,
+) -> int:
+    """
+    Estimate the peak memory of a query.
+
+    A file scan streams its partitions, so it is charged the decoded size
+    of the partitions it reads at the same time: up to ``max_io_threads``
+    partitions of at most ``target_partition_size`` bytes on every rank
+    (but never more than the decoded size of the columns it scans). An
+    in-memory frame is charged its whole size.
+
+    Parameters
+    ----------
+    ir
+        Root of the pre-lowered IR graph.
+    stats
+        Datasource statistics of the graph.
+    config_options
+        GPUEngine configuration options.
+    nranks
+        Number of ranks of the cluster.
+
+    Returns
+    -------
+    The estimated number of bytes across all ranks.
+    """
+    executor = config_options.executor
+    in_flight = max(1, executor.max_io_threads) * nranks
+    nbytes = 0
+    for node in traversal([ir]):
+        if isinstance(node, Scan) and (source := stats.scan_stats.get(node)):
+            file_size = sum(
+                size
+                for column in node.schema
+                if (size := source.column_storage_size(column)) is not None
+            )
+            total = file_size * len(node.paths)
+            partition_size = min(total, executor.target_partition_size)
+            nbytes += min(total, partition_size * in_flight)
+        elif isinstance(node, DataFrameScan):
+            nbytes += int(pl.DataFrame._from_pydf(node.df).estimated_size())
+    return nbytes
+
+
+def admit_query(
+    ir: IR,
+    config_options: ConfigOptions[StreamingExecutor],
+    scheduler: QueryScheduler | None,
+) -> contextlib.AbstractContextManager[None]:
+    """
+    Return a context that runs a query once it is admitted by ``scheduler``.
+
+    Parameters
+    ----------
+    ir
+        Root of the pre-lowered IR graph.
+    config_options
+        GPUEngine configuration options, holding the admission budget,
+        concurrency and timeout.
+    scheduler
+        The engine's scheduler. If ``None``, the query runs immediately.
+
+    Returns
+    -------
+    A context manager; see :meth:`QueryScheduler.admit`.
+    """
+    if scheduler is None:
+        return contextlib.nullcontext()
+    executor = config_options.executor
+    nbytes = 0
+    if executor.admission_budget is not None:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=executor.max_io_threads
+        ) as pool:
+            stats = collect_statistics(ir, config_options, pool)
+        nbytes = estimate_query_bytes(
+            ir, stats, config_options, nranks=scheduler.nranks
+        )
+    return scheduler.admit(
+        nbytes,
+        budget=executor.admission_budget,
+        max_concurrent=executor.admission_max_concurrent,
+        timeout=executor.admission_timeout,
+    )
+
+
+def dispatch_query(
+    scheduler: QueryScheduler | None,
+) -> contextlib.AbstractContextManager[None]:
+    """
+    Return a context that dispatches an admitted query to the ranks.
+
+    Parameters
+    ----------
+    scheduler
+        The engine's scheduler. If ``None``, the query is dispatched
+        immediately.
+
+    Returns
+    -------
+    A context manager; see :meth:`QueryScheduler.dispatch`.
+    """
+    if scheduler is None:
+        return contextlib.nullcontext()
+    return scheduler.dispatch()
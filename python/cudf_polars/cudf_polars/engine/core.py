@@ -32,6 +32,7 @@ from cudf_polars.dsl.utils.io import (
     attach_cached_parquet_metadata,
     prefetch_parquet_file_metadata_for_ir,
 )
+from cudf_polars.engine.plan_cache import get_plan_cache
 from cudf_polars.quent._plan import build_plan
 from cudf_polars.streaming.actor_graph.collectives import ReserveOpIDs
 from cudf_polars.streaming.actor_graph.collectives.common import reserve_op_id
@@ -39,7 +40,7 @@ from cudf_polars.streaming.actor_graph.core import generate_network
 from cudf_polars.streaming.actor_graph.tracing import log_query_plan
 from cudf_polars.streaming.actor_graph.utils import empty_table_chunk
 from cudf_polars.streaming.base import StatsCollector
-from cudf_polars.streaming.parallel import lower_ir_graph_with_node_map
+from cudf_polars.streaming.profile import QueryProfile, record_profile
 from cudf_polars.streaming.statistics import collect_statistics
 from cudf_polars.streaming.utils import _concat
 from cudf_polars.utils.config import get_total_device_memory
@@ -700,10 +701,13 @@ def evaluate_on_rank(
     This is the main worker-side entry point for multi-rank execution.
     It performs the following steps collectively across all ranks:
 
-    1. Collect statistics (on rank 0 and allgather)
-    2. Lower the IR graph
-    3. Reserve collective operation IDs
-    4. Execute the lowered pipeline
+    1. Replace shared sub-plans by scans of their cached results (see
+       :mod:`cudf_polars.engine.result_cache`)
+    2. Collect statistics (on rank 0 and allgather)
+    3. Lower the IR graph (reusing the rank-local lowering of an
+       identical earlier query)
+    4. Reserve collective operation IDs
+    5. Execute the lowered pipeline
 
     Parameters
     ----------
@@ -732,9 +736,60 @@ def evaluate_on_rank(
     metadata
         Collected channel metadata.
     """
+    # Imported here: the result cache scans results like a persisted result,
+    # and the persisted-result module imports this one.
+    from cudf_polars.engine.result_cache import get_result_cache
+
+    subplan_options = dataclasses.replace(
+        config_options,
+        executor=dataclasses.replace(
+            config_options.executor, quent_context=None, profile_output=None
+        ),
+    )
+    result_cache = get_result_cache()
+    ir = result_cache.rewrite(
+        ctx,
+        comm,
+        ir,
+        config_options,
+        lambda subplan: _evaluate_plan_on_rank(
+            ctx,
+            comm,
+            py_executor,
+            subplan,
+            subplan_options,
+            local_quent_context=None,
+            query_id=uuid.uuid4(),
+        ),
+    )
+    try:
+        return _evaluate_plan_on_rank(
+            ctx,
+            comm,
+            py_executor,
+            ir,
+            config_options,
+            local_quent_context=local_quent_context,
+            query_id=query_id,
+        )
+    finally:
+        result_cache.evict(ctx, config_options.executor.result_cache_size)
+
+
+def _evaluate_plan_on_rank(
+    ctx: Context,
+    comm: Communicator,
+    py_executor: ThreadPoolExecutor,
+    ir: IR,
+    config_options: ConfigOptions[StreamingExecutor],
+    *,
+    local_quent_context: LocalQuentContext | None,
+    query_id: uuid.UUID,
+) -> tuple[DataFrame, list[ChannelMetadata]]:
+    """Lower and execute a plan on a single rank (see :func:`evaluate_on_rank`)."""
     stats = allgather_stats(comm, ctx.br(), ir, config_options, py_executor)
 
-    lowering, node_map = lower_ir_graph_with_node_map(
+    lowering, node_map = get_plan_cache().lower(
         ir, config_options, stats, rank=comm.rank, nranks=comm.nranks
     )
     optimized = lowering.optimized
@@ -784,10 +839,28 @@ def evaluate_on_rank(
             ir_context.py_executor,
             stats=stats,
         )
-        attach_cached_parquet_metadata(ir, cached_parquet_info_map)
+        ir, partition_info = attach_cached_parquet_metadata(
+            ir, partition_info, cached_parquet_info_map
+        )
+
+    if config_options.executor.profile_output is None:
+        with ReserveOpIDs(ir, config_options) as collective_id_map:
+            return execute_ir_on_rank(
+                ctx,
+                comm,
+                ir,
+                ir_context,
+                partition_info,
+                config_options,
+                stats,
+                collective_id_map,
+            )
 
-    with ReserveOpIDs(ir, config_options) as collective_id_map:
-        return execute_ir_on_rank(
+    with (
+        record_profile(query_id) as recorder,
+        ReserveOpIDs(ir, config_options) as collective_id_map,
+    ):
+        result = execute_ir_on_rank(
             ctx,
             comm,
             ir,
@@ -797,6 +870,23 @@ def evaluate_on_rank(
             stats,
             collective_id_map,
         )
+    if comm.nranks == 1:
+        ranks = [recorder.serialize()]
+    else:
+        with reserve_op_id() as op_id:
+            ranks = all_gather_host_data(comm, ctx.br(), op_id, recorder.serialize())
+    if comm.rank == 0:
+        QueryProfile.from_ranks(
+            ranks,
+            query_id=query_id,
+            optimized=optimized,
+            lowered=ir,
+            partition_info=partition_info,
+            node_map=node_map,
+            stats=stats,
+            config_options=config_options,
+        ).dump(config_options.executor.profile_output)
+    return result
 
 
 def is_duplicated_output(metadata: list[ChannelMetadata] | None) -> bool:
@@ -31,7 +31,13 @@ from rapidsmpf.streaming.core.context import Context
 import cudf_polars.quent
 import cudf_polars.quent._logging
 import cudf_polars.quent._types
-from cudf_polars.engine import persisted_result, rank_local_store
+from cudf_polars.engine import (
+    persisted_result,
+    plan_cache,
+    rank_local_store,
+    result_cache,
+)
+from cudf_polars.engine.admission import QueryScheduler, admit_query, dispatch_query
 from cudf_polars.engine.core import (
     ClusterInfo,
     StreamingEngine,
@@ -461,6 +467,10 @@ def _teardown_worker(
         # Drop this engine's persisted partitions before the Context is torn down,
         # so they don't outlive their allocator.
         rank_local_store.close_store(uid)
+        if mp_ctx.ctx is not None:
+            result_cache.clear_result_cache(mp_ctx.ctx)
+        # Drop the lowered plans, which may reference in-memory input data.
+        plan_cache.clear_plan_cache()
         if mp_ctx.py_executor is not None:
             mp_ctx.py_executor.shutdown(wait=True, cancel_futures=True)
         # Shut down the Context explicitly on the same thread that
@@ -513,6 +523,7 @@ def _reset_worker(
     # Drop this engine's persisted partitions before the Context is torn down, so they
     # don't outlive their allocator. This invalidates any live QueryResult from execute().
     rank_local_store.close_store(uid)
+    result_cache.clear_result_cache(mp_ctx.ctx)
     # Explicit shutdown is thread-affine. ``distributed.worker.run``
     # dispatches sync work onto the worker's event-loop thread, which is
     # the same thread that built the Context in ``_setup_worker``.
@@ -706,14 +717,20 @@ def evaluate_pipeline_dask_mode(
         quent_context._emit_query_events(quent_logger)
 
     worker_config = config_options.drop_unserializable()
-    result_map = dask_context.client.run(
-        functools.partial(_worker_evaluate, uid=dask_context.rapidsmpf_id),
-        ir,
-        worker_config,
-        collect_metadata=collect_metadata,
-        quent_context=quent_context,
-        query_id=query_id,
-    )
+    # ``Client.run`` blocks until every worker is done, so the query is
+    # dispatched for its whole run.
+    with (
+        admit_query(ir, config_options, dask_context.scheduler),
+        dispatch_query(dask_context.scheduler),
+    ):
+        result_map = dask_context.client.run(
+            functools.partial(_worker_evaluate, uid=dask_context.rapidsmpf_id),
+            ir,
+            worker_config,
+            collect_metadata=collect_metadata,
+            quent_context=quent_context,
+            query_id=query_id,
+        )
 
     ranked: list[tuple[int, pl.DataFrame]] = []
     metadata_collector: list[ChannelMetadata] = []
@@ -952,6 +969,10 @@ class DaskEngine(StreamingEngine):
             quent_logger=self._quent_logger,
             owned_client=owned_client,
             owned_cluster=owned_cluster,
+            # Admits the queries submitted from every client thread, and
+            # dispatches them so all workers run them in the same order.
+            # ``Client.run`` runs one query at a time.
+            scheduler=QueryScheduler(nranks=nranks, capacity=1),
         )
         self._dask_context: DaskContext | None = dask_ctx
         super().__init__(
@@ -257,6 +257,67 @@ class StreamingOptions:
         ``CUDF_POLARS__EXECUTOR__JOIN_FILTER_PUSHDOWN__*``.
         Default: enabled.
         Category: executor.
+    join_reorder
+        Whether to reorder chains of inner joins by estimated selectivity.
+        Env: ``CUDF_POLARS__EXECUTOR__JOIN_REORDER``.
+        Default: ``True``.
+        Category: executor.
+    plan_cache_size
+        Maximum number of lowered plans every rank keeps for reuse by
+        repeated queries. ``0`` disables the cache.
+        Env: ``CUDF_POLARS__EXECUTOR__PLAN_CACHE_SIZE``.
+        Default: ``32``.
+        Category: executor.
+    persist_spill_directory
+        Local directory for persisted result partitions spilled beyond
+        ``persist_host_limit``. ``None`` keeps them in host memory.
+        Env: ``CUDF_POLARS__EXECUTOR__PERSIST_SPILL_DIRECTORY``.
+        Default: ``None``.
+        Category: executor.
+    persist_host_limit
+        Maximum bytes of spilled persisted result partitions every rank keeps
+        in host memory.
+        Env: ``CUDF_POLARS__EXECUTOR__PERSIST_HOST_LIMIT``.
+        Default: 4 GiB.
+        Category: executor.
+    result_cache_size
+        Maximum bytes (across the cluster) of sub-plan results kept for reuse
+        by later queries that share the sub-plan. ``0`` disables the cache.
+        Env: ``CUDF_POLARS__EXECUTOR__RESULT_CACHE_SIZE``.
+        Default: ``0``.
+        Category: executor.
+    admission_budget
+        Maximum total estimated memory, in bytes across the cluster, of the
+        queries a Ray or Dask engine runs at the same time. ``None`` admits
+        queries without estimating their memory.
+        Env: ``CUDF_POLARS__EXECUTOR__ADMISSION_BUDGET``.
+        Default: ``None``.
+        Category: executor.
+    admission_max_concurrent
+        Maximum number of queries a Ray or Dask engine admits at the same
+        time. ``None`` admits one query at a time without an
+        ``admission_budget``, and otherwise as many as fit within the budget.
+        Env: ``CUDF_POLARS__EXECUTOR__ADMISSION_MAX_CONCURRENT``.
+        Default: ``None``.
+        Category: executor.
+    admission_timeout
+        Maximum number of seconds a query waits for admission before it is
+        rejected. ``None`` waits indefinitely.
+        Env: ``CUDF_POLARS__EXECUTOR__ADMISSION_TIMEOUT``.
+        Default: ``None``.
+        Category: executor.
+    profile_output
+        Path of a JSON file that rank 0 writes the profile of every query to.
+        ``None`` disables profiling.
+        Env: ``CUDF_POLARS__EXECUTOR__PROFILE_OUTPUT``.
+        Default: ``None``.
+        Category: executor.
+    profile_hints
+        Path of a profile whose observed row counts replace the planner's
+        estimates when the same query runs again.
+        Env: ``CUDF_POLARS__EXECUTOR__PROFILE_HINTS``.
+        Default: ``None``.
+        Category: executor.
     sink_to_directory
         Whether multi-partition sink operations should write to a directory
         rather than a single file. The ``spmd``/``ray``/``dask`` engines
@@ -264,6 +325,17 @@ class StreamingOptions:
         Env: ``CUDF_POLARS__EXECUTOR__SINK_TO_DIRECTORY``.
         Default: ``True`` (forced by the streaming engines).
         Category: executor.
+    quantile_mode
+        How multi-partition ``median``/``quantile`` aggregations are computed
+        (``"exact"``, ``"approximate"``).
+        Env: ``CUDF_POLARS__EXECUTOR__QUANTILE_MODE``.
+        Default: ``"exact"``.
+        Category: executor.
+    approx_quantile_max_centroids
+        Maximum number of t-digest centroids for approximate quantiles.
+        Env: ``CUDF_POLARS__EXECUTOR__APPROX_QUANTILE_MAX_CENTROIDS``.
+        Default: ``1000``.
+        Category: executor.
     quent_context
         Quent tracing context, or ``None`` to disable tracing.
         Env: ``CUDF_POLARS__EXECUTOR__QUENT_CONTEXT`` (``true``/``false``).
@@ -358,9 +430,45 @@ class StreamingOptions:
     join_filter_pushdown: (
         dict[str, Any] | JoinFilterPushdownOptions | None | Unspecified
     ) = _opt("executor")
+    join_reorder: bool | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__JOIN_REORDER", parse_boolean
+    )
+    plan_cache_size: int | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__PLAN_CACHE_SIZE", int
+    )
+    persist_spill_directory: str | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__PERSIST_SPILL_DIRECTORY"
+    )
+    persist_host_limit: int | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__PERSIST_HOST_LIMIT", int
+    )
+    result_cache_size: int | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__RESULT_CACHE_SIZE", int
+    )
+    admission_budget: int | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__ADMISSION_BUDGET", int
+    )
+    admission_max_concurrent: int | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__ADMISSION_MAX_CONCURRENT", int
+    )
+    admission_timeout: float | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__ADMISSION_TIMEOUT", float
+    )
+    profile_output: str | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__PROFILE_OUTPUT"
+    )
+    profile_hints: str | None | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__PROFILE_HINTS"
+    )
     sink_to_directory: bool | Unspecified = _opt(
         "executor", "CUDF_POLARS__EXECUTOR__SINK_TO_DIRECTORY", parse_boolean
     )
+    quantile_mode: str | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__QUANTILE_MODE"
+    )
+    approx_quantile_max_centroids: int | Unspecified = _opt(
+        "executor", "CUDF_POLARS__EXECUTOR__APPROX_QUANTILE_MAX_CENTROIDS", int
+    )
     quent_context: QuentContext | None | Unspecified = _opt(
         "executor",
     )
@@ -8,7 +8,9 @@ Developer notes
 The lifecycle of a persisted result spans three phases. Each rank keeps its own
 output partition GPU-resident in a process-local store keyed by
 ``(query_id, rank)`` (see :mod:`cudf_polars.engine.rank_local_store`), so nothing
-crosses the process boundary until the caller explicitly collects.
+crosses the process boundary until the caller explicitly collects. Under device
+memory pressure, the store spills partitions to host memory and, optionally, to
+local files; a spilled partition is read back when it is scanned.
 
 Execute (`engine.execute(lf)` -> :class:`PersistedQueryResult`):
 
@@ -87,8 +89,9 @@ def evaluate_and_persist(
 
     Runs the collective evaluation using this process's rapidsmpf context and
     puts the partition in this engine's store (``uid``) under
-    ``(query_id, comm.rank)``. Returns this rank's index (nothing crosses the
-    process boundary).
+    ``(query_id, comm.rank)``. The store may spill the partition under device
+    memory pressure (see :mod:`cudf_polars.engine.rank_local_store`). Returns
+    this rank's index (nothing crosses the process boundary).
 
     Parameters
     ----------
@@ -119,7 +122,12 @@ def evaluate_and_persist(
     )
     if deduplicate_replicated:
         gpu_df = drop_if_replicated(gpu_df, comm.rank, metadata)
-    rank_local_store.open_store(uid).put(
+    rank_local_store.open_store(
+        uid,
+        ctx.br(),
+        host_limit=config_options.executor.persist_host_limit,
+        spill_directory=config_options.executor.persist_spill_directory,
+    ).put(
         query_id,
         comm.rank,
         gpu_df,
@@ -176,7 +184,7 @@ class _PersistedLoader:
     def __reduce__(self) -> tuple:
         return (_PersistedLoader, (self._handle, None))
 
-    def __call__(self) -> DataFrame:
+    def __call__(self) -> DataFrame | pl.DataFrame:
         h = self._handle
         try:
             store = rank_local_store.require_store(h.uid)
@@ -204,6 +212,39 @@ class _PersistedLoader:
         return store.is_duplicated(h.query_id, h.rank)
 
 
+class StoredPartitionLoader:
+    """
+    Loader that reads a rank's partition from a store, keeping it stored.
+
+    Unlike the loader of a :class:`PersistedQueryResult`, the partition can be
+    scanned any number of times (see :meth:`~cudf_polars.engine.rank_local_store.RankLocalStore.get`).
+
+    Parameters
+    ----------
+    store
+        The store holding the partition.
+    query_id
+        Identifier of the query that produced the partition.
+    rank
+        Rank that owns the partition.
+    """
+
+    def __init__(
+        self, store: rank_local_store.RankLocalStore, query_id: uuid.UUID, rank: int
+    ) -> None:
+        self._store = store
+        self._query_id = query_id
+        self._rank = rank
+
+    def __call__(self) -> DataFrame | pl.DataFrame:
+        """Return this rank's partition."""
+        return self._store.get(self._query_id, self._rank)
+
+    def is_duplicated(self) -> bool:
+        """Whether this rank's partition is part of a duplicated output."""
+        return self._store.is_duplicated(self._query_id, self._rank)
+
+
 def _raising(exc: Exception) -> Iterator[pl.DataFrame | DataFrame]:
     """
     Return an iterator that re-raises ``exc`` when first advanced.
@@ -368,7 +409,7 @@ class PersistedSource(RankAwareSource):
         return any(
             loader.is_duplicated()
             for loader in loaders
-            if isinstance(loader, _PersistedLoader)
+            if isinstance(loader, (_PersistedLoader, StoredPartitionLoader))
         )
 
 
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Process-local cache of lowered query plans.
+
+Optimizing and lowering a query plan only depends on the pre-lowered IR,
+the configuration options, the datasource statistics and the rank layout.
+Repeated queries (for example benchmark iterations, or a dashboard
+re-running the same ``LazyFrame``) therefore reuse the lowering of an
+earlier run on the same rank.
+
+The serialized datasource statistics are part of the cache key. They are
+re-collected for every query, and the cached datasource information is
+validated against the size and modification time of every file, so a
+changed source file misses the cache. Queries scanning in-memory frames
+are never cached. Lowering is rank-local, so ranks need not agree on
+whether a query hits the cache.
+
+The cached lowered plans are shared by every query that hits the cache,
+so they must not be modified (see
+:func:`~cudf_polars.dsl.utils.io.attach_cached_parquet_metadata`).
+
+Like :mod:`cudf_polars.engine.rank_local_store`, the cache is a process
+global, because every engine backend lowers plans on its worker processes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from cudf_polars.dsl.ir import DataFrameScan
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.streaming.parallel import lower_ir_graph_with_node_map
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.streaming.base import StatsCollector
+    from cudf_polars.streaming.parallel import LoweringInfo
+    from cudf_polars.utils.config import ConfigOptions, StreamingExecutor
+
+
+class PlanCache:
+    """A least-recently-used cache of lowered plans."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[
+            Hashable, tuple[LoweringInfo, dict[str, list[str]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._entries)
+
+    def lower(
+        self,
+        ir: IR,
+        config_options: ConfigOptions[StreamingExecutor],
+        stats: StatsCollector,
+        *,
+        rank: int = 0,
+        nranks: int = 1,
+    ) -> tuple[LoweringInfo, dict[str, list[str]]]:
+        """
+        Lower an IR graph, reusing the lowering of an identical query.
+
+        Parameters
+        ----------
+        ir
+            Root of the graph to rewrite.
+        config_options
+            GPUEngine configuration options. The cache holds at most
+            ``config_options.executor.plan_cache_size`` plans, and is
+            bypassed if that is zero or the query scans an in-memory
+            frame.
+        stats
+            Pre-computed statistics collector.
+        rank
+            Rank of the current worker.
+        nranks
+            Total number of workers.
+
+        Returns
+        -------
+        The lowering information, and the mapping from physical to
+        logical stable IDs. See :func:`~cudf_polars.streaming.parallel.lower_ir_graph_with_node_map`.
+        """
+        max_size = config_options.executor.plan_cache_size
+        # An in-memory frame hashes by its identity, so its plans never hit,
+        # and a cached plan would keep the frame alive.
+        if max_size == 0 or any(
+            isinstance(node, DataFrameScan) for node in traversal([ir])
+        ):
+            return lower_ir_graph_with_node_map(
+                ir, config_options, stats, rank=rank, nranks=nranks
+            )
+        key = _cache_key(ir, config_options, stats, rank, nranks)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        entry = lower_ir_graph_with_node_map(
+            ir, config_options, stats, rank=rank, nranks=nranks
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached plans and reset the hit counters (idempotent)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _cache_key(
+    ir: IR,
+    config_options: ConfigOptions[StreamingExecutor],
+    stats: StatsCollector,
+    rank: int,
+    nranks: int,
+) -> Hashable:
+    """Return the key of the lowering of ``ir``."""
+    # Live cluster handles and the per-query tracing context don't affect
+    # the lowering, and would otherwise make every key unique.
+    executor = dataclasses.replace(
+        config_options.executor.drop_unserializable(), quent_context=None
+    )
+    fingerprint = hashlib.sha256(json.dumps(stats.serialize(ir)).encode()).hexdigest()
+    return (
+        ir,
+        dataclasses.replace(config_options, executor=executor),
+        fingerprint,
+        rank,
+        nranks,
+    )
+
+
+# The process-global cache shared by every engine on this process
+_cache = PlanCache()
+
+
+def get_plan_cache() -> PlanCache:
+    """Return the plan cache of the current process."""
+    return _cache
+
+
+def clear_plan_cache() -> None:
+    """Drop every cached plan on the current process (idempotent)."""
+    _cache.clear()
@@ -7,28 +7,130 @@ This module contains the one unavoidable process-global used by the
 persisted-result feature. It is needed because the IO source that loads a
 persisted partition runs deep within the Polars IR and has no access to the
 owning engine.
+
+Persisted partitions are stored in device memory, but a long-lived result
+must not starve running queries. A store opened with a buffer resource
+registers a spill function with its spill manager: under device memory
+pressure, the oldest device-resident partitions are copied to host memory.
+If a spill directory is configured, host-resident partitions beyond the
+store's host memory limit are then written to Arrow IPC files in that
+directory. A spilled partition is read back (as a host frame, which the
+scan moves to the device) only when it is scanned.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import polars as pl
+
+from cudf_polars.containers import DataFrame
+
 if TYPE_CHECKING:
-    import uuid
+    from collections.abc import Iterator
+
+    from rapidsmpf.memory.buffer_resource import BufferResource
+
+
+@dataclasses.dataclass(frozen=True)
+class RankLocalStoreStatistics:
+    """Memory use and spilling activity of a :class:`RankLocalStore`."""
+
+    device_bytes: int
+    """Bytes of the partitions resident in device memory."""
+    host_bytes: int
+    """Bytes of the partitions spilled to host memory."""
+    disk_bytes: int
+    """Bytes of the partitions spilled to local files."""
+    spilled_to_host: int
+    """Number of partitions spilled from device to host memory."""
+    spilled_to_disk: int
+    """Number of partitions spilled from host memory to local files."""
+    unspilled: int
+    """Number of spilled partitions read back by a scan."""
+
 
-    from cudf_polars.containers import DataFrame
+def _device_size(df: DataFrame) -> int:
+    """Return the device memory footprint of a partition."""
+    return sum(column.obj.device_buffer_size() for column in df.columns)
+
+
+class _Partition:
+    """A stored partition, in device memory, in host memory, or in a local file."""
+
+    __slots__ = ("duplicated", "frame", "nbytes", "path")
+
+    def __init__(self, frame: DataFrame, *, duplicated: bool) -> None:
+        self.frame: DataFrame | pl.DataFrame | None = frame
+        self.path: Path | None = None
+        self.duplicated = duplicated
+        # The size of a spilled partition, in host memory or on disk.
+        self.nbytes = 0
 
 
 class RankLocalStore:
-    """One engine's rank-local partitions on a process, keyed by ``query_id`` then rank."""
+    """
+    One engine's rank-local partitions on a process, keyed by ``query_id`` then rank.
+
+    Parameters
+    ----------
+    br
+        Buffer resource whose spill manager may spill the stored partitions
+        under device memory pressure. If ``None``, partitions are never
+        spilled.
+    host_limit
+        Maximum number of bytes of spilled partitions to keep in host memory
+        before writing them to ``spill_directory``.
+    spill_directory
+        Local directory (ideally on fast local storage) for partitions
+        spilled beyond ``host_limit``. If ``None``, spilled partitions
+        always stay in host memory.
+    """
 
-    def __init__(self) -> None:
-        # Nested ``query_id -> {rank -> (partition, duplicated)}``. Each entry
-        # keeps the partition and whether it is part of a duplicated output (an
-        # identical, complete copy held on every rank, e.g. a global sort/limit
-        # result). The flag must survive persistence so a re-scan can re-advertise
-        # it and downstream collectives don't double-count.
-        self._partitions: dict[uuid.UUID, dict[int, tuple[DataFrame, bool]]] = {}
+    def __init__(
+        self,
+        br: BufferResource | None = None,
+        *,
+        host_limit: int = 0,
+        spill_directory: str | None = None,
+    ) -> None:
+        # Nested ``query_id -> {rank -> partition}``. Each partition records
+        # whether it is part of a duplicated output (an identical, complete
+        # copy held on every rank, e.g. a global sort/limit result). The flag
+        # must survive persistence so a re-scan can re-advertise it and
+        # downstream collectives don't double-count.
+        self._partitions: dict[uuid.UUID, dict[int, _Partition]] = {}
+        self._host_limit = host_limit
+        self._spill_directory = spill_directory
+        self._spill_path: Path | None = None
+        # Re-entrant: copying a partition to the host may allocate device
+        # memory, and so re-enter the spill function.
+        self._lock = threading.RLock()
+        # Set while this store is spilling; a nested spill request frees
+        # nothing rather than spilling the partition being copied again.
+        self._spilling = False
+        self._spilled_to_host = 0
+        self._spilled_to_disk = 0
+        self._unspilled = 0
+        self._br = br
+        self._spill_func_id: int | None = None
+        if br is not None:
+            # Persisted partitions are colder than the buffers of running
+            # queries, so spill them first.
+            self._spill_func_id = br.spill_manager.add_spill_function(
+                self._spill, priority=1
+            )
+
+    def _iter_partitions(self) -> Iterator[_Partition]:
+        """Yield the stored partitions, oldest first."""
+        for ranks in list(self._partitions.values()):
+            yield from list(ranks.values())
 
     def put(
         self, query_id: uuid.UUID, rank: int, df: DataFrame, *, duplicated: bool
@@ -48,9 +150,12 @@ class RankLocalStore:
             Whether this partition is part of a duplicated output (an identical
             copy held on every rank).
         """
-        self._partitions.setdefault(query_id, {})[rank] = (df, duplicated)
+        with self._lock:
+            self._partitions.setdefault(query_id, {})[rank] = _Partition(
+                df, duplicated=duplicated
+            )
 
-    def pop(self, query_id: uuid.UUID, rank: int) -> DataFrame:
+    def pop(self, query_id: uuid.UUID, rank: int) -> DataFrame | pl.DataFrame:
         """
         Remove and return this rank's partition.
 
@@ -63,7 +168,8 @@ class RankLocalStore:
 
         Returns
         -------
-        This rank's partition for ``query_id``.
+        This rank's partition for ``query_id``: a GPU-resident frame, or a
+        host frame if the partition was spilled.
 
         Raises
         ------
@@ -71,17 +177,82 @@ class RankLocalStore:
             If the partition has already been read. A persisted result is
             consumed on read and cannot be scanned more than once yet.
         """
-        try:
-            df, _ = self._partitions[query_id].pop(rank)
-        except KeyError:
-            raise RuntimeError(
-                "A persisted query result is consumed on read and cannot be "
-                "scanned more than once (for example a self-join, or "
-                "collecting the same LazyFrame twice). Call engine.execute() "
-                "again for a fresh result. Re-scan support is tracked as "
-                "future work (see https://github.com/rapidsai/cudf/issues/23115)."
-            ) from None
-        return df
+        with self._lock:
+            try:
+                partition = self._partitions[query_id].pop(rank)
+            except KeyError:
+                raise RuntimeError(
+                    "A persisted query result is consumed on read and cannot be "
+                    "scanned more than once (for example a self-join, or "
+                    "collecting the same LazyFrame twice). Call engine.execute() "
+                    "again for a fresh result. Re-scan support is tracked as "
+                    "future work (see https://github.com/rapidsai/cudf/issues/23115)."
+                ) from None
+            if partition.path is not None:
+                partition.frame = pl.read_ipc(partition.path, memory_map=False)
+                partition.path.unlink(missing_ok=True)
+            if not isinstance(partition.frame, DataFrame):
+                self._unspilled += 1
+        assert partition.frame is not None
+        return partition.frame
+
+    def get(self, query_id: uuid.UUID, rank: int) -> DataFrame | pl.DataFrame:
+        """
+        Return this rank's partition, keeping it stored.
+
+        Unlike :meth:`pop`, the partition can be read any number of times. A
+        partition spilled to a local file stays spilled, and is read back for
+        every call.
+
+        Parameters
+        ----------
+        query_id
+            Identifier of the query the partition belongs to.
+        rank
+            This rank's index within the cluster.
+
+        Returns
+        -------
+        This rank's partition for ``query_id``: a GPU-resident frame, or a
+        host frame if the partition was spilled.
+
+        Raises
+        ------
+        KeyError
+            If the partition is absent.
+        """
+        with self._lock:
+            partition = self._partitions[query_id][rank]
+            if partition.path is not None:
+                self._unspilled += 1
+                return pl.read_ipc(partition.path, memory_map=False)
+            if not isinstance(partition.frame, DataFrame):
+                self._unspilled += 1
+            assert partition.frame is not None
+            return partition.frame
+
+    def nbytes(self, query_id: uuid.UUID, rank: int) -> int:
+        """
+        Return the size of this rank's partition, in its current memory tier.
+
+        Parameters
+        ----------
+        query_id
+            Identifier of the query the partition belongs to.
+        rank
+            This rank's index within the cluster.
+
+        Returns
+        -------
+        The number of bytes of the partition, or 0 if it is absent.
+        """
+        with self._lock:
+            partition = self._partitions.get(query_id, {}).get(rank)
+            if partition is None:
+                return 0
+            if isinstance(partition.frame, DataFrame):
+                return _device_size(partition.frame)
+            return partition.nbytes
 
     def is_duplicated(self, query_id: uuid.UUID, rank: int) -> bool:
         """
@@ -103,7 +274,96 @@ class RankLocalStore:
         ``True`` if the partition is an identical copy held on every rank.
         """
         entry = self._partitions.get(query_id, {}).get(rank)
-        return entry is not None and entry[1]
+        return entry is not None and entry.duplicated
+
+    def statistics(self) -> RankLocalStoreStatistics:
+        """
+        Return the memory use and spilling activity of this store.
+
+        Returns
+        -------
+        The bytes held in every memory tier, and the number of partitions
+        spilled and read back since the store was opened.
+        """
+        device_bytes = host_bytes = disk_bytes = 0
+        with self._lock:
+            for partition in self._iter_partitions():
+                if isinstance(partition.frame, DataFrame):
+                    device_bytes += _device_size(partition.frame)
+                elif partition.path is not None:
+                    disk_bytes += partition.nbytes
+                else:
+                    host_bytes += partition.nbytes
+            return RankLocalStoreStatistics(
+                device_bytes=device_bytes,
+                host_bytes=host_bytes,
+                disk_bytes=disk_bytes,
+                spilled_to_host=self._spilled_to_host,
+                spilled_to_disk=self._spilled_to_disk,
+                unspilled=self._unspilled,
+            )
+
+    def _spill(self, amount: int) -> int:
+        """
+        Spill device-resident partitions, oldest first.
+
+        Registered with the spill manager of the store's buffer resource.
+
+        Parameters
+        ----------
+        amount
+            Number of device bytes requested.
+
+        Returns
+        -------
+        Number of device bytes freed. A nested call, made while this store is
+        already spilling, frees nothing.
+        """
+        spilled = 0
+        with self._lock:
+            if self._spilling:
+                return 0
+            self._spilling = True
+            try:
+                for partition in self._iter_partitions():
+                    if spilled >= amount:
+                        break
+                    if isinstance(partition.frame, DataFrame):
+                        spilled += _device_size(partition.frame)
+                        partition.frame = partition.frame.to_polars()
+                        partition.nbytes = int(partition.frame.estimated_size())
+                        self._spilled_to_host += 1
+                self._spill_to_disk()
+            finally:
+                self._spilling = False
+        return spilled
+
+    def _spill_to_disk(self) -> None:
+        """Write host-resident partitions beyond the host limit to local files."""
+        if self._spill_directory is None:
+            return
+        host_bytes = sum(
+            partition.nbytes
+            for partition in self._iter_partitions()
+            if isinstance(partition.frame, pl.DataFrame)
+        )
+        for partition in self._iter_partitions():
+            if host_bytes <= self._host_limit:
+                break
+            if isinstance(partition.frame, pl.DataFrame):
+                if self._spill_path is None:
+                    self._spill_path = Path(
+                        tempfile.mkdtemp(
+                            prefix="cudf-polars-persisted-", dir=self._spill_directory
+                        )
+                    )
+                path = self._spill_path / f"{uuid.uuid4().hex}.arrow"
+                partition.frame.write_ipc(path)
+                host_bytes -= partition.nbytes
+                partition.frame = None
+                partition.path = path
+                partition.nbytes = path.stat().st_size
+                self._spilled_to_disk += 1
 
     def drop(self, query_id: uuid.UUID) -> None:
         """
@@ -114,20 +374,50 @@ class RankLocalStore:
         query_id
             Identifier of the query whose partitions are dropped.
         """
-        self._partitions.pop(query_id, None)
+        with self._lock:
+            for partition in self._partitions.pop(query_id, {}).values():
+                if partition.path is not None:
+                    partition.path.unlink(missing_ok=True)
 
     def clear(self) -> None:
         """Drop all partitions in this store (idempotent)."""
-        self._partitions.clear()
+        with self._lock:
+            self._partitions.clear()
+            if self._spill_path is not None:
+                shutil.rmtree(self._spill_path, ignore_errors=True)
+                self._spill_path = None
+
+    def close(self) -> None:
+        """Drop all partitions and stop spilling (idempotent)."""
+        self.clear()
+        if self._br is not None and self._spill_func_id is not None:
+            self._br.spill_manager.remove_spill_function(self._spill_func_id)
+            self._spill_func_id = None
 
 
 # The process-global set of per-engine stores, keyed by uid
 _stores: dict[str, RankLocalStore] = {}
 
 
-def open_store(uid: str) -> RankLocalStore:
-    """Return this engine's store on the current process, creating it if absent."""
-    return _stores.setdefault(uid, RankLocalStore())
+def open_store(
+    uid: str,
+    br: BufferResource | None = None,
+    *,
+    host_limit: int = 0,
+    spill_directory: str | None = None,
+) -> RankLocalStore:
+    """
+    Return this engine's store on the current process, creating it if absent.
+
+    The spilling parameters (see :class:`RankLocalStore`) only apply when
+    the store is created.
+    """
+    store = _stores.get(uid)
+    if store is None:
+        store = _stores[uid] = RankLocalStore(
+            br, host_limit=host_limit, spill_directory=spill_directory
+        )
+    return store
 
 
 def require_store(uid: str) -> RankLocalStore:
@@ -137,7 +427,9 @@ def require_store(uid: str) -> RankLocalStore:
 
 def close_store(uid: str) -> None:
     """Drop this engine's store on the current process (idempotent)."""
-    _stores.pop(uid, None)
+    store = _stores.pop(uid, None)
+    if store is not None:
+        store.close()
 
 
 def close_all() -> None:
@@ -147,7 +439,9 @@ def close_all() -> None:
     For a process dedicated to a single engine (a Ray actor), this is equivalent
     to :func:`close_store` for that engine but needs no uid.
     """
-    _stores.clear()
+    while _stores:
+        _, store = _stores.popitem()
+        store.close()
 
 
 def drop_query(uid: str, query_id: uuid.UUID) -> None:
@@ -27,7 +27,13 @@ from rapidsmpf.streaming.core.context import Context
 import cudf_polars.quent
 import cudf_polars.quent._logging
 import cudf_polars.quent._types
-from cudf_polars.engine import persisted_result, rank_local_store
+from cudf_polars.engine import (
+    persisted_result,
+    plan_cache,
+    rank_local_store,
+    result_cache,
+)
+from cudf_polars.engine.admission import QueryScheduler, admit_query, dispatch_query
 from cudf_polars.engine.core import (
     ClusterInfo,
     StreamingEngine,
@@ -168,20 +174,24 @@ def evaluate_pipeline_ray_mode(
     # Serialize the IR into the Ray object store so actors fetch by reference
     # instead of receiving N copies.
     ir_ref = ray.put(ir)
-    # ray.get() returns results in the same order as the input list of object refs,
-    # guaranteeing that result[i] corresponds to rank_actors[i] (rank order).
-    result = ray.get(
-        [
-            rank.evaluate_polars_ir.remote(
-                ir_ref,
-                actor_config_options,
-                collect_metadata=collect_metadata,
-                quent_context=config_options.executor.quent_context,
-                query_id=query_id,
-            )
-            for rank in rank_actors
-        ]
-    )
+    scheduler = config_options.executor.ray_context.scheduler
+    with admit_query(ir, config_options, scheduler):
+        # Every actor runs its tasks in submission order, so submitting the
+        # query to all of them at once keeps the ranks in step.
+        with dispatch_query(scheduler):
+            refs = [
+                rank.evaluate_polars_ir.remote(
+                    ir_ref,
+                    actor_config_options,
+                    collect_metadata=collect_metadata,
+                    quent_context=config_options.executor.quent_context,
+                    query_id=query_id,
+                )
+                for rank in rank_actors
+            ]
+        # ray.get() returns results in the same order as the input list of object refs,
+        # guaranteeing that result[i] corresponds to rank_actors[i] (rank order).
+        result = ray.get(refs)
     dfs: list[pl.DataFrame] = []
     metadata_collector: list[ChannelMetadata] = []
     for df, md in result:
@@ -360,8 +370,10 @@ class RankActor:
         # Collective: all ranks idle before any rank tears down its Context.
         if self._comm.nranks > 1:
             barrier(self._comm)
-        # Drop persisted partitions before tearing down the Context.
+        # Drop persisted partitions and cached results before tearing down
+        # the Context.
         rank_local_store.close_all()
+        result_cache.clear_result_cache(self._ctx)
         self._ctx.shutdown()
         self._ctx = None
         self._rapidsmpf_options = Options.deserialize(rapidsmpf_options_as_bytes)
@@ -404,7 +416,9 @@ class RankActor:
         try:
             # Drop persisted partitions before tearing down the Context.
             rank_local_store.close_all()
+            plan_cache.clear_plan_cache()
             if self._ctx is not None:
+                result_cache.clear_result_cache(self._ctx)
                 self._ctx.shutdown()
         finally:
             self._ctx = None
@@ -816,12 +830,18 @@ class RayEngine(StreamingEngine):
             )
 
             self._rank_actors: list[ActorHandle[RankActor]] | None = rank_actors
+            # Admits the queries submitted from every client thread, and
+            # dispatches them so all actors run them in the same order.
+            # A (synchronous) rank actor runs one query at a time.
+            self._scheduler = QueryScheduler(nranks=nranks, capacity=1)
             super().__init__(
                 nranks=nranks,
                 executor_options={
                     **executor_options,
                     "cluster": "ray",
-                    "ray_context": RayContext(rank_actors, self._quent_logger),
+                    "ray_context": RayContext(
+                        rank_actors, self._quent_logger, self._scheduler
+                    ),
                 },
                 engine_options=engine_options,
                 exit_stack=exit_stack,
@@ -880,7 +900,9 @@ class RayEngine(StreamingEngine):
             executor_options={
                 **executor_options,
                 "cluster": "ray",
-                "ray_context": RayContext(self._rank_actors, self._quent_logger),
+                "ray_context": RayContext(
+                    self._rank_actors, self._quent_logger, self._scheduler
+                ),
             },
             engine_options=engine_options,
             exit_stack=self._exit_stack,
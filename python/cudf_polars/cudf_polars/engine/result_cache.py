@@ -0,0 +1,368 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Process-local cache of sub-plan results shared by repeated queries.
+
+Many queries share an expensive sub-plan, for example the same filtered
+join of a fact table. Polars only deduplicates a sub-plan within a single
+query (see :class:`~cudf_polars.dsl.ir.Cache`), so every query recomputes
+it. Instead, each rank remembers the sub-plans rooted at a join or a
+group-by of the queries it runs. When a query contains a sub-plan that an
+earlier query also contained, the rank first evaluates the sub-plan and
+keeps its partition of the result in a
+:class:`~cudf_polars.engine.rank_local_store.RankLocalStore`, which spills
+it under device memory pressure like a persisted result. The sub-plan is
+then replaced by a scan of the stored result, in this and every later
+query that contains it.
+
+A sub-plan is identified by its IR (see
+:meth:`~cudf_polars.dsl.nodebase.Node.get_hashable`) together with the
+size and modification time of every file it scans, so a rewritten source
+file never reuses a stale result. Sub-plans that scan anything other than
+local files are never cached.
+
+The results are kept within ``result_cache_size`` bytes (across all
+ranks), evicting the least recently used results first. Every rank runs
+the same queries in the same order and exchanges the size of every
+result, so all ranks make the same caching decisions. This matters,
+because a rank that recomputes a sub-plan takes part in collective
+operations that a rank scanning the cached result would skip.
+
+Like :mod:`cudf_polars.engine.plan_cache`, the cache is a process global,
+because every engine backend evaluates queries on its worker processes.
+Several engines may share a process, so every result is owned by the
+engine (identified by its streaming context on this rank) and the rank
+layout that computed it, and is only reused by queries of the same engine.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from functools import reduce
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from cudf_polars.dsl.ir import DataFrameScan, GroupBy, Join, PythonScan, Scan
+from cudf_polars.dsl.traversal import CachingVisitor, reuse_if_unchanged, traversal
+from cudf_polars.engine.core import all_gather_host_data, is_duplicated_output
+from cudf_polars.engine.persisted_result import PersistedSource, StoredPartitionLoader
+from cudf_polars.engine.rank_local_store import RankLocalStore
+from cudf_polars.streaming.actor_graph.collectives.common import reserve_op_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+    from cudf_streaming.channel_metadata import ChannelMetadata
+    from rapidsmpf.communicator.communicator import Communicator
+    from rapidsmpf.streaming.core.context import Context
+
+    from cudf_polars.containers import DataFrame
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.typing import GenericTransformer
+    from cudf_polars.utils.config import ConfigOptions, StreamingExecutor
+
+
+# The number of sub-plans every engine remembers as candidates for caching
+_MAX_SEEN = 1024
+
+
+class _Entry:
+    """A cached sub-plan result."""
+
+    __slots__ = ("nbytes", "query_id", "scan")
+
+    def __init__(self, query_id: uuid.UUID, scan: PythonScan, nbytes: int) -> None:
+        self.query_id = query_id
+        # Reused by every query, so that the lowering of a query that scans
+        # the result can be reused too (see :mod:`cudf_polars.engine.plan_cache`).
+        self.scan = scan
+        self.nbytes = nbytes
+
+
+class _SpliceState(TypedDict):
+    """State for splicing cached results into a plan."""
+
+    scans: Mapping[IR, IR]
+
+
+def _splice(node: IR, rec: GenericTransformer[IR, IR, _SpliceState]) -> IR:
+    """Replace cached sub-plans by scans of their results."""
+    scan = rec.state["scans"].get(node)
+    return scan if scan is not None else reuse_if_unchanged(node, rec)
+
+
+def _file_versions(node: Scan) -> tuple[tuple[str, int, int], ...] | None:
+    """Return the path, size and modification time of every scanned file."""
+    versions = []
+    for path in node.paths:
+        try:
+            stat = Path(path).stat()
+        except (OSError, ValueError):
+            # A remote or otherwise unversioned source.
+            return None
+        versions.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(versions)
+
+
+def _candidate_keys(root: IR, rank: int, nranks: int) -> dict[IR, Hashable]:
+    """Return the cache key of every cacheable sub-plan of ``root``."""
+    versions: dict[IR, frozenset[tuple[str, int, int]] | None] = {}
+    keys: dict[IR, Hashable] = {}
+    for node in reversed(list(traversal([root]))):
+        if isinstance(node, Scan):
+            file_versions = _file_versions(node)
+            versions[node] = None if file_versions is None else frozenset(file_versions)
+        elif isinstance(node, (PythonScan, DataFrameScan)):
+            # The source of a Python scan (e.g. a persisted result) may
+            # produce different data every time it is scanned, and an
+            # in-memory frame is identified by the object holding it.
+            versions[node] = None
+        else:
+            versions[node] = reduce(
+                lambda a, b: None if a is None or b is None else a | b,
+                (versions[child] for child in node.children),
+                frozenset(),
+            )
+        if isinstance(node, (Join, GroupBy)) and versions[node] is not None:
+            keys[node] = (node, tuple(sorted(versions[node])), rank, nranks)
+    return keys
+
+
+class ResultCache:
+    """A least-recently-used cache of sub-plan results."""
+
+    def __init__(self) -> None:
+        # Cached results by owning engine, least recently used first.
+        self._entries: dict[int, OrderedDict[Hashable, _Entry]] = {}
+        # Hashes of the sub-plans of earlier queries by engine, most
+        # recently seen last. Only hashes are kept, so that the sub-plans
+        # (and any data they reference) are not kept alive.
+        self._seen: dict[int, OrderedDict[int, None]] = {}
+        self._stores: dict[int, RankLocalStore] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:  # noqa: D105
+        return sum(len(entries) for entries in self._entries.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached results, across all ranks."""
+        with self._lock:
+            return sum(
+                entry.nbytes
+                for entries in self._entries.values()
+                for entry in entries.values()
+            )
+
+    @staticmethod
+    def _plan(
+        root: IR,
+        keys: Mapping[IR, Hashable],
+        entries: Mapping[Hashable, _Entry],
+        seen: Mapping[int, None],
+    ) -> tuple[list[IR], list[IR]]:
+        """
+        Return the outermost sub-plans of ``root`` to scan from the cache.
+
+        Returns the sub-plans with a cached result, and the sub-plans
+        of earlier queries to evaluate and cache now.
+        """
+        hits: list[IR] = []
+        misses: list[IR] = []
+        visited: set[IR] = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            key = keys.get(node)
+            if key is not None and key in entries:
+                hits.append(node)
+            elif key is not None and hash(key) in seen:
+                misses.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return hits, misses
+
+    @staticmethod
+    def _remember(keys: Mapping[IR, Hashable], seen: OrderedDict[int, None]) -> None:
+        """Record the sub-plans of a query as candidates for caching."""
+        for key in keys.values():
+            seen[hash(key)] = None
+            seen.move_to_end(hash(key))
+        while len(seen) > _MAX_SEEN:
+            seen.popitem(last=False)
+
+    def _materialize(
+        self,
+        ctx: Context,
+        comm: Communicator,
+        node: IR,
+        config_options: ConfigOptions[StreamingExecutor],
+        evaluate: Callable[[IR], tuple[DataFrame, list[ChannelMetadata]]],
+    ) -> _Entry:
+        """Evaluate a sub-plan and store this rank's partition of its result."""
+        df, metadata = evaluate(node)
+        with self._lock:
+            store = self._stores.get(id(ctx))
+            if store is None:
+                store = self._stores[id(ctx)] = RankLocalStore(
+                    ctx.br(),
+                    host_limit=config_options.executor.persist_host_limit,
+                    spill_directory=config_options.executor.persist_spill_directory,
+                )
+        query_id = uuid.uuid4()
+        store.put(query_id, comm.rank, df, duplicated=is_duplicated_output(metadata))
+        nbytes = store.nbytes(query_id, comm.rank)
+        if comm.nranks > 1:
+            with reserve_op_id() as op_id:
+                sizes = all_gather_host_data(
+                    comm, ctx.br(), op_id, nbytes.to_bytes(8, "little")
+                )
+            nbytes = sum(int.from_bytes(size, "little") for size in sizes)
+        source = PersistedSource(
+            {comm.rank: StoredPartitionLoader(store, query_id, comm.rank)},
+            {name: dtype.polars_type for name, dtype in node.schema.items()},
+        )
+
+        def scan_fn(*args: object, **kwargs: object) -> object:
+            # Closes over ``source``, so the scan is found to be rank aware.
+            return source(*args, **kwargs)  # type: ignore[arg-type]
+
+        # The index keeps the scans of different results distinct.
+        options = (scan_fn, None, "io_plugin", -1 - self.misses)
+        return _Entry(query_id, PythonScan(node.schema, options, None), nbytes)
+
+    def rewrite(
+        self,
+        ctx: Context,
+        comm: Communicator,
+        ir: IR,
+        config_options: ConfigOptions[StreamingExecutor],
+        evaluate: Callable[[IR], tuple[DataFrame, list[ChannelMetadata]]],
+    ) -> IR:
+        """
+        Replace the shared sub-plans of a query by scans of their results.
+
+        This is a collective operation: every rank must call it with the
+        same query.
+
+        Parameters
+        ----------
+        ctx
+            The active RapidsMPF streaming context for this rank. Only the
+            results cached by queries run in this context are reused.
+        comm
+            The active RapidsMPF communicator for this rank.
+        ir
+            Root of the pre-lowered IR graph.
+        config_options
+            GPUEngine configuration options. The cache is bypassed if
+            ``config_options.executor.result_cache_size`` is zero.
+        evaluate
+            Function evaluating a sub-plan on this rank, and returning this
+            rank's partition of the result and the channel metadata.
+
+        Returns
+        -------
+        The rewritten graph.
+        """
+        if config_options.executor.result_cache_size == 0:
+            return ir
+        keys = _candidate_keys(ir, comm.rank, comm.nranks)
+        with self._lock:
+            entries = self._entries.setdefault(id(ctx), OrderedDict())
+            seen = self._seen.setdefault(id(ctx), OrderedDict())
+            hits, misses = self._plan(ir, keys, entries, seen)
+            self._remember(keys, seen)
+            for node in hits:
+                entries.move_to_end(keys[node])
+        for node in misses:
+            entry = self._materialize(ctx, comm, node, config_options, evaluate)
+            with self._lock:
+                entries[keys[node]] = entry
+                self.misses += 1
+        if not (hits or misses):
+            return ir
+        with self._lock:
+            self.hits += len(hits)
+            scans = {node: entries[keys[node]].scan for node in hits + misses}
+        mapper: GenericTransformer[IR, IR, _SpliceState] = CachingVisitor(
+            _splice, state=_SpliceState(scans=scans)
+        )
+        return mapper(ir)
+
+    def evict(self, ctx: Context, max_size: int) -> None:
+        """
+        Drop the least recently used results beyond a memory budget.
+
+        Parameters
+        ----------
+        ctx
+            The streaming context on this rank of the engine whose results
+            to evict.
+        max_size
+            Maximum total size of the engine's cached results, in bytes
+            across all ranks.
+        """
+        with self._lock:
+            entries = self._entries.get(id(ctx), OrderedDict())
+            store = self._stores.get(id(ctx))
+            nbytes = sum(entry.nbytes for entry in entries.values())
+            while entries and nbytes > max_size:
+                _, entry = entries.popitem(last=False)
+                nbytes -= entry.nbytes
+                if store is not None:
+                    store.drop(entry.query_id)
+
+    def clear(self, ctx: Context | None = None) -> None:
+        """
+        Drop cached results (idempotent).
+
+        Parameters
+        ----------
+        ctx
+            The streaming context on this rank of the engine whose results
+            to drop. If ``None``, drop the results of every engine and
+            reset the hit counters.
+        """
+        with self._lock:
+            owners = list(self._stores) if ctx is None else [id(ctx)]
+            for owner in owners:
+                self._entries.pop(owner, None)
+                self._seen.pop(owner, None)
+                store = self._stores.pop(owner, None)
+                if store is not None:
+                    store.close()
+            if ctx is None:
+                self._entries.clear()
+                self._seen.clear()
+                self.hits = 0
+                self.misses = 0
+
+
+# The process-global cache shared by every engine on this process
+_cache = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """Return the sub-plan result cache of the current process."""
+    return _cache
+
+
+def clear_result_cache(ctx: Context | None = None) -> None:
+    """
+    Drop cached sub-plan results on the current process (idempotent).
+
+    Parameters
+    ----------
+    ctx
+        The streaming context on this rank of the engine whose results to
+        drop. If ``None``, drop the results of every engine.
+    """
+    _cache.clear(ctx)
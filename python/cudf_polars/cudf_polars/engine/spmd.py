@@ -31,7 +31,12 @@ from rapidsmpf.streaming.core.context import Context
 import cudf_polars.quent
 import cudf_polars.quent._logging
 from cudf_polars.containers import DataFrame, DataType
-from cudf_polars.engine import persisted_result, rank_local_store
+from cudf_polars.engine import (
+    persisted_result,
+    plan_cache,
+    rank_local_store,
+    result_cache,
+)
 from cudf_polars.engine.core import (
     ClusterInfo,
     StreamingEngine,
@@ -608,8 +613,10 @@ class SPMDEngine(StreamingEngine):
         # Collective: synchronize all ranks before tearing down the Context.
         if self._comm.nranks > 1:
             barrier(self._comm)
-        # Free persisted partitions before the Context is torn down.
+        # Free persisted partitions and cached results before the Context is
+        # torn down.
         self._drop_persisted()
+        result_cache.clear_result_cache(self._ctx)
         # Same-thread shutdown, _reset runs on the thread that built the
         # Context (the test driver's main thread). The per-engine RMM
         # resource is kept alive across resets, see :meth:`_cleanup_ctx`.
@@ -788,6 +795,9 @@ class SPMDEngine(StreamingEngine):
 
         # Free persisted partitions before _cleanup_ctx tears down the Context.
         self._drop_persisted()
+        result_cache.clear_result_cache(self._ctx)
+        # Drop the lowered plans, which may reference in-memory input data.
+        plan_cache.clear_plan_cache()
 
         # Order matters: ``super().shutdown()`` closes ``self._exit_stack``,
         # which invokes ``self._cleanup_ctx``. That requires ``self._ctx`` to
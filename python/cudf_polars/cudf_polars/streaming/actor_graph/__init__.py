@@ -14,8 +14,12 @@ import cudf_polars.streaming.actor_graph.collectives.sort
 import cudf_polars.streaming.actor_graph.groupby
 import cudf_polars.streaming.actor_graph.io
 import cudf_polars.streaming.actor_graph.join
+import cudf_polars.streaming.actor_graph.map_function
+import cudf_polars.streaming.actor_graph.merge_sorted
 import cudf_polars.streaming.actor_graph.over
 import cudf_polars.streaming.actor_graph.repartition
+import cudf_polars.streaming.actor_graph.rolling
+import cudf_polars.streaming.actor_graph.slice
 import cudf_polars.streaming.actor_graph.union  # noqa: F401
 
 __all__: list[str] = []
@@ -10,7 +10,15 @@ from typing import TYPE_CHECKING, Literal
 
 from rapidsmpf.shuffler import Shuffler
 
-from cudf_polars.dsl.ir import Distinct, GroupBy, Sort
+from cudf_polars.dsl.ir import (
+    Distinct,
+    GroupBy,
+    MapFunction,
+    MergeSorted,
+    Rolling,
+    Slice,
+    Sort,
+)
 from cudf_polars.dsl.traversal import traversal
 from cudf_polars.streaming.io import StreamingSink
 from cudf_polars.streaming.join import Join
@@ -96,6 +104,8 @@ class ReserveOpIDs:
             Repartition,
             StreamingSink,
             Sort,
+            Rolling,
+            MergeSorted,
         )
         if self.dynamic_planning_enabled:
             collective_types = (
@@ -104,13 +114,21 @@ class ReserveOpIDs:
                 Repartition,
                 StreamingSink,
                 Sort,
+                Rolling,
+                MergeSorted,
                 GroupBy,
                 Distinct,
                 Over,
             )
 
+        # Slices with a non-zero offset and row indices gather the row
+        # counts of all ranks.
         self.collective_nodes: list[IR] = [
-            node for node in traversal([ir]) if isinstance(node, collective_types)
+            node
+            for node in traversal([ir])
+            if isinstance(node, collective_types)
+            or (isinstance(node, Slice) and node.offset != 0)
+            or (isinstance(node, MapFunction) and node.name == "row_index")
         ]
         self.collective_id_map: dict[IR, list[int]] = {}
 
@@ -138,13 +156,11 @@ class ReserveOpIDs:
                         _get_new_collective_id_unsafe(),
                     ]
                 elif isinstance(node, Join) and self.dynamic_planning_enabled:
-                    # Join needs 4 IDs: allgather, left shuffle, right shuffle,
-                    # and bloom filter.
+                    # Join needs 6 IDs: size allgather, heavy-hitter allgather,
+                    # heavy-hitter build allgather, bloom filter, left shuffle,
+                    # and right shuffle.
                     self.collective_id_map[node] = [
-                        _get_new_collective_id_unsafe(),
-                        _get_new_collective_id_unsafe(),
-                        _get_new_collective_id_unsafe(),
-                        _get_new_collective_id_unsafe(),
+                        _get_new_collective_id_unsafe() for _ in range(6)
                     ]
                 elif isinstance(node, Sort):
                     if self.dynamic_planning_enabled:
@@ -160,6 +176,13 @@ class ReserveOpIDs:
                             _get_new_collective_id_unsafe(),
                             _get_new_collective_id_unsafe(),
                         ]
+                elif isinstance(node, MergeSorted):
+                    # 3 IDs: boundary allgather, left shuffle, right shuffle
+                    self.collective_id_map[node] = [
+                        _get_new_collective_id_unsafe(),
+                        _get_new_collective_id_unsafe(),
+                        _get_new_collective_id_unsafe(),
+                    ]
                 elif isinstance(node, Over) and not node.is_scalar:
                     # Non-scalar Over needs 2 IDs: one for the size AllGather +
                     # forward shuffle (the AllGather completes before the forward
@@ -46,6 +46,7 @@ from cudf_polars.streaming.actor_graph.utils import (
 )
 from cudf_polars.streaming.groupby import combine, decompose
 from cudf_polars.streaming.repartition import Repartition
+from cudf_polars.utils.config import QuantileMode
 
 if TYPE_CHECKING:
     from rapidsmpf.communicator.communicator import Communicator
@@ -78,7 +79,13 @@ class DecomposedGroupBy:
     """The column indices to shuffle on."""
 
     @classmethod
-    def from_ir(cls, ir: GroupBy | Distinct) -> DecomposedGroupBy:
+    def from_ir(
+        cls,
+        ir: GroupBy | Distinct,
+        *,
+        quantile_mode: QuantileMode = QuantileMode.EXACT,
+        max_centroids: int = 1000,
+    ) -> DecomposedGroupBy:
         """Decompose a GroupBy IR node into multi-phase operations."""
         piecewise_ir: GroupBy | Distinct
         reduction_ir: GroupBy | Distinct
@@ -98,7 +105,13 @@ class DecomposedGroupBy:
             selection_exprs, piecewise_exprs, reduction_exprs, need_preshuffle = (
                 combine(
                     *(
-                        decompose(agg.name, agg.value, names=name_generator)
+                        decompose(
+                            agg.name,
+                            agg.value,
+                            names=name_generator,
+                            quantile_mode=quantile_mode,
+                            max_centroids=max_centroids,
+                        )
                         for agg in ir.agg_requests
                     )
                 )
@@ -626,6 +639,9 @@ async def groupby_actor(
     ch_in: Channel[TableChunk],
     target_partition_size: int,
     collective_ids: list[int],
+    *,
+    quantile_mode: QuantileMode = QuantileMode.EXACT,
+    max_centroids: int = 1000,
 ) -> None:
     """
     Dynamic GroupBy or Distinct actor that selects the best strategy at runtime.
@@ -653,6 +669,11 @@ async def groupby_actor(
         The target partition size.
     collective_ids
         The collective IDs.
+    quantile_mode
+        How to decompose median and quantile aggregations.
+    max_centroids
+        The maximum number of t-digest centroids for approximate
+        quantiles.
     """
     async with shutdown_on_error(
         context, ch_in, ch_out, trace_ir=ir, ir_context=ir_context
@@ -699,7 +720,9 @@ async def groupby_actor(
             )
             return
 
-        decomposed = DecomposedGroupBy.from_ir(ir)
+        decomposed = DecomposedGroupBy.from_ir(
+            ir, quantile_mode=quantile_mode, max_centroids=max_centroids
+        )
         assert not decomposed.need_preshuffle, "Should already be shuffled."
 
         aggregated, input_drained, chunks_received = await _local_aggregation(
@@ -789,6 +812,8 @@ def _(
             channels[ir.children[0]].reserve_output_slot(),
             config_options.executor.target_partition_size,
             collective_ids,
+            quantile_mode=config_options.executor.quantile_mode,
+            max_centroids=config_options.executor.approx_quantile_max_centroids,
         )
     ]
 
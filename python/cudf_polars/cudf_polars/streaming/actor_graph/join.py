@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import math
+from dataclasses import asdict, dataclass, replace
 from typing import TYPE_CHECKING, Any, Literal
 
 import pylibcudf as plc
@@ -12,6 +13,8 @@ from cudf_streaming.bloom_filter import BloomFilter
 from cudf_streaming.channel_metadata import (
     ChannelMetadata,
     HashScheme,
+    OrderKey,
+    OrderScheme,
     Partitioning,
 )
 from cudf_streaming.table_chunk import (
@@ -20,6 +23,7 @@ from cudf_streaming.table_chunk import (
 )
 from pylibcudf.hashing import LIBCUDF_DEFAULT_HASH_SEED
 from rapidsmpf.memory.memory_reservation import opaque_memory_usage
+from rapidsmpf.shuffler import PartitionAssignment
 from rapidsmpf.streaming.core.actor import define_actor
 from rapidsmpf.streaming.core.memory_reserve_or_wait import (
     reserve_memory,
@@ -32,7 +36,9 @@ from cudf_polars.dsl.utils.naming import names_to_indices
 from cudf_polars.streaming.actor_graph.collectives.allgather import (
     AllGatherManager,
 )
+from cudf_polars.streaming.actor_graph.collectives.ordering import adjust_ordering
 from cudf_polars.streaming.actor_graph.collectives.shuffle import (
+    ShuffleManager,
     _global_shuffle,
     _key_column_indices,
 )
@@ -62,14 +68,20 @@ from cudf_polars.streaming.actor_graph.utils import (
 )
 from cudf_polars.streaming.repartition import Repartition
 from cudf_polars.streaming.utils import _concat
+from cudf_polars.utils.cuda_stream import (
+    get_joined_cuda_stream,
+    stream_ordered_after,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine, Iterable, MutableMapping
 
     from cudf_streaming.bloom_filter import BloomFilterChunk
+    from cudf_streaming.channel_metadata import Ordering
     from rapidsmpf.communicator.communicator import Communicator
     from rapidsmpf.streaming.core.channel import Channel
     from rapidsmpf.streaming.core.context import Context
+    from rmm.pylibrmm.stream import Stream
 
     from cudf_polars.dsl.expr import NamedExpr
     from cudf_polars.dsl.ir import IR, IRExecutionContext
@@ -88,7 +100,7 @@ class JoinStrategy:
     right_meta: ChannelMetadata | None = None
     """Metadata from right channel"""
     broadcast_side: Literal["left", "right"] | None = None
-    """The side to broadcast. If None, the strategy is a shuffle join."""
+    """The side to broadcast. If None, the strategy is a shuffle or merge join."""
     shuffle_modulus: int = 0
     """The shuffle modulus. Only used for shuffle joins."""
     output_indices: tuple[int, ...] = ()
@@ -101,6 +113,29 @@ class JoinStrategy:
     """The key expressions for the left side. Only used for shuffle joins."""
     right_keys: tuple[NamedExpr, ...] = ()
     """The key expressions for the right side. Only used for shuffle joins."""
+    skew_side: Literal["left", "right"] | None = None
+    """
+    The probe side of a skew-aware shuffle join. Probe rows with a heavy-hitter
+    key are joined locally against the broadcast build rows for these keys.
+    If None, all rows are shuffled. Only used for shuffle joins.
+    """
+    hot_keys: DataFrame | None = None
+    """The heavy-hitter values of the shuffle keys. Only used for skew-aware joins."""
+    merge_orderings: tuple[Ordering, Ordering] | None = None
+    """
+    The common range partitioning of the left and right side on the join keys.
+    If None, the strategy is not a merge join.
+    """
+    left_ordering: Ordering | None = None
+    """
+    The input ordering of the left side, if its boundaries can be adjusted
+    in place of a shuffle. Only used for merge joins.
+    """
+    right_ordering: Ordering | None = None
+    """
+    The input ordering of the right side, if its boundaries can be adjusted
+    in place of a shuffle. Only used for merge joins.
+    """
 
 
 @dataclass(frozen=True)
@@ -528,12 +563,12 @@ async def _join_chunks(
     await ch_out.drain(context)
 
 
-def _log_shuffle_strategy_decision(
-    tracer: ActorTracer,
+def _shuffle_strategy_decision(
     strategy: JoinStrategy,
     partitioning_left: NormalizedPartitioning,
     partitioning_right: NormalizedPartitioning,
-) -> None:
+) -> Literal["chunkwise", "shuffle_left", "shuffle_right", "shuffle"]:
+    """Which sides of a shuffle join actually need to be shuffled."""
     left_scheme_desired = HashScheme(strategy.left_indices, strategy.shuffle_modulus)
     right_scheme_desired = HashScheme(strategy.right_indices, strategy.shuffle_modulus)
     left_partitioned = (
@@ -545,13 +580,13 @@ def _log_shuffle_strategy_decision(
         and partitioning_right.local_scheme == "inherit"
     )
     if left_partitioned and right_partitioned:
-        tracer.decision = "chunkwise"
+        return "chunkwise"
     elif left_partitioned:
-        tracer.decision = "shuffle_right"
+        return "shuffle_right"
     elif right_partitioned:
-        tracer.decision = "shuffle_left"
+        return "shuffle_left"
     else:
-        tracer.decision = "shuffle"
+        return "shuffle"
 
 
 async def passthrough_split(
@@ -984,6 +1019,430 @@ async def _shuffle_join(
         await gather_in_task_group(*actor_tasks)
 
 
+async def _split_hot_rows(
+    context: Context,
+    ir_context: IRExecutionContext,
+    ch_in: Channel[TableChunk],
+    ch_cold: Channel[TableChunk],
+    ch_hot: Channel[TableChunk],
+    key_indices: tuple[int, ...],
+    hot_keys: DataFrame,
+) -> None:
+    """
+    Split the rows of ch_in by whether their key is a heavy hitter.
+
+    Rows with a heavy-hitter key are sent to ch_hot (without metadata), all
+    other rows are sent to ch_cold (with the metadata of ch_in).
+    """
+    metadata = await recv_metadata(ch_in, context)
+    await send_metadata(ch_cold, context, metadata)
+    while (msg := await ch_in.recv(context)) is not None:
+        seq_num = msg.sequence_number
+        chunk = TableChunk.from_message(msg, br=context.br()).make_available_and_spill(
+            context.br(), allow_overbooking=True
+        )
+        stream = get_joined_cuda_stream(
+            ir_context.get_cuda_stream, upstreams=(chunk.stream, hot_keys.stream)
+        )
+        table = chunk.table_view()
+        keys = plc.Table([table.columns()[i] for i in key_indices])
+        hot, cold = (
+            plc.copying.gather(
+                table,
+                join_fn(keys, hot_keys.table, plc.types.NullEquality.EQUAL, stream),
+                plc.copying.OutOfBoundsPolicy.DONT_CHECK,
+                stream=stream,
+            )
+            for join_fn in (plc.join.left_semi_join, plc.join.left_anti_join)
+        )
+        del chunk, table, keys
+        if hot.num_rows() > 0:
+            await ch_hot.send(
+                context,
+                Message(
+                    seq_num,
+                    TableChunk.from_pylibcudf_table(
+                        hot, stream, exclusive_view=True, br=context.br()
+                    ),
+                ),
+            )
+        await ch_cold.send(
+            context,
+            Message(
+                seq_num,
+                TableChunk.from_pylibcudf_table(
+                    cold, stream, exclusive_view=True, br=context.br()
+                ),
+            ),
+        )
+        del hot, cold
+    await gather_in_task_group(ch_hot.drain(context), ch_cold.drain(context))
+
+
+async def _buffer_channel(
+    context: Context, ch_in: Channel[TableChunk], chunk_store: ChunkStore
+) -> None:
+    """Buffer all messages of ch_in (without metadata) in chunk_store."""
+    while (msg := await ch_in.recv(context)) is not None:
+        chunk_store.insert(msg)
+
+
+async def _skew_join(
+    context: Context,
+    comm: Communicator,
+    ir: Join,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_left: Channel[TableChunk],
+    ch_right: Channel[TableChunk],
+    strategy: JoinStrategy,
+    collective_ids: list[int],
+    *,
+    row_counts: tuple[int, int],
+    tracer: ActorTracer | None,
+    prefilter_threshold: float,
+    prefilter_max_key_columns: int | None,
+    prefilter_trace: bool,
+) -> None:
+    """
+    Execute a skew-aware shuffle join.
+
+    Probe rows with a heavy-hitter key stay on their rank, and are joined
+    against the (AllGathered) build rows for the heavy hitters. All other
+    rows are joined with a shuffle join. Pops one collective ID for the
+    build-side AllGather before the IDs of the shuffle join.
+    """
+    skew_side = strategy.skew_side
+    hot_keys = strategy.hot_keys
+    assert skew_side is not None
+    assert hot_keys is not None
+    left, right = ir.children
+    if skew_side == "left":
+        build_side: Literal["left", "right"] = "right"
+        probe_child, build_child = left, right
+        probe_meta, build_meta = strategy.left_meta, strategy.right_meta
+    else:
+        build_side = "left"
+        probe_child, build_child = right, left
+        probe_meta, build_meta = strategy.right_meta, strategy.left_meta
+    assert probe_meta is not None
+    assert build_meta is not None
+
+    # The heavy hitters are not hash partitioned.
+    await send_metadata(
+        ch_out,
+        context,
+        ChannelMetadata(
+            local_count=max(1, strategy.shuffle_modulus // comm.nranks)
+            + probe_meta.local_count,
+            partitioning=None,
+            duplicated=False,
+        ),
+    )
+    hot_build_id = collective_ids.pop(0)
+
+    ch_left_cold = context.create_channel()
+    ch_right_cold = context.create_channel()
+    ch_left_hot = context.create_channel()
+    ch_right_hot = context.create_channel()
+    ch_cold_out = context.create_channel()
+    ch_probe_hot, ch_build_hot = (
+        (ch_left_hot, ch_right_hot)
+        if skew_side == "left"
+        else (ch_right_hot, ch_left_hot)
+    )
+    hot_probe = ChunkStore(context)
+
+    async def forward_cold_output() -> None:
+        # The output chunks of the shuffle join were already traced.
+        await recv_metadata(ch_cold_out, context)
+        while (msg := await ch_cold_out.recv(context)) is not None:
+            await ch_out.send(context, msg)
+
+    async with shutdown_on_error(
+        context,
+        ch_left_cold,
+        ch_right_cold,
+        ch_left_hot,
+        ch_right_hot,
+        ch_cold_out,
+        trace_ir=ir,
+        ir_context=ir_context,
+    ):
+        *_, (build_dfs, build_size), _ = await gather_in_task_group(
+            _split_hot_rows(
+                context,
+                ir_context,
+                ch_left,
+                ch_left_cold,
+                ch_left_hot,
+                strategy.left_indices,
+                hot_keys,
+            ),
+            _split_hot_rows(
+                context,
+                ir_context,
+                ch_right,
+                ch_right_cold,
+                ch_right_hot,
+                strategy.right_indices,
+                hot_keys,
+            ),
+            _shuffle_join(
+                context,
+                comm,
+                ir,
+                ir_context,
+                ch_cold_out,
+                ch_left_cold,
+                ch_right_cold,
+                strategy,
+                collective_ids,
+                row_counts=row_counts,
+                tracer=tracer,
+                prefilter_threshold=prefilter_threshold,
+                prefilter_max_key_columns=prefilter_max_key_columns,
+                prefilter_trace=prefilter_trace,
+            ),
+            _buffer_channel(context, ch_probe_hot, hot_probe),
+            _collect_small_side_for_broadcast(
+                context,
+                comm,
+                ch_build_hot,
+                build_child,
+                need_allgather=comm.nranks > 1 and not build_meta.duplicated,
+                collective_id=hot_build_id,
+                ir_context=ir_context,
+                concat_size_limit=None,
+            ),
+            forward_cold_output(),
+        )
+
+    seq_num = strategy.shuffle_modulus
+    for msg in hot_probe:
+        await _broadcast_join_large_chunk(
+            context,
+            ir,
+            ir_context,
+            ch_out,
+            build_dfs,
+            build_child,
+            TableChunk.from_message(msg, br=context.br()).make_available_and_spill(
+                context.br(), allow_overbooking=True
+            ),
+            probe_child,
+            seq_num,
+            build_size,
+            build_side,
+            tracer=tracer,
+        )
+        seq_num += 1
+
+    await ch_out.drain(context)
+
+
+async def _range_partition(
+    context: Context,
+    comm: Communicator,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_in: Channel[TableChunk],
+    ordering: Ordering,
+    collective_id: int,
+) -> None:
+    """Range-partition an unordered side to the boundaries of ``ordering``."""
+    metadata_in = await recv_metadata(ch_in, context)
+    npartitions = ordering.num_boundaries + 1
+    await send_metadata(
+        ch_out,
+        context,
+        ChannelMetadata(local_count=max(1, npartitions // comm.nranks)),
+    )
+    # Duplicated inputs are only inserted by rank 0.
+    skip_insert = metadata_in.duplicated and comm.rank != 0
+    boundaries = ordering.get_boundaries(context.br())
+    shuffle = ShuffleManager(
+        context,
+        comm,
+        npartitions,
+        collective_id,
+        partition_assignment=PartitionAssignment.CONTIGUOUS,
+    )
+    async with shuffle.inserting() as inserter:
+        while (msg := await ch_in.recv(context)) is not None:
+            if skip_insert:
+                continue
+            chunk = TableChunk.from_message(
+                msg, br=context.br()
+            ).make_available_and_spill(context.br(), allow_overbooking=True)
+            with stream_ordered_after(
+                context.br().stream_pool.get_stream,
+                upstreams=(chunk.stream, boundaries.stream),
+            ) as stream:
+                # Rows equal to boundary ``i`` belong to partition ``i + 1``.
+                partition_map = plc.search.upper_bound(
+                    boundaries.table_view(),
+                    plc.Table(
+                        [
+                            chunk.table_view().columns()[key.column_index]
+                            for key in ordering.keys
+                        ]
+                    ),
+                    [key.order for key in ordering.keys],
+                    [key.null_order for key in ordering.keys],
+                    stream=stream,
+                )
+                partition_map_chunk = TableChunk.from_pylibcudf_table(
+                    plc.Table([partition_map]),
+                    stream,
+                    exclusive_view=True,
+                    br=context.br(),
+                )
+            inserter.insert_index(chunk, partition_map_chunk)
+            del chunk, partition_map_chunk
+
+    for partition_id in sorted(shuffle.local_partitions()):
+        stream = ir_context.get_cuda_stream()
+        await ch_out.send(
+            context,
+            Message(
+                partition_id,
+                TableChunk.from_pylibcudf_table(
+                    shuffle.extract_chunk(partition_id, stream),
+                    stream,
+                    exclusive_view=True,
+                    br=context.br(),
+                ),
+            ),
+        )
+    await ch_out.drain(context)
+
+
+async def _adjust_ordered_side(
+    context: Context,
+    comm: Communicator,
+    child: IR,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_in: Channel[TableChunk],
+    input_ordering: Ordering,
+    ordering: Ordering,
+    collective_id: int,
+) -> None:
+    """Move the range boundaries of an ordered side to those of ``ordering``."""
+    await recv_metadata(ch_in, context)
+    await send_metadata(
+        ch_out,
+        context,
+        ChannelMetadata(
+            local_count=max(1, (ordering.num_boundaries + 1) // comm.nranks)
+        ),
+    )
+    await adjust_ordering(
+        context,
+        comm,
+        child,
+        ir_context,
+        ch_out,
+        ch_in,
+        input_ordering,
+        ordering,
+        collective_id=collective_id,
+    )
+
+
+async def _merge_join(
+    context: Context,
+    comm: Communicator,
+    ir: Join,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_left: Channel[TableChunk],
+    ch_right: Channel[TableChunk],
+    strategy: JoinStrategy,
+    collective_ids: list[int],
+    *,
+    tracer: ActorTracer | None,
+) -> None:
+    """
+    Execute a merge join of range-partitioned inputs.
+
+    Both sides are brought to the same range boundaries on the join keys,
+    so that every key range is joined locally. An ordered side only has
+    its boundaries adjusted (a no-op when they already match), while an
+    unordered side is range-partitioned with a shuffle.
+    """
+    assert strategy.merge_orderings is not None
+    npartitions = strategy.merge_orderings[0].num_boundaries + 1
+    # The output of every partition is not sorted, so we don't advertise
+    # the range partitioning of the inputs.
+    await send_metadata(
+        ch_out,
+        context,
+        ChannelMetadata(
+            local_count=max(1, npartitions // comm.nranks),
+            partitioning=None,
+            duplicated=False,
+        ),
+    )
+    ch_left_ranged = context.create_channel()
+    ch_right_ranged = context.create_channel()
+    async with shutdown_on_error(
+        context,
+        ch_left_ranged,
+        ch_right_ranged,
+        trace_ir=ir,
+        ir_context=ir_context,
+    ):
+        actor_tasks: list[Coroutine[Any, Any, None]] = []
+        for child, ch_ranged, ch_in, input_ordering, ordering in zip(
+            ir.children,
+            (ch_left_ranged, ch_right_ranged),
+            (ch_left, ch_right),
+            (strategy.left_ordering, strategy.right_ordering),
+            strategy.merge_orderings,
+            strict=True,
+        ):
+            if input_ordering is None:
+                actor_tasks.append(
+                    _range_partition(
+                        context,
+                        comm,
+                        ir_context,
+                        ch_ranged,
+                        ch_in,
+                        ordering,
+                        collective_ids.pop(0),
+                    )
+                )
+            else:
+                actor_tasks.append(
+                    _adjust_ordered_side(
+                        context,
+                        comm,
+                        child,
+                        ir_context,
+                        ch_ranged,
+                        ch_in,
+                        input_ordering,
+                        ordering,
+                        collective_ids.pop(0),
+                    )
+                )
+        actor_tasks.append(
+            _join_chunks(
+                context,
+                ir,
+                ir_context,
+                ch_out,
+                ch_left_ranged,
+                ch_right_ranged,
+                tracer=tracer,
+            )
+        )
+        await gather_in_task_group(*actor_tasks)
+
+
 def _make_shuffle_strategy(
     ir: Join,
     shuffle_modulus: int,
@@ -1031,6 +1490,93 @@ def _make_shuffle_strategy(
     )
 
 
+def _range_ordering(partitioning: NormalizedPartitioning) -> Ordering | None:
+    """Return the Ordering of a side that is range partitioned on the join keys."""
+    scheme = partitioning.inter_rank_scheme
+    if partitioning and isinstance(scheme, OrderScheme):
+        return scheme.orderings[0]
+    return None
+
+
+def _make_merge_strategy(
+    ir: Join,
+    left_partitioning: NormalizedPartitioning,
+    right_partitioning: NormalizedPartitioning,
+    left_metadata: ChannelMetadata,
+    right_metadata: ChannelMetadata,
+    *,
+    prefer_right: bool,
+) -> JoinStrategy | None:
+    """
+    Make a merge strategy, if either side is range partitioned on the join keys.
+
+    The range boundaries of the preferred side are used if possible, so that
+    the other (smaller) side is repartitioned. Returns None if neither side
+    has usable boundaries.
+    """
+    if left_metadata.duplicated or right_metadata.duplicated:
+        return None
+    key_indices = (
+        names_to_indices(ir.left_on, ir.children[0].schema, concrete_prefix=True),
+        names_to_indices(ir.right_on, ir.children[1].schema, concrete_prefix=True),
+    )
+    orderings = (
+        _range_ordering(left_partitioning),
+        _range_ordering(right_partitioning),
+    )
+    for side in (1, 0) if prefer_right else (0, 1):
+        ordering = orderings[side]
+        other = 1 - side
+        if (
+            ordering is None
+            or not ordering.strict_boundaries
+            or len(ordering.keys) > len(key_indices[other])
+        ):
+            continue
+        n_keys = len(ordering.keys)
+        dtypes = [
+            [list(child.schema.values())[i] for i in indices[:n_keys]]
+            for child, indices in zip(ir.children, key_indices, strict=True)
+        ]
+        if dtypes[0] != dtypes[1]:
+            continue
+        targets = [ordering, ordering]
+        targets[other] = ordering.with_keys(
+            [
+                OrderKey(index, key.order, key.null_order)
+                for index, key in zip(key_indices[other], ordering.keys, strict=False)
+            ]
+        )
+        # An ordered side only needs its boundaries adjusted.
+        left_ordering, right_ordering = (
+            input_ordering
+            if input_ordering is not None
+            and input_ordering.keys[:n_keys] == target.keys
+            else None
+            for input_ordering, target in zip(orderings, targets, strict=True)
+        )
+        return JoinStrategy(
+            left_meta=left_metadata,
+            right_meta=right_metadata,
+            merge_orderings=(targets[0], targets[1]),
+            left_ordering=left_ordering,
+            right_ordering=right_ordering,
+        )
+    return None
+
+
+def _merge_strategy_decision(
+    strategy: JoinStrategy,
+) -> Literal["merge", "merge_shuffle_left", "merge_shuffle_right"]:
+    """Which side of a merge join needs to be range partitioned."""
+    if strategy.left_ordering is None:
+        return "merge_shuffle_left"
+    elif strategy.right_ordering is None:
+        return "merge_shuffle_right"
+    else:
+        return "merge"
+
+
 async def _aggregate_estimates(
     context: Context,
     comm: Communicator,
@@ -1074,22 +1620,260 @@ async def _aggregate_estimates(
     return new_left_sample, new_right_sample
 
 
+def _skew_probe_side(
+    ir: Join, left_rows: int, right_rows: int
+) -> Literal["left", "right"] | None:
+    """The side of a join whose heavy hitters may stay local, if any."""
+    # Every build row for a heavy hitter must be visible to the probe
+    # rows with that key, and the unmatched build rows are not emitted.
+    how = ir.options[0]
+    if how == "Inner":
+        return "left" if left_rows >= right_rows else "right"
+    elif how in ("Left", "Semi", "Anti"):
+        return "left"
+    elif how == "Right":
+        return "right"
+    return None
+
+
+def _local_heavy_hitters(
+    chunks: list[TableChunk],
+    key_indices: tuple[int, ...],
+    min_share: float,
+    scale: float,
+    stream: Stream,
+) -> plc.Table | None:
+    """
+    Find the frequent keys of the sampled chunks of one rank.
+
+    Parameters
+    ----------
+    chunks
+        The sampled chunks.
+    key_indices
+        The indices of the key columns.
+    min_share
+        The minimum share of the sampled rows of a frequent key.
+    scale
+        Factor to extrapolate a sampled row count to the rank.
+    stream
+        The stream to use, ordered after the streams of ``chunks``.
+
+    Returns
+    -------
+    The key columns of the frequent keys, followed by their estimated
+    (FLOAT64) row counts on this rank, or None if there are no samples.
+    """
+    if not chunks:
+        return None
+    keys = plc.concatenate.concatenate(
+        [
+            plc.Table([chunk.table_view().columns()[i] for i in key_indices])
+            for chunk in chunks
+        ],
+        stream=stream,
+    )
+    if (sampled_rows := keys.num_rows()) == 0:
+        return None
+    group_keys, (counts,) = plc.groupby.GroupBy(
+        keys, null_handling=plc.types.NullPolicy.INCLUDE
+    ).aggregate(
+        [
+            plc.groupby.GroupByRequest(
+                keys.columns()[0],
+                [plc.aggregation.count(plc.types.NullPolicy.INCLUDE)],
+            )
+        ],
+        stream=stream,
+    )
+    (count,) = counts.columns()
+    # A key that occurs only once in the sample is not a reliable estimate.
+    mask = plc.binaryop.binary_operation(
+        count,
+        plc.Scalar.from_py(
+            max(2, math.ceil(min_share * sampled_rows)), count.type(), stream=stream
+        ),
+        plc.binaryop.BinaryOperator.GREATER_EQUAL,
+        plc.DataType(plc.TypeId.BOOL8),
+        stream=stream,
+    )
+    estimated_rows = plc.binaryop.binary_operation(
+        count,
+        plc.Scalar.from_py(scale, plc.DataType(plc.TypeId.FLOAT64), stream=stream),
+        plc.binaryop.BinaryOperator.MUL,
+        plc.DataType(plc.TypeId.FLOAT64),
+        stream=stream,
+    )
+    return plc.stream_compaction.apply_boolean_mask(
+        plc.Table([*group_keys.columns(), estimated_rows]), mask, stream=stream
+    )
+
+
+async def _find_heavy_hitters(
+    context: Context,
+    comm: Communicator,
+    ir: Join,
+    ir_context: IRExecutionContext,
+    strategy: JoinStrategy,
+    probe_side: Literal["left", "right"],
+    probe_metadata: ChannelMetadata,
+    probe_sample: TableSizeStats,
+    executor: StreamingExecutor,
+    collective_ids: list[int],
+    *,
+    tracer: ActorTracer | None,
+) -> DataFrame | None:
+    """
+    Find the heavy-hitter keys of the probe side of a shuffle join.
+
+    A key is a heavy hitter if its estimated share of all probe rows is
+    at least ``join_skew_factor / shuffle_modulus``. Any such key has at
+    least that share of the sample of some rank, so every rank AllGathers
+    the keys that are frequent in its own sample (with their extrapolated
+    row counts), and the global estimates are summed over ranks.
+
+    Returns the heavy-hitter values of the probe-side shuffle keys, or None.
+    """
+    assert executor.dynamic_planning is not None
+    skew_factor = executor.dynamic_planning.join_skew_factor
+    min_share = skew_factor / strategy.shuffle_modulus
+    left, right = ir.children
+    left_dtypes = [list(left.schema.values())[i] for i in strategy.left_indices]
+    right_dtypes = [list(right.schema.values())[i] for i in strategy.right_indices]
+    if (
+        not 0 < min_share < 1
+        or probe_metadata.duplicated
+        or not (strategy.left_indices and strategy.right_indices)
+        or left_dtypes != right_dtypes
+    ):
+        return None
+
+    collective_id = collective_ids.pop(0)
+    key_indices, probe_child = (
+        (strategy.left_indices, left)
+        if probe_side == "left"
+        else (strategy.right_indices, right)
+    )
+    # Sampled messages are replayed after the strategy is chosen.
+    sampled: list[tuple[int, TableChunk]] = [
+        (
+            msg.sequence_number,
+            TableChunk.from_message(msg, br=context.br()).make_available_and_spill(
+                context.br(), allow_overbooking=True
+            ),
+        )
+        for msg in probe_sample.chunks
+    ]
+    stream = get_joined_cuda_stream(
+        ir_context.get_cuda_stream,
+        upstreams=[chunk.stream for _, chunk in sampled],
+    )
+    candidates = _local_heavy_hitters(
+        [chunk for _, chunk in sampled],
+        key_indices,
+        min_share,
+        probe_metadata.local_count / max(1, len(sampled)),
+        stream,
+    )
+    for seq_num, chunk in sampled:
+        probe_sample.chunks.insert(Message(seq_num, chunk))
+    del sampled
+
+    if comm.nranks > 1:
+        allgather = AllGatherManager(context, comm, collective_id)
+        with allgather.inserting() as inserter:
+            if candidates is not None:
+                inserter.insert(
+                    0,
+                    TableChunk.from_pylibcudf_table(
+                        candidates, stream, exclusive_view=True, br=context.br()
+                    ),
+                )
+        candidates = await allgather.extract_concatenated(
+            stream, ordered=False, ir_context=ir_context
+        )
+    if candidates is None or candidates.num_columns() == 0:
+        return None
+
+    n_keys = len(key_indices)
+    group_keys, (totals,) = plc.groupby.GroupBy(
+        plc.Table(candidates.columns()[:n_keys]),
+        null_handling=plc.types.NullPolicy.INCLUDE,
+    ).aggregate(
+        [
+            plc.groupby.GroupByRequest(
+                candidates.columns()[n_keys], [plc.aggregation.sum()]
+            )
+        ],
+        stream=stream,
+    )
+    (total,) = totals.columns()
+    hot_keys = plc.stream_compaction.apply_boolean_mask(
+        group_keys,
+        plc.binaryop.binary_operation(
+            total,
+            plc.Scalar.from_py(
+                min_share * probe_sample.total_rows, total.type(), stream=stream
+            ),
+            plc.binaryop.BinaryOperator.GREATER_EQUAL,
+            plc.DataType(plc.TypeId.BOOL8),
+            stream=stream,
+        ),
+        stream=stream,
+    )
+    if tracer is not None:
+        tracer.set_extra(
+            "join_skew",
+            {
+                "probe_side": probe_side,
+                "min_share": min_share,
+                "hot_key_count": hot_keys.num_rows(),
+            },
+        )
+    if hot_keys.num_rows() == 0:
+        return None
+    names = list(probe_child.schema.keys())
+    return DataFrame.from_table(
+        hot_keys,
+        [names[i] for i in key_indices],
+        [probe_child.schema[names[i]] for i in key_indices],
+        stream,
+    )
+
+
 async def _choose_strategy_from_samples(
+    context: Context,
     comm: Communicator,
     ir: Join,
+    ir_context: IRExecutionContext,
     left_metadata: ChannelMetadata,
     right_metadata: ChannelMetadata,
     left_partitioning: NormalizedPartitioning,
     right_partitioning: NormalizedPartitioning,
     executor: StreamingExecutor,
+    collective_ids: list[int],
     *,
     left_sample: TableSizeStats,
     right_sample: TableSizeStats,
     chunkwise: bool,
     tracer: ActorTracer | None,
 ) -> JoinStrategy:
-    """Choose potential broadcast side and minimum shuffle modulus."""
-    if chunkwise:
+    """Choose potential broadcast side, minimum shuffle modulus and hot keys."""
+    if chunkwise and isinstance(left_partitioning.inter_rank_scheme, OrderScheme):
+        # Both sides are range partitioned with the same boundaries
+        strategy = _make_merge_strategy(
+            ir,
+            left_partitioning,
+            right_partitioning,
+            left_metadata,
+            right_metadata,
+            prefer_right=False,
+        )
+        assert strategy is not None
+        if tracer is not None:
+            tracer.decision = _merge_strategy_decision(strategy)
+        return strategy
+    elif chunkwise:
         if tracer is not None:
             tracer.decision = "chunkwise"
         # TODO: Ensure this emits a "dynamic planning" decision of "chunkwise"
@@ -1168,6 +1952,26 @@ async def _choose_strategy_from_samples(
         ) // MAX_ROWS_PER_PARTITION
         min_shuffle_modulus = max(min_shuffle_modulus, min_partitions_for_row_limit)
 
+    # Prefer a merge join if either side is already range partitioned
+    # on the join keys into enough partitions.
+    merge_strategy = _make_merge_strategy(
+        ir,
+        left_partitioning,
+        right_partitioning,
+        left_metadata,
+        right_metadata,
+        prefer_right=right_total_rows > left_total_rows,
+    )
+    if (
+        merge_strategy is not None
+        and merge_strategy.merge_orderings is not None
+        and merge_strategy.merge_orderings[0].num_boundaries + 1
+        >= max(1, min_shuffle_modulus)
+    ):
+        if tracer is not None:
+            tracer.decision = _merge_strategy_decision(merge_strategy)
+        return merge_strategy
+
     shuffle_modulus = _choose_shuffle_modulus(
         comm,
         left_partitioning,
@@ -1184,13 +1988,33 @@ async def _choose_strategy_from_samples(
         right_metadata,
     )
 
-    if tracer is not None:
-        _log_shuffle_strategy_decision(
-            tracer,
+    decision: str = _shuffle_strategy_decision(
+        strategy, left_partitioning, right_partitioning
+    )
+    if decision == "shuffle" and (
+        skew_side := _skew_probe_side(ir, left_total_rows, right_total_rows)
+    ):
+        # Neither side is partitioned yet, so a single heavy key would
+        # send a large share of the probe side to a single partition.
+        hot_keys = await _find_heavy_hitters(
+            context,
+            comm,
+            ir,
+            ir_context,
             strategy,
-            left_partitioning,
-            right_partitioning,
+            skew_side,
+            left_metadata if skew_side == "left" else right_metadata,
+            left_sample if skew_side == "left" else right_sample,
+            executor,
+            collective_ids,
+            tracer=tracer,
         )
+        if hot_keys is not None:
+            strategy = replace(strategy, skew_side=skew_side, hot_keys=hot_keys)
+            decision = f"shuffle_skew_{skew_side}"
+
+    if tracer is not None:
+        tracer.decision = decision
     return strategy
 
 
@@ -1225,6 +2049,7 @@ async def _choose_strategy(
     context: Context,
     comm: Communicator,
     ir: Join,
+    ir_context: IRExecutionContext,
     ch_left: Channel[TableChunk],
     ch_right: Channel[TableChunk],
     left_metadata: ChannelMetadata,
@@ -1234,7 +2059,7 @@ async def _choose_strategy(
     *,
     tracer: ActorTracer | None,
 ) -> tuple[TableSizeStats, TableSizeStats, JoinStrategy]:
-    """Sample both sides, aggregate estimates, and choose broadcast vs shuffle."""
+    """Sample both sides, aggregate estimates, and choose a join strategy."""
     nranks = comm.nranks
     left_partitioning = NormalizedPartitioning.from_keys(
         left_metadata.partitioning,
@@ -1250,10 +2075,23 @@ async def _choose_strategy(
     hash_chunkwise = isinstance(
         left_partitioning.inter_rank_scheme, HashScheme
     ) and isinstance(right_partitioning.inter_rank_scheme, HashScheme)
-    if hash_chunkwise and left_partitioning.is_aligned_with(
+    order_chunkwise = (
+        isinstance(left_partitioning.inter_rank_scheme, OrderScheme)
+        and isinstance(right_partitioning.inter_rank_scheme, OrderScheme)
+        and _make_merge_strategy(
+            ir,
+            left_partitioning,
+            right_partitioning,
+            left_metadata,
+            right_metadata,
+            prefer_right=False,
+        )
+        is not None
+    )
+    if (hash_chunkwise or order_chunkwise) and left_partitioning.is_aligned_with(
         right_partitioning, context.br()
     ):
-        # We can use a chunkwise join
+        # We can use a chunkwise (or merge) join
         chunkwise = True
         left_sample = TableSizeStats(
             chunks=ChunkStore(context),
@@ -1294,13 +2132,16 @@ async def _choose_strategy(
         )
 
     strategy = await _choose_strategy_from_samples(
+        context,
         comm,
         ir,
+        ir_context,
         left_metadata,
         right_metadata,
         left_partitioning,
         right_partitioning,
         executor,
+        collective_ids,
         left_sample=left_sample,
         right_sample=right_sample,
         chunkwise=chunkwise,
@@ -1325,8 +2166,8 @@ async def join_actor(
     """
     Dynamic Join actor that selects the best strategy at runtime.
 
-    Receives metadata from the left and right channels, then either
-    executes a shuffle join or a broadcast join. Strategy is chosen
+    Receives metadata from the left and right channels, then executes
+    a shuffle join, a broadcast join or a merge join. Strategy is chosen
     at runtime from sampled chunks when partitioning is not aligned.
 
     Parameters
@@ -1367,6 +2208,7 @@ async def join_actor(
             context,
             comm,
             ir,
+            ir_context,
             ch_left,
             ch_right,
             left_metadata,
@@ -1421,6 +2263,21 @@ async def join_actor(
                         tracer=tracer,
                     )
                 )
+            elif strategy.merge_orderings is not None:
+                actor_tasks.append(
+                    _merge_join(
+                        context,
+                        comm,
+                        ir,
+                        ir_context,
+                        ch_out,
+                        ch_left,
+                        ch_right,
+                        strategy,
+                        collective_ids,
+                        tracer=tracer,
+                    )
+                )
             else:
                 dynamic_options = executor.dynamic_planning
                 prefilter_threshold = (
@@ -1438,8 +2295,9 @@ async def join_actor(
                     if dynamic_options is not None
                     else False
                 )
+                join = _shuffle_join if strategy.skew_side is None else _skew_join
                 actor_tasks.append(
-                    _shuffle_join(
+                    join(
                         context,
                         comm,
                         ir,
@@ -1536,12 +2394,14 @@ def _(
     ):
         # Dynamic join - decide strategy at runtime
         collective_ids = list(rec.state["collective_id_map"].get(ir, []))
-        # Join uses up to 4 collective IDs: allgather, left shuffle, right
-        # shuffle, and bloom filter.
-        if len(collective_ids) < 4:
+        # Join uses up to 6 collective IDs: size allgather, heavy-hitter
+        # allgather, heavy-hitter build allgather, bloom filter, left shuffle,
+        # and right shuffle.
+        if len(collective_ids) < 6:
             raise ValueError(
-                "Dynamic join requires 4 reserved collective IDs "
-                "(allgather + left shuffle + right shuffle + bloom filter); got "
+                "Dynamic join requires 6 reserved collective IDs "
+                "(2 x allgather + heavy-hitter broadcast + bloom filter + "
+                "left shuffle + right shuffle); got "
                 f"{len(collective_ids)} for this Join. "
                 "Ensure ReserveOpIDs is run with dynamic_planning enabled."
             )
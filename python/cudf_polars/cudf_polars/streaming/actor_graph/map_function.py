@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+MapFunction logic for the RapidsMPF streaming runtime.
+
+Most map functions are applied partition-wise. A ``row_index`` needs the
+global row offset of every partition: partitions arrive in global row
+order (by sequence number within a rank, and by rank across ranks), so
+each rank buffers its (spillable) input chunks and AllGathers its local
+row count. The prefix sum of these counts gives the offset of every
+local chunk.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from cudf_streaming.channel_metadata import ChannelMetadata
+from cudf_streaming.table_chunk import TableChunk
+from rapidsmpf.streaming.core.actor import define_actor
+from rapidsmpf.streaming.core.message import Message
+
+from cudf_polars.dsl.ir import MapFunction
+from cudf_polars.streaming.actor_graph.dispatch import generate_ir_sub_network
+from cudf_polars.streaming.actor_graph.nodes import default_node_single
+from cudf_polars.streaming.actor_graph.tracing import send_chunk
+from cudf_polars.streaming.actor_graph.utils import (
+    ChannelManager,
+    allgather_values,
+    evaluate_chunk,
+    process_children,
+    recv_metadata,
+    send_metadata,
+    shutdown_on_error,
+)
+from cudf_polars.streaming.repartition import Repartition
+
+if TYPE_CHECKING:
+    from rapidsmpf.communicator.communicator import Communicator
+    from rapidsmpf.streaming.core.channel import Channel
+    from rapidsmpf.streaming.core.context import Context
+
+    from cudf_polars.dsl.ir import IR, IRExecutionContext
+    from cudf_polars.streaming.actor_graph.dispatch import SubNetGenerator
+
+
+@define_actor()
+async def row_index_actor(
+    context: Context,
+    comm: Communicator,
+    ir: MapFunction,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_in: Channel[TableChunk],
+    collective_ids: list[int],
+) -> None:
+    """
+    Multi-partition row-index actor.
+
+    Parameters
+    ----------
+    context
+        The rapidsmpf context.
+    comm
+        The communicator.
+    ir
+        The ``row_index`` MapFunction node.
+    ir_context
+        The execution context for the IR node.
+    ch_out
+        The output Channel[TableChunk].
+    ch_in
+        The input Channel[TableChunk].
+    collective_ids
+        Collective ID for the row-count AllGather.
+    """
+    async with shutdown_on_error(
+        context, ch_in, ch_out, trace_ir=ir, ir_context=ir_context
+    ) as tracer:
+        metadata_in = await recv_metadata(ch_in, context)
+        await send_metadata(
+            ch_out,
+            context,
+            ChannelMetadata(
+                local_count=metadata_in.local_count,
+                partitioning=None,
+                duplicated=metadata_in.duplicated,
+            ),
+        )
+        if tracer is not None and metadata_in.duplicated:
+            tracer.set_duplicated()
+
+        # Buffer local chunks, we can't number their rows until we
+        # know the row counts of all preceding chunks.
+        store = context.spillable_messages()
+        buffered: list[tuple[int, int, int]] = []
+        while (msg := await ch_in.recv(context)) is not None:
+            seq_num = msg.sequence_number
+            chunk = TableChunk.from_message(msg, br=context.br())
+            row_count = chunk.shape[0]
+            buffered.append((seq_num, row_count, store.insert(Message(seq_num, chunk))))
+            del chunk
+        buffered.sort()
+
+        start = 0
+        if comm.nranks > 1 and not metadata_in.duplicated:
+            local_rows = sum(row_count for _, row_count, _ in buffered)
+            rank_rows = await allgather_values(
+                context, comm, collective_ids[0], local_rows
+            )
+            start = sum(rows for (rows,) in rank_rows[: comm.rank])
+
+        name, offset = ir.options
+        for seq_num, row_count, mid in buffered:
+            chunk = await evaluate_chunk(
+                context,
+                TableChunk.from_message(store.extract(mid=mid), br=context.br()),
+                MapFunction(
+                    ir.schema,
+                    ir.name,
+                    (name, offset + start),
+                    ir.children[0],
+                ),
+                ir_context=ir_context,
+            )
+            start += row_count
+            await send_chunk(context, ch_out, chunk, seq_num, tracer=tracer)
+            del chunk
+
+        await ch_out.drain(context)
+
+
+@generate_ir_sub_network.register(MapFunction)
+def _(
+    ir: MapFunction, rec: SubNetGenerator
+) -> tuple[dict[IR, list[Any]], dict[IR, ChannelManager]]:
+    executor = rec.state["config_options"].executor
+    partition_info = rec.state["partition_info"]
+    dynamic = executor.dynamic_planning is not None
+    nodes, channels = process_children(ir, rec)
+    channels[ir] = ChannelManager(rec.state["context"])
+
+    if ir.name != "row_index" or (
+        partition_info[ir].count == 1
+        and (not dynamic or isinstance(ir.children[0], Repartition))
+    ):
+        nodes[ir] = [
+            default_node_single(
+                rec.state["context"],
+                ir,
+                rec.state["ir_context"],
+                channels[ir].reserve_input_slot(),
+                channels[ir.children[0]].reserve_output_slot(),
+            )
+        ]
+        return nodes, channels
+
+    nodes[ir] = [
+        row_index_actor(
+            rec.state["context"],
+            rec.state["comm"],
+            ir,
+            rec.state["ir_context"],
+            channels[ir].reserve_input_slot(),
+            channels[ir.children[0]].reserve_output_slot(),
+            list(rec.state["collective_id_map"][ir]),
+        )
+    ]
+    return nodes, channels
@@ -0,0 +1,414 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+MergeSorted logic for the RapidsMPF streaming runtime.
+
+Both inputs are sorted by the merge key. Each rank buffers its (spillable)
+input chunks of both sides, and samples split candidates on the merge key
+from both of them. The global range boundaries are computed exactly as for
+a multi-partition ``Sort``, so that both sides can be range-partitioned
+with the *same* boundaries. Every output partition then holds one key
+range of each side, and is merged locally.
+
+Every received piece of a partition is a sorted run of one input chunk.
+The shuffle does not preserve the order of the pieces, so every row is
+tagged with its position in the (globally ordered) input, and the pieces
+of each side are merged on ``(key, position)`` rather than re-sorted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+import pylibcudf as plc
+from cudf_streaming.channel_metadata import ChannelMetadata, OrderKey, Partitioning
+from cudf_streaming.partition_utils import unpack_and_concat
+from cudf_streaming.table_chunk import TableChunk
+from rapidsmpf.shuffler import PartitionAssignment
+from rapidsmpf.streaming.core.actor import define_actor
+from rapidsmpf.streaming.core.message import Message
+
+from cudf_polars.containers import DataFrame, DataType
+from cudf_polars.dsl.expr import Col, NamedExpr
+from cudf_polars.dsl.ir import Empty, MergeSorted, Sort
+from cudf_polars.streaming.actor_graph.collectives.shuffle import ShuffleManager
+from cudf_polars.streaming.actor_graph.collectives.sort import (
+    _build_order_scheme,
+    _compute_sort_boundaries,
+)
+from cudf_polars.streaming.actor_graph.dispatch import generate_ir_sub_network
+from cudf_polars.streaming.actor_graph.nodes import default_node_multi
+from cudf_polars.streaming.actor_graph.tracing import send_chunk
+from cudf_polars.streaming.actor_graph.utils import (
+    ChannelManager,
+    ChunkStore,
+    gather_in_task_group,
+    process_children,
+    recv_metadata,
+    send_metadata,
+    shutdown_on_error,
+)
+from cudf_polars.streaming.repartition import Repartition
+from cudf_polars.streaming.sort import (
+    _select_local_split_candidates,
+    find_sort_splits,
+    merge_sorted_key_order,
+)
+from cudf_polars.utils.cuda_stream import get_joined_cuda_stream
+from cudf_polars.utils.dtypes import make_empty_column
+
+if TYPE_CHECKING:
+    from rapidsmpf.communicator.communicator import Communicator
+    from rapidsmpf.streaming.core.channel import Channel
+    from rapidsmpf.streaming.core.context import Context
+    from rmm.pylibrmm.stream import Stream
+
+    from cudf_polars.dsl.ir import IR, IRExecutionContext
+    from cudf_polars.streaming.actor_graph.dispatch import SubNetGenerator
+
+
+_POSITION_DTYPE = DataType(pl.UInt64())
+
+
+def _merge_side(
+    context: Context,
+    shuffle: ShuffleManager,
+    partition_id: int,
+    child: IR,
+    key: str,
+    order: plc.types.Order,
+    null_order: plc.types.NullOrder,
+    stream: Stream,
+) -> DataFrame:
+    """Merge the received (sorted) pieces of one side of a partition."""
+    tables = []
+    for piece in shuffle.extract_pieces(partition_id):
+        table = unpack_and_concat([piece], stream=stream, br=context.br())
+        if table.num_rows() > 0:
+            tables.append(table)
+    # The position column is appended after the columns of the input.
+    position_index = len(child.schema)
+    if not tables:
+        columns = [make_empty_column(dtype, stream) for dtype in child.schema.values()]
+    elif len(tables) == 1:
+        columns = tables[0].columns()[:position_index]
+    else:
+        columns = plc.merge.merge(
+            tables,
+            [list(child.schema).index(key), position_index],
+            [order, plc.types.Order.ASCENDING],
+            [null_order, plc.types.NullOrder.AFTER],
+            stream=stream,
+        ).columns()[:position_index]
+    df = DataFrame.from_table(
+        plc.Table(columns),
+        list(child.schema.keys()),
+        list(child.schema.values()),
+        stream,
+    )
+    df.column_map[key].set_sorted(
+        is_sorted=plc.types.Sorted.YES, order=order, null_order=null_order
+    )
+    return df
+
+
+async def _buffer_side(
+    context: Context,
+    comm: Communicator,
+    ch_in: Channel[TableChunk],
+    chunk_store: ChunkStore,
+    child: IR,
+    key: str,
+    num_partitions: int,
+    *,
+    skip: bool,
+) -> list[TableChunk]:
+    """
+    Buffer the input chunks of one side, tagging rows with their position.
+
+    Returns the local split candidates on the merge key. If ``skip``, the
+    input is consumed but not buffered.
+    """
+    candidates: list[TableChunk] = []
+    local_row_offset = 0
+    while (msg := await ch_in.recv(context)) is not None:
+        if skip:
+            continue
+        seq_num = msg.sequence_number
+        chunk = TableChunk.from_message(msg, br=context.br()).make_available_and_spill(
+            context.br(), allow_overbooking=True
+        )
+        stream = chunk.stream
+        tbl = chunk.table_view()
+        df = DataFrame.from_table(
+            tbl, list(child.schema.keys()), list(child.schema.values()), stream
+        )
+        candidates.append(
+            TableChunk.from_pylibcudf_table(
+                _select_local_split_candidates(
+                    df, [key], num_partitions, seq_num
+                ).table,
+                stream,
+                exclusive_view=True,
+                br=context.br(),
+            )
+        )
+        # Sequence numbers are rank-local, so the position is offset by
+        # the rank (ranks hold consecutive slices of a sorted input).
+        position = plc.filling.sequence(
+            tbl.num_rows(),
+            plc.Scalar.from_py(
+                comm.rank * (1 << 48) + local_row_offset,
+                _POSITION_DTYPE.plc_type,
+                stream=stream,
+            ),
+            plc.Scalar.from_py(1, _POSITION_DTYPE.plc_type, stream=stream),
+            stream=stream,
+        )
+        local_row_offset += tbl.num_rows()
+        chunk_store.insert(
+            Message(
+                seq_num,
+                TableChunk.from_pylibcudf_table(
+                    plc.Table([*tbl.columns(), position]),
+                    stream,
+                    exclusive_view=True,
+                    br=context.br(),
+                ),
+            )
+        )
+        del chunk, df, tbl
+    return candidates
+
+
+async def _shuffle_side(
+    context: Context,
+    shuffle: ShuffleManager,
+    chunk_store: ChunkStore,
+    key_index: int,
+    order: plc.types.Order,
+    null_order: plc.types.NullOrder,
+    boundaries_df: DataFrame,
+    ir_context: IRExecutionContext,
+) -> None:
+    """Range-partition the buffered chunks of one side."""
+    async with shuffle.inserting() as inserter:
+        for msg in chunk_store:
+            seq_num = msg.sequence_number
+            chunk = TableChunk.from_message(
+                msg, br=context.br()
+            ).make_available_and_spill(context.br(), allow_overbooking=True)
+            stream = get_joined_cuda_stream(
+                ir_context.get_cuda_stream,
+                upstreams=(chunk.stream, boundaries_df.stream),
+            )
+            splits = find_sort_splits(
+                plc.Table([chunk.table_view().columns()[key_index]]),
+                boundaries_df.table,
+                seq_num,
+                [order],
+                [null_order],
+                stream=stream,
+                chunk_relative=True,
+            )
+            inserter.insert_split(chunk, splits)
+
+
+@define_actor()
+async def merge_sorted_actor(
+    context: Context,
+    comm: Communicator,
+    ir: MergeSorted,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    chs_in: tuple[Channel[TableChunk], Channel[TableChunk]],
+    num_partitions: int,
+    collective_ids: list[int],
+) -> None:
+    """
+    Multi-partition MergeSorted actor.
+
+    Parameters
+    ----------
+    context
+        The rapidsmpf context.
+    comm
+        The communicator.
+    ir
+        The MergeSorted node.
+    ir_context
+        The execution context for the IR node.
+    ch_out
+        The output Channel[TableChunk].
+    chs_in
+        The left and right input Channel[TableChunk]s.
+    num_partitions
+        The number of output partitions.
+    collective_ids
+        Collective IDs for the boundary AllGather and the left and
+        right shuffles.
+    """
+    async with shutdown_on_error(
+        context, *chs_in, ch_out, trace_ir=ir, ir_context=ir_context
+    ) as tracer:
+        key_order = merge_sorted_key_order(ir)
+        assert key_order is not None
+        order, null_order = key_order
+        key = ir.key
+        metadata = await gather_in_task_group(
+            *(recv_metadata(ch, context) for ch in chs_in)
+        )
+        boundaries_ir = Sort(
+            {key: ir.schema[key]},
+            (NamedExpr(key, Col(ir.schema[key], key)),),
+            (order,),
+            (null_order,),
+            False,  # noqa: FBT003
+            None,
+            Empty({key: ir.schema[key]}),
+        )
+
+        # Receive both sides concurrently, so that neither producer blocks.
+        # Duplicated inputs are only sampled and shuffled by rank 0.
+        skip = [md.duplicated and comm.rank != 0 for md in metadata]
+        stores = [ChunkStore(context) for _ in chs_in]
+        candidates = await gather_in_task_group(
+            *(
+                _buffer_side(
+                    context,
+                    comm,
+                    ch,
+                    store,
+                    child,
+                    key,
+                    num_partitions,
+                    skip=skip_side,
+                )
+                for ch, store, child, skip_side in zip(
+                    chs_in, stores, ir.children, skip, strict=True
+                )
+            )
+        )
+        need_allgather = comm.nranks > 1 and not all(md.duplicated for md in metadata)
+        allgather_id, *shuffle_ids = collective_ids
+        boundaries_df = await _compute_sort_boundaries(
+            context,
+            comm,
+            ir_context,
+            [c for side in candidates for c in side],
+            boundaries_ir,
+            [key],
+            num_partitions,
+            allgather_id if need_allgather else None,
+        )
+        await send_metadata(
+            ch_out,
+            context,
+            ChannelMetadata(
+                local_count=max(1, num_partitions // comm.nranks),
+                partitioning=Partitioning(
+                    _build_order_scheme(
+                        context,
+                        [OrderKey(list(ir.schema).index(key), order, null_order)],
+                        boundaries_df,
+                    ),
+                    "inherit",
+                ),
+            ),
+        )
+
+        shuffles = [
+            ShuffleManager(
+                context,
+                comm,
+                num_partitions,
+                shuffle_id,
+                partition_assignment=PartitionAssignment.CONTIGUOUS,
+            )
+            for shuffle_id in shuffle_ids
+        ]
+        for shuffle, store, child in zip(shuffles, stores, ir.children, strict=True):
+            await _shuffle_side(
+                context,
+                shuffle,
+                store,
+                list(child.schema).index(key),
+                order,
+                null_order,
+                boundaries_df,
+                ir_context,
+            )
+
+        for partition_id in shuffles[0].local_partitions():
+            stream = ir_context.get_cuda_stream()
+            sides = [
+                _merge_side(
+                    context,
+                    shuffle,
+                    partition_id,
+                    child,
+                    key,
+                    order,
+                    null_order,
+                    stream,
+                )
+                for shuffle, child in zip(shuffles, ir.children, strict=True)
+            ]
+            if all(df.num_rows == 0 for df in sides):
+                continue
+            result = ir.do_evaluate(key, *sides, context=ir_context)
+            del sides
+            await send_chunk(
+                context,
+                ch_out,
+                TableChunk.from_pylibcudf_table(
+                    result.table, result.stream, exclusive_view=True, br=context.br()
+                ),
+                partition_id,
+                tracer=tracer,
+            )
+            del result
+
+        await ch_out.drain(context)
+
+
+@generate_ir_sub_network.register(MergeSorted)
+def _(
+    ir: MergeSorted, rec: SubNetGenerator
+) -> tuple[dict[IR, list[Any]], dict[IR, ChannelManager]]:
+    nodes, channels = process_children(ir, rec)
+    channels[ir] = ChannelManager(rec.state["context"])
+    chs_in = tuple(channels[c].reserve_output_slot() for c in ir.children)
+
+    if all(isinstance(c, Repartition) for c in ir.children):
+        # Single-partition fallback.
+        nodes[ir] = [
+            default_node_multi(
+                rec.state["context"],
+                ir,
+                rec.state["ir_context"],
+                channels[ir].reserve_input_slot(),
+                chs_in,
+            )
+        ]
+        return nodes, channels
+
+    collective_ids = list(rec.state["collective_id_map"][ir])
+    assert len(collective_ids) == 3, (
+        f"MergeSorted must have 3 collective IDs, got {len(collective_ids)}."
+    )
+    nodes[ir] = [
+        merge_sorted_actor(
+            rec.state["context"],
+            rec.state["comm"],
+            ir,
+            rec.state["ir_context"],
+            channels[ir].reserve_input_slot(),
+            chs_in,
+            rec.state["partition_info"][ir].count,
+            collective_ids,
+        )
+    ]
+    return nodes, channels
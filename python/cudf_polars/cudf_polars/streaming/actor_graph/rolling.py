@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Rolling actor for the RapidsMPF streaming runtime.
+
+The input of a ``Rolling`` node is sorted by the grouping keys (if any)
+and then by the rolling index, and partitions arrive in that order: by
+sequence number within a rank, and by rank across ranks. Since windows
+only look backwards, a row can only depend on a bounded "halo" of the
+trailing rows of the preceding partitions.
+
+Each rank buffers its (spillable) input chunks, computes the trailing
+halo of its local data, and AllGathers these halos so that the first
+local chunk can see the tail of the preceding ranks. Chunks are then
+evaluated in order, each prepended with the halo of everything before
+it, and only the rows of the chunk itself are emitted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+import pylibcudf as plc
+from cudf_streaming.channel_metadata import ChannelMetadata
+from cudf_streaming.table_chunk import TableChunk
+from rapidsmpf.streaming.core.actor import define_actor
+from rapidsmpf.streaming.core.message import Message
+
+from cudf_polars.containers import DataFrame, DataType
+from cudf_polars.dsl.ir import Rolling
+from cudf_polars.streaming.actor_graph.collectives.allgather import AllGatherManager
+from cudf_polars.streaming.actor_graph.dispatch import generate_ir_sub_network
+from cudf_polars.streaming.actor_graph.nodes import default_node_single
+from cudf_polars.streaming.actor_graph.tracing import send_chunk
+from cudf_polars.streaming.actor_graph.utils import (
+    ChannelManager,
+    chunk_to_frame,
+    empty_table_chunk,
+    process_children,
+    recv_metadata,
+    send_metadata,
+    shutdown_on_error,
+)
+from cudf_polars.streaming.repartition import Repartition
+from cudf_polars.streaming.rolling import rolling_halo, rolling_with_halo
+from cudf_polars.streaming.utils import _concat
+
+if TYPE_CHECKING:
+    from rapidsmpf.communicator.communicator import Communicator
+    from rapidsmpf.streaming.core.channel import Channel
+    from rapidsmpf.streaming.core.context import Context
+
+    from cudf_polars.dsl.ir import IR, IRExecutionContext
+    from cudf_polars.streaming.actor_graph.dispatch import SubNetGenerator
+
+
+def _extend_halo(
+    ir: Rolling,
+    df: DataFrame,
+    halo: DataFrame | None,
+    *,
+    context: IRExecutionContext,
+) -> tuple[DataFrame, bool]:
+    """
+    Extend a trailing halo backwards with the preceding partition ``df``.
+
+    Returns the new halo, and whether the halo is complete (i.e. the
+    window of the last row starts inside ``df``).
+    """
+    combined = df if halo is None else _concat(df, halo, context=context)
+    halo = rolling_halo(ir, combined, context=context)
+    return halo, halo.num_rows < combined.num_rows
+
+
+def _preceding_ranks_halo(
+    ir: Rolling,
+    gathered: plc.Table,
+    rank: int,
+    stream: Any,
+    *,
+    context: IRExecutionContext,
+) -> DataFrame | None:
+    """Select and trim the gathered halos of all ranks before ``rank``."""
+    schema = ir.children[0].schema
+    *columns, ranks = gathered.columns()
+    mask = plc.binaryop.binary_operation(
+        ranks,
+        plc.Scalar.from_py(rank, ranks.type(), stream=stream),
+        plc.binaryop.BinaryOperator.LESS,
+        plc.DataType(plc.TypeId.BOOL8),
+        stream=stream,
+    )
+    df = DataFrame.from_table(
+        plc.stream_compaction.apply_boolean_mask(
+            plc.Table(columns), mask, stream=stream
+        ),
+        list(schema.keys()),
+        list(schema.values()),
+        stream,
+    )
+    return rolling_halo(ir, df, context=context) if df.num_rows else None
+
+
+@define_actor()
+async def rolling_actor(
+    context: Context,
+    comm: Communicator,
+    ir: Rolling,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_in: Channel[TableChunk],
+    collective_ids: list[int],
+) -> None:
+    """
+    Multi-partition rolling actor.
+
+    Parameters
+    ----------
+    context
+        The rapidsmpf context.
+    comm
+        The communicator.
+    ir
+        The Rolling node.
+    ir_context
+        The execution context for the IR node.
+    ch_out
+        The output Channel[TableChunk].
+    ch_in
+        The input Channel[TableChunk].
+    collective_ids
+        Collective ID for the halo AllGather.
+    """
+    async with shutdown_on_error(
+        context, ch_in, ch_out, trace_ir=ir, ir_context=ir_context
+    ) as tracer:
+        metadata_in = await recv_metadata(ch_in, context)
+        await send_metadata(
+            ch_out,
+            context,
+            ChannelMetadata(
+                local_count=metadata_in.local_count,
+                partitioning=None,
+                duplicated=metadata_in.duplicated,
+            ),
+        )
+        if tracer is not None and metadata_in.duplicated:
+            tracer.set_duplicated()
+
+        # Buffer local chunks, so that we can evaluate them in sequence order.
+        store = context.spillable_messages()
+        mids: list[tuple[int, int]] = []
+        while (msg := await ch_in.recv(context)) is not None:
+            mids.append((msg.sequence_number, store.insert(msg)))
+        mids.sort()
+
+        def extract(mid: int) -> TableChunk:
+            return TableChunk.from_message(
+                store.extract(mid=mid), br=context.br()
+            ).make_available_and_spill(context.br(), allow_overbooking=True)
+
+        halo: DataFrame | None = None
+        if comm.nranks > 1 and not metadata_in.duplicated:
+            # Exchange the trailing halo of every rank. Walk backwards
+            # through the local chunks only as far as the window reaches.
+            local_halo: DataFrame | None = None
+            for i in reversed(range(len(mids))):
+                seq_num, mid = mids[i]
+                chunk = extract(mid)
+                local_halo, complete = await ir_context.to_thread(
+                    _extend_halo,
+                    ir,
+                    chunk_to_frame(chunk, ir.children[0]),
+                    local_halo,
+                    context=ir_context,
+                )
+                mids[i] = (seq_num, store.insert(Message(seq_num, chunk)))
+                del chunk
+                if complete:
+                    break
+
+            stream = ir_context.get_cuda_stream()
+            if local_halo is None:
+                # This rank received no input, but must still take part in
+                # the AllGather.
+                local_halo = chunk_to_frame(
+                    empty_table_chunk(ir.children[0], context, stream),
+                    ir.children[0],
+                )
+            rank_dtype = DataType(pl.UInt32())
+            rank_col = plc.Column.from_scalar(
+                plc.Scalar.from_py(
+                    comm.rank, rank_dtype.plc_type, stream=local_halo.stream
+                ),
+                local_halo.num_rows,
+                stream=local_halo.stream,
+            )
+            allgather = AllGatherManager(context, comm, collective_ids[0])
+            with allgather.inserting() as inserter:
+                inserter.insert(
+                    comm.rank,
+                    TableChunk.from_pylibcudf_table(
+                        plc.Table([*local_halo.table.columns(), rank_col]),
+                        local_halo.stream,
+                        exclusive_view=True,
+                        br=context.br(),
+                    ),
+                )
+            del local_halo, rank_col
+            gathered = await allgather.extract_concatenated(
+                stream, ordered=True, ir_context=ir_context
+            )
+            halo = await ir_context.to_thread(
+                _preceding_ranks_halo,
+                ir,
+                gathered,
+                comm.rank,
+                stream,
+                context=ir_context,
+            )
+            del gathered
+
+        for seq_num, mid in mids:
+            result, halo = await ir_context.to_thread(
+                rolling_with_halo,
+                ir,
+                halo,
+                chunk_to_frame(extract(mid), ir.children[0]),
+                context=ir_context,
+            )
+            await send_chunk(
+                context,
+                ch_out,
+                TableChunk.from_pylibcudf_table(
+                    result.table, result.stream, exclusive_view=True, br=context.br()
+                ),
+                seq_num,
+                tracer=tracer,
+            )
+            del result
+
+        await ch_out.drain(context)
+
+
+@generate_ir_sub_network.register(Rolling)
+def _(
+    ir: Rolling, rec: SubNetGenerator
+) -> tuple[dict[IR, list[Any]], dict[IR, ChannelManager]]:
+    executor = rec.state["config_options"].executor
+    partition_info = rec.state["partition_info"]
+    dynamic = executor.dynamic_planning is not None
+    nodes, channels = process_children(ir, rec)
+    channels[ir] = ChannelManager(rec.state["context"])
+
+    if partition_info[ir].count == 1 and (
+        not dynamic or isinstance(ir.children[0], Repartition)
+    ):
+        nodes[ir] = [
+            default_node_single(
+                rec.state["context"],
+                ir,
+                rec.state["ir_context"],
+                channels[ir].reserve_input_slot(),
+                channels[ir.children[0]].reserve_output_slot(),
+            )
+        ]
+        return nodes, channels
+
+    nodes[ir] = [
+        rolling_actor(
+            rec.state["context"],
+            rec.state["comm"],
+            ir,
+            rec.state["ir_context"],
+            channels[ir].reserve_input_slot(),
+            channels[ir.children[0]].reserve_output_slot(),
+            list(rec.state["collective_id_map"][ir]),
+        )
+    ]
+    return nodes, channels
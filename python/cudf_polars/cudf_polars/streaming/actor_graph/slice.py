@@ -0,0 +1,225 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Slice logic for the RapidsMPF streaming runtime.
+
+Partitions arrive in global row order: by sequence number within a
+rank, and by rank across ranks. Each rank buffers its (spillable) input
+chunks and AllGathers its local row count. The prefix sum of these
+counts gives the global offset of every local chunk, so each rank can
+resolve the slice window (including negative offsets) and only forward
+the chunks and row ranges that overlap it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from cudf_streaming.channel_metadata import ChannelMetadata
+from cudf_streaming.table_chunk import TableChunk
+from rapidsmpf.streaming.core.actor import define_actor
+from rapidsmpf.streaming.core.message import Message
+
+from cudf_polars.dsl.ir import Slice
+from cudf_polars.streaming.actor_graph.dispatch import generate_ir_sub_network
+from cudf_polars.streaming.actor_graph.nodes import default_node_single
+from cudf_polars.streaming.actor_graph.tracing import send_chunk
+from cudf_polars.streaming.actor_graph.utils import (
+    ChannelManager,
+    allgather_values,
+    evaluate_chunk,
+    maybe_remap_partitioning,
+    process_children,
+    recv_metadata,
+    send_metadata,
+    shutdown_on_error,
+)
+from cudf_polars.streaming.repartition import Repartition
+from cudf_polars.utils import conversion
+
+if TYPE_CHECKING:
+    from rapidsmpf.communicator.communicator import Communicator
+    from rapidsmpf.streaming.core.channel import Channel
+    from rapidsmpf.streaming.core.context import Context
+
+    from cudf_polars.dsl.ir import IR, IRExecutionContext
+    from cudf_polars.streaming.actor_graph.dispatch import SubNetGenerator
+
+
+def slice_window(
+    offset: int,
+    length: int | None,
+    row_counts: list[int],
+    *,
+    start: int,
+    total: int,
+) -> list[tuple[int, int] | None]:
+    """
+    Find the rows of each local partition that overlap a global slice.
+
+    Parameters
+    ----------
+    offset
+        Start of the slice. Negative values count from the end.
+    length
+        Length of the slice, or None to slice to the end.
+    row_counts
+        The row count of every local partition, in sequence order.
+    start
+        The global row offset of the first local partition.
+    total
+        The global row count.
+
+    Returns
+    -------
+    The ``(offset, length)`` to take from each local partition, or None
+    if the partition doesn't overlap the slice.
+    """
+    lo, hi = conversion.from_polars_slice((offset, length), num_rows=total)
+    windows: list[tuple[int, int] | None] = []
+    for count in row_counts:
+        begin = max(lo - start, 0)
+        end = min(hi - start, count)
+        windows.append((begin, end - begin) if begin < end else None)
+        start += count
+    return windows
+
+
+@define_actor()
+async def slice_actor(
+    context: Context,
+    comm: Communicator,
+    ir: Slice,
+    ir_context: IRExecutionContext,
+    ch_out: Channel[TableChunk],
+    ch_in: Channel[TableChunk],
+    collective_ids: list[int],
+) -> None:
+    """
+    Multi-partition slice actor.
+
+    Parameters
+    ----------
+    context
+        The rapidsmpf context.
+    comm
+        The communicator.
+    ir
+        The Slice node.
+    ir_context
+        The execution context for the IR node.
+    ch_out
+        The output Channel[TableChunk].
+    ch_in
+        The input Channel[TableChunk].
+    collective_ids
+        Collective ID for the row-count AllGather.
+    """
+    async with shutdown_on_error(
+        context, ch_in, ch_out, trace_ir=ir, ir_context=ir_context
+    ) as tracer:
+        metadata_in = await recv_metadata(ch_in, context)
+        await send_metadata(
+            ch_out,
+            context,
+            ChannelMetadata(
+                local_count=metadata_in.local_count,
+                partitioning=maybe_remap_partitioning(
+                    ir, metadata_in.partitioning, context=context
+                ),
+                duplicated=metadata_in.duplicated,
+            ),
+        )
+        if tracer is not None and metadata_in.duplicated:
+            tracer.set_duplicated()
+
+        # Buffer local chunks, we can't tell which rows to keep
+        # until we know the row counts of all preceding chunks.
+        store = context.spillable_messages()
+        buffered: list[tuple[int, int, int]] = []
+        while (msg := await ch_in.recv(context)) is not None:
+            seq_num = msg.sequence_number
+            chunk = TableChunk.from_message(msg, br=context.br())
+            row_count = chunk.shape[0]
+            buffered.append((seq_num, row_count, store.insert(Message(seq_num, chunk))))
+            del chunk
+        buffered.sort()
+        local_rows = sum(row_count for _, row_count, _ in buffered)
+
+        if comm.nranks > 1 and not metadata_in.duplicated:
+            rank_rows = [
+                rows
+                for (rows,) in await allgather_values(
+                    context, comm, collective_ids[0], local_rows
+                )
+            ]
+            start = sum(rank_rows[: comm.rank])
+            total = sum(rank_rows)
+        else:
+            start = 0
+            total = local_rows
+
+        windows = slice_window(
+            ir.offset,
+            ir.length,
+            [row_count for _, row_count, _ in buffered],
+            start=start,
+            total=total,
+        )
+        for (seq_num, row_count, mid), window in zip(buffered, windows, strict=True):
+            # Extracting from the store releases chunks outside the window.
+            chunk = TableChunk.from_message(store.extract(mid=mid), br=context.br())
+            if window is None:
+                continue
+            if window != (0, row_count):
+                chunk = await evaluate_chunk(
+                    context,
+                    chunk,
+                    Slice(ir.schema, *window, ir.children[0]),
+                    ir_context=ir_context,
+                )
+            await send_chunk(context, ch_out, chunk, seq_num, tracer=tracer)
+            del chunk
+
+        await ch_out.drain(context)
+
+
+@generate_ir_sub_network.register(Slice)
+def _(
+    ir: Slice, rec: SubNetGenerator
+) -> tuple[dict[IR, list[Any]], dict[IR, ChannelManager]]:
+    executor = rec.state["config_options"].executor
+    partition_info = rec.state["partition_info"]
+    dynamic = executor.dynamic_planning is not None
+    nodes, channels = process_children(ir, rec)
+    channels[ir] = ChannelManager(rec.state["context"])
+
+    if ir.offset == 0 or (
+        partition_info[ir].count == 1
+        and (not dynamic or isinstance(ir.children[0], Repartition))
+    ):
+        # Taking the first N rows is applied partition-wise
+        # (and again after collapsing to a single partition).
+        nodes[ir] = [
+            default_node_single(
+                rec.state["context"],
+                ir,
+                rec.state["ir_context"],
+                channels[ir].reserve_input_slot(),
+                channels[ir.children[0]].reserve_output_slot(),
+            )
+        ]
+        return nodes, channels
+
+    nodes[ir] = [
+        slice_actor(
+            rec.state["context"],
+            rec.state["comm"],
+            ir,
+            rec.state["ir_context"],
+            channels[ir].reserve_input_slot(),
+            channels[ir.children[0]].reserve_output_slot(),
+            list(rec.state["collective_id_map"][ir]),
+        )
+    ]
+    return nodes, channels
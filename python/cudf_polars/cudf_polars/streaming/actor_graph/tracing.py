@@ -36,6 +36,9 @@ class ActorTracer:
     row_count
         Total row count produced by this node during execution.
         None if row counting is not available for this node.
+    byte_count
+        Total size in bytes of the chunks produced by this node during
+        execution. None if row counting is not available for this node.
     chunk_count
         Total chunk count produced by this node during execution.
     decision
@@ -47,6 +50,7 @@ class ActorTracer:
     """
 
     __slots__ = (
+        "byte_count",
         "chunk_count",
         "decision",
         "duplicated",
@@ -60,6 +64,7 @@ class ActorTracer:
         self.ir_id = ir_id
         self.ir_type = ir_type
         self.row_count: int | None = None
+        self.byte_count: int | None = None
         self.chunk_count: int = 0
         self.decision: str | None = None
         self.duplicated: bool = False
@@ -69,8 +74,8 @@ class ActorTracer:
         """
         Record a chunk.
 
-        If chunk is provided, both row_count and chunk_count are updated.
-        Otherwise, only chunk_count is incremented.
+        If chunk is provided, row_count, byte_count and chunk_count are
+        updated. Otherwise, only chunk_count is incremented.
 
         Parameters
         ----------
@@ -79,6 +84,7 @@ class ActorTracer:
         """
         if chunk is not None:
             self.row_count = (self.row_count or 0) + chunk.shape[0]
+            self.byte_count = (self.byte_count or 0) + chunk.data_alloc_size()
         self.chunk_count += 1
 
     def set_duplicated(self, *, duplicated: bool = True) -> None:
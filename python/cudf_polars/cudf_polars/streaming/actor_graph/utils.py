@@ -44,6 +44,7 @@ from cudf_polars.dsl.utils.column_domain import column_domain_bindings
 from cudf_polars.dsl.utils.naming import names_to_indices
 from cudf_polars.streaming.actor_graph.collectives.allgather import AllGatherManager
 from cudf_polars.streaming.actor_graph.tracing import ActorTracer, send_chunk
+from cudf_polars.streaming.profile import get_profile_recorder
 from cudf_polars.streaming.utils import _concat
 from cudf_polars.utils.dtypes import make_empty_column
 
@@ -269,7 +270,8 @@ async def shutdown_on_error(
         emitted on exit.
     ir_context
         The IR execution context from cudf-polars. This is used to propagate
-        the query_id to the structlog logs emitted in this context.
+        the query_id to the structlog logs emitted in this context, and to
+        record the actor's statistics if the query is profiled.
 
     Yields
     ------
@@ -309,12 +311,19 @@ async def shutdown_on_error(
                 )
                 if tracer.row_count is not None:
                     record["row_count"] = tracer.row_count
+                if tracer.byte_count is not None:
+                    record["byte_count"] = tracer.byte_count
                 if tracer.decision is not None:
                     record["decision"] = tracer.decision
                 record.update(tracer.extra)
             cudf_polars.dsl.tracing.log(
                 "Streaming Actor", start=start, stop=stop, **record
             )
+            if (
+                ir_context is not None
+                and (recorder := get_profile_recorder(ir_context.query_id)) is not None
+            ):
+                recorder.record(tracer, (stop - start) / 1e9)
 
 
 def _update_ordering_indices(
@@ -1566,9 +1575,42 @@ async def allgather_reduce(
     if comm.nranks == 1:
         return tuple(local_values)
 
-    n = len(local_values)
-    fmt = f"<{'q' * n}"
-    data = struct.pack(fmt, *local_values)
+    gathered = await allgather_values(context, comm, op_id, *local_values)
+    return tuple(sum(values) for values in zip(*gathered, strict=True))
+
+
+async def allgather_values(
+    context: Context,
+    comm: Communicator,
+    op_id: int,
+    *local_values: int,
+) -> list[tuple[int, ...]]:
+    """
+    Allgather local scalar values from all ranks.
+
+    Parameters
+    ----------
+    context
+        The rapidsmpf context.
+    comm
+        The communicator.
+    op_id
+        The collective operation ID for this allgather.
+    *local_values
+        One or more local scalar values to contribute.
+
+    Returns
+    -------
+    list[tuple[int, ...]]
+        The local_values of every rank, indexed by rank.
+    """
+    if comm.nranks == 1:
+        return [tuple(local_values)]
+
+    # Prefix the values with the rank, so the result can be
+    # ordered independently of the arrival order.
+    fmt = f"<{'q' * (len(local_values) + 1)}"
+    data = struct.pack(fmt, comm.rank, *local_values)
     packed = PackedData.from_host_bytes(data, context.br())
 
     allgather = AllGather(context, comm, op_id)
@@ -1578,12 +1620,7 @@ async def allgather_reduce(
         allgather.insert_finished()
 
     results = await allgather.extract_all(context, ordered=False)
-
-    totals = [0] * n
-    for packed_result in results:
-        result_bytes = packed_result.to_host_bytes()
-        values = struct.unpack(fmt, result_bytes)
-        for i, v in enumerate(values):
-            totals[i] += v
-
-    return tuple(totals)
+    gathered = sorted(
+        struct.unpack(fmt, packed_result.to_host_bytes()) for packed_result in results
+    )
+    return [values[1:] for values in gathered]
@@ -4,9 +4,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import enum
 from enum import IntEnum
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, Protocol, TypedDict
 
 from cudf_polars.dsl.traversal import traversal
 
@@ -45,12 +46,60 @@ class PartitionInfo:
         yield "partitioned_on", self.partitioned_on
 
 
+class SerializedColumnStatistics(TypedDict):
+    """The serialized form of ColumnStatistics."""
+
+    null_count: int | None
+    distinct_count: int | None
+    min_value: int | float | None
+    max_value: int | float | None
+
+
 class SerializedDataSourceInfo(TypedDict):
     """The serialized form of DataSourceInfo."""
 
-    type: Literal["parquet", "dataframe"]
+    type: Literal["parquet", "csv", "ndjson", "dataframe"]
     row_count: int | None
     per_file_means: dict[str, int] | None
+    column_statistics: NotRequired[dict[str, SerializedColumnStatistics]]
+
+
+@dataclasses.dataclass(frozen=True)
+class ColumnStatistics:
+    """
+    Column statistics of a data source.
+
+    Every statistic is an estimate for the whole data source,
+    and is None if unknown.
+    """
+
+    null_count: int | None = None
+    """Number of null values."""
+    distinct_count: int | None = None
+    """Number of distinct non-null values."""
+    min_value: int | float | None = None
+    """Minimum non-null value (numeric columns only)."""
+    max_value: int | float | None = None
+    """Maximum non-null value (numeric columns only)."""
+
+    def serialize(self) -> SerializedColumnStatistics:
+        """Return JSON-serializable representation of the column statistics."""
+        return {
+            "null_count": self.null_count,
+            "distinct_count": self.distinct_count,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+        }
+
+    @classmethod
+    def deserialize(cls, data: SerializedColumnStatistics) -> ColumnStatistics:
+        """Deserialize ColumnStatistics from a dictionary."""
+        return cls(
+            data["null_count"],
+            data["distinct_count"],
+            data["min_value"],
+            data["max_value"],
+        )
 
 
 class SerializedStatsEntry(TypedDict):
@@ -60,17 +109,24 @@ class SerializedStatsEntry(TypedDict):
     info: SerializedDataSourceInfo
 
 
+class SerializedRowHintEntry(TypedDict):
+    """The serialized form of an observed row count."""
+
+    stable_id: int
+    row_count: int
+
+
 class DataSourceInfo(Protocol):
     """
     Table data source information.
 
     Notes
     -----
-    Sub-class for specific data source types (e.g. Parquet, DataFrame).
+    Sub-class for specific data source types (e.g. Parquet, CSV, DataFrame).
     """
 
     @property
-    def type(self) -> Literal["parquet", "dataframe"]:
+    def type(self) -> Literal["parquet", "csv", "ndjson", "dataframe"]:
         """The type of the data source. Useful for serialization and deserialization."""
 
     @property
@@ -80,6 +136,9 @@ class DataSourceInfo(Protocol):
     def column_storage_size(self, column: str) -> int | None:
         """Return the average storage size for a single column in one file."""
 
+    def column_statistics(self, column: str) -> ColumnStatistics | None:
+        """Return the statistics of a single column, if known."""
+
     def serialize(self) -> SerializedDataSourceInfo:
         """Return JSON-serializable representation of the data source info."""
 
@@ -91,30 +150,41 @@ class DataSourceInfo(Protocol):
 class StatsCollector:
     """Scan statistics collector."""
 
-    __slots__ = ("scan_stats",)
+    __slots__ = ("row_hints", "scan_stats")
 
     scan_stats: dict[IR, DataSourceInfo]
     """DataSourceInfo for each leaf Scan/DataFrameScan node."""
+    row_hints: dict[int, int]
+    """Row counts observed by an earlier run, keyed by the node's stable ID."""
 
     def __init__(self) -> None:
         self.scan_stats: dict[IR, DataSourceInfo] = {}
+        self.row_hints: dict[int, int] = {}
 
-    def serialize(self, ir: IR) -> list[SerializedStatsEntry]:
+    def serialize(self, ir: IR) -> list[SerializedStatsEntry | SerializedRowHintEntry]:
         """
         Serialize to a JSON-compatible list.
 
         IR nodes are represented by their position in a deterministic
         traversal of *ir* so that the result is independent of object
-        identity.
+        identity. Row hints are already keyed by stable ID.
         """
         node_to_idx = {node: i for i, node in enumerate(traversal([ir]))}
         return [
-            {"index": node_to_idx[node], "info": info.serialize()}
-            for node, info in self.scan_stats.items()
+            *(
+                {"index": node_to_idx[node], "info": info.serialize()}
+                for node, info in self.scan_stats.items()
+            ),
+            *(
+                {"stable_id": stable_id, "row_count": row_count}
+                for stable_id, row_count in sorted(self.row_hints.items())
+            ),
         ]
 
     @classmethod
-    def deserialize(cls, entries: list[SerializedStatsEntry], ir: IR) -> StatsCollector:
+    def deserialize(
+        cls, entries: list[SerializedStatsEntry | SerializedRowHintEntry], ir: IR
+    ) -> StatsCollector:
         """
         Reconstruct a :class:`StatsCollector` from its serialized form.
 
@@ -125,17 +195,31 @@ class StatsCollector:
         ir
             Root of the (pre-lowered) IR graph on the local rank.
         """
-        from cudf_polars.streaming.io import DataFrameSourceInfo, ParquetSourceInfo
+        from cudf_polars.streaming.io import (
+            CSVSourceInfo,
+            DataFrameSourceInfo,
+            NDJSONSourceInfo,
+            ParquetSourceInfo,
+        )
 
         _deserializers: dict[
-            str, type[ParquetSourceInfo] | type[DataFrameSourceInfo]
+            str,
+            type[ParquetSourceInfo]
+            | type[CSVSourceInfo]
+            | type[NDJSONSourceInfo]
+            | type[DataFrameSourceInfo],
         ] = {
             "parquet": ParquetSourceInfo,
+            "csv": CSVSourceInfo,
+            "ndjson": NDJSONSourceInfo,
             "dataframe": DataFrameSourceInfo,
         }
         idx_to_node = dict(enumerate(traversal([ir])))
         stats = cls()
         for entry in entries:
+            if "stable_id" in entry:
+                stats.row_hints[entry["stable_id"]] = entry["row_count"]
+                continue
             info_data = entry["info"]
             info_cls = _deserializers[info_data["type"]]
             stats.scan_stats[idx_to_node[entry["index"]]] = info_cls.deserialize(
@@ -0,0 +1,402 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compare two PDS-H/PDS-DS benchmark runs.
+
+Reads the JSON lines written by the benchmark runners (``--output``) and
+compares the per-query timings of a candidate run against a baseline::
+
+    python -m cudf_polars.streaming.benchmarks.compare baseline.jsonl candidate.jsonl
+
+which is also available as the ``compare`` subcommand of the ``pdsh`` and
+``pdsds`` scripts.
+
+For every query that succeeded in both runs, the speedup is the ratio of
+the baseline and candidate mean durations, with a bootstrap confidence
+interval over the iterations of each run. A query regressed if, with the
+requested confidence, the candidate is slower by more than the threshold.
+The geometric-mean speedup across the queries is reported the same way.
+
+The command exits with status 1 if any query (or the geometric mean)
+regressed, or if a query fails in or is missing from the candidate run
+but not the baseline, so it can gate library upgrades.
+
+WARNING: This is an experimental (and unofficial)
+benchmark script. It is not intended for public use
+and may be modified or removed at any time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import math
+import random
+import sys
+import textwrap
+from pathlib import Path
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__: list[str] = [
+    "BenchmarkRun",
+    "Comparison",
+    "QueryComparison",
+    "build_parser",
+    "compare_runs",
+    "format_comparison",
+    "load_run",
+]
+
+Status = Literal["regressed", "improved", "unchanged", "failed", "missing"]
+
+
+@dataclasses.dataclass
+class BenchmarkRun:
+    """The timings and metadata of one benchmark run."""
+
+    run_id: str
+    query_set: str
+    scale_factor: float
+    frontend: str
+    durations: dict[int, list[float]]
+    """Durations (in seconds) of the successful iterations of every query."""
+    failed: set[int]
+    """Queries with at least one failed iteration."""
+    metadata: dict[str, Any]
+    """Versions, hardware and configuration of the run."""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkRun:
+        """Create a BenchmarkRun from a serialized ``RunConfig``."""
+        durations: dict[int, list[float]] = {}
+        failed: set[int] = set()
+        for query, records in data["records"].items():
+            q_id = int(query)
+            durations[q_id] = [
+                record["duration"]
+                for record in records
+                if record["status"] == "success"
+            ]
+            if any(record["status"] != "success" for record in records):
+                failed.add(q_id)
+        return cls(
+            run_id=data["run_id"],
+            query_set=data["query_set"],
+            scale_factor=data["scale_factor"],
+            frontend=data["frontend"],
+            durations=durations,
+            failed=failed,
+            metadata={
+                "versions": data.get("versions"),
+                "hardware": data.get("hardware"),
+                "streaming_options": data.get("streaming_options"),
+                "iterations": data.get("iterations"),
+                "io_mode": data.get("io_mode"),
+            },
+        )
+
+
+def load_run(path: str | Path, run_id: str | None = None) -> BenchmarkRun:
+    """
+    Load a benchmark run from a results file.
+
+    Parameters
+    ----------
+    path
+        A JSON lines file written by a benchmark runner. Every run appends
+        one line.
+    run_id
+        Prefix of the ID of the run to load. Defaults to the last run in
+        the file.
+
+    Returns
+    -------
+    The benchmark run.
+    """
+    with Path(path).open() as f:
+        runs = [json.loads(line) for line in f if line.strip()]
+    if run_id is not None:
+        runs = [run for run in runs if run["run_id"].startswith(run_id)]
+    if not runs:
+        raise ValueError(
+            f"No benchmark run{f' {run_id!r}' if run_id else ''} in {path}."
+        )
+    return BenchmarkRun.from_dict(runs[-1])
+
+
+@dataclasses.dataclass
+class QueryComparison:
+    """The change in the timing of one query."""
+
+    query: int
+    status: Status
+    baseline: float | None = None
+    """Mean baseline duration, in seconds."""
+    candidate: float | None = None
+    """Mean candidate duration, in seconds."""
+    speedup: float | None = None
+    """Baseline over candidate duration: above one if the candidate is faster."""
+    low: float | None = None
+    """Lower bound of the speedup's confidence interval."""
+    high: float | None = None
+    """Upper bound of the speedup's confidence interval."""
+    candidate_only: bool = False
+    """
+    Whether a failed or missing query only failed in, or is only missing
+    from, the candidate run, which counts as a regression.
+    """
+
+
+@dataclasses.dataclass
+class Comparison:
+    """The comparison of a candidate run against a baseline."""
+
+    queries: list[QueryComparison]
+    geomean: QueryComparison | None
+    """Geometric-mean speedup across the compared queries (``query`` is 0)."""
+    warnings: list[str]
+    """Differences between the runs that may invalidate the comparison."""
+
+    @property
+    def regressed(self) -> bool:
+        """
+        Whether any query, or the geometric mean, regressed.
+
+        A query that fails in, or is missing from, the candidate run but
+        not the baseline also counts as a regression.
+        """
+        return any(
+            comparison.status == "regressed" or comparison.candidate_only
+            for comparison in (
+                *self.queries,
+                *([self.geomean] if self.geomean else []),
+            )
+        )
+
+
+def _classify(low: float, high: float, threshold: float) -> Status:
+    if high < 1 / (1 + threshold):
+        return "regressed"
+    if low > 1 + threshold:
+        return "improved"
+    return "unchanged"
+
+
+def _interval(samples: list[float], confidence: float) -> tuple[float, float]:
+    """Return the percentile interval of bootstrap samples."""
+    samples = sorted(samples)
+    alpha = (1 - confidence) / 2
+    last = len(samples) - 1
+    return (
+        samples[round(alpha * last)],
+        samples[round((1 - alpha) * last)],
+    )
+
+
+def _warnings(baseline: BenchmarkRun, candidate: BenchmarkRun) -> list[str]:
+    warnings = [
+        f"{name} differs: {getattr(baseline, name)!r} != {getattr(candidate, name)!r}"
+        for name in ("query_set", "scale_factor", "frontend")
+        if getattr(baseline, name) != getattr(candidate, name)
+    ]
+    hardware = [run.metadata.get("hardware") or {} for run in (baseline, candidate)]
+    gpus = [[gpu["name"] for gpu in info.get("gpus", [])] for info in hardware]
+    if gpus[0] != gpus[1]:
+        warnings.append(f"GPUs differ: {gpus[0]} != {gpus[1]}")
+    cpus = [(info.get("cpu") or {}).get("model") for info in hardware]
+    if cpus[0] != cpus[1]:
+        warnings.append(f"CPUs differ: {cpus[0]!r} != {cpus[1]!r}")
+    return warnings
+
+
+def compare_runs(
+    baseline: BenchmarkRun,
+    candidate: BenchmarkRun,
+    *,
+    threshold: float = 0.05,
+    confidence: float = 0.95,
+    resamples: int = 2_000,
+    seed: int = 0,
+) -> Comparison:
+    """
+    Compare the query timings of two benchmark runs.
+
+    Parameters
+    ----------
+    baseline
+        The reference run.
+    candidate
+        The run to compare against the baseline.
+    threshold
+        Relative slowdown (e.g. 0.05 for 5%) a query must exceed to be
+        flagged as regressed, and relative speedup to be flagged as improved.
+    confidence
+        Confidence level of the bootstrap intervals.
+    resamples
+        Number of bootstrap resamples.
+    seed
+        Seed of the bootstrap resampling.
+
+    Returns
+    -------
+    The comparison. A query with a single iteration in either run has a
+    degenerate confidence interval, so it is classified by its speedup.
+    """
+    rng = random.Random(seed)
+    queries: list[QueryComparison] = []
+    # Bootstrap samples of the log speedup of every compared query.
+    log_samples: list[list[float]] = []
+    speedups: list[float] = []
+    for query in sorted(baseline.durations.keys() | candidate.durations.keys()):
+        before = baseline.durations.get(query)
+        after = candidate.durations.get(query)
+        if before is None or after is None:
+            queries.append(
+                QueryComparison(query, "missing", candidate_only=after is None)
+            )
+            continue
+        if query in baseline.failed or query in candidate.failed:
+            queries.append(
+                QueryComparison(
+                    query,
+                    "failed",
+                    candidate_only=query not in baseline.failed,
+                )
+            )
+            continue
+        samples = [
+            fmean(rng.choices(before, k=len(before)))
+            / fmean(rng.choices(after, k=len(after)))
+            for _ in range(resamples)
+        ]
+        low, high = _interval(samples, confidence)
+        speedup = fmean(before) / fmean(after)
+        queries.append(
+            QueryComparison(
+                query,
+                _classify(low, high, threshold),
+                baseline=fmean(before),
+                candidate=fmean(after),
+                speedup=speedup,
+                low=low,
+                high=high,
+            )
+        )
+        speedups.append(speedup)
+        log_samples.append([math.log(sample) for sample in samples])
+
+    geomean = None
+    if log_samples:
+        samples = [
+            math.exp(fmean(resample)) for resample in zip(*log_samples, strict=True)
+        ]
+        low, high = _interval(samples, confidence)
+        geomean = QueryComparison(
+            0,
+            _classify(low, high, threshold),
+            speedup=math.exp(fmean(math.log(speedup) for speedup in speedups)),
+            low=low,
+            high=high,
+        )
+    return Comparison(queries, geomean, _warnings(baseline, candidate))
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """Format a comparison as a table."""
+
+    def fmt(value: float | None, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    lines = [
+        f"{'query':>8} {'baseline':>10} {'candidate':>10} {'speedup':>8} "
+        f"{'interval':>17}  status",
+    ]
+    rows = [
+        *((str(q.query), q) for q in comparison.queries),
+        *([("geomean", comparison.geomean)] if comparison.geomean else []),
+    ]
+    for name, q in rows:
+        interval = (
+            "-" if q.low is None or q.high is None else f"[{q.low:.3f}, {q.high:.3f}]"
+        )
+        lines.append(
+            f"{name:>8} {fmt(q.baseline, '10.4f'):>10} "
+            f"{fmt(q.candidate, '10.4f'):>10} {fmt(q.speedup, '7.3f')}x "
+            f"{interval:>17}  {q.status}"
+        )
+    lines.extend(f"warning: {warning}" for warning in comparison.warnings)
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for comparing benchmark runs."""
+    parser = argparse.ArgumentParser(
+        prog="Cudf-Polars PDS-H/PDS-DS Benchmark Comparison",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("baseline", type=str, help="Results file of the baseline.")
+    parser.add_argument("candidate", type=str, help="Results file of the candidate.")
+    parser.add_argument(
+        "--baseline-run",
+        type=str,
+        default=None,
+        help="ID (prefix) of the baseline run. Default: the last run in the file.",
+    )
+    parser.add_argument(
+        "--candidate-run",
+        type=str,
+        default=None,
+        help="ID (prefix) of the candidate run. Default: the last run in the file.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help=textwrap.dedent("""\
+            Relative slowdown past which a query regresses.
+            Default: 0.05"""),
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the bootstrap intervals. Default: 0.95",
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=2_000,
+        help="Number of bootstrap resamples. Default: 2000",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the bootstrap resampling. Default: 0",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Compare two benchmark runs, returning 1 if any query regressed."""
+    args = build_parser().parse_args(argv)
+    comparison = compare_runs(
+        load_run(args.baseline, args.baseline_run),
+        load_run(args.candidate, args.candidate_run),
+        threshold=args.threshold,
+        confidence=args.confidence,
+        resamples=args.resamples,
+        seed=args.seed,
+    )
+    print(format_comparison(comparison))
+    return 1 if comparison.regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1060 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Deterministic PDS-H data generator.
+
+Writes the eight PDS-H tables at any scale factor, so that the benchmarks
+can run without building and running the external ``dbgen`` tool::
+
+    python -m cudf_polars.streaming.benchmarks.datagen --scale 10 --path /data/sf10
+
+The cardinalities, key relationships and value domains follow the TPC-H
+specification (section 4.2.3). Comments are substrings of a text pool
+built from the specification's grammar, as ``dbgen`` does, but the values
+are not identical to those of ``dbgen``.
+
+Every value is a function of the seed, the column and the row's key, so
+the output does not depend on how the work is split into files, chunks or
+threads, and two runs with the same options write byte-identical files
+(for a given Polars version, which determines the Parquet encoding).
+
+Every table is written in parallel files, and every file as a stream of
+chunks of ``--chunk-rows`` rows, so memory use is bounded by the number of
+workers times the chunk size (unless the files are sorted).
+
+WARNING: This is an experimental (and unofficial)
+benchmark script. It is not intended for public use
+and may be modified or removed at any time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import dataclasses
+import hashlib
+import os
+import random
+import string
+import textwrap
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+__all__: list[str] = ["PDSH_TABLES", "build_parser", "generate"]
+
+PDSH_TABLES = (
+    "region",
+    "nation",
+    "supplier",
+    "customer",
+    "part",
+    "partsupp",
+    "orders",
+    "lineitem",
+)
+
+REGIONS = ["AFRICA", "AMERICA", "ASIA", "EUROPE", "MIDDLE EAST"]
+NATIONS = [
+    ("ALGERIA", 0),
+    ("ARGENTINA", 1),
+    ("BRAZIL", 1),
+    ("CANADA", 1),
+    ("EGYPT", 4),
+    ("ETHIOPIA", 0),
+    ("FRANCE", 3),
+    ("GERMANY", 3),
+    ("INDIA", 2),
+    ("INDONESIA", 2),
+    ("IRAN", 4),
+    ("IRAQ", 4),
+    ("JAPAN", 2),
+    ("JORDAN", 4),
+    ("KENYA", 0),
+    ("MOROCCO", 0),
+    ("MOZAMBIQUE", 0),
+    ("PERU", 1),
+    ("CHINA", 2),
+    ("ROMANIA", 3),
+    ("SAUDI ARABIA", 4),
+    ("VIETNAM", 2),
+    ("RUSSIA", 3),
+    ("UNITED KINGDOM", 3),
+    ("UNITED STATES", 1),
+]
+COLORS = [
+    "almond",
+    "antique",
+    "aquamarine",
+    "azure",
+    "beige",
+    "bisque",
+    "black",
+    "blanched",
+    "blue",
+    "blush",
+    "brown",
+    "burlywood",
+    "burnished",
+    "chartreuse",
+    "chiffon",
+    "chocolate",
+    "coral",
+    "cornflower",
+    "cornsilk",
+    "cream",
+    "cyan",
+    "dark",
+    "deep",
+    "dim",
+    "dodger",
+    "drab",
+    "firebrick",
+    "floral",
+    "forest",
+    "frosted",
+    "gainsboro",
+    "ghost",
+    "goldenrod",
+    "green",
+    "grey",
+    "honeydew",
+    "hot",
+    "indian",
+    "ivory",
+    "khaki",
+    "lace",
+    "lavender",
+    "lawn",
+    "lemon",
+    "light",
+    "lime",
+    "linen",
+    "magenta",
+    "maroon",
+    "medium",
+    "metallic",
+    "midnight",
+    "mint",
+    "misty",
+    "moccasin",
+    "navajo",
+    "navy",
+    "olive",
+    "orange",
+    "orchid",
+    "pale",
+    "papaya",
+    "peach",
+    "peru",
+    "pink",
+    "plum",
+    "powder",
+    "puff",
+    "purple",
+    "red",
+    "rose",
+    "rosy",
+    "royal",
+    "saddle",
+    "salmon",
+    "sandy",
+    "seashell",
+    "sienna",
+    "sky",
+    "slate",
+    "smoke",
+    "snow",
+    "spring",
+    "steel",
+    "tan",
+    "thistle",
+    "tomato",
+    "turquoise",
+    "violet",
+    "wheat",
+    "white",
+    "yellow",
+]
+TYPE_SYLLABLES = [
+    ["STANDARD", "SMALL", "MEDIUM", "LARGE", "ECONOMY", "PROMO"],
+    ["ANODIZED", "BURNISHED", "PLATED", "POLISHED", "BRUSHED"],
+    ["TIN", "NICKEL", "BRASS", "STEEL", "COPPER"],
+]
+CONTAINER_SYLLABLES = [
+    ["SM", "LG", "MED", "JUMBO", "WRAP"],
+    ["CASE", "BOX", "BAG", "JAR", "PKG", "PACK", "CAN", "DRUM"],
+]
+SEGMENTS = ["AUTOMOBILE", "BUILDING", "FURNITURE", "MACHINERY", "HOUSEHOLD"]
+PRIORITIES = ["1-URGENT", "2-HIGH", "3-MEDIUM", "4-NOT SPECIFIED", "5-LOW"]
+INSTRUCTIONS = ["DELIVER IN PERSON", "COLLECT COD", "NONE", "TAKE BACK RETURN"]
+MODES = ["REG AIR", "AIR", "RAIL", "SHIP", "TRUCK", "MAIL", "FOB"]
+
+# Words of the comment grammar (TPC-H specification 4.2.2.14)
+NOUNS = [
+    "foxes",
+    "ideas",
+    "theodolites",
+    "pinto beans",
+    "instructions",
+    "dependencies",
+    "excuses",
+    "platelets",
+    "asymptotes",
+    "courts",
+    "dolphins",
+    "multipliers",
+    "sauternes",
+    "warthogs",
+    "frets",
+    "dinos",
+    "attainments",
+    "somas",
+    "Tiresias",
+    "patterns",
+    "forges",
+    "braids",
+    "hockey players",
+    "frays",
+    "warhorses",
+    "dugouts",
+    "notornis",
+    "epitaphs",
+    "pearls",
+    "tithes",
+    "waters",
+    "orbits",
+    "gifts",
+    "sheaves",
+    "depths",
+    "sentiments",
+    "decoys",
+    "realms",
+    "pains",
+    "grouches",
+    "escapades",
+    "accounts",
+    "packages",
+    "requests",
+    "deposits",
+]
+VERBS = [
+    "sleep",
+    "wake",
+    "are",
+    "cajole",
+    "haggle",
+    "nag",
+    "use",
+    "boost",
+    "affix",
+    "detect",
+    "integrate",
+    "maintain",
+    "nod",
+    "was",
+    "lose",
+    "sublate",
+    "solve",
+    "thrash",
+    "promise",
+    "engage",
+    "hinder",
+    "print",
+    "x-ray",
+    "breach",
+    "eat",
+    "grow",
+    "impress",
+    "mold",
+    "poach",
+    "serve",
+    "run",
+    "dazzle",
+    "snooze",
+    "doze",
+    "unwind",
+    "kindle",
+    "play",
+    "hang",
+    "believe",
+    "doubt",
+]
+ADJECTIVES = [
+    "furious",
+    "sly",
+    "careful",
+    "blithe",
+    "quick",
+    "fluffy",
+    "slow",
+    "quiet",
+    "ruthless",
+    "thin",
+    "close",
+    "dogged",
+    "daring",
+    "brave",
+    "stealthy",
+    "permanent",
+    "enticing",
+    "idle",
+    "busy",
+    "regular",
+    "final",
+    "ironic",
+    "even",
+    "bold",
+    "silent",
+    "special",
+    "pending",
+    "unusual",
+    "express",
+]
+ADVERBS = [
+    "sometimes",
+    "always",
+    "never",
+    "furiously",
+    "slyly",
+    "carefully",
+    "blithely",
+    "quickly",
+    "fluffily",
+    "slowly",
+    "quietly",
+    "ruthlessly",
+    "thinly",
+    "closely",
+    "doggedly",
+    "daringly",
+    "bravely",
+    "stealthily",
+    "permanently",
+    "enticingly",
+    "idly",
+    "busily",
+    "regularly",
+    "finally",
+    "ironically",
+    "evenly",
+    "boldly",
+    "silently",
+]
+PREPOSITIONS = [
+    "about",
+    "above",
+    "across",
+    "after",
+    "against",
+    "along",
+    "among",
+    "around",
+    "at",
+    "atop",
+    "before",
+    "behind",
+    "beneath",
+    "beside",
+    "besides",
+    "between",
+    "beyond",
+    "by",
+    "despite",
+    "during",
+    "except",
+    "for",
+    "from",
+    "inside",
+    "into",
+    "near",
+    "of",
+    "on",
+    "outside",
+    "over",
+    "past",
+    "since",
+    "through",
+    "throughout",
+    "to",
+    "toward",
+    "under",
+    "until",
+    "up",
+    "upon",
+    "without",
+    "with",
+    "within",
+]
+TERMINATORS = [".", ";", ":", "?", "!", "--"]
+
+# Dates of the specification, as days since the epoch
+_EPOCH = date(1970, 1, 1)
+START_DATE = (date(1992, 1, 1) - _EPOCH).days
+END_DATE = (date(1998, 12, 31) - _EPOCH).days
+CURRENT_DATE = (date(1995, 6, 17) - _EPOCH).days
+
+# Size of the text pools that comments and addresses are sliced from
+_TEXT_POOL_SIZE = 1 << 20
+_CHAR_POOL_SIZE = 1 << 16
+
+# Constants of the SplitMix64 finalizer
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+NumericType = Literal["decimal", "float"]
+
+
+def _text_pool(seed: int) -> str:
+    """Return the pool of comment text."""
+    rng = random.Random(seed)
+    sentences: list[str] = []
+    size = 0
+    while size < _TEXT_POOL_SIZE:
+        words = [rng.choice(ADJECTIVES), rng.choice(NOUNS), rng.choice(VERBS)]
+        if rng.random() < 0.5:
+            words.append(rng.choice(ADVERBS))
+        if rng.random() < 0.5:
+            words.extend([rng.choice(PREPOSITIONS), "the", rng.choice(NOUNS)])
+        sentence = " ".join(words) + rng.choice(TERMINATORS)
+        sentences.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(sentences)[:_TEXT_POOL_SIZE]
+
+
+def _char_pool(seed: int) -> str:
+    """Return the pool of random address characters."""
+    rng = random.Random(seed)
+    return "".join(
+        rng.choices(string.ascii_letters + string.digits + ",. ", k=_CHAR_POOL_SIZE)
+    )
+
+
+def _lookup(index: pl.Expr, values: Sequence[str] | Sequence[int]) -> pl.Expr:
+    """Return ``values[index]`` for every row."""
+    return index.replace_strict(list(range(len(values))), list(values))
+
+
+def _zfill(key: pl.Expr, width: int = 9) -> pl.Expr:
+    return key.cast(pl.String).str.zfill(width)
+
+
+def _as_date(days: pl.Expr) -> pl.Expr:
+    return days.cast(pl.Int32).cast(pl.Date)
+
+
+def _rows(start: int, stop: int) -> pl.LazyFrame:
+    """Return the row indices ``[start, stop)`` of a table chunk."""
+    return pl.LazyFrame().select(pl.int_range(start, stop, dtype=pl.Int64).alias("_i"))
+
+
+def _scaled(scale_factor: float, base: int) -> int:
+    return max(1, round(scale_factor * base))
+
+
+def _retail_cents(partkey: pl.Expr) -> pl.Expr:
+    """Return the retail price of a part, in cents."""
+    return 90_000 + (partkey // 10) % 20_001 + 100 * (partkey % 1_000)
+
+
+@dataclasses.dataclass(frozen=True)
+class Generator:
+    """
+    Generator of the PDS-H tables.
+
+    Parameters
+    ----------
+    scale_factor
+        Scale factor of the dataset, e.g. 1 for about 1 GB of raw data.
+    seed
+        Seed of the random values.
+    numeric_type
+        Whether to store prices, balances and quantities as ``Decimal(15, 2)``
+        (as in the specification) or as ``Float64``.
+    """
+
+    scale_factor: float
+    seed: int = 0
+    numeric_type: NumericType = "decimal"
+    _text: str = dataclasses.field(init=False, repr=False)
+    _chars: str = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_text", _text_pool(self.seed))
+        object.__setattr__(self, "_chars", _char_pool(self.seed))
+
+    @property
+    def suppliers(self) -> int:
+        """Number of rows of the supplier table."""
+        return _scaled(self.scale_factor, 10_000)
+
+    @property
+    def customers(self) -> int:
+        """Number of rows of the customer table."""
+        return _scaled(self.scale_factor, 150_000)
+
+    @property
+    def parts(self) -> int:
+        """Number of rows of the part table."""
+        return _scaled(self.scale_factor, 200_000)
+
+    @property
+    def orders(self) -> int:
+        """Number of rows of the orders table."""
+        return _scaled(self.scale_factor, 1_500_000)
+
+    def num_rows(self, table: str) -> int:
+        """
+        Return the number of generation units of a table.
+
+        This is the number of rows, except for ``lineitem``, which is
+        generated by order (with one to seven line items per order).
+        """
+        return {
+            "region": len(REGIONS),
+            "nation": len(NATIONS),
+            "supplier": self.suppliers,
+            "customer": self.customers,
+            "part": self.parts,
+            "partsupp": 4 * self.parts,
+            "orders": self.orders,
+            "lineitem": self.orders,
+        }[table]
+
+    def chunk(self, table: str, start: int, stop: int) -> pl.LazyFrame:
+        """Return rows ``[start, stop)`` of a table (see :meth:`num_rows`)."""
+        build: Callable[[int, int], pl.LazyFrame] = getattr(self, f"_{table}")
+        return build(start, stop)
+
+    def _integers(self, key: pl.Expr, column: str, low: int, high: int) -> pl.Expr:
+        """Return uniform random integers in ``[low, high]`` for every row key."""
+        digest = hashlib.blake2b(
+            f"{self.seed}/{column}".encode(), digest_size=8
+        ).digest()
+        stream = int.from_bytes(digest, "little")
+        # SplitMix64 of the key in the column's stream. The arithmetic on
+        # unsigned integers wraps around.
+        z = key.cast(pl.UInt64) * pl.lit(_GAMMA, dtype=pl.UInt64) + pl.lit(
+            stream, dtype=pl.UInt64
+        )
+        z = (z ^ (z // (1 << 30))) * pl.lit(_MIX1, dtype=pl.UInt64)
+        z = (z ^ (z // (1 << 27))) * pl.lit(_MIX2, dtype=pl.UInt64)
+        z = z ^ (z // (1 << 31))
+        return (z % (high - low + 1)).cast(pl.Int64) + low
+
+    def _choice(self, key: pl.Expr, column: str, values: Sequence[str]) -> pl.Expr:
+        return _lookup(self._integers(key, column, 0, len(values) - 1), values)
+
+    def _slice(
+        self, pool: str, key: pl.Expr, column: str, low: int, high: int
+    ) -> pl.Expr:
+        length = self._integers(key, f"{column}/length", low, high)
+        offset = self._integers(key, f"{column}/offset", 0, len(pool) - high)
+        return pl.lit(pool).str.slice(offset, length)
+
+    def _text_column(self, key: pl.Expr, column: str, low: int, high: int) -> pl.Expr:
+        """Return random comments of ``low`` to ``high`` characters."""
+        return self._slice(self._text, key, column, low, high)
+
+    def _address(self, key: pl.Expr, column: str) -> pl.Expr:
+        return self._slice(self._chars, key, column, 10, 40)
+
+    def _phone(self, key: pl.Expr, column: str, nationkey: pl.Expr) -> pl.Expr:
+        return pl.format(
+            "{}-{}-{}-{}",
+            nationkey + 10,
+            self._integers(key, f"{column}/1", 100, 999),
+            self._integers(key, f"{column}/2", 100, 999),
+            self._integers(key, f"{column}/3", 1_000, 9_999),
+        )
+
+    def _money(self, cents: pl.Expr) -> pl.Expr:
+        """Convert an amount in cents to the configured numeric type."""
+        if self.numeric_type == "float":
+            return cents / 100
+        units = cents.abs()
+        return pl.format(
+            "{}{}.{}",
+            pl.when(cents < 0).then(pl.lit("-")).otherwise(pl.lit("")),
+            units // 100,
+            _zfill(units % 100, 2),
+        ).cast(pl.Decimal(15, 2))
+
+    def _suppkey(self, partkey: pl.Expr, index: pl.Expr) -> pl.Expr:
+        """Return the ``index``-th supplier (of four) of a part."""
+        n = self.suppliers
+        return (partkey + index * (n // 4 + (partkey - 1) // n)) % n + 1
+
+    def _region(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i")
+        return _rows(start, stop).select(
+            key.alias("r_regionkey"),
+            _lookup(key, REGIONS).alias("r_name"),
+            self._text_column(key, "r_comment", 31, 115).alias("r_comment"),
+        )
+
+    def _nation(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i")
+        names, regions = zip(*NATIONS, strict=True)
+        return _rows(start, stop).select(
+            key.alias("n_nationkey"),
+            _lookup(key, names).alias("n_name"),
+            _lookup(key, regions).cast(pl.Int64).alias("n_regionkey"),
+            self._text_column(key, "n_comment", 31, 114).alias("n_comment"),
+        )
+
+    def _supplier(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i") + 1
+        nationkey = self._integers(key, "s_nationkey", 0, len(NATIONS) - 1)
+        comment = self._text_column(key, "s_comment", 25, 100)
+        # Five in every 10,000 suppliers have complaints, and five have
+        # recommendations (see query 16).
+        remark = self._integers(key, "s_comment/remark", 0, 9_999)
+        return _rows(start, stop).select(
+            key.alias("s_suppkey"),
+            pl.format("Supplier#{}", _zfill(key)).alias("s_name"),
+            self._address(key, "s_address").alias("s_address"),
+            nationkey.alias("s_nationkey"),
+            self._phone(key, "s_phone", nationkey).alias("s_phone"),
+            self._money(self._integers(key, "s_acctbal", -99_999, 999_999)).alias(
+                "s_acctbal"
+            ),
+            pl.when(remark < 5)
+            .then(pl.format("Customer {} Complaints", comment))
+            .when(remark < 10)
+            .then(pl.format("Customer {} Recommends", comment))
+            .otherwise(comment)
+            .alias("s_comment"),
+        )
+
+    def _customer(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i") + 1
+        nationkey = self._integers(key, "c_nationkey", 0, len(NATIONS) - 1)
+        return _rows(start, stop).select(
+            key.alias("c_custkey"),
+            pl.format("Customer#{}", _zfill(key)).alias("c_name"),
+            self._address(key, "c_address").alias("c_address"),
+            nationkey.alias("c_nationkey"),
+            self._phone(key, "c_phone", nationkey).alias("c_phone"),
+            self._money(self._integers(key, "c_acctbal", -99_999, 999_999)).alias(
+                "c_acctbal"
+            ),
+            self._choice(key, "c_mktsegment", SEGMENTS).alias("c_mktsegment"),
+            self._text_column(key, "c_comment", 29, 116).alias("c_comment"),
+        )
+
+    def _part(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i") + 1
+        # Five distinct colors: the offsets between consecutive colors sum
+        # to less than the number of colors.
+        colors = [self._integers(key, "p_name/0", 0, len(COLORS) - 1)]
+        for i in range(1, 5):
+            colors.append(colors[-1] + self._integers(key, f"p_name/{i}", 1, 18))
+        manufacturer = self._integers(key, "p_mfgr", 1, 5)
+        return _rows(start, stop).select(
+            key.alias("p_partkey"),
+            pl.concat_str(
+                [_lookup(color % len(COLORS), COLORS) for color in colors],
+                separator=" ",
+            ).alias("p_name"),
+            pl.format("Manufacturer#{}", manufacturer).alias("p_mfgr"),
+            pl.format(
+                "Brand#{}{}", manufacturer, self._integers(key, "p_brand", 1, 5)
+            ).alias("p_brand"),
+            pl.concat_str(
+                [
+                    self._choice(key, f"p_type/{i}", syllables)
+                    for i, syllables in enumerate(TYPE_SYLLABLES)
+                ],
+                separator=" ",
+            ).alias("p_type"),
+            self._integers(key, "p_size", 1, 50).alias("p_size"),
+            pl.concat_str(
+                [
+                    self._choice(key, f"p_container/{i}", syllables)
+                    for i, syllables in enumerate(CONTAINER_SYLLABLES)
+                ],
+                separator=" ",
+            ).alias("p_container"),
+            self._money(_retail_cents(key)).alias("p_retailprice"),
+            self._text_column(key, "p_comment", 5, 22).alias("p_comment"),
+        )
+
+    def _partsupp(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_i")
+        partkey = key // 4 + 1
+        return _rows(start, stop).select(
+            partkey.alias("ps_partkey"),
+            self._suppkey(partkey, key % 4).alias("ps_suppkey"),
+            self._integers(key, "ps_availqty", 1, 9_999).alias("ps_availqty"),
+            self._money(self._integers(key, "ps_supplycost", 100, 100_000)).alias(
+                "ps_supplycost"
+            ),
+            self._text_column(key, "ps_comment", 49, 198).alias("ps_comment"),
+        )
+
+    def _lines(self, start: int, stop: int) -> pl.LazyFrame:
+        """
+        Return the line items of orders ``[start, stop)``.
+
+        Amounts are in cents and dates in days since the epoch.
+        """
+        # Only the first eight of every 32 order keys are used.
+        orderkey = (pl.col("_i") // 8) * 32 + pl.col("_i") % 8 + 1
+        key = pl.col("_orderkey") * 8 + pl.col("l_linenumber")
+        count = self._integers(pl.col("_orderkey"), "l_linenumber", 1, 7)
+        shipdate = pl.col("o_orderdate") + self._integers(key, "l_shipdate", 1, 121)
+        return (
+            _rows(start, stop)
+            .with_columns(orderkey.alias("_orderkey"))
+            .with_columns(
+                self._integers(
+                    pl.col("_orderkey"), "o_orderdate", START_DATE, END_DATE - 151
+                ).alias("o_orderdate"),
+                pl.int_ranges(1, count + 1).alias("l_linenumber"),
+            )
+            .explode("l_linenumber")
+            .with_columns(
+                self._integers(key, "l_partkey", 1, self.parts).alias("l_partkey"),
+                self._integers(key, "l_quantity", 1, 50).alias("l_quantity"),
+                self._integers(key, "l_discount", 0, 10).alias("l_discount"),
+                self._integers(key, "l_tax", 0, 8).alias("l_tax"),
+                shipdate.alias("l_shipdate"),
+                (
+                    pl.col("o_orderdate") + self._integers(key, "l_commitdate", 30, 90)
+                ).alias("l_commitdate"),
+                (shipdate + self._integers(key, "l_receiptdate", 1, 30)).alias(
+                    "l_receiptdate"
+                ),
+            )
+            .with_columns(
+                (pl.col("l_quantity") * _retail_cents(pl.col("l_partkey"))).alias(
+                    "l_extendedprice"
+                ),
+                pl.when(pl.col("l_shipdate") > CURRENT_DATE)
+                .then(pl.lit("O"))
+                .otherwise(pl.lit("F"))
+                .alias("l_linestatus"),
+            )
+        )
+
+    def _orders(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_orderkey")
+        # Customers whose key is divisible by three have no orders.
+        customers = self.customers - self.customers // 3
+        customer = self._integers(key, "o_custkey", 0, customers - 1)
+        linestatus = pl.col("l_linestatus")
+        charge = (
+            pl.col("l_extendedprice")
+            * (100 + pl.col("l_tax"))
+            * (100 - pl.col("l_discount"))
+            + 5_000
+        ) // 10_000
+        return (
+            self._lines(start, stop)
+            .group_by("_i", "_orderkey", "o_orderdate", maintain_order=True)
+            .agg(
+                pl.when((linestatus == "F").all())
+                .then(pl.lit("F"))
+                .when((linestatus == "O").all())
+                .then(pl.lit("O"))
+                .otherwise(pl.lit("P"))
+                .alias("o_orderstatus"),
+                charge.sum().alias("o_totalprice"),
+            )
+            .select(
+                key.alias("o_orderkey"),
+                ((customer // 2) * 3 + customer % 2 + 1).alias("o_custkey"),
+                pl.col("o_orderstatus"),
+                self._money(pl.col("o_totalprice")).alias("o_totalprice"),
+                _as_date(pl.col("o_orderdate")).alias("o_orderdate"),
+                self._choice(key, "o_orderpriority", PRIORITIES).alias(
+                    "o_orderpriority"
+                ),
+                pl.format(
+                    "Clerk#{}",
+                    _zfill(
+                        self._integers(
+                            key, "o_clerk", 1, _scaled(self.scale_factor, 1_000)
+                        )
+                    ),
+                ).alias("o_clerk"),
+                pl.lit(0, dtype=pl.Int64).alias("o_shippriority"),
+                self._text_column(key, "o_comment", 19, 78).alias("o_comment"),
+            )
+        )
+
+    def _lineitem(self, start: int, stop: int) -> pl.LazyFrame:
+        key = pl.col("_orderkey") * 8 + pl.col("l_linenumber")
+        partkey = pl.col("l_partkey")
+        return self._lines(start, stop).select(
+            pl.col("_orderkey").alias("l_orderkey"),
+            partkey,
+            self._suppkey(partkey, self._integers(key, "l_suppkey", 0, 3)).alias(
+                "l_suppkey"
+            ),
+            pl.col("l_linenumber"),
+            self._money(pl.col("l_quantity") * 100).alias("l_quantity"),
+            self._money(pl.col("l_extendedprice")).alias("l_extendedprice"),
+            self._money(pl.col("l_discount")).alias("l_discount"),
+            self._money(pl.col("l_tax")).alias("l_tax"),
+            pl.when(pl.col("l_receiptdate") <= CURRENT_DATE)
+            .then(self._choice(key, "l_returnflag", ["R", "A"]))
+            .otherwise(pl.lit("N"))
+            .alias("l_returnflag"),
+            pl.col("l_linestatus"),
+            _as_date(pl.col("l_shipdate")).alias("l_shipdate"),
+            _as_date(pl.col("l_commitdate")).alias("l_commitdate"),
+            _as_date(pl.col("l_receiptdate")).alias("l_receiptdate"),
+            self._choice(key, "l_shipinstruct", INSTRUCTIONS).alias("l_shipinstruct"),
+            self._choice(key, "l_shipmode", MODES).alias("l_shipmode"),
+            self._text_column(key, "l_comment", 10, 43).alias("l_comment"),
+        )
+
+
+def _write_file(
+    generator: Generator,
+    table: str,
+    start: int,
+    stop: int,
+    path: Path,
+    *,
+    chunk_rows: int,
+    row_group_size: int | None,
+    compression: str,
+    sort_by: Sequence[str],
+) -> Path:
+    """Write rows ``[start, stop)`` of a table to a Parquet file."""
+    frame = pl.concat(
+        [
+            generator.chunk(table, begin, min(begin + chunk_rows, stop))
+            for begin in range(start, stop, chunk_rows)
+        ]
+    )
+    if sort_by:
+        frame = frame.sort(sort_by, maintain_order=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame.sink_parquet(
+        path,
+        compression=compression,  # type: ignore[arg-type]
+        row_group_size=row_group_size,
+    )
+    return path
+
+
+def generate(
+    path: str | Path,
+    scale_factor: float,
+    *,
+    tables: Sequence[str] = PDSH_TABLES,
+    seed: int = 0,
+    numeric_type: NumericType = "decimal",
+    files: int = 1,
+    chunk_rows: int = 1_000_000,
+    row_group_size: int | None = None,
+    compression: str = "zstd",
+    sort_by: dict[str, list[str]] | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """
+    Generate a PDS-H dataset.
+
+    Parameters
+    ----------
+    path
+        Directory to write the tables to.
+    scale_factor
+        Scale factor of the dataset.
+    tables
+        Names of the tables to write.
+    seed
+        Seed of the random values.
+    numeric_type
+        Type of prices, balances and quantities: ``"decimal"`` or ``"float"``.
+    files
+        Number of files to write for every table. If one, table ``t`` is
+        written to ``{path}/t.parquet``. Otherwise, it is written to the
+        directory ``{path}/t/``, with at most as many files as rows.
+    chunk_rows
+        Number of rows to generate at once (orders, for ``lineitem``).
+    row_group_size
+        Number of rows per Parquet row group. Defaults to the Polars default.
+    compression
+        Parquet compression codec.
+    sort_by
+        Columns to sort the files of each table by. Each file is sorted
+        independently, and in memory.
+    workers
+        Number of files to write concurrently. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    The paths of the written files.
+    """
+    unknown = set(tables) - set(PDSH_TABLES)
+    if unknown:
+        raise ValueError(f"Unknown PDS-H tables: {sorted(unknown)}.")
+    if files < 1 or chunk_rows < 1:
+        raise ValueError("files and chunk_rows must be positive.")
+    generator = Generator(scale_factor, seed=seed, numeric_type=numeric_type)
+    root = Path(path)
+    tasks = []
+    for table in tables:
+        num_rows = generator.num_rows(table)
+        num_files = min(files, num_rows)
+        tasks.extend(
+            (
+                table,
+                num_rows * i // num_files,
+                num_rows * (i + 1) // num_files,
+                root / f"{table}.parquet"
+                if files == 1
+                else root / table / f"part.{i}.parquet",
+            )
+            for i in range(num_files)
+        )
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers or os.cpu_count()
+    ) as pool:
+        futures = [
+            pool.submit(
+                _write_file,
+                generator,
+                table,
+                start,
+                stop,
+                file_path,
+                chunk_rows=chunk_rows,
+                row_group_size=row_group_size,
+                compression=compression,
+                sort_by=(sort_by or {}).get(table, []),
+            )
+            for table, start, stop, file_path in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def _sort_by_type(value: str) -> tuple[str, list[str]]:
+    table, sep, columns = value.partition("=")
+    if not sep or not columns:
+        raise argparse.ArgumentTypeError(
+            f"Expected TABLE=COLUMN[,COLUMN...], got {value!r}."
+        )
+    return table, columns.split(",")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the PDS-H data generator."""
+    parser = argparse.ArgumentParser(
+        prog="Cudf-Polars PDS-H Data Generator",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        required=True,
+        help="Directory to write the dataset to.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        required=True,
+        help="Dataset scale factor.",
+    )
+    parser.add_argument(
+        "--tables",
+        type=lambda value: value.split(","),
+        default=list(PDSH_TABLES),
+        help="Comma-separated list of tables to write. Default: all tables.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the random values. Default: 0",
+    )
+    parser.add_argument(
+        "--numeric-type",
+        choices=["decimal", "float"],
+        default="decimal",
+        help=textwrap.dedent("""\
+            Type of prices, balances and quantities:
+                - decimal : Decimal(15, 2), as in the specification
+                - float   : Float64
+            Default: decimal"""),
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=1,
+        help=textwrap.dedent("""\
+            Number of files per table. With more than one file, every
+            table is written to a directory (use --suffix '' to run the
+            benchmarks on it). Default: 1"""),
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=1_000_000,
+        help="Number of rows to generate at once. Default: 1000000",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Number of rows per Parquet row group. Default: Polars default",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["lz4", "uncompressed", "snappy", "gzip", "brotli", "zstd"],
+        default="zstd",
+        help="Parquet compression codec. Default: zstd",
+    )
+    parser.add_argument(
+        "--sort-by",
+        type=_sort_by_type,
+        action="append",
+        default=[],
+        metavar="TABLE=COLUMN[,COLUMN...]",
+        help=textwrap.dedent("""\
+            Sort the files of a table by the given columns (e.g.
+            lineitem=l_shipdate). May be repeated. Every file is sorted
+            in memory."""),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of files to write concurrently. Default: number of CPUs",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Generate a PDS-H dataset from command-line arguments."""
+    args = build_parser().parse_args(argv)
+    paths = generate(
+        args.path,
+        args.scale,
+        tables=args.tables,
+        seed=args.seed,
+        numeric_type=args.numeric_type,
+        files=args.files,
+        chunk_rows=args.chunk_rows,
+        row_group_size=args.row_group_size,
+        compression=args.compression,
+        sort_by=dict(args.sort_by),
+        workers=args.workers,
+    )
+    print(f"Wrote {len(paths)} files to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
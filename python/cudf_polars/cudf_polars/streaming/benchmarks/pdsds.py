@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import importlib
 import os
+import sys
 from typing import TYPE_CHECKING, ClassVar
 
 import polars as pl
@@ -331,6 +332,10 @@ class PDSDSDuckDBQueries(PDSDSQueries):
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["compare"]:
+        from cudf_polars.streaming.benchmarks.compare import main
+
+        sys.exit(main(sys.argv[2:]))
     parser = build_parser(num_queries=99)
     args = parse_args(parser=parser)
     if args.frontend not in _CPU_ENGINES:
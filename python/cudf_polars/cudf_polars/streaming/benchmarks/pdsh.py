@@ -14,6 +14,7 @@ and may be modified or removed at any time.
 from __future__ import annotations
 
 import os
+import sys
 from datetime import date
 from typing import TYPE_CHECKING
 
@@ -1798,6 +1799,10 @@ class PDSHDuckDBQueries:
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["compare"]:
+        from cudf_polars.streaming.benchmarks.compare import main
+
+        sys.exit(main(sys.argv[2:]))
     parser = build_parser(num_queries=22)
     args = parse_args(parser=parser)
     if args.frontend not in _CPU_ENGINES:
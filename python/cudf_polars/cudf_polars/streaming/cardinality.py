@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cardinality estimation from datasource column statistics.
+
+The estimates here follow the usual textbook assumptions: values are
+uniformly distributed between the minimum and maximum of a column,
+columns are independent, and the key values of the smaller side of an
+equi-join are contained in the key values of the larger side. They are
+only heuristics used to rank plan alternatives.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+import pylibcudf as plc
+
+from cudf_polars.dsl import expr
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from cudf_polars.streaming.base import ColumnStatistics
+
+
+class SourceColumnStatistics(NamedTuple):
+    """Statistics of the datasource column that a column originates from."""
+
+    statistics: ColumnStatistics
+    row_count: int
+    """Row count of the datasource."""
+
+
+_FLIPPED_COMPARISONS: dict[plc.binaryop.BinaryOperator, plc.binaryop.BinaryOperator] = {
+    plc.binaryop.BinaryOperator.EQUAL: plc.binaryop.BinaryOperator.EQUAL,
+    plc.binaryop.BinaryOperator.NOT_EQUAL: plc.binaryop.BinaryOperator.NOT_EQUAL,
+    plc.binaryop.BinaryOperator.LESS: plc.binaryop.BinaryOperator.GREATER,
+    plc.binaryop.BinaryOperator.LESS_EQUAL: plc.binaryop.BinaryOperator.GREATER_EQUAL,
+    plc.binaryop.BinaryOperator.GREATER: plc.binaryop.BinaryOperator.LESS,
+    plc.binaryop.BinaryOperator.GREATER_EQUAL: plc.binaryop.BinaryOperator.LESS_EQUAL,
+}
+
+
+def _non_null_fraction(source: SourceColumnStatistics) -> float:
+    null_count = source.statistics.null_count
+    if null_count is None or source.row_count <= 0:
+        return 1.0
+    return max(0.0, 1.0 - null_count / source.row_count)
+
+
+def _range_selectivity(
+    op: plc.binaryop.BinaryOperator,
+    value: float,
+    lo: float,
+    hi: float,
+    *,
+    integral: bool,
+) -> float:
+    """Fraction of ``[lo, hi]`` satisfying ``column <op> value``."""
+    # Integer ranges are treated as ``hi - lo + 1`` discrete values.
+    width = hi - lo + 1 if integral else hi - lo
+    if width <= 0:
+        # A single value
+        satisfied = {
+            plc.binaryop.BinaryOperator.LESS: lo < value,
+            plc.binaryop.BinaryOperator.LESS_EQUAL: lo <= value,
+            plc.binaryop.BinaryOperator.GREATER: lo > value,
+            plc.binaryop.BinaryOperator.GREATER_EQUAL: lo >= value,
+        }[op]
+        return 1.0 if satisfied else 0.0
+    if integral:
+        if op == plc.binaryop.BinaryOperator.LESS:
+            below = math.ceil(value) - lo
+        elif op == plc.binaryop.BinaryOperator.LESS_EQUAL:
+            below = math.floor(value) - lo + 1
+        elif op == plc.binaryop.BinaryOperator.GREATER:
+            below = hi - math.floor(value)
+        else:
+            below = hi - math.ceil(value) + 1
+    elif op in (
+        plc.binaryop.BinaryOperator.LESS,
+        plc.binaryop.BinaryOperator.LESS_EQUAL,
+    ):
+        below = value - lo
+    else:
+        below = hi - value
+    return min(1.0, max(0.0, below / width))
+
+
+def _comparison_selectivity(
+    op: plc.binaryop.BinaryOperator,
+    source: SourceColumnStatistics,
+    value: object,
+) -> float | None:
+    """Selectivity of ``column <op> value``, or None if unknown."""
+    stats = source.statistics
+    lo, hi = stats.min_value, stats.max_value
+    numeric = (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and lo is not None
+        and hi is not None
+    )
+    in_range = not numeric or lo <= value <= hi  # type: ignore[operator]
+    if op == plc.binaryop.BinaryOperator.EQUAL:
+        if not in_range:
+            selectivity = 0.0
+        elif stats.distinct_count:
+            selectivity = 1 / stats.distinct_count
+        else:
+            return None
+    elif op == plc.binaryop.BinaryOperator.NOT_EQUAL:
+        if not in_range:
+            selectivity = 1.0
+        elif stats.distinct_count:
+            selectivity = 1 - 1 / stats.distinct_count
+        else:
+            return None
+    elif numeric:
+        assert lo is not None
+        assert hi is not None
+        selectivity = _range_selectivity(
+            op,
+            value,  # type: ignore[arg-type]
+            lo,
+            hi,
+            integral=isinstance(lo, int) and isinstance(hi, int),
+        )
+    else:
+        return None
+    # Comparisons with null are never true.
+    return selectivity * _non_null_fraction(source)
+
+
+def predicate_selectivity(
+    predicate: expr.Expr,
+    lookup: Callable[[str], SourceColumnStatistics | None],
+) -> float | None:
+    """
+    Estimate the fraction of rows for which a predicate is true.
+
+    Parameters
+    ----------
+    predicate
+        Boolean expression.
+    lookup
+        Return the datasource statistics for a named input column of
+        the predicate, or None if unknown.
+
+    Returns
+    -------
+    The estimated selectivity, or None if it cannot be estimated.
+    """
+    if isinstance(predicate, expr.BinOp):
+        left, right = predicate.children
+        op = predicate.op
+        if op in (
+            plc.binaryop.BinaryOperator.NULL_LOGICAL_AND,
+            plc.binaryop.BinaryOperator.LOGICAL_AND,
+        ):
+            selectivities = [
+                s
+                for child in (left, right)
+                if (s := predicate_selectivity(child, lookup)) is not None
+            ]
+            return math.prod(selectivities) if selectivities else None
+        if op in (
+            plc.binaryop.BinaryOperator.NULL_LOGICAL_OR,
+            plc.binaryop.BinaryOperator.LOGICAL_OR,
+        ):
+            a = predicate_selectivity(left, lookup)
+            b = predicate_selectivity(right, lookup)
+            if a is None or b is None:
+                return None
+            return a + b - a * b
+        if op not in _FLIPPED_COMPARISONS:
+            return None
+        if isinstance(left, expr.Literal) and isinstance(right, expr.Col):
+            left, right = right, left
+            op = _FLIPPED_COMPARISONS[op]
+        if (
+            isinstance(left, expr.Col)
+            and isinstance(right, expr.Literal)
+            and right.value is not None
+            and (source := lookup(left.name)) is not None
+        ):
+            return _comparison_selectivity(op, source, right.value)
+        return None
+    if isinstance(predicate, expr.BooleanFunction):
+        name = predicate.name
+        if name is expr.BooleanFunction.Name.Not:
+            (child,) = predicate.children
+            s = predicate_selectivity(child, lookup)
+            return None if s is None else 1 - s
+        if name in (
+            expr.BooleanFunction.Name.IsNull,
+            expr.BooleanFunction.Name.IsNotNull,
+        ):
+            (child,) = predicate.children
+            if (
+                not isinstance(child, expr.Col)
+                or (source := lookup(child.name)) is None
+                or source.statistics.null_count is None
+            ):
+                return None
+            non_null = _non_null_fraction(source)
+            return (
+                non_null
+                if name is expr.BooleanFunction.Name.IsNotNull
+                else 1 - non_null
+            )
+    return None
+
+
+def distinct_count(
+    source: SourceColumnStatistics | None, row_count: int | None
+) -> int | None:
+    """
+    Estimate the number of distinct values of a column.
+
+    Parameters
+    ----------
+    source
+        Datasource statistics of the column, or None if unknown.
+    row_count
+        Estimated row count of the node producing the column.
+
+    Returns
+    -------
+    The distinct-count estimate, or None if unknown.
+    """
+    if source is None or (count := source.statistics.distinct_count) is None:
+        return None
+    return count if row_count is None else min(count, row_count)
+
+
+def equijoin_rows(
+    how: str,
+    left_rows: int,
+    right_rows: int,
+    key_distinct_counts: Sequence[tuple[int, int]],
+) -> int | None:
+    """
+    Estimate the output row count of an equi-join.
+
+    Parameters
+    ----------
+    how
+        Join type.
+    left_rows
+        Estimated left row count.
+    right_rows
+        Estimated right row count.
+    key_distinct_counts
+        Estimated ``(left, right)`` distinct counts of each join-key pair.
+
+    Returns
+    -------
+    The estimated row count, or None if it cannot be estimated.
+    """
+    if not key_distinct_counts:
+        return None
+    # Each left key value matches ``right_rows / right_ndv`` rows, and
+    # ``min(left_ndv, right_ndv)`` of the key values occur on both sides.
+    denominator = math.prod(max(1, lc, rc) for lc, rc in key_distinct_counts)
+    inner = (
+        left_rows * right_rows / max(1, min(denominator, max(left_rows, right_rows)))
+    )
+    matched_fraction = math.prod(
+        min(1.0, rc / lc) if lc else 1.0 for lc, rc in key_distinct_counts
+    )
+    if how == "Inner":
+        return round(inner)
+    if how == "Semi":
+        return round(left_rows * matched_fraction)
+    if how == "Anti":
+        return round(left_rows * (1 - matched_fraction))
+    if how == "Left":
+        return round(max(left_rows, inner))
+    if how == "Right":
+        return round(max(right_rows, inner))
+    if how == "Full":
+        return round(max(left_rows, right_rows, inner))
+    return None
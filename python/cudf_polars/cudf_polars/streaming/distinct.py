@@ -7,18 +7,19 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING
 
+import polars as pl
+
 import pylibcudf as plc
 
+from cudf_polars.containers import DataType
 from cudf_polars.dsl.expressions.base import Col, NamedExpr
-from cudf_polars.dsl.ir import Distinct
+from cudf_polars.dsl.ir import Distinct, MapFunction, Projection, Slice, Sort
+from cudf_polars.dsl.utils.naming import unique_names
 from cudf_polars.streaming.base import PartitionInfo
 from cudf_polars.streaming.dispatch import lower_ir_node
 from cudf_polars.streaming.repartition import Repartition
 from cudf_polars.streaming.shuffle import Shuffle
-from cudf_polars.streaming.utils import (
-    _dynamic_planning_on,
-    _lower_ir_fallback,
-)
+from cudf_polars.streaming.utils import _dynamic_planning_on
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
@@ -45,7 +46,7 @@ def _lower_distinct_static(
     """
     Lower a Distinct IR into partition-wise stages with static planning.
 
-    Note: Edge cases (KEEP_NONE + ordering, complex slice, pre-shuffle)
+    Note: Edge cases (KEEP_NONE + ordering, pre-shuffle)
     must be handled by the caller before calling this function.
 
     Parameters
@@ -98,7 +99,7 @@ def lower_distinct(
     """
     Lower a Distinct IR with an already-lowered child.
 
-    Note: Edge cases (KEEP_NONE + ordering, complex slice, pre-shuffle)
+    Note: Edge cases (KEEP_NONE + ordering, pre-shuffle)
     must be handled by the caller before calling this function.
     """
     if _dynamic_planning_on(
@@ -117,10 +118,62 @@ def lower_distinct(
     return _lower_distinct_static(ir, child, partition_info)
 
 
+def _ordered_distinct_keep_none(ir: Distinct) -> IR:
+    """
+    Rewrite an order-preserving ``KEEP_NONE`` distinct.
+
+    The shuffle on the distinct keys is not stable, so we attach a
+    global row ordinal before dropping duplicates (which does not depend
+    on the row order, since no duplicated row is kept), and restore the
+    original order with a sort on the ordinal.
+    """
+    (child,) = ir.children
+    ordinal = next(unique_names(child.schema.keys()))
+    ordinal_dtype = DataType(pl.UInt64())
+    schema = {ordinal: ordinal_dtype} | child.schema
+    distinct = Distinct(
+        schema,
+        ir.keep,
+        ir.subset or frozenset(child.schema),
+        None,
+        False,  # noqa: FBT003
+        MapFunction(schema, "row_index", (ordinal, 0), child),
+    )
+    return Projection(
+        ir.schema,
+        Sort(
+            schema,
+            (NamedExpr(ordinal, Col(ordinal_dtype, ordinal)),),
+            (plc.types.Order.ASCENDING,),
+            (plc.types.NullOrder.AFTER,),
+            False,  # noqa: FBT003
+            ir.zlice,
+            distinct,
+        ),
+    )
+
+
 @lower_ir_node.register(Distinct)
 def _(
     ir: Distinct, rec: LowerIRTransformer
 ) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    if ir.zlice is not None and (ir.zlice[0] >= 1 or ir.zlice[1] is None):
+        # Pull "complex" slices out of the Distinct node altogether.
+        return rec(
+            Slice(
+                ir.schema,
+                *ir.zlice,
+                Distinct(
+                    ir.schema,
+                    ir.keep,
+                    ir.subset,
+                    None,
+                    ir.stable,
+                    ir.children[0],
+                ),
+            )
+        )
+
     # Extract child partitioning
     child, partition_info = rec(ir.children[0])
     child_count = partition_info[child].count
@@ -135,14 +188,15 @@ def _(
     )
 
     # Handle edge cases upfront
-    # KEEP_NONE + ordering = unsupported (need shuffle but shuffle is unstable)
     if ir.keep == plc.stream_compaction.DuplicateKeepOption.KEEP_NONE:
         if require_tree:
-            return _lower_ir_fallback(
-                ir,
-                rec,
-                msg="Unsupported unique options for multiple partitions.",
-            )
+            if child_count == 1 and not _dynamic_planning_on(config_options):
+                new_node = ir.reconstruct([child])
+                partition_info[new_node] = PartitionInfo(count=1)
+                return new_node, partition_info
+            # KEEP_NONE + ordering: the shuffle is unstable, so restore
+            # the order with a global row ordinal.
+            return rec(_ordered_distinct_keep_none(ir))
 
         # KEEP_NONE needs pre-shuffle (must see all duplicates to drop them)
         if partition_info[child].partitioned_on != distinct_keys:
@@ -156,14 +210,6 @@ def _(
                 partitioned_on=distinct_keys,
             )
 
-    # Complex slice = unsupported (offset >= 1 or no length)
-    if ir.zlice is not None and (ir.zlice[0] >= 1 or ir.zlice[1] is None):
-        return _lower_ir_fallback(
-            ir,
-            rec,
-            msg="Complex slice not supported for multiple partitions.",
-        )
-
     return lower_distinct(
         ir,
         child,
@@ -38,7 +38,8 @@ from cudf_polars.dsl.translate import Translator
 from cudf_polars.dsl.traversal import traversal
 from cudf_polars.streaming.base import IOPartitionFlavor
 from cudf_polars.streaming.io import StreamingScan, scan_partition_plan
-from cudf_polars.streaming.parallel import lower_ir_graph
+from cudf_polars.streaming.join_reorder import reorder_joins
+from cudf_polars.streaming.parallel import lower_ir_graph, remove_cache_nodes
 from cudf_polars.streaming.shuffle import Shuffle
 from cudf_polars.streaming.statistics import (
     collect_statistics,
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
     from cudf_polars.dsl.expressions.base import Expr
     from cudf_polars.dsl.ir import IR
     from cudf_polars.streaming.base import PartitionInfo, StatsCollector
+    from cudf_polars.streaming.join_reorder import JoinOrderDecision
 
 
 @dataclasses.dataclass
@@ -124,9 +126,14 @@ def explain_query(
         with cm:
             stats = collect_statistics(ir, config, executor)
         lowered = lower_ir_graph(ir, config, stats)
-        return _repr_ir_tree(
+        plan = _repr_ir_tree(
             lowered.lowered, lowered.partition_info, stats=stats, config=config
         )
+        if config.executor.name == "streaming" and config.executor.join_reorder:
+            # Report why the physical plan joins in a different order.
+            _, decisions = reorder_joins(remove_cache_nodes(ir), stats)
+            plan += "".join(_repr_join_order(decision) for decision in decisions)
+        return plan
     else:
         if config.executor.name == "streaming":
             # Include row-count statistics for the logical plan
@@ -379,6 +386,22 @@ def _fmt_row_count(value: int | None) -> str:
         return f"{round(value / 1_000_000_000, 2):g} B"
 
 
+def _repr_join_order(decision: JoinOrderDecision) -> str:
+    """Format a join reordering decision with the estimated rows of every join."""
+
+    def _steps(keys: Sequence[tuple[str, ...]], rows: Sequence[int]) -> str:
+        return " -> ".join(
+            f"{key} [~{_fmt_row_count(count)}]"
+            for key, count in zip(keys, rows, strict=True)
+        )
+
+    return (
+        "JOIN REORDER\n"
+        f"  before: {_steps(decision.original, decision.original_rows)}\n"
+        f"  after:  {_steps(decision.chosen, decision.chosen_rows)}\n"
+    )
+
+
 def _repr_ir_tree(
     ir: IR,
     partition_info: MutableMapping[IR, PartitionInfo] | None = None,
@@ -726,6 +749,7 @@ class SerializablePlan:
         config_options: ConfigOptions,
         lowered: bool = False,
         executor: concurrent.futures.Executor | None = None,
+        partition_info: MutableMapping[IR, PartitionInfo] | None = None,
     ) -> Self:
         """
         Construct a serializable plan from an IR node.
@@ -742,13 +766,15 @@ class SerializablePlan:
             Optional executor to use for IO operations. This function does not start
             or shutdown the executor. If not provided, a new thread pool executor
             is created and used.
+        partition_info
+            Partitioning of an already-lowered *ir*, to include in the plan.
+            Ignored if ``lowered`` is True.
 
         Returns
         -------
         plan
             A serializable representation of the query plan.
         """
-        partition_info_dict: dict[str, SerializablePartitionInfo] | None = None
         cm: contextlib.AbstractContextManager[concurrent.futures.Executor]
 
         if executor is None:
@@ -761,18 +787,20 @@ class SerializablePlan:
                 stats = collect_statistics(ir, config_options, executor)
             lowering = lower_ir_graph(ir, config_options, stats)
             ir = lowering.lowered
-            partition_info_d = lowering.partition_info
-            partition_info_dict = {}
+            partition_info = lowering.partition_info
 
         nodes: dict[str, SerializableIRNode] = {}
+        partition_info_dict: dict[str, SerializablePartitionInfo] | None = (
+            None if partition_info is None else {}
+        )
         for ir_node in traversal([ir]):
             stable_id = str(ir_node.get_stable_id())
             nodes[stable_id] = SerializableIRNode.from_ir(ir_node)
-            if partition_info_dict is not None:
+            if partition_info is not None and partition_info_dict is not None:
                 partition_info_dict[stable_id] = SerializablePartitionInfo(
-                    count=partition_info_d[ir_node].count,
+                    count=partition_info[ir_node].count,
                     partitioned_on=tuple(
-                        expr.name for expr in partition_info_d[ir_node].partitioned_on
+                        expr.name for expr in partition_info[ir_node].partitioned_on
                     ),
                 )
 
@@ -782,6 +810,27 @@ class SerializablePlan:
             partition_info=partition_info_dict,
         )
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Reconstruct a plan from its :func:`dataclasses.asdict` form."""
+        partition_info = data.get("partition_info")
+        return cls(
+            roots=data["roots"],
+            nodes={
+                stable_id: SerializableIRNode(**node)
+                for stable_id, node in data["nodes"].items()
+            },
+            partition_info=None
+            if partition_info is None
+            else {
+                stable_id: SerializablePartitionInfo(
+                    count=info["count"],
+                    partitioned_on=tuple(info["partitioned_on"]),
+                )
+                for stable_id, info in partition_info.items()
+            },
+        )
+
     @classmethod
     def from_query(
         cls,
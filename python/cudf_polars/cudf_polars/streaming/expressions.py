@@ -53,10 +53,16 @@ from cudf_polars.dsl.traversal import (
 )
 from cudf_polars.streaming.base import PartitionInfo
 from cudf_polars.streaming.distinct import lower_distinct
+from cudf_polars.streaming.groupby import (
+    _TDIGEST_DTYPE,
+    _TDigestQuantile,
+    _quantile_value,
+)
 from cudf_polars.streaming.over import _decompose_grouped_window_node
 from cudf_polars.streaming.repartition import Repartition
 from cudf_polars.streaming.shuffle import Shuffle
 from cudf_polars.streaming.utils import _dynamic_planning_on
+from cudf_polars.utils.config import QuantileMode
 
 if TYPE_CHECKING:
     from collections.abc import Generator, MutableMapping, Sequence
@@ -217,7 +223,7 @@ def _decompose_agg_node(
     agg: Agg | Len,
     input_ir: IR,
     partition_info: MutableMapping[IR, PartitionInfo],
-    config_options: ConfigOptions,
+    config_options: ConfigOptions[StreamingExecutor],
     *,
     names: Generator[str, None, None],
 ) -> tuple[Expr, IR, MutableMapping[IR, PartitionInfo]]:
@@ -356,6 +362,68 @@ def _decompose_agg_node(
             names=names,
         )
         (expr,) = columns
+    elif agg.name in {"median", "quantile"}:
+        child, *rest = agg.children
+        if config_options.executor.quantile_mode == QuantileMode.EXACT:
+            # An exact quantile needs all the data, but we only
+            # need to collect the (single) input column.
+            columns, input_ir, partition_info = select(
+                [child],
+                input_ir,
+                partition_info,
+                names=names,
+                repartition=True,
+            )
+
+            # Combined stage
+            (column,) = columns
+            columns, input_ir, partition_info = select(
+                [agg.reconstruct([column, *rest])],
+                input_ir,
+                partition_info,
+                names=names,
+            )
+            (expr,) = columns
+        else:
+            # Chunkwise stage
+            max_centroids = config_options.executor.approx_quantile_max_centroids
+            columns, input_ir, partition_info = select(
+                [
+                    Agg(
+                        _TDIGEST_DTYPE,
+                        "tdigest",
+                        max_centroids,
+                        ExecutionContext.FRAME,
+                        Cast(DataType(pl.Float64()), False, child),  # noqa: FBT003
+                    )
+                ],
+                input_ir,
+                partition_info,
+                names=names,
+                repartition=True,
+            )
+
+            # Combined stage
+            (column,) = columns
+            columns, input_ir, partition_info = select(
+                [
+                    _TDigestQuantile(
+                        agg.dtype,
+                        _quantile_value(agg),
+                        Agg(
+                            _TDIGEST_DTYPE,
+                            "merge_tdigest",
+                            max_centroids,
+                            ExecutionContext.FRAME,
+                            column,
+                        ),
+                    )
+                ],
+                input_ir,
+                partition_info,
+                names=names,
+            )
+            (expr,) = columns
     else:
         # Chunkwise stage
         columns, input_ir, partition_info = select(
@@ -379,7 +447,32 @@ def _decompose_agg_node(
     return expr, input_ir, partition_info
 
 
-_SUPPORTED_AGGS = ("count", "min", "max", "sum", "mean", "n_unique")
+_SUPPORTED_AGGS = (
+    "count",
+    "min",
+    "max",
+    "sum",
+    "mean",
+    "n_unique",
+    "median",
+    "quantile",
+)
+
+
+def _reduces_to_scalars(expr: Expr) -> bool:
+    """
+    Whether every non-pointwise part of ``expr`` is a scalar reduction.
+
+    Such expressions can be decomposed into a multi-partition reduction,
+    whose (broadcast) results are combined partition-wise.
+    """
+    if expr.is_pointwise:
+        return all(_reduces_to_scalars(child) for child in expr.children)
+    return (
+        isinstance(expr, Len)
+        or (isinstance(expr, Agg) and expr.name in _SUPPORTED_AGGS)
+        or (isinstance(expr, UnaryFunction) and expr.name == "null_count")
+    )
 
 
 def _decompose_expr_node(
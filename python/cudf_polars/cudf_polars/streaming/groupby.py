@@ -38,6 +38,7 @@ from cudf_polars.streaming.utils import (
     _dynamic_planning_on,
     _lower_ir_fallback,
 )
+from cudf_polars.utils.config import QuantileMode
 
 if TYPE_CHECKING:
     from collections.abc import Generator, MutableMapping
@@ -59,6 +60,8 @@ _GB_AGG_SUPPORTED = (
     "var",
     "item",
     "first_non_null",
+    "median",
+    "quantile",
 )
 
 _GB_AGG_REDUCTIONS = {
@@ -99,6 +102,77 @@ class _StructCreate(Expr):
         )
 
 
+# Layout of a libcudf t-digest column (see cudf::tdigest::tdigest_column_view)
+_TDIGEST_DTYPE = DataType(
+    pl.Struct(
+        [
+            pl.Field(
+                "centroids",
+                pl.List(
+                    pl.Struct(
+                        [
+                            pl.Field("mean", pl.Float64()),
+                            pl.Field("weight", pl.Float64()),
+                        ]
+                    )
+                ),
+            ),
+            pl.Field("min", pl.Float64()),
+            pl.Field("max", pl.Float64()),
+        ]
+    )
+)
+
+
+def _quantile_value(expr: Agg) -> float:
+    """Return the quantile requested by a median or quantile aggregation."""
+    if expr.name == "median":
+        return 0.5
+    _, quantile = expr.children
+    assert isinstance(quantile, Literal)
+    return float(quantile.value)
+
+
+class _TDigestQuantile(Expr):
+    """Compute an approximate quantile from a column of t-digests."""
+
+    __slots__ = ("quantile",)
+    _non_child = ("dtype", "quantile")
+
+    def __init__(self, dtype: DataType, quantile: float, child: Expr) -> None:
+        self.dtype = dtype
+        self.quantile = quantile
+        self.children = (child,)
+        self.is_pointwise = True
+
+    def do_evaluate(
+        self, df: DataFrame, *, context: ExecutionContext = ExecutionContext.FRAME
+    ) -> Column:
+        """Evaluate this expression given a dataframe for context."""
+        (child,) = self.children
+        column = child.evaluate(df, context=context)
+        f64 = DataType(pl.Float64())
+        percentiles = plc.Column.from_scalar(
+            plc.Scalar.from_py(self.quantile, f64.plc_type, stream=df.stream),
+            1,
+            stream=df.stream,
+        )
+        # One list (of one percentile) per digest, null for empty digests.
+        result = Column(
+            plc.lists.extract_list_element(
+                plc.quantiles.percentile_approx(
+                    column.obj, percentiles, stream=df.stream
+                ),
+                0,
+                stream=df.stream,
+            ),
+            dtype=f64,
+        )
+        if self.dtype != f64:
+            result = result.astype(self.dtype, df.stream)
+        return result
+
+
 def combine(
     *decompositions: tuple[NamedExpr, list[NamedExpr], list[NamedExpr], bool],
 ) -> tuple[list[NamedExpr], list[NamedExpr], list[NamedExpr], bool]:
@@ -251,8 +325,76 @@ def _decompose_std_var(
     return selection, aggregations, reductions, False
 
 
+def _decompose_quantile(
+    name: str,
+    expr: Agg,
+    *,
+    names: Generator[str, None, None],
+    quantile_mode: QuantileMode,
+    max_centroids: int,
+) -> tuple[NamedExpr, list[NamedExpr], list[NamedExpr], bool]:
+    """Decompose a median or quantile aggregation."""
+    if quantile_mode == QuantileMode.EXACT:
+        # Exact quantiles need every row of a group in the same
+        # partition: aggregate after a shuffle on the keys, then
+        # pass the (unique) per-group results through the reduction.
+        selection = NamedExpr(name, Col(expr.dtype, name))
+        aggregation = [NamedExpr(name, expr)]
+        reduction = [
+            NamedExpr(
+                name,
+                Agg(
+                    expr.dtype,
+                    "first_non_null",
+                    None,
+                    ExecutionContext.GROUPBY,
+                    Col(expr.dtype, name),
+                ),
+            )
+        ]
+        return selection, aggregation, reduction, True
+
+    child = expr.children[0]
+    quantile = _quantile_value(expr)
+    f64 = DataType(pl.Float64())
+    tdigest_dtype = _TDIGEST_DTYPE
+    tdigest_name = f"{next(names)}__tdigest"
+    tdigest_col = Col(tdigest_dtype, tdigest_name)
+    aggregations = [
+        NamedExpr(
+            tdigest_name,
+            Agg(
+                tdigest_dtype,
+                "tdigest",
+                max_centroids,
+                ExecutionContext.GROUPBY,
+                Cast(f64, False, child),  # noqa: FBT003
+            ),
+        )
+    ]
+    reductions = [
+        NamedExpr(
+            tdigest_name,
+            Agg(
+                tdigest_dtype,
+                "merge_tdigest",
+                max_centroids,
+                ExecutionContext.GROUPBY,
+                tdigest_col,
+            ),
+        )
+    ]
+    selection = NamedExpr(name, _TDigestQuantile(expr.dtype, quantile, tdigest_col))
+    return selection, aggregations, reductions, False
+
+
 def decompose(
-    name: str, expr: Expr, *, names: Generator[str, None, None]
+    name: str,
+    expr: Expr,
+    *,
+    names: Generator[str, None, None],
+    quantile_mode: QuantileMode = QuantileMode.EXACT,
+    max_centroids: int = 1000,
 ) -> tuple[NamedExpr, list[NamedExpr], list[NamedExpr], bool]:
     """
     Decompose a groupby-aggregation expression.
@@ -265,6 +407,12 @@ def decompose(
         The aggregation expression for a single column.
     names
         Generator of unique names for temporaries.
+    quantile_mode
+        Whether to compute median and quantile aggregations exactly
+        (requires a pre-shuffle) or approximately with t-digests.
+    max_centroids
+        The maximum number of t-digest centroids for approximate
+        quantiles.
 
     Returns
     -------
@@ -349,6 +497,14 @@ def decompose(
             return selection, aggregations, reductions, need_preshuffle
         elif expr.name in {"std", "var"}:
             return _decompose_std_var(name, expr, names=names)
+        elif expr.name in {"median", "quantile"}:
+            return _decompose_quantile(
+                name,
+                expr,
+                names=names,
+                quantile_mode=quantile_mode,
+                max_centroids=max_centroids,
+            )
         else:
             raise NotImplementedError(
                 "group_by does not support multiple partitions "
@@ -369,12 +525,6 @@ def _(
     # Pull slice operations out of the GroupBy before lowering
     if ir.zlice is not None:
         offset, length = ir.zlice
-        if length is None:  # pragma: no cover
-            return _lower_ir_fallback(
-                ir,
-                rec,
-                msg="This slice not supported for multiple partitions.",
-            )
         new_join = GroupBy(
             ir.schema,
             ir.keys,
@@ -419,7 +569,13 @@ def _(
     try:
         selection_exprs, piecewise_exprs, reduction_exprs, need_preshuffle = combine(
             *(
-                decompose(agg.name, agg.value, names=name_generator)
+                decompose(
+                    agg.name,
+                    agg.value,
+                    names=name_generator,
+                    quantile_mode=config_options.executor.quantile_mode,
+                    max_centroids=config_options.executor.approx_quantile_max_centroids,
+                )
                 for agg in ir.agg_requests
             )
         )
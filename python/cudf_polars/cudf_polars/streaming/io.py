@@ -4,14 +4,20 @@
 
 from __future__ import annotations
 
+import abc
+import contextlib
 import dataclasses
-import functools
+import hashlib
 import itertools
+import json
 import math
+import os
 import statistics
-from collections import defaultdict
+import struct
+import threading
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Self, overload
+from typing import TYPE_CHECKING, Any, Generic, Literal, Self, TypeVar, overload
 
 import polars as pl
 
@@ -27,6 +33,7 @@ from cudf_polars.dsl.ir import (
 )
 from cudf_polars.dsl.tracing import nvtx_annotate_cudf_polars
 from cudf_polars.streaming.base import (
+    ColumnStatistics,
     IOPartitionFlavor,
     IOPartitionPlan,
     PartitionInfo,
@@ -34,12 +41,15 @@ from cudf_polars.streaming.base import (
 )
 from cudf_polars.streaming.dispatch import lower_ir_node
 from cudf_polars.streaming.utils import _dynamic_planning_on
-from cudf_polars.utils.config import Cluster
+from cudf_polars.utils.config import DEFAULT_SOURCE_INFO_CACHE_SIZE, Cluster
 from cudf_polars.utils.cuda_stream import get_cuda_stream
 from cudf_polars.utils.versions import POLARS_VERSION_LT_137
 
 if TYPE_CHECKING:
     from collections.abc import Hashable, MutableMapping, Sequence
+    from typing import TypeAlias
+
+    from rmm.pylibrmm.stream import Stream
 
     from cudf_polars.containers import DataFrame, DataType
     from cudf_polars.dsl.expr import NamedExpr
@@ -57,6 +67,22 @@ if TYPE_CHECKING:
         StreamingExecutor,
     )
 
+    _SourceInfoKey: TypeAlias = tuple[
+        tuple[str, ...],
+        frozenset[str],
+        tuple[tuple[str, DataType], ...],
+        int,
+        int,
+    ]
+    _TextSourceInfoKey: TypeAlias = tuple[
+        tuple[str, ...],
+        frozenset[str],
+        tuple[tuple[str, DataType], ...],
+        tuple[tuple[str, Any], ...],
+        int,
+        int,
+    ]
+
 
 @lower_ir_node.register(DataFrameScan)
 def _(
@@ -80,7 +106,7 @@ def scan_partition_plan(
     ir: Scan, stats: StatsCollector, config_options: ConfigOptions[StreamingExecutor]
 ) -> IOPartitionPlan:
     """Extract the partitioning plan of a Scan operation."""
-    if ir.typ == "parquet":
+    if ir.typ in ("parquet", "csv", "ndjson"):
         blocksize: int = config_options.executor.target_partition_size
         if source := stats.scan_stats.get(ir):
             column_sizes = [
@@ -89,7 +115,14 @@ def scan_partition_plan(
                 if (sz := source.column_storage_size(col)) is not None
             ]
             if (file_size := sum(column_sizes)) > 0:
-                if file_size > blocksize:
+                if file_size > blocksize and ir.typ != "parquet":
+                    # Text files are read whole.
+                    return IOPartitionPlan(
+                        1,
+                        IOPartitionFlavor.SINGLE_FILE,
+                        estimated_chunk_bytes=file_size,
+                    )
+                elif file_size > blocksize:
                     k_lo = file_size // blocksize
                     k_hi = k_lo + 1
                     factor = (
@@ -120,7 +153,6 @@ def scan_partition_plan(
                     estimated_chunk_bytes=file_size * factor,
                 )
 
-    # TODO: Use file sizes for csv and json
     return IOPartitionPlan(1, IOPartitionFlavor.SINGLE_FILE)
 
 
@@ -904,6 +936,20 @@ def _columnchunk_metadata_from_footers(
     return columnchunk_metadata
 
 
+def _columnchunk_statistics_from_footers(
+    footers: list[plc.io.parquet_metadata.FileMetaData],
+) -> dict[str, list[plc.io.parquet_metadata.ColumnChunkMetaData]]:
+    columnchunk_statistics: dict[
+        str, list[plc.io.parquet_metadata.ColumnChunkMetaData]
+    ] = {}
+    for fmd in footers:
+        for rg in fmd.row_groups:
+            for col in rg.columns:
+                name = ".".join(col.meta_data.path_in_schema)
+                columnchunk_statistics.setdefault(name, []).append(col.meta_data)
+    return columnchunk_statistics
+
+
 class ParquetMetadata:
     """
     Parquet metadata container.
@@ -918,6 +964,7 @@ class ParquetMetadata:
 
     __slots__ = (
         "cached_parquet_info",
+        "column_chunks",
         "column_names",
         "max_footer_samples",
         "mean_size_per_file",
@@ -926,6 +973,7 @@ class ParquetMetadata:
         "row_count",
         "sample_paths",
         "sampled_file_count",
+        "sampled_row_count",
         "total_file_count",
     )
 
@@ -945,6 +993,10 @@ class ParquetMetadata:
     """Sampled file paths."""
     cached_parquet_info: list[CachedParquetInfo] | None
     """Cached parquet info for the sampled paths. Only set if all files were sampled."""
+    column_chunks: dict[str, list[plc.io.parquet_metadata.ColumnChunkMetaData]]
+    """Column-chunk metadata (including statistics) of the sampled row groups."""
+    sampled_row_count: int
+    """Total row count of the sampled files."""
 
     @nvtx_annotate_cudf_polars(message="ParquetMetadata")
     def __init__(self, paths: tuple[str, ...], max_footer_samples: int):
@@ -956,9 +1008,11 @@ class ParquetMetadata:
         self.num_row_groups_per_file = ()
         self.mean_size_per_file = {}
         self.column_names = ()
+        self.column_chunks = {}
         self.cached_parquet_info = None
         self.total_file_count = len(self.paths)
         self.sampled_file_count = 0
+        self.sampled_row_count = 0
         if max_footer_samples <= 0:
             self.sample_paths = ()
             return
@@ -1008,9 +1062,11 @@ class ParquetMetadata:
             name: int(statistics.mean(sizes))
             for name, sizes in column_sizes_per_file.items()
         }
+        self.column_chunks = _columnchunk_statistics_from_footers(sample_footers)
         self.num_row_groups_per_file = tuple(num_row_groups_per_sampled_file)
         self.row_count = row_count
         self.sampled_file_count = sampled_file_count
+        self.sampled_row_count = sampled_row_count
 
 
 @nvtx_annotate_cudf_polars(message="_sample_rg_sizes")
@@ -1077,6 +1133,109 @@ def _decoded_size_floor(dtype: DataType, nrows: int) -> int:
     return max(1, nrows)
 
 
+# struct formats of the PLAIN-encoded footer statistics of numeric columns.
+_PLAIN_STATISTICS_FORMATS: dict[plc.TypeId, str] = {
+    plc.TypeId.INT8: "<i",
+    plc.TypeId.INT16: "<i",
+    plc.TypeId.INT32: "<i",
+    plc.TypeId.INT64: "<q",
+    plc.TypeId.UINT8: "<I",
+    plc.TypeId.UINT16: "<I",
+    plc.TypeId.UINT32: "<I",
+    plc.TypeId.UINT64: "<Q",
+    plc.TypeId.FLOAT32: "<f",
+    plc.TypeId.FLOAT64: "<d",
+}
+
+
+# Types whose deprecated footer min/max (ordered as signed values) are also
+# valid under the column's own sort order.
+_DEPRECATED_STATISTICS_TYPES: frozenset[plc.TypeId] = frozenset(
+    {
+        plc.TypeId.BOOL8,
+        plc.TypeId.INT8,
+        plc.TypeId.INT16,
+        plc.TypeId.INT32,
+        plc.TypeId.INT64,
+    }
+)
+
+
+def _decode_plain_statistic(dtype: DataType, value: bytes | None) -> int | float | None:
+    """Decode a footer min/max statistic, or return None if unsupported."""
+    fmt = _PLAIN_STATISTICS_FORMATS.get(dtype.id())
+    if fmt is None or value is None or len(value) != struct.calcsize(fmt):
+        return None
+    (result,) = struct.unpack(fmt, value)
+    if isinstance(result, float) and not math.isfinite(result):
+        return None
+    return result
+
+
+def _column_statistics(
+    chunks: list[plc.io.parquet_metadata.ColumnChunkMetaData],
+    dtype: DataType,
+    *,
+    sampled_row_count: int,
+    row_count: int,
+) -> ColumnStatistics:
+    """
+    Combine the footer statistics of the sampled column chunks.
+
+    Null counts are extrapolated from the sampled rows to ``row_count``.
+    The value range only covers the sampled files. The distinct count
+    is the sum of the per-chunk distinct counts capped at ``row_count``
+    (if every chunk records one), otherwise it is bounded by the value
+    range of integer columns.
+    """
+    stats = [chunk.statistics for chunk in chunks]
+    null_counts = [s.null_count for s in stats]
+    null_count: int | None = None
+    if sampled_row_count and all(n is not None for n in null_counts):
+        null_count = min(
+            row_count, round(sum(null_counts) * row_count / sampled_row_count)
+        )
+
+    min_value: int | float | None = None
+    max_value: int | float | None = None
+    # All-null chunks don't record a value range.
+    valued = [
+        s
+        for s, chunk in zip(stats, chunks, strict=True)
+        if s.null_count != chunk.num_values
+    ]
+    if valued:
+        use_deprecated = dtype.id() in _DEPRECATED_STATISTICS_TYPES
+        mins = [
+            _decode_plain_statistic(
+                dtype,
+                s.min if s.min_value is None and use_deprecated else s.min_value,
+            )
+            for s in valued
+        ]
+        maxs = [
+            _decode_plain_statistic(
+                dtype,
+                s.max if s.max_value is None and use_deprecated else s.max_value,
+            )
+            for s in valued
+        ]
+        if all(v is not None for v in mins) and all(v is not None for v in maxs):
+            min_value = min(v for v in mins if v is not None)
+            max_value = max(v for v in maxs if v is not None)
+
+    distinct_counts = [s.distinct_count for s in stats]
+    distinct_count: int | None = None
+    if distinct_counts and all(n is not None for n in distinct_counts):
+        # Chunks may share values, so the sum is an upper bound.
+        distinct_count = min(
+            row_count, sum(n for n in distinct_counts if n is not None)
+        )
+    elif isinstance(min_value, int) and isinstance(max_value, int):
+        distinct_count = min(max_value - min_value + 1, row_count - (null_count or 0))
+    return ColumnStatistics(null_count, distinct_count, min_value, max_value)
+
+
 class ParquetSourceInfo:
     """Parquet datasource information, fully computed at construction time."""
 
@@ -1087,14 +1246,18 @@ class ParquetSourceInfo:
         row_count: int | None,
         per_file_means: dict[str, int] | None = None,
         *,
+        column_stats: dict[str, ColumnStatistics] | None = None,
         # TODO: change this to cached_parquet_info
         cached_parquet_info: list[CachedParquetInfo] | None = None,
     ):
         if per_file_means is None:
             per_file_means = {}
+        if column_stats is None:
+            column_stats = {}
 
         self.row_count = row_count
         self.per_file_means = per_file_means
+        self.column_stats = column_stats
         self.cached_parquet_info = cached_parquet_info
 
     @classmethod
@@ -1154,6 +1317,17 @@ class ParquetSourceInfo:
                     else max(footer_mean, decoded_floor)
                 )
 
+        column_stats = {
+            col: _column_statistics(
+                metadata.column_chunks[col],
+                schema_map[col],
+                sampled_row_count=metadata.sampled_row_count,
+                row_count=row_count,
+            )
+            for col in needed_cols
+            if col in metadata.column_chunks
+        }
+
         cached_parquet_info: list[CachedParquetInfo] | None
         if (
             metadata.sampled_file_count == metadata.total_file_count
@@ -1162,18 +1336,30 @@ class ParquetSourceInfo:
             cached_parquet_info = list(metadata.cached_parquet_info)
         else:
             cached_parquet_info = None
-        return cls(row_count, per_file_means, cached_parquet_info=cached_parquet_info)
+        return cls(
+            row_count,
+            per_file_means,
+            column_stats=column_stats,
+            cached_parquet_info=cached_parquet_info,
+        )
 
     def column_storage_size(self, column: str) -> int | None:
         """Return the average storage size for a single column in one file."""
         return self.per_file_means.get(column)
 
+    def column_statistics(self, column: str) -> ColumnStatistics | None:
+        """Return the footer statistics of a single column, if known."""
+        return self.column_stats.get(column)
+
     def serialize(self) -> SerializedDataSourceInfo:
         """Return JSON-serializable representation of the data source info."""
         return {
             "type": self.type,
             "row_count": self.row_count,
             "per_file_means": self.per_file_means,
+            "column_statistics": {
+                name: stats.serialize() for name, stats in self.column_stats.items()
+            },
         }
 
     @classmethod
@@ -1181,7 +1367,14 @@ class ParquetSourceInfo:
         """Deserialize a ParquetSourceInfo from a dictionary."""
         if data["type"] != "parquet":
             raise ValueError(f"Expected ParquetSourceInfo, got {data['type']}")
-        return cls(data["row_count"], data["per_file_means"])
+        return cls(
+            data["row_count"],
+            data["per_file_means"],
+            column_stats={
+                name: ColumnStatistics.deserialize(stats)
+                for name, stats in data.get("column_statistics", {}).items()
+            },
+        )
 
 
 class DataFrameSourceInfo:
@@ -1208,6 +1401,10 @@ class DataFrameSourceInfo:
         """Return the average storage size for a single column in one file."""
         return None
 
+    def column_statistics(self, column: str) -> ColumnStatistics | None:
+        """Return the statistics of a single column, if known."""
+        return None
+
     def serialize(self) -> SerializedDataSourceInfo:
         """Return JSON-serializable representation of the data source info."""
         return {
@@ -1226,17 +1423,514 @@ class DataFrameSourceInfo:
         return cls(data["row_count"])
 
 
-@functools.cache
+def _read_line_sample(path: str, sample_size: int, eol: bytes) -> tuple[bytes, bool]:
+    """
+    Read the leading complete lines of a text file.
+
+    Returns the sampled bytes, and whether they cover the whole file.
+    """
+    with Path(path).open("rb") as f:
+        sample = f.read(sample_size + 1)
+    if len(sample) <= sample_size:
+        return sample, True
+    sample = sample[:sample_size]
+    return sample[: sample.rfind(eol) + 1], False
+
+
+# Leading bytes of the compressed formats Polars reads text files from.
+# Samples of compressed files cannot be decoded line by line.
+_COMPRESSION_MAGIC = (
+    b"\x1f\x8b",  # gzip
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"BZh",  # bzip2
+    b"\xfd7zXZ\x00",  # xz
+    b"PK\x03\x04",  # zip
+)
+
+
+class TextSourceInfo(abc.ABC):
+    """
+    Datasource information for line-based text files (CSV and NDJSON).
+
+    Unlike Parquet, these formats carry no metadata. The row count and
+    decoded column sizes are extrapolated from the file sizes and the
+    leading lines of (a sample of) the files, which are decoded on the
+    device. Statistics are optional, so files that cannot be sampled
+    (e.g. compressed files, or options the sample decoder does not
+    support) get no statistics rather than failing the query.
+    """
+
+    type: Literal["csv", "ndjson"]
+
+    def __init__(
+        self,
+        row_count: int | None,
+        per_file_means: dict[str, int] | None = None,
+    ):
+        if per_file_means is None:
+            per_file_means = {}
+
+        self.row_count = row_count
+        self.per_file_means = per_file_means
+
+    @staticmethod
+    def _eol(reader_options: dict[str, Any]) -> bytes:
+        """Return the line terminator."""
+        return b"\n"
+
+    @classmethod
+    @abc.abstractmethod
+    def _decode_sample(
+        cls,
+        sample: bytes,
+        columns: list[str],
+        schema: dict[str, DataType],
+        reader_options: dict[str, Any],
+        stream: Stream,
+    ) -> plc.io.TableWithMetadata:
+        """Decode sampled lines into a table of ``columns``."""
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: tuple[str, ...],
+        needed_cols: frozenset[str],
+        schema: tuple[tuple[str, DataType], ...],
+        reader_options: tuple[tuple[str, Any], ...],
+        max_file_samples: int,
+        sample_size: int,
+    ) -> Self:
+        """Build datasource information from a list of paths."""
+        if (
+            not paths
+            or max_file_samples <= 0
+            or any(plc.io.SourceInfo._is_remote_uri(path) for path in paths)
+        ):
+            return cls(None, {})
+        options = dict(reader_options)
+        schema_map = dict(schema)
+        # Decode every column if none are needed, since we still need
+        # the row count.
+        columns = sorted(needed_cols) or list(schema_map)
+
+        stride = max(1, int(len(paths) / max_file_samples))
+        sample_paths = paths[: stride * max_file_samples : stride]
+        sampled_rows = 0
+        sampled_bytes = 0
+        complete = len(sample_paths) == len(paths)
+        column_bytes: defaultdict[str, int] = defaultdict(int)
+        try:
+            eol = cls._eol(options)
+            stream = get_cuda_stream()
+            for path in sample_paths:
+                sample, whole_file = _read_line_sample(path, sample_size, eol)
+                complete = complete and whole_file
+                if not sample:
+                    continue
+                if sample.startswith(_COMPRESSION_MAGIC):
+                    return cls(None, {})
+                tbl_w_meta = cls._decode_sample(
+                    sample, columns, schema_map, options, stream
+                )
+                sampled_rows += tbl_w_meta.tbl.num_rows()
+                sampled_bytes += len(sample)
+                for name, column in zip(
+                    tbl_w_meta.column_names(include_children=False),
+                    tbl_w_meta.columns,
+                    strict=True,
+                ):
+                    column_bytes[name] += column.device_buffer_size()
+            stream.synchronize()
+            total_bytes = sum(Path(path).stat().st_size for path in paths)
+        except Exception:
+            # Statistics are optional: the scan itself reports any real
+            # problem with the files.
+            return cls(None, {})
+
+        if complete:
+            row_count = sampled_rows
+        elif sampled_rows:
+            row_count = int(total_bytes * sampled_rows / sampled_bytes)
+        else:
+            return cls(None, {})
+        if not (row_count and needed_cols):
+            return cls(row_count, {})
+
+        rows_per_file = max(1, row_count // len(paths))
+        per_file_means = {
+            name: max(
+                int(column_bytes[name] * rows_per_file / sampled_rows),
+                _decoded_size_floor(schema_map[name], rows_per_file),
+            )
+            for name in needed_cols
+        }
+        return cls(row_count, per_file_means)
+
+    def column_storage_size(self, column: str) -> int | None:
+        """Return the average decoded size for a single column in one file."""
+        return self.per_file_means.get(column)
+
+    def column_statistics(self, column: str) -> ColumnStatistics | None:
+        """Return the statistics of a single column, if known."""
+        return None
+
+    def serialize(self) -> SerializedDataSourceInfo:
+        """Return JSON-serializable representation of the data source info."""
+        return {
+            "type": self.type,
+            "row_count": self.row_count,
+            "per_file_means": self.per_file_means,
+        }
+
+    @classmethod
+    def deserialize(cls, data: SerializedDataSourceInfo) -> Self:
+        """Deserialize datasource information from a dictionary."""
+        if data["type"] != cls.type:
+            raise ValueError(f"Expected {cls.__name__}, got {data['type']}")
+        return cls(data["row_count"], data["per_file_means"])
+
+
+class CSVSourceInfo(TextSourceInfo):
+    """CSV datasource information, estimated from sampled lines."""
+
+    type: Literal["csv"] = "csv"
+
+    @staticmethod
+    def _eol(reader_options: dict[str, Any]) -> bytes:
+        """Return the line terminator."""
+        return chr(reader_options["eol_char"]).encode()
+
+    @classmethod
+    def _decode_sample(
+        cls,
+        sample: bytes,
+        columns: list[str],
+        schema: dict[str, DataType],
+        reader_options: dict[str, Any],
+        stream: Stream,
+    ) -> plc.io.TableWithMetadata:
+        """Decode sampled lines into a table of ``columns``."""
+        options = (
+            plc.io.csv.CsvReaderOptions.builder(plc.io.SourceInfo([sample]))
+            .skiprows(reader_options["skip_rows"])
+            .skip_blank_lines(skip_blank_lines=False)
+            .lineterminator(chr(reader_options["eol_char"]))
+            .quotechar(chr(reader_options["quote_char"]))
+            .decimal("," if reader_options["decimal_comma"] else ".")
+            .delimiter(chr(reader_options["separator"]))
+            .build()
+        )
+        if reader_options["names"] is not None:
+            options.set_names(list(reader_options["names"]))
+        options.set_header(0 if reader_options["has_header"] else -1)
+        options.set_dtypes({name: schema[name].plc_type for name in columns})
+        options.set_use_cols_names(columns)
+        if reader_options["comment_prefix"] is not None:
+            options.set_comment(chr(reader_options["comment_prefix"]))
+        return plc.io.csv.read_csv(options, stream=stream)
+
+
+class NDJSONSourceInfo(TextSourceInfo):
+    """NDJSON datasource information, estimated from sampled lines."""
+
+    type: Literal["ndjson"] = "ndjson"
+
+    @classmethod
+    def _decode_sample(
+        cls,
+        sample: bytes,
+        columns: list[str],
+        schema: dict[str, DataType],
+        reader_options: dict[str, Any],
+        stream: Stream,
+    ) -> plc.io.TableWithMetadata:
+        """Decode sampled lines into a table of ``columns``."""
+        options = (
+            plc.io.json.JsonReaderOptions.builder(plc.io.SourceInfo([sample]))
+            .lines(val=True)
+            .dtypes([(name, schema[name].plc_type, []) for name in columns])
+            .prune_columns(val=True)
+            .build()
+        )
+        return plc.io.json.read_json(options, stream=stream)
+
+
+def _text_reader_options(ir: Scan) -> tuple[tuple[str, Any], ...]:
+    """Return the (hashable) reader options needed to decode samples of ``ir``."""
+    if ir.typ != "csv":
+        return ()
+    parse_options = ir.reader_options["parse_options"]
+    reader_schema = ir.reader_options["schema"]
+    comment_prefix = parse_options["comment_prefix"]
+    return (
+        ("separator", parse_options["separator"]),
+        ("quote_char", parse_options["quote_char"]),
+        ("eol_char", parse_options["eol_char"]),
+        ("decimal_comma", bool(parse_options["decimal_comma"])),
+        (
+            "comment_prefix",
+            comment_prefix["Single"] if comment_prefix is not None else None,
+        ),
+        ("has_header", bool(ir.reader_options["has_header"])),
+        ("skip_rows", ir.reader_options["skip_rows"]),
+        (
+            "names",
+            tuple(reader_schema["fields"]) if reader_schema is not None else None,
+        ),
+    )
+
+
+def _file_schema(ir: Scan) -> Schema:
+    """Return the schema of the columns that ``ir`` reads from its files."""
+    generated = {ir.include_file_paths, ir.row_index[0] if ir.row_index else None}
+    return {name: dtype for name, dtype in ir.schema.items() if name not in generated}
+
+
+def _path_fingerprint(path: str) -> tuple[int, int, int] | None:
+    """
+    Return a cheap validation token for a single file.
+
+    The token is ``(size, mtime_ns, inode)`` for local files. ``None``
+    is returned for remote URIs (and unreadable paths), since these
+    cannot be validated without a round-trip to the object store.
+    """
+    if plc.io.SourceInfo._is_remote_uri(path):
+        return None
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _paths_fingerprint(
+    paths: tuple[str, ...],
+) -> tuple[tuple[int, int, int], ...] | None:
+    """Return validation tokens for all paths, or None if any path is unverifiable."""
+    fingerprints = []
+    for path in paths:
+        if (fingerprint := _path_fingerprint(path)) is None:
+            return None
+        fingerprints.append(fingerprint)
+    return tuple(fingerprints)
+
+
+_InfoT = TypeVar("_InfoT", ParquetSourceInfo, CSVSourceInfo, NDJSONSourceInfo)
+
+
+def _key_token(value: Any) -> Any:
+    """Return a JSON-serializable, deterministic form of a cache key."""
+    if isinstance(value, frozenset):
+        return sorted(value)
+    if isinstance(value, tuple):
+        return [_key_token(v) for v in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return repr(value)
+
+
+class SourceInfoCache(Generic[_InfoT]):
+    """
+    Validated LRU cache of file datasource information.
+
+    Entries are keyed by the dataset paths and sampling options, and
+    are validated against the ``(size, mtime, inode)`` of every file
+    before reuse. Entries for sources that cannot be validated cheaply
+    (e.g. remote URIs) are only kept until :meth:`expire_unvalidated`
+    is called, which happens before every streaming query.
+
+    Optionally, validated entries are also persisted to ``cache_dir`` so
+    that new processes can plan repeat queries without re-reading file
+    footers. The on-disk cache is bounded by a byte budget with
+    least-recently-used eviction.
+
+    Parameters
+    ----------
+    info_type
+        The datasource information type. Entries are built with
+        ``info_type.from_paths(*key)``, where the first element of
+        the key is the tuple of dataset paths.
+    max_entries
+        Maximum number of in-memory entries.
+    """
+
+    _version = 2
+
+    def __init__(self, info_type: type[_InfoT], max_entries: int = 128):
+        self.info_type = info_type
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            tuple[Any, ...],
+            tuple[tuple[tuple[int, int, int], ...] | None, _InfoT],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: tuple[Any, ...],
+        *,
+        cache_dir: str | None = None,
+        cache_size: int = 0,
+    ) -> _InfoT:
+        """Return cached (or freshly computed) datasource information."""
+        paths = key[0]
+        fingerprint = _paths_fingerprint(paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry[0] is None if fingerprint is None else entry[0] == fingerprint
+            ):
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        info: _InfoT | None = None
+        if fingerprint is not None and cache_dir is not None:
+            info = self._load(cache_dir, key, fingerprint)
+        if info is None:
+            info = self.info_type.from_paths(*key)
+            if fingerprint is not None and cache_dir is not None:
+                self._store(cache_dir, cache_size, key, fingerprint, info)
+
+        with self._lock:
+            self._entries[key] = (fingerprint, info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return info
+
+    def expire_unvalidated(self) -> None:
+        """Drop entries that cannot be validated against the underlying files."""
+        with self._lock:
+            for key in [k for k, (fp, _) in self._entries.items() if fp is None]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _entry_path(self, cache_dir: str, key: tuple[Any, ...]) -> Path:
+        token = json.dumps([self._version, self.info_type.type, _key_token(key)])
+        digest = hashlib.sha256(token.encode()).hexdigest()
+        return Path(cache_dir) / f"{digest}.json"
+
+    def _load(
+        self,
+        cache_dir: str,
+        key: tuple[Any, ...],
+        fingerprint: tuple[tuple[int, int, int], ...],
+    ) -> _InfoT | None:
+        entry_path = self._entry_path(cache_dir, key)
+        try:
+            data = json.loads(entry_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if [tuple(fp) for fp in data.get("fingerprint", ())] != list(fingerprint):
+            # Stale entry: the underlying data has changed.
+            entry_path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(OSError):
+            # Touch the entry for LRU ordering.
+            os.utime(entry_path)
+        return self.info_type.deserialize(data["info"])
+
+    def _store(
+        self,
+        cache_dir: str,
+        cache_size: int,
+        key: tuple[Any, ...],
+        fingerprint: tuple[tuple[int, int, int], ...],
+        info: _InfoT,
+    ) -> None:
+        entry_path = self._entry_path(cache_dir, key)
+        payload = json.dumps({"fingerprint": fingerprint, "info": info.serialize()})
+        if len(payload) > cache_size:
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically, since other processes may share cache_dir.
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(payload)
+            tmp_path.replace(entry_path)
+            self._evict(entry_path.parent, cache_size)
+        except OSError:  # pragma: no cover
+            # The on-disk cache is an optimization only.
+            return
+
+    @staticmethod
+    def _evict(cache_dir: Path, cache_size: int) -> None:
+        entries = []
+        for entry in cache_dir.glob("*.json"):
+            with contextlib.suppress(OSError):
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= cache_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+_parquet_source_info_cache = SourceInfoCache(ParquetSourceInfo)
+_text_source_info_caches: dict[str, SourceInfoCache[Any]] = {
+    "csv": SourceInfoCache(CSVSourceInfo),
+    "ndjson": SourceInfoCache(NDJSONSourceInfo),
+}
+
+# Text sources are sampled from the leading lines of at most
+# ``_TEXT_MAX_FILE_SAMPLES`` files, reading up to ``_TEXT_SAMPLE_SIZE``
+# bytes from each.
+_TEXT_MAX_FILE_SAMPLES = 3
+_TEXT_SAMPLE_SIZE = 1 << 20
+
+
 def _build_parquet_source(
     paths: tuple[str, ...],
     needed_cols: frozenset[str],
     schema: tuple[tuple[str, DataType], ...],
     max_footer_samples: int,
     max_row_group_samples: int,
+    *,
+    cache_dir: str | None = None,
+    cache_size: int = DEFAULT_SOURCE_INFO_CACHE_SIZE,
 ) -> ParquetSourceInfo:
     """Return cached, fully-computed Parquet datasource information."""
-    return ParquetSourceInfo.from_paths(
-        paths, needed_cols, schema, max_footer_samples, max_row_group_samples
+    key: _SourceInfoKey = (
+        paths,
+        needed_cols,
+        schema,
+        max_footer_samples,
+        max_row_group_samples,
+    )
+    return _parquet_source_info_cache.get(
+        key, cache_dir=cache_dir, cache_size=cache_size
+    )
+
+
+def _build_text_source(
+    typ: str,
+    paths: tuple[str, ...],
+    needed_cols: frozenset[str],
+    schema: tuple[tuple[str, DataType], ...],
+    reader_options: tuple[tuple[str, Any], ...],
+    max_file_samples: int = _TEXT_MAX_FILE_SAMPLES,
+    sample_size: int = _TEXT_SAMPLE_SIZE,
+    *,
+    cache_dir: str | None = None,
+    cache_size: int = DEFAULT_SOURCE_INFO_CACHE_SIZE,
+) -> TextSourceInfo:
+    """Return cached CSV or NDJSON datasource information."""
+    key: _TextSourceInfoKey = (
+        paths,
+        needed_cols,
+        schema,
+        reader_options,
+        max_file_samples,
+        sample_size,
+    )
+    return _text_source_info_caches[typ].get(
+        key, cache_dir=cache_dir, cache_size=cache_size
     )
 
 
@@ -1256,13 +1950,44 @@ def _build_source_info(
         needed_cols = frozenset(ir.schema) if needed_cols is None else needed_cols
         schema = tuple(ir.schema.items()) if schema is None else schema
         paths = tuple(ir.paths)
-        return _build_parquet_source(paths, needed_cols, schema, max_footer, max_rg)
+        return _build_parquet_source(
+            paths,
+            needed_cols,
+            schema,
+            max_footer,
+            max_rg,
+            cache_dir=config_options.parquet_options.source_info_cache_dir,
+            cache_size=config_options.parquet_options.source_info_cache_size,
+        )
+    elif isinstance(ir, Scan) and ir.typ in ("csv", "ndjson"):
+        file_schema = _file_schema(ir)
+        needed_cols = frozenset(file_schema) if needed_cols is None else needed_cols
+        schema = tuple(file_schema.items()) if schema is None else schema
+        return _build_text_source(
+            ir.typ,
+            tuple(ir.paths),
+            needed_cols,
+            schema,
+            _text_reader_options(ir),
+            cache_dir=config_options.executor.text_source_info_cache_dir,
+            cache_size=config_options.executor.text_source_info_cache_size,
+        )
     else:  # pragma: no cover
         raise ValueError(f"Unsupported Scan type: {ir.typ}")
 
 
 def _clear_source_info_cache() -> None:
-    """Clear DataSourceInfo caches."""
-    # TODO: Avoid clearing the cache if we can
-    # check that the underlying data hasn't changed.
-    _build_parquet_source.cache_clear()
+    """Clear in-memory DataSourceInfo caches."""
+    _parquet_source_info_cache.clear()
+    for cache in _text_source_info_caches.values():
+        cache.clear()
+
+
+def _expire_source_info_cache() -> None:
+    """Drop DataSourceInfo cache entries that cannot be validated."""
+    # Entries for local files are validated against the file size and
+    # modification time on every lookup, so only unverifiable entries
+    # (e.g. remote URIs) need to be dropped between queries.
+    _parquet_source_info_cache.expire_unvalidated()
+    for cache in _text_source_info_caches.values():
+        cache.expire_unvalidated()
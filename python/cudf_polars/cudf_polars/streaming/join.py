@@ -199,12 +199,6 @@ def _(
     # Pull slice operations out of the Join before lowering
     if (zlice := ir.options[2]) is not None:
         offset, length = zlice
-        if length is None:  # pragma: no cover
-            return _lower_ir_fallback(
-                ir,
-                rec,
-                msg="This slice not supported for multiple partitions.",
-            )
         new_join = Join(
             ir.schema,
             ir.left_on,
@@ -61,6 +61,7 @@ execution. Poor estimates can choose an unprofitable rewrite.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypedDict
@@ -95,6 +96,12 @@ from cudf_polars.dsl.utils.column_domain import (
     ColumnRef,
     column_domain_bindings,
 )
+from cudf_polars.streaming.cardinality import (
+    SourceColumnStatistics,
+    distinct_count,
+    equijoin_rows,
+    predicate_selectivity,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Mapping, Sequence
@@ -214,19 +221,60 @@ def analyze_plan(ir: IR, stats: StatsCollector) -> PlanFacts:
     column_lineages: dict[ColumnRef, ColumnLineage] = {}
 
     for node in post_traversal([ir]):
+        bindings = column_domain_bindings(node)
+        for name in node.schema:
+            column = ColumnRef(node, name)
+            binding = bindings.get(name)
+            if binding is None:
+                source_lineage = None
+                source_child_index = None
+            else:
+                source_child_index = binding.child_index
+                source = ColumnRef(
+                    node.children[source_child_index],
+                    binding.name,
+                )
+                source_lineage = column_lineages[source]
+            column_lineages[column] = ColumnLineage(
+                column, source_lineage, source_child_index
+            )
+
+        rows: int | None
         if isinstance(node, (Scan, DataFrameScan)):
             source_info = stats.scan_stats.get(node)
             rows = None if source_info is None else source_info.row_count
             if rows is None and isinstance(node, DataFrameScan):
                 rows = node.df.shape()[0]
-        elif isinstance(node, (Select, Projection, HStack, Filter, Distinct, GroupBy)):
-            rows = row_estimates[node.children[0]]
-        elif isinstance(node, Join):
-            rows = _estimate_join_rows(
-                node.options[0],
+            if isinstance(node, Scan) and node.predicate is not None:
+                rows = _filtered_rows(
+                    rows, node.predicate.value, node, column_lineages, stats
+                )
+        elif isinstance(node, Filter):
+            rows = _filtered_rows(
                 row_estimates[node.children[0]],
-                row_estimates[node.children[1]],
+                node.mask.value,
+                node.children[0],
+                column_lineages,
+                stats,
             )
+        elif isinstance(node, (GroupBy, Distinct)):
+            (child,) = node.children
+            rows = row_estimates[child]
+            if isinstance(node, GroupBy):
+                keys = [k.value for k in node.keys]
+            else:
+                keys = [
+                    expr.Col(dtype, name)
+                    for name, dtype in child.schema.items()
+                    if node.subset is None or name in node.subset
+                ]
+            group_count = _group_count(keys, child, rows, column_lineages, stats)
+            if rows is not None and group_count is not None:
+                rows = min(rows, group_count)
+        elif isinstance(node, (Select, Projection, HStack)):
+            rows = row_estimates[node.children[0]]
+        elif isinstance(node, Join):
+            rows = _estimate_join_rows(node, row_estimates, column_lineages, stats)
         else:
             child_estimates = [
                 estimate
@@ -234,6 +282,9 @@ def analyze_plan(ir: IR, stats: StatsCollector) -> PlanFacts:
                 if (estimate := row_estimates[child]) is not None
             ]
             rows = max(child_estimates, default=None)
+        if stats.row_hints:
+            # Row counts observed by an earlier run of the same plan
+            rows = stats.row_hints.get(node.get_stable_id(), rows)
         row_estimates[node] = rows
 
         if (
@@ -243,24 +294,6 @@ def analyze_plan(ir: IR, stats: StatsCollector) -> PlanFacts:
         ):
             selective_nodes.add(node)
 
-        bindings = column_domain_bindings(node)
-        for name in node.schema:
-            column = ColumnRef(node, name)
-            binding = bindings.get(name)
-            if binding is None:
-                source_lineage = None
-                source_child_index = None
-            else:
-                source_child_index = binding.child_index
-                source = ColumnRef(
-                    node.children[source_child_index],
-                    binding.name,
-                )
-                source_lineage = column_lineages[source]
-            column_lineages[column] = ColumnLineage(
-                column, source_lineage, source_child_index
-            )
-
     return PlanFacts(
         row_estimates=row_estimates,
         selective_nodes=frozenset(selective_nodes),
@@ -786,13 +819,99 @@ def _largest_key_source(root: IR, column: str, facts: PlanFacts) -> _Producer |
     return max(candidates, key=lambda item: (item[0], -item[1]))[2]
 
 
+def _source_column_statistics(
+    node: IR,
+    column: str,
+    column_lineages: Mapping[ColumnRef, ColumnLineage],
+    stats: StatsCollector,
+) -> SourceColumnStatistics | None:
+    """Return the datasource statistics of the column that ``column`` originates from."""
+    lineage = column_lineages.get(ColumnRef(node, column))
+    if lineage is None:
+        return None
+    while lineage.source is not None:
+        lineage = lineage.source
+    source_info = stats.scan_stats.get(lineage.column.node)
+    if source_info is None or source_info.row_count is None:
+        return None
+    column_stats = source_info.column_statistics(lineage.column.name)
+    if column_stats is None:
+        return None
+    return SourceColumnStatistics(column_stats, source_info.row_count)
+
+
+def _filtered_rows(
+    rows: int | None,
+    predicate: expr.Expr,
+    node: IR,
+    column_lineages: Mapping[ColumnRef, ColumnLineage],
+    stats: StatsCollector,
+) -> int | None:
+    """Estimate the rows of ``node`` that satisfy ``predicate``."""
+    if not rows:
+        return rows
+    selectivity = predicate_selectivity(
+        predicate,
+        lambda name: _source_column_statistics(node, name, column_lineages, stats),
+    )
+    if selectivity is None:
+        return rows
+    # Statistics are only estimates, so never filter out every row.
+    return max(1, round(rows * selectivity))
+
+
+def _group_count(
+    keys: Sequence[expr.Expr],
+    node: IR,
+    rows: int | None,
+    column_lineages: Mapping[ColumnRef, ColumnLineage],
+    stats: StatsCollector,
+) -> int | None:
+    """Estimate the number of distinct combinations of ``keys`` in ``node``."""
+    if not keys:
+        return None
+    counts = []
+    for key in keys:
+        if not isinstance(key, expr.Col):
+            return None
+        count = distinct_count(
+            _source_column_statistics(node, key.name, column_lineages, stats), rows
+        )
+        if count is None:
+            return None
+        counts.append(count)
+    return math.prod(counts)
+
+
 def _estimate_join_rows(
-    how: str, left_rows: int | None, right_rows: int | None
+    node: Join,
+    row_estimates: Mapping[IR, int | None],
+    column_lineages: Mapping[ColumnRef, ColumnLineage],
+    stats: StatsCollector,
 ) -> int | None:
+    how = node.options[0]
+    left, right = node.children
+    left_rows = row_estimates[left]
+    right_rows = row_estimates[right]
     if left_rows is None:
         return right_rows
     if right_rows is None:
         return left_rows
+    key_distinct_counts = []
+    for left_key, right_key in zip(node.left_on, node.right_on, strict=True):
+        left_count = _group_count(
+            [left_key.value], left, left_rows, column_lineages, stats
+        )
+        right_count = _group_count(
+            [right_key.value], right, right_rows, column_lineages, stats
+        )
+        if left_count is None or right_count is None:
+            break
+        key_distinct_counts.append((left_count, right_count))
+    else:
+        estimate = equijoin_rows(how, left_rows, right_rows, key_distinct_counts)
+        if estimate is not None:
+            return estimate
     if how in ("Inner", "Semi", "Anti"):
         return min(left_rows, right_rows)
     if how == "Left":
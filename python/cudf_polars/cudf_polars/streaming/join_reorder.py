@@ -0,0 +1,345 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Reorder chains of inner joins using datasource statistics.
+
+Polars emits multi-way joins in the order they appear in the query. For a
+star-schema query, joining the fact table with an unselective dimension
+first produces needlessly large intermediate results. This pass collects
+left-deep chains of inner equi-joins::
+
+    join(join(join(fact, d1), d2), d3)
+
+and rebuilds each chain greedily: at every step, it joins the input that
+gives the smallest estimated intermediate result among the inputs whose
+join keys are already available. A dimension's keys may refer to columns
+of an earlier dimension (a snowflake), so the greedy order always respects
+those dependencies.
+
+Each step is estimated from key distinct counts where the datasource
+statistics provide them. Otherwise the key of a filtered dimension is
+assumed to be a foreign key of the chain, so the chain keeps the same
+fraction of its rows as the dimension keeps of its datasource. A chain is
+only rewritten if every step can be estimated and the new order reduces
+the total estimated size of the intermediate results.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import singledispatch
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from cudf_polars.dsl import expr
+from cudf_polars.dsl.ir import IR, DataFrameScan, Join, Projection
+from cudf_polars.dsl.traversal import CachingVisitor, reuse_if_unchanged, traversal
+from cudf_polars.dsl.utils.column_domain import ColumnRef
+from cudf_polars.streaming.cardinality import distinct_count, equijoin_rows
+from cudf_polars.streaming.join_filter_pushdown import (
+    _source_column_statistics,
+    analyze_plan,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from cudf_polars.streaming.base import StatsCollector
+    from cudf_polars.streaming.join_filter_pushdown import PlanFacts
+    from cudf_polars.typing import GenericTransformer, Schema
+    from cudf_polars.utils.config import ConfigOptions, StreamingExecutor
+
+
+@dataclass(frozen=True)
+class _ChainStep:
+    """An input joined onto a chain of inner joins."""
+
+    right: IR
+    left_on: tuple[expr.NamedExpr, ...]
+    right_on: tuple[expr.NamedExpr, ...]
+    options: Any
+    added: Schema
+    """The columns this join adds to its left input."""
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """The right join-key names, used to identify the step."""
+        return tuple(key.name for key in self.right_on)
+
+
+@dataclass(frozen=True)
+class JoinOrderDecision:
+    """A chain of inner joins rebuilt in a different order."""
+
+    original: tuple[tuple[str, ...], ...]
+    """The right join keys of every join, in the original order."""
+    original_rows: tuple[int, ...]
+    """The estimated rows after every join, in the original order."""
+    chosen: tuple[tuple[str, ...], ...]
+    """The right join keys of every join, in the chosen order."""
+    chosen_rows: tuple[int, ...]
+    """The estimated rows after every join, in the chosen order."""
+
+
+class _ReorderState(TypedDict):
+    """State shared by the join reordering DAG rewrite."""
+
+    stats: StatsCollector
+    facts: PlanFacts
+    parents: Mapping[IR, int]
+    decisions: list[JoinOrderDecision]
+
+
+def _chain_step(node: Join) -> _ChainStep | None:
+    """Return the chain step of a reorderable join, or None."""
+    how, _, zlice, _, coalesce, maintain_order = node.options
+    if how != "Inner" or zlice is not None or maintain_order != "none":
+        return None
+    if not all(
+        isinstance(key.value, expr.Col) and key.value.name == key.name
+        for key in (*node.left_on, *node.right_on)
+    ):
+        return None
+    left, right = node.children
+    right_keys = {key.name for key in node.right_on}
+    added = {
+        name: dtype
+        for name, dtype in right.schema.items()
+        if not (coalesce and name in right_keys)
+    }
+    if any(name in left.schema for name in added) or dict(node.schema) != {
+        **left.schema,
+        **added,
+    }:
+        # Suffixed output columns depend on the join order.
+        return None
+    return _ChainStep(right, node.left_on, node.right_on, node.options, added)
+
+
+def _join_chain(
+    node: Join, parents: Mapping[IR, int]
+) -> tuple[IR, list[_ChainStep]] | None:
+    """
+    Collect the left-deep chain of reorderable joins rooted at ``node``.
+
+    Returns the leftmost input and the chain steps in join order, or
+    None if ``node`` doesn't join at least two inputs onto a chain.
+    """
+    steps: list[_ChainStep] = []
+    current: IR = node
+    while isinstance(current, Join) and (current is node or parents[current] == 1):
+        step = _chain_step(current)
+        if step is None:
+            break
+        steps.append(step)
+        current = current.children[0]
+    if len(steps) < 2:
+        return None
+    steps.reverse()
+    return current, steps
+
+
+def _source_rows(
+    node: IR, column: str, facts: PlanFacts, stats: StatsCollector
+) -> int | None:
+    """Return the datasource row count of the column ``column`` originates from."""
+    lineage = facts.column_lineages.get(ColumnRef(node, column))
+    if lineage is None:
+        return None
+    while lineage.source is not None:
+        lineage = lineage.source
+    source = lineage.column.node
+    if (
+        info := stats.scan_stats.get(source)
+    ) is not None and info.row_count is not None:
+        return info.row_count
+    if isinstance(source, DataFrameScan):
+        return source.df.shape()[0]
+    return None
+
+
+def _step_rows(
+    rows: int,
+    step: _ChainStep,
+    origins: Mapping[str, IR],
+    facts: PlanFacts,
+    stats: StatsCollector,
+) -> int | None:
+    """Estimate the rows after joining ``step`` onto ``rows`` chain rows."""
+    right_rows = facts.row_estimates.get(step.right)
+    if right_rows is None:
+        return None
+    key_distinct_counts = []
+    for left_key, right_key in zip(step.left_on, step.right_on, strict=True):
+        origin = origins[left_key.name]
+        left_count = distinct_count(
+            _source_column_statistics(
+                origin, left_key.name, facts.column_lineages, stats
+            ),
+            rows,
+        )
+        right_count = distinct_count(
+            _source_column_statistics(
+                step.right, right_key.name, facts.column_lineages, stats
+            ),
+            right_rows,
+        )
+        if left_count is None or right_count is None:
+            break
+        key_distinct_counts.append((left_count, right_count))
+    else:
+        return equijoin_rows("Inner", rows, right_rows, key_distinct_counts)
+    # Without distinct counts, assume that the chain rows reference the
+    # right rows by a foreign key.
+    source_rows = _source_rows(step.right, step.right_on[0].name, facts, stats)
+    if not source_rows:
+        return None
+    return round(rows * min(1.0, right_rows / source_rows))
+
+
+def _order_chain(
+    leftmost: IR,
+    steps: Sequence[_ChainStep],
+    facts: PlanFacts,
+    stats: StatsCollector,
+) -> tuple[list[int], list[int], list[int]] | None:
+    """
+    Choose a join order for a chain.
+
+    Returns the chosen order of the steps, and the estimated rows after
+    every step in the original and chosen orders. Returns None if any
+    step can't be estimated.
+    """
+    leftmost_rows = facts.row_estimates.get(leftmost)
+    if leftmost_rows is None:
+        return None
+    origins: dict[str, IR] = dict.fromkeys(leftmost.schema, leftmost)
+    for step in steps:
+        origins.update(dict.fromkeys(step.added, step.right))
+
+    rows = leftmost_rows
+    original_rows: list[int] = []
+    for step in steps:
+        estimate = _step_rows(rows, step, origins, facts, stats)
+        if estimate is None:
+            return None
+        original_rows.append(rows := estimate)
+
+    rows = leftmost_rows
+    available = set(leftmost.schema)
+    remaining = list(range(len(steps)))
+    order: list[int] = []
+    chosen_rows: list[int] = []
+    while remaining:
+        # The first remaining step of the original order is always ready.
+        candidates = []
+        for i in remaining:
+            step = steps[i]
+            if all(key.name in available for key in step.left_on):
+                estimate = _step_rows(rows, step, origins, facts, stats)
+                if estimate is None:
+                    return None
+                candidates.append((estimate, i))
+        rows, i = min(candidates)
+        order.append(i)
+        chosen_rows.append(rows)
+        available.update(steps[i].added)
+        remaining.remove(i)
+    return order, original_rows, chosen_rows
+
+
+def reorder_joins(ir: IR, stats: StatsCollector) -> tuple[IR, list[JoinOrderDecision]]:
+    """
+    Reorder the chains of inner joins in an IR DAG.
+
+    Parameters
+    ----------
+    ir
+        DAG to rewrite.
+    stats
+        Pre-populated statistics.
+
+    Returns
+    -------
+    The rewritten DAG, and the decision for every reordered chain.
+    """
+    state = _ReorderState(
+        stats=stats,
+        facts=analyze_plan(ir, stats),
+        parents=Counter(child for node in traversal([ir]) for child in node.children),
+        decisions=[],
+    )
+    mapper: GenericTransformer[IR, IR, _ReorderState] = CachingVisitor(
+        _rewrite, state=state
+    )
+    return mapper(ir), state["decisions"]
+
+
+def optimize_join_order(
+    ir: IR,
+    stats: StatsCollector,
+    config_options: ConfigOptions[StreamingExecutor],
+) -> IR:
+    """
+    Rewrite an IR DAG to join the most selective inputs of join chains first.
+
+    Parameters
+    ----------
+    ir
+        DAG to rewrite.
+    stats
+        Pre-populated statistics.
+    config_options
+        Configuration options controlling the rewrite.
+
+    Returns
+    -------
+    Rewritten DAG.
+    """
+    if not config_options.executor.join_reorder:
+        return ir
+    return reorder_joins(ir, stats)[0]
+
+
+@singledispatch
+def _rewrite(node: IR, rec: GenericTransformer[IR, IR, _ReorderState]) -> IR:
+    raise AssertionError
+
+
+@_rewrite.register(IR)
+def _(node: IR, rec: GenericTransformer[IR, IR, _ReorderState]) -> IR:
+    return reuse_if_unchanged(node, rec)
+
+
+@_rewrite.register(Join)
+def _(node: Join, rec: GenericTransformer[IR, IR, _ReorderState]) -> IR:
+    chain = _join_chain(node, rec.state["parents"])
+    if chain is None:
+        return reuse_if_unchanged(node, rec)
+    leftmost, steps = chain
+    plan = _order_chain(leftmost, steps, rec.state["facts"], rec.state["stats"])
+    if plan is None or sum(plan[2]) >= sum(plan[1]):
+        return reuse_if_unchanged(node, rec)
+    order, original_rows, chosen_rows = plan
+    rec.state["decisions"].append(
+        JoinOrderDecision(
+            original=tuple(step.keys for step in steps),
+            original_rows=tuple(original_rows),
+            chosen=tuple(steps[i].keys for i in order),
+            chosen_rows=tuple(chosen_rows),
+        )
+    )
+    result = rec(leftmost)
+    for i in order:
+        step = steps[i]
+        result = Join(
+            {**result.schema, **step.added},
+            step.left_on,
+            step.right_on,
+            step.options,
+            result,
+            rec(step.right),
+        )
+    if list(result.schema) != list(node.schema):
+        return Projection(node.schema, result)
+    return result
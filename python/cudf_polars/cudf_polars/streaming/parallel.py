@@ -18,6 +18,7 @@ import cudf_polars.streaming.distinct
 import cudf_polars.streaming.groupby
 import cudf_polars.streaming.io
 import cudf_polars.streaming.join
+import cudf_polars.streaming.rolling
 import cudf_polars.streaming.select
 import cudf_polars.streaming.shuffle
 import cudf_polars.streaming.sort  # noqa: F401
@@ -40,7 +41,8 @@ from cudf_polars.dsl.traversal import CachingVisitor, reuse_if_unchanged, traver
 from cudf_polars.dsl.utils.naming import unique_names
 from cudf_polars.streaming.base import PartitionInfo
 from cudf_polars.streaming.dispatch import lower_ir_node
-from cudf_polars.streaming.io import _clear_source_info_cache
+from cudf_polars.streaming.expressions import _reduces_to_scalars
+from cudf_polars.streaming.io import _expire_source_info_cache
 from cudf_polars.streaming.repartition import Repartition
 from cudf_polars.streaming.utils import (
     _contains_over,
@@ -120,8 +122,10 @@ def optimize_with_stats(
     from cudf_polars.streaming.join_filter_pushdown import (
         optimize_join_filter_pushdown,
     )
+    from cudf_polars.streaming.join_reorder import optimize_join_order
 
     ir = remove_cache_nodes(ir)
+    ir = optimize_join_order(ir, stats, config_options)
     return optimize_join_filter_pushdown(ir, stats, config_options)
 
 
@@ -254,8 +258,8 @@ def evaluate_streaming(
     -------
     A cudf-polars DataFrame object.
     """
-    # Clear source info cache in case data was overwritten
-    _clear_source_info_cache()
+    # Drop source info that can't be validated in case data was overwritten
+    _expire_source_info_cache()
 
     from cudf_polars.streaming.actor_graph.core import evaluate_logical_plan
 
@@ -302,10 +306,23 @@ def _(
 def _(
     ir: MapFunction, rec: LowerIRTransformer
 ) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
-    # Allow pointwise operations
-    if ir.name in ("rename", "explode"):
+    # Allow pointwise operations. A row index is offset by the row
+    # counts of the preceding partitions at execution time.
+    if ir.name in ("rechunk", "rename", "explode", "row_index"):
         return _lower_ir_pwise(ir, rec)
 
+    # Polars emits the unpivoted rows column by column, so only an
+    # unpivot of a single column preserves row order partition-wise.
+    if ir.name == "unpivot":
+        _, pivotees, _, _ = ir.options
+        if len(pivotees) <= 1:
+            return _lower_ir_pwise(ir, rec)
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="unpivot of multiple columns is not supported for multiple partitions.",
+        )
+
     # Fallback for everything else
     return _lower_ir_fallback(
         ir, rec, msg=f"{ir.name} is not supported for multiple partitions."
@@ -365,10 +382,32 @@ def _(
     if partition_info[child].count > 1 and not all(
         expr.is_pointwise for expr in traversal([ir.mask.value])
     ):
-        # TODO: Use expression decomposition to lower Filter
-        # See: https://github.com/rapidsai/cudf/issues/20076
-        return _lower_ir_fallback(
-            ir, rec, msg="This filter is not supported for multiple partitions."
+        if not _reduces_to_scalars(ir.mask.value):
+            # TODO: Decompose non-scalar masks (e.g. ``is_in`` a column)
+            # See: https://github.com/rapidsai/cudf/issues/20076
+            return _lower_ir_fallback(
+                ir, rec, msg="This filter is not supported for multiple partitions."
+            )
+        # Evaluate the mask as a temporary column, so that its scalar
+        # reductions are decomposed like those of any other selection,
+        # and filter on that column partition-wise.
+        (df,) = ir.children
+        mask = NamedExpr(next(unique_names(df.schema)), ir.mask.value)
+        stacked = HStack(
+            df.schema | {mask.name: mask.value.dtype},
+            (mask,),
+            True,  # noqa: FBT003
+            df,
+        )
+        return rec(
+            Projection(
+                ir.schema,
+                Filter(
+                    stacked.schema,
+                    NamedExpr(mask.name, Col(mask.value.dtype, mask.name)),
+                    stacked,
+                ),
+            )
         )
 
     new_node = ir.reconstruct([child])
@@ -384,6 +423,10 @@ def _(
     config_options = rec.state["config_options"]
     dynamic_planning = _dynamic_planning_on(config_options)
 
+    if ir.offset == 0 and ir.length is None:
+        # No-op slice.
+        return rec(ir.children[0])
+
     if ir.offset == 0:
         # Taking the first N rows.
         # We don't know how large each partition is, so we reduce.
@@ -397,10 +440,14 @@ def _(
             partition_info[new_node] = PartitionInfo(count=1)
         return new_node, partition_info
 
-    # Fallback
-    return _lower_ir_fallback(
-        ir, rec, msg="This slice not supported for multiple partitions."
-    )
+    # Slicing from a non-zero (or negative) offset.
+    # We don't know where each partition starts, so the runtime gathers
+    # per-rank row counts and only keeps the rows overlapping the window.
+    # Dropping rows doesn't change the partitioning of the remaining rows.
+    child, partition_info = rec(ir.children[0])
+    new_node = ir.reconstruct([child])
+    partition_info[new_node] = partition_info[child]
+    return new_node, partition_info
 
 
 def _add_anchor_column(ir: HStack) -> tuple[HStack, str, DataType]:
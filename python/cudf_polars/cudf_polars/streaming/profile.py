@@ -0,0 +1,390 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Query profiles for the streaming executor.
+
+A profile is the physical plan of one query annotated with what its
+actors observed at runtime: the rows, bytes and chunks every actor
+produced, how long it ran, and the strategy it picked (for example a
+broadcast or a shuffle join). With the ``profile_output`` executor option
+set, every rank records the statistics of its actors and rank 0 writes
+the combined profile as JSON after each query.
+
+A profile is rendered as an annotated plan with
+:meth:`QueryProfile.explain_analyze`. Passed back in through the
+``profile_hints`` option, the row counts it observed replace the
+planner's estimates (see
+:func:`~cudf_polars.streaming.join_filter_pushdown.analyze_plan`) for the
+matching nodes of the next run of the same query. Nodes are matched by
+their stable ID, so a hint only applies to a sub-plan that is identical
+to the one profiled.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import threading
+import time
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from cudf_polars.streaming.explain import (
+    SerializablePlan,
+    _fmt_partition_bytes,
+    _fmt_row_count,
+    _repr_schema,
+)
+from cudf_polars.streaming.join_filter_pushdown import analyze_plan
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Iterator, MutableMapping, Sequence
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.streaming.actor_graph.tracing import ActorTracer
+    from cudf_polars.streaming.base import PartitionInfo, StatsCollector
+    from cudf_polars.utils.config import ConfigOptions
+
+
+__all__: list[str] = [
+    "ActorProfile",
+    "ProfileRecorder",
+    "QueryProfile",
+    "get_profile_recorder",
+    "record_profile",
+]
+
+PROFILE_VERSION = 1
+
+
+@dataclasses.dataclass
+class ActorProfile:
+    """The runtime statistics of the actors of one IR node."""
+
+    ir_type: str
+    row_count: int | None = None
+    """Rows produced, or None if the actors did not count rows."""
+    byte_count: int | None = None
+    """Bytes produced, or None if the actors did not count rows."""
+    chunk_count: int = 0
+    wall_time: float = 0.0
+    """Seconds between the start and the end of the slowest actor."""
+    decision: str | None = None
+    """The strategy picked at runtime (e.g. ``"broadcast_left"``)."""
+    duplicated: bool = False
+    """Whether every rank produced a copy of the same rows."""
+    extra: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def merge(self, other: ActorProfile, *, across_ranks: bool = False) -> None:
+        """
+        Merge the statistics of another actor of the same IR node.
+
+        Parameters
+        ----------
+        other
+            The statistics to merge into these.
+        across_ranks
+            Whether *other* ran on another rank. The rows of a duplicated
+            output are then counted once rather than summed.
+        """
+        if not (across_ranks and self.duplicated and other.duplicated):
+            self.row_count = _add(self.row_count, other.row_count)
+            self.byte_count = _add(self.byte_count, other.byte_count)
+            self.chunk_count += other.chunk_count
+        self.wall_time = max(self.wall_time, other.wall_time)
+        if self.decision is None:
+            self.decision = other.decision
+        if not across_ranks:
+            self.duplicated = self.duplicated or other.duplicated
+        self.extra = {**other.extra, **self.extra}
+
+
+def _add(a: int | None, b: int | None) -> int | None:
+    if a is None:
+        return b
+    return a if b is None else a + b
+
+
+class ProfileRecorder:
+    """Thread-safe collector of the actor statistics of a query on one rank."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.actors: dict[int, ActorProfile] = {}
+        self.wall_time: float = 0.0
+        """Seconds the query ran for on this rank."""
+
+    def record(self, tracer: ActorTracer, wall_time: float) -> None:
+        """
+        Record the statistics of a finished actor.
+
+        Parameters
+        ----------
+        tracer
+            The tracer of the actor.
+        wall_time
+            Seconds the actor ran for.
+        """
+        if tracer.ir_id is None or tracer.ir_type is None:
+            return
+        actor = ActorProfile(
+            tracer.ir_type,
+            row_count=tracer.row_count,
+            byte_count=tracer.byte_count,
+            chunk_count=tracer.chunk_count,
+            wall_time=wall_time,
+            decision=tracer.decision,
+            duplicated=tracer.duplicated,
+            extra=dict(tracer.extra),
+        )
+        with self._lock:
+            if (existing := self.actors.get(tracer.ir_id)) is None:
+                self.actors[tracer.ir_id] = actor
+            else:
+                existing.merge(actor)
+
+    def serialize(self) -> bytes:
+        """Serialize the recorded statistics for an allgather."""
+        with self._lock:
+            return json.dumps(
+                {
+                    "wall_time": self.wall_time,
+                    "actors": {
+                        str(ir_id): dataclasses.asdict(actor)
+                        for ir_id, actor in self.actors.items()
+                    },
+                },
+                default=str,
+            ).encode()
+
+
+_recorders: dict[uuid.UUID, ProfileRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def record_profile(query_id: uuid.UUID) -> Iterator[ProfileRecorder]:
+    """
+    Record the statistics of the actors of a query on this rank.
+
+    Parameters
+    ----------
+    query_id
+        ID of the query, see :class:`~cudf_polars.dsl.ir.IRExecutionContext`.
+
+    Yields
+    ------
+    The recorder that the actors of the query report to.
+    """
+    recorder = ProfileRecorder()
+    with _recorders_lock:
+        _recorders[query_id] = recorder
+    start = time.monotonic()
+    try:
+        yield recorder
+    finally:
+        recorder.wall_time = time.monotonic() - start
+        with _recorders_lock:
+            del _recorders[query_id]
+
+
+def get_profile_recorder(query_id: uuid.UUID) -> ProfileRecorder | None:
+    """Return the recorder of a query, or None if it is not profiled."""
+    return _recorders.get(query_id)
+
+
+@dataclasses.dataclass
+class QueryProfile:
+    """
+    The physical plan of a query annotated with runtime statistics.
+
+    All node IDs are stable IDs stored as strings, as in
+    :class:`~cudf_polars.streaming.explain.SerializablePlan`.
+    """
+
+    query_id: str
+    nranks: int
+    wall_time: float
+    """Seconds the slowest rank spent executing the query."""
+    plan: SerializablePlan
+    """The physical (lowered) plan."""
+    actors: dict[str, ActorProfile]
+    """Statistics of the actors of every physical node, across all ranks."""
+    node_map: dict[str, list[str]]
+    """Mapping from physical to logical (optimized) node IDs."""
+    estimated_rows: dict[str, int]
+    """The planner's row estimate of every logical node."""
+    version: int = PROFILE_VERSION
+
+    @classmethod
+    def from_ranks(
+        cls,
+        ranks: Sequence[bytes],
+        *,
+        query_id: uuid.UUID,
+        optimized: IR,
+        lowered: IR,
+        partition_info: MutableMapping[IR, PartitionInfo],
+        node_map: dict[str, list[str]],
+        stats: StatsCollector,
+        config_options: ConfigOptions,
+    ) -> Self:
+        """
+        Combine the statistics recorded by every rank into a profile.
+
+        Parameters
+        ----------
+        ranks
+            :meth:`ProfileRecorder.serialize` of every rank, in rank order.
+        query_id
+            ID of the query.
+        optimized
+            The logical plan after optimization.
+        lowered
+            The physical plan.
+        partition_info
+            Partitioning of the physical plan.
+        node_map
+            Mapping from physical to logical node IDs, see
+            :func:`~cudf_polars.streaming.parallel.lower_ir_graph_with_node_map`.
+        stats
+            The statistics the query was planned with.
+        config_options
+            The configuration options.
+        """
+        actors: dict[str, ActorProfile] = {}
+        wall_time = 0.0
+        for data in ranks:
+            recorded = json.loads(data)
+            wall_time = max(wall_time, recorded["wall_time"])
+            for ir_id, actor in recorded["actors"].items():
+                profile = ActorProfile(**actor)
+                if (existing := actors.get(ir_id)) is None:
+                    actors[ir_id] = profile
+                else:
+                    existing.merge(profile, across_ranks=True)
+        return cls(
+            query_id=str(query_id),
+            nranks=len(ranks),
+            wall_time=wall_time,
+            plan=SerializablePlan.from_ir(
+                lowered, config_options=config_options, partition_info=partition_info
+            ),
+            actors=actors,
+            node_map=node_map,
+            estimated_rows={
+                str(node.get_stable_id()): rows
+                for node, rows in analyze_plan(optimized, stats).row_estimates.items()
+                if rows is not None
+            },
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Reconstruct a profile from its :meth:`to_dict` form."""
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(
+                f"Unsupported query profile version {data.get('version')!r}."
+            )
+        return cls(
+            query_id=data["query_id"],
+            nranks=data["nranks"],
+            wall_time=data["wall_time"],
+            plan=SerializablePlan.from_dict(data["plan"]),
+            actors={
+                ir_id: ActorProfile(**actor) for ir_id, actor in data["actors"].items()
+            },
+            node_map=data["node_map"],
+            estimated_rows=data["estimated_rows"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON-serializable form of the profile."""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Load a profile written by :meth:`dump`."""
+        with Path(path).open() as f:
+            return cls.from_dict(json.load(f))
+
+    def dump(self, path: str | Path) -> None:
+        """Write the profile to a JSON file."""
+        with Path(path).open("w") as f:
+            json.dump(self.to_dict(), f, default=str)
+
+    def row_hints(self) -> dict[int, int]:
+        """
+        Return the observed row counts of the logical nodes.
+
+        A logical node is lowered to a sub-graph of physical nodes, and the
+        root of that sub-graph produces its rows.
+
+        Returns
+        -------
+        Row counts keyed by the stable ID of the logical node, see
+        :attr:`~cudf_polars.streaming.base.StatsCollector.row_hints`.
+        """
+        hints: dict[int, int] = {}
+        for physical_id, logical_ids in self.node_map.items():
+            actor = self.actors.get(physical_id)
+            if actor is None or actor.row_count is None:
+                continue
+            for logical_id in logical_ids:
+                hints[int(logical_id)] = actor.row_count
+        return hints
+
+    def explain_analyze(self) -> str:
+        """
+        Format the physical plan annotated with the runtime statistics.
+
+        Every node shows the rows it produced, the planner's estimate (if
+        any), the bytes and chunks it produced, its wall time and the
+        strategy it picked at runtime.
+        """
+        header = (
+            f"QUERY {self.query_id} ranks={self.nranks} time={self.wall_time:.3f}s\n"
+        )
+        return header + "".join(
+            self._repr_node(root, offset="") for root in self.plan.roots
+        )
+
+    def _repr_node(self, node_id: str, *, offset: str) -> str:
+        node = self.plan.nodes[node_id]
+        annotations: list[str] = []
+        if (actor := self.actors.get(node_id)) is not None:
+            if actor.row_count is not None:
+                annotations.append(f"rows={_fmt_row_count(actor.row_count)}")
+            estimates = [
+                self.estimated_rows[logical_id]
+                for logical_id in self.node_map.get(node_id, [])
+                if logical_id in self.estimated_rows
+            ]
+            if estimates:
+                annotations.append(f"estimate=~{_fmt_row_count(estimates[0])}")
+            if actor.byte_count is not None:
+                annotations.append(f"bytes={_fmt_partition_bytes(actor.byte_count)}")
+            annotations.append(f"chunks={actor.chunk_count}")
+            annotations.append(f"time={actor.wall_time:.3f}s")
+            if actor.decision is not None:
+                annotations.append(f"decision={actor.decision}")
+        if self.plan.partition_info is not None:
+            annotations.append(f"[{self.plan.partition_info[node_id].count}]")
+        line = " ".join(
+            [
+                f"{offset}{node.type.upper()}{_repr_schema(tuple(node.schema))}",
+                *annotations,
+            ]
+        )
+        children = [
+            self._repr_node(child, offset=offset + "  ") for child in node.children
+        ]
+        return f"{line}\n" + "".join(
+            f"{text}{offset}  (repeated {count} times)\n"
+            if (count := sum(1 for _ in group)) > 1
+            else text
+            for text, group in groupby(children)
+        )
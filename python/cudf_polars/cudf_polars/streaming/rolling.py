@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Multi-partition Rolling logic."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pylibcudf as plc
+
+from cudf_polars.dsl.ir import Rolling, Slice, concatenate_chunks
+from cudf_polars.dsl.utils.reshape import broadcast
+from cudf_polars.dsl.utils.windows import duration_to_scalar
+from cudf_polars.streaming.dispatch import lower_ir_node
+from cudf_polars.streaming.utils import _concat, _lower_ir_fallback
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from cudf_polars.containers import DataFrame
+    from cudf_polars.dsl.ir import IR, IRExecutionContext
+    from cudf_polars.streaming.base import PartitionInfo
+    from cudf_polars.streaming.dispatch import LowerIRTransformer
+
+
+def _looks_ahead(ir: Rolling) -> bool:
+    """Whether any window extends past the current row."""
+    # The window for a row with index ``t`` is ``[t + offset, t + offset + period]``
+    return ir.preceding_ordinal + ir.following_ordinal > 0
+
+
+def rolling_halo_start(ir: Rolling, df: DataFrame) -> int:
+    """
+    Find the first row of ``df`` that a later row's window may reach.
+
+    Parameters
+    ----------
+    ir
+        The Rolling node. Windows must not look ahead of the current row.
+    df
+        Input rows of ``ir``, sorted by the grouping keys and then the
+        rolling index.
+
+    Returns
+    -------
+    The row offset at which the trailing "halo" of ``df`` starts. Rows
+    before this offset cannot fall into the window of any row that
+    follows ``df`` in sort order.
+    """
+    if df.num_rows == 0:
+        return 0
+    stream = df.stream
+    keys = broadcast(
+        *(k.evaluate(df) for k in ir.keys), target_length=df.num_rows, stream=stream
+    )
+    orderby = ir.index.evaluate(df).obj
+    if (
+        plc.traits.is_integral(orderby.type())
+        and orderby.type().id() != plc.TypeId.INT64
+    ):
+        orderby = plc.unary.cast(orderby, plc.DataType(plc.TypeId.INT64), stream=stream)
+    table = plc.Table([*(k.obj for k in keys), orderby])
+    (last,) = plc.copying.slice(table, [df.num_rows - 1, df.num_rows], stream=stream)
+    *last_keys, last_index = last.columns()
+    # A later row with index >= last_index (within the same group) only
+    # reaches rows with index >= last_index + offset.
+    threshold = plc.binaryop.binary_operation(
+        last_index,
+        duration_to_scalar(ir.index_dtype, -ir.preceding_ordinal, stream=stream),
+        plc.binaryop.BinaryOperator.SUB,
+        last_index.type(),
+        stream=stream,
+    )
+    ncols = table.num_columns()
+    start = plc.search.lower_bound(
+        table,
+        plc.Table([*last_keys, threshold]),
+        [plc.types.Order.ASCENDING] * ncols,
+        [plc.types.NullOrder.BEFORE] * ncols,
+        stream=stream,
+    )
+    return plc.copying.get_element(start, 0, stream=stream).to_py(stream=stream)
+
+
+def rolling_halo(
+    ir: Rolling, df: DataFrame, *, context: IRExecutionContext
+) -> DataFrame:
+    """Return a copy of the trailing rows of ``df`` that later windows may reach."""
+    start = rolling_halo_start(ir, df)
+    # Copy, so the halo outlives the (possibly spilled) input partition.
+    return concatenate_chunks([df.slice((start, df.num_rows - start))], context=context)
+
+
+def rolling_with_halo(
+    ir: Rolling,
+    halo: DataFrame | None,
+    df: DataFrame,
+    *,
+    context: IRExecutionContext,
+) -> tuple[DataFrame, DataFrame]:
+    """
+    Evaluate a Rolling node on one partition, given the preceding halo.
+
+    Parameters
+    ----------
+    ir
+        The Rolling node.
+    halo
+        Trailing rows of all preceding partitions that may fall into a
+        window of a row in ``df`` (or None for the first partition).
+    df
+        The input partition.
+    context
+        The IR execution context.
+
+    Returns
+    -------
+    The rolling result for the rows of ``df``, and the halo to pass to the
+    following partition.
+    """
+    nhalo = 0 if halo is None else halo.num_rows
+    if nhalo:
+        assert halo is not None
+        df = _concat(halo, df, context=context)
+    result = ir.do_evaluate(*ir._non_child_args, df, context=context)
+    return (
+        result.slice((nhalo, df.num_rows - nhalo)),
+        rolling_halo(ir, df, context=context),
+    )
+
+
+@lower_ir_node.register(Rolling)
+def _(
+    ir: Rolling, rec: LowerIRTransformer
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    if ir.zlice is not None:
+        # Pull the slice out of the Rolling node altogether.
+        return rec(
+            Slice(
+                ir.schema,
+                *ir.zlice,
+                Rolling(
+                    ir.schema,
+                    ir.index,
+                    ir.index_dtype,
+                    ir.preceding_ordinal,
+                    ir.following_ordinal,
+                    ir.closed_window,
+                    ir.keys,
+                    ir.agg_requests,
+                    None,
+                    ir.children[0],
+                ),
+            )
+        )
+
+    if _looks_ahead(ir):
+        # TODO: Support look-ahead windows by also exchanging the
+        # leading rows of the following partition.
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="Rolling windows that extend past the current row are not "
+            "supported for multiple partitions.",
+        )
+
+    # Input partitions are already ordered by the rolling index (and the
+    # grouping keys, for which a stable Sort is inserted at translation).
+    # Each partition is evaluated together with a bounded "halo" of trailing
+    # rows from the preceding partitions at execution time.
+    child, partition_info = rec(ir.children[0])
+    new_node = ir.reconstruct([child])
+    partition_info[new_node] = partition_info[child]
+    return new_node, partition_info
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import operator
+from functools import reduce
 from typing import TYPE_CHECKING
 
 import polars as pl
@@ -12,11 +14,13 @@ import pylibcudf as plc
 
 from cudf_polars.containers import Column, DataFrame, DataType
 from cudf_polars.dsl.expr import Col
-from cudf_polars.dsl.ir import Slice, Sort
+from cudf_polars.dsl.ir import MergeSorted, Slice, Sort
 from cudf_polars.dsl.traversal import traversal
 from cudf_polars.dsl.utils.naming import unique_names
+from cudf_polars.streaming.base import PartitionInfo
 from cudf_polars.streaming.dispatch import lower_ir_node
 from cudf_polars.streaming.utils import (
+    _dynamic_planning_on,
     _lower_ir_fallback,
 )
 
@@ -26,7 +30,6 @@ if TYPE_CHECKING:
     from rmm.pylibrmm.stream import Stream
 
     from cudf_polars.dsl.ir import IR
-    from cudf_polars.streaming.base import PartitionInfo
     from cudf_polars.streaming.dispatch import LowerIRTransformer
 
 
@@ -282,3 +285,66 @@ def _(
     sort_node = ir.reconstruct([child])
     partition_info[sort_node] = partition_info[child]
     return sort_node, partition_info
+
+
+def _merge_sorted_input_order(
+    child: IR, key: str
+) -> tuple[plc.types.Order, plc.types.NullOrder] | None:
+    """Find the order of the merge key in one input of a ``MergeSorted``."""
+    while isinstance(child, Slice):
+        # Slicing preserves the order (complex Sort slices are lowered
+        # to a Slice of the Sort).
+        (child,) = child.children
+    if not isinstance(child, Sort):
+        # Polars requires inputs that are already sorted to be sorted in
+        # ascending order by the key (with nulls first).
+        return plc.types.Order.ASCENDING, plc.types.NullOrder.BEFORE
+    if isinstance(child.by[0].value, Col) and child.by[0].value.name == key:
+        return child.order[0], child.null_order[0]
+    return None
+
+
+def merge_sorted_key_order(
+    ir: MergeSorted,
+) -> tuple[plc.types.Order, plc.types.NullOrder] | None:
+    """
+    Find the order of the key of a ``MergeSorted`` node.
+
+    Returns the ``(order, null_order)`` of the merge key, or None unless
+    both inputs are sorted by the merge key in the same order. Inputs
+    that are not ``Sort`` nodes (e.g. scans of sorted data) are sorted
+    in ascending order.
+    """
+    orders = {_merge_sorted_input_order(child, ir.key) for child in ir.children}
+    if len(orders) != 1 or None in orders:
+        return None
+    return orders.pop()
+
+
+@lower_ir_node.register(MergeSorted)
+def _(
+    ir: MergeSorted, rec: LowerIRTransformer
+) -> tuple[IR, MutableMapping[IR, PartitionInfo]]:
+    if merge_sorted_key_order(ir) is None:
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="merge_sorted is only supported for multiple partitions when "
+            "both inputs are sorted by the key in the same order.",
+        )
+
+    children, _partition_info = zip(*(rec(c) for c in ir.children), strict=True)
+    partition_info = reduce(operator.or_, _partition_info)
+    count = sum(partition_info[c].count for c in children)
+    if count == len(children) and not _dynamic_planning_on(rec.state["config_options"]):
+        return _lower_ir_fallback(
+            ir,
+            rec,
+            msg="merge_sorted of single-partition inputs is not parallelized.",
+        )
+
+    # Both sides are range-partitioned on the merge key (with shared
+    # boundaries) at execution time, and merged partition-wise.
+    new_node = ir.reconstruct(children)
+    partition_info[new_node] = PartitionInfo(count=count)
+    return new_node, partition_info
@@ -6,12 +6,16 @@
 from __future__ import annotations
 
 import concurrent.futures
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from cudf_polars.dsl.ir import DataFrameScan, Scan
 from cudf_polars.dsl.traversal import traversal
 from cudf_polars.streaming.base import StatsCollector
-from cudf_polars.streaming.io import _build_source_info
+from cudf_polars.streaming.io import (
+    _build_source_info,
+    _file_schema,
+    _text_reader_options,
+)
 
 if TYPE_CHECKING:
     from cudf_polars.dsl.ir import IR
@@ -40,19 +44,26 @@ def collect_statistics(
         Executor to use for IO operations. This function does not start
         or shutdown the executor.
     """
-    # Group parquet Scan nodes by paths, accumulating the union of needed columns
-    # across all Scan nodes that read the same files.
-    parquet_groups: dict[tuple[str, ...], tuple[set[str], Schema, list[Scan]]] = {}
+    # Group file Scan nodes by type, paths (and reader options for text
+    # formats), accumulating the union of needed columns across all Scan
+    # nodes that read the same files.
+    scan_groups: dict[
+        tuple[str, tuple[str, ...], tuple[tuple[str, Any], ...]],
+        tuple[set[str], Schema, list[Scan]],
+    ] = {}
     dataframe_scans: list[DataFrameScan] = []
     for node in traversal([root]):
         if isinstance(node, Scan):
-            if node.typ == "parquet":
-                paths_key = tuple(node.paths)
-                if paths_key not in parquet_groups:
-                    parquet_groups[paths_key] = (set(), {}, [])
-                needed_cols, schema, scan_nodes = parquet_groups[paths_key]
-                needed_cols.update(node.schema.keys())
-                schema.update(node.schema)
+            if node.typ in ("parquet", "csv", "ndjson"):
+                group_key = (node.typ, tuple(node.paths), _text_reader_options(node))
+                if group_key not in scan_groups:
+                    scan_groups[group_key] = (set(), {}, [])
+                needed_cols, schema, scan_nodes = scan_groups[group_key]
+                node_schema = (
+                    node.schema if node.typ == "parquet" else _file_schema(node)
+                )
+                needed_cols.update(node_schema.keys())
+                schema.update(node_schema)
                 scan_nodes.append(node)
         elif isinstance(node, DataFrameScan):
             dataframe_scans.append(node)
@@ -67,7 +78,7 @@ def collect_statistics(
             needed_cols=frozenset(needed_cols),
             schema=tuple(schema.items()),
         ): scan_nodes
-        for needed_cols, schema, scan_nodes in parquet_groups.values()
+        for needed_cols, schema, scan_nodes in scan_groups.values()
     }
 
     try:
@@ -85,4 +96,9 @@ def collect_statistics(
     for node in dataframe_scans:
         stats.scan_stats[node] = _build_source_info(node, config_options)
 
+    if (hints := config_options.executor.profile_hints) is not None:
+        from cudf_polars.streaming.profile import QueryProfile
+
+        stats.row_hints = QueryProfile.load(hints).row_hints()
+
     return stats
@@ -43,6 +43,7 @@ if TYPE_CHECKING:
     from rapidsmpf.communicator.communicator import Communicator
     from rapidsmpf.streaming.core.context import Context
 
+    from cudf_polars.engine.admission import QueryScheduler
     from cudf_polars.engine.ray import RankActor
     from cudf_polars.quent._context import QuentContext
     from cudf_polars.quent._logging import QuentLogger
@@ -56,12 +57,16 @@ __all__ = [
     "InMemoryExecutor",
     "JoinFilterPushdownOptions",
     "ParquetOptions",
+    "QuantileMode",
     "RayContext",
     "SPMDContext",
     "StreamingExecutor",
     "StreamingFallbackMode",
 ]
 
+# Default budget, in bytes, of the on-disk datasource statistics cache.
+DEFAULT_SOURCE_INFO_CACHE_SIZE = 64 * 2**20
+
 
 def _env_get_int(name: str, default: int) -> int:
     try:
@@ -129,6 +134,20 @@ class StreamingFallbackMode(enum.StrEnum):
     SILENT = "silent"
 
 
+class QuantileMode(enum.StrEnum):
+    """
+    How the streaming executor computes multi-partition quantiles.
+
+    * ``QuantileMode.EXACT`` : Shuffle on the group keys (or gather the input
+      column for an ungrouped aggregation) and compute exact order statistics.
+    * ``QuantileMode.APPROXIMATE`` : Combine partial t-digest sketches in the
+      tree reduction and query the merged sketch.
+    """
+
+    EXACT = "exact"
+    APPROXIMATE = "approximate"
+
+
 class Cluster(enum.StrEnum):
     """
     The cluster configuration for the streaming executor.
@@ -241,6 +260,15 @@ class ParquetOptions:
         When enabled, filter predicates are JIT-compiled to CUDA kernels for
         improved performance on large datasets with complex filters.
         Default is False.
+    source_info_cache_dir
+        Directory used to persist Parquet datasource statistics (row-count
+        and column-size estimates) across processes. Cached entries are
+        validated against the size and modification time of every file
+        before reuse. Default is None (no on-disk cache).
+    source_info_cache_size
+        Maximum number of bytes to keep in ``source_info_cache_dir``. The
+        least-recently-used entries are evicted once this budget is
+        exceeded. Default is 64 MiB.
     """
 
     _env_prefix = "CUDF_POLARS__PARQUET_OPTIONS"
@@ -296,6 +324,20 @@ class ParquetOptions:
             default=False,
         )
     )
+    source_info_cache_dir: str | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__SOURCE_INFO_CACHE_DIR",
+            lambda v: _optional_converter(v, str),
+            default=None,
+        )
+    )
+    source_info_cache_size: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__SOURCE_INFO_CACHE_SIZE",
+            int,
+            default=DEFAULT_SOURCE_INFO_CACHE_SIZE,
+        )
+    )
 
     def __post_init__(self) -> None:  # noqa: D105
         if not isinstance(self.chunked, bool):
@@ -321,6 +363,12 @@ class ParquetOptions:
             )
         if not isinstance(self.use_jit_filter, bool):
             raise TypeError("use_jit_filter must be a bool")
+        if self.source_info_cache_dir is not None and not isinstance(
+            self.source_info_cache_dir, str
+        ):
+            raise TypeError("source_info_cache_dir must be a str or None")
+        if not isinstance(self.source_info_cache_size, int):
+            raise TypeError("source_info_cache_size must be an int")
 
 
 def default_target_partition_size(min_device_size: int | None) -> int:
@@ -372,6 +420,12 @@ class DynamicPlanningOptions:
     join_prefilter_trace
         Whether to collect input/output row counts around applied join
         prefilters. Default is False.
+    join_skew_factor
+        A join key is a heavy hitter when its estimated share of the
+        probe-side rows of a shuffle join is at least this many times the
+        expected share of a single shuffle partition (``1 / modulus``).
+        The build-side rows for heavy hitters are broadcast, and only the
+        remaining keys are shuffled. Set to 0 to disable. Default is 4.0.
     """
 
     _env_prefix = "CUDF_POLARS__EXECUTOR__DYNAMIC_PLANNING"
@@ -402,6 +456,11 @@ class DynamicPlanningOptions:
             default=False,
         )
     )
+    join_skew_factor: float = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__JOIN_SKEW_FACTOR", float, default=4.0
+        )
+    )
 
     def __post_init__(self) -> None:  # noqa: D105
         if not isinstance(self.sample_chunk_count, int):
@@ -428,6 +487,15 @@ class DynamicPlanningOptions:
                 )
         if not isinstance(self.join_prefilter_trace, bool):
             raise TypeError("join_prefilter_trace must be a bool")
+        join_skew_factor = self.join_skew_factor
+        if isinstance(join_skew_factor, bool) or not isinstance(
+            join_skew_factor, (int, float)
+        ):
+            raise TypeError("join_skew_factor must be a float or int")
+        join_skew_factor = float(join_skew_factor)
+        object.__setattr__(self, "join_skew_factor", join_skew_factor)
+        if join_skew_factor < 0:
+            raise ValueError("join_skew_factor must be non-negative")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -652,10 +720,14 @@ class RayContext:
     rank_actors
         List of :class:`~cudf_polars.engine.ray.RankActor` handles, one per GPU
         in the cluster.
+    scheduler
+        The engine's :class:`~cudf_polars.engine.admission.QueryScheduler`,
+        which admits the queries submitted to the cluster.
     """
 
     rank_actors: list[ActorHandle[RankActor]]
     quent_logger: QuentLogger | None
+    scheduler: QueryScheduler | None = None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -681,6 +753,9 @@ class DaskContext:
         :class:`~cudf_polars.engine.dask.DaskEngine`.
     owned_cluster
         Cluster to close on shutdown, if created internally.
+    scheduler
+        The engine's :class:`~cudf_polars.engine.admission.QueryScheduler`,
+        which admits the queries submitted to the cluster.
     """
 
     client: distributed.Client
@@ -688,6 +763,7 @@ class DaskContext:
     quent_logger: QuentLogger | None
     owned_client: distributed.Client | None = None
     owned_cluster: Any | None = None
+    scheduler: QueryScheduler | None = None
 
 
 @dataclasses.dataclass(frozen=True, eq=True)
@@ -752,6 +828,100 @@ class StreamingExecutor:
         Options controlling the logical join-domain prefilter rewrite. See
         :class:`~cudf_polars.utils.config.JoinFilterPushdownOptions` for more.
         ``None`` disables the rewrite.
+    join_reorder
+        Whether to reorder chains of inner joins so that the most selective
+        inputs are joined first, using datasource statistics. Default is True.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__JOIN_REORDER``
+        environment variable.
+    text_source_info_cache_dir
+        Directory used to persist CSV and NDJSON datasource statistics
+        (row-count and column-size estimates) across processes. Cached
+        entries are validated against the size and modification time of
+        every file before reuse. Default is None (no on-disk cache).
+        Parquet statistics are configured with
+        :class:`~cudf_polars.utils.config.ParquetOptions` instead.
+
+        This can be set using the
+        ``CUDF_POLARS__EXECUTOR__TEXT_SOURCE_INFO_CACHE_DIR`` environment
+        variable.
+    text_source_info_cache_size
+        Maximum number of bytes to keep in ``text_source_info_cache_dir``.
+        The least-recently-used entries are evicted once this budget is
+        exceeded. Default is 64 MiB.
+
+        This can be set using the
+        ``CUDF_POLARS__EXECUTOR__TEXT_SOURCE_INFO_CACHE_SIZE`` environment
+        variable.
+    plan_cache_size
+        The maximum number of lowered plans every rank keeps for reuse by
+        later queries with the same plan, options and datasource statistics.
+        Default is 32. ``0`` disables the cache.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__PLAN_CACHE_SIZE``
+        environment variable.
+    persist_spill_directory
+        Local directory for the partitions of persisted query results (see
+        ``engine.execute()``) that are spilled beyond ``persist_host_limit``.
+        Default is None, which keeps spilled partitions in host memory.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__PERSIST_SPILL_DIRECTORY``
+        environment variable.
+    persist_host_limit
+        Maximum number of bytes of spilled persisted partitions every rank
+        keeps in host memory before writing them to ``persist_spill_directory``.
+        Default is 4 GiB.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__PERSIST_HOST_LIMIT``
+        environment variable.
+    result_cache_size
+        Maximum number of bytes (across the cluster) of sub-plan results
+        kept for reuse by later queries that share the sub-plan. Default is
+        0, which disables the cache. See :mod:`cudf_polars.engine.result_cache`.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__RESULT_CACHE_SIZE``
+        environment variable.
+    admission_budget
+        Maximum total estimated memory, in bytes across the cluster, of the
+        queries a Ray or Dask engine runs at the same time. A query's
+        estimate is the decoded size of the columns it scans. Queries that
+        don't fit wait for admission, and queries that can never fit are
+        rejected. Default is None, which admits queries without estimating
+        their memory. See :mod:`cudf_polars.engine.admission`.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__ADMISSION_BUDGET``
+        environment variable.
+    admission_max_concurrent
+        Maximum number of queries a Ray or Dask engine admits at the same
+        time. It is capped at the number of queries the engine can run at
+        the same time (currently one). Default is None, which uses that
+        cap.
+
+        This can be set using the
+        ``CUDF_POLARS__EXECUTOR__ADMISSION_MAX_CONCURRENT`` environment
+        variable.
+    admission_timeout
+        Maximum number of seconds a query submitted to a Ray or Dask engine
+        waits for admission before it is rejected. Default is None, which
+        waits indefinitely.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__ADMISSION_TIMEOUT``
+        environment variable.
+    profile_output
+        Path of a JSON file that rank 0 writes the profile of every query to:
+        the physical plan annotated with the rows, bytes, chunks, wall time
+        and runtime decisions of its actors. Default is None, which disables
+        profiling. See :mod:`cudf_polars.streaming.profile`.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__PROFILE_OUTPUT``
+        environment variable.
+    profile_hints
+        Path of a profile written by ``profile_output``. The row counts it
+        observed replace the estimates of the matching plan nodes when the
+        same query is planned again. Default is None.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__PROFILE_HINTS``
+        environment variable.
     max_io_threads
         Maximum number of IO threads. Default is 4.
         This controls the parallelism of IO operations when reading data.
@@ -763,6 +933,20 @@ class StreamingExecutor:
     num_py_executors
         Maximum number of workers for the Python ThreadPoolExecutor.
         Default is 8.
+    quantile_mode
+        How ``median`` and ``quantile`` aggregations are computed across
+        multiple partitions. ``QuantileMode.EXACT`` by default.
+
+        * ``QuantileMode.EXACT``: Exact order statistics.
+        * ``QuantileMode.APPROXIMATE``: Approximate t-digest based quantiles.
+          Interpolation options are ignored in this mode.
+
+        This can be set using the ``CUDF_POLARS__EXECUTOR__QUANTILE_MODE``
+        environment variable.
+    approx_quantile_max_centroids
+        The maximum number of t-digest centroids used for approximate
+        quantiles. Larger values are more accurate but use more memory.
+        Default is 1000.
     quent_context
         Quent tracing context. When ``None`` (default), Quent tracing is disabled.
         Pass a :class:`~cudf_polars.quent.QuentContext` instance to enable tracing.
@@ -824,6 +1008,82 @@ class StreamingExecutor:
     join_filter_pushdown: JoinFilterPushdownOptions | None = dataclasses.field(
         default_factory=JoinFilterPushdownOptions
     )
+    join_reorder: bool = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__JOIN_REORDER", _bool_converter, default=True
+        )
+    )
+    text_source_info_cache_dir: str | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__TEXT_SOURCE_INFO_CACHE_DIR",
+            lambda v: _optional_converter(v, str),
+            default=None,
+        )
+    )
+    text_source_info_cache_size: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__TEXT_SOURCE_INFO_CACHE_SIZE",
+            int,
+            default=DEFAULT_SOURCE_INFO_CACHE_SIZE,
+        )
+    )
+    plan_cache_size: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__PLAN_CACHE_SIZE", int, default=32
+        )
+    )
+    persist_spill_directory: str | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__PERSIST_SPILL_DIRECTORY",
+            lambda v: _optional_converter(v, str),
+            default=None,
+        )
+    )
+    persist_host_limit: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__PERSIST_HOST_LIMIT", int, default=4 * 2**30
+        )
+    )
+    result_cache_size: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__RESULT_CACHE_SIZE", int, default=0
+        )
+    )
+    admission_budget: int | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__ADMISSION_BUDGET",
+            _optional_int_converter,
+            default=None,
+        )
+    )
+    admission_max_concurrent: int | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__ADMISSION_MAX_CONCURRENT",
+            _optional_int_converter,
+            default=None,
+        )
+    )
+    admission_timeout: float | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__ADMISSION_TIMEOUT",
+            lambda v: _optional_converter(v, float),
+            default=None,
+        )
+    )
+    profile_output: str | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__PROFILE_OUTPUT",
+            lambda v: _optional_converter(v, str),
+            default=None,
+        )
+    )
+    profile_hints: str | None = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__PROFILE_HINTS",
+            lambda v: _optional_converter(v, str),
+            default=None,
+        )
+    )
     max_io_threads: int = dataclasses.field(
         default_factory=_make_default_factory(
             f"{_env_prefix}__MAX_IO_THREADS", int, default=4
@@ -839,6 +1099,18 @@ class StreamingExecutor:
             f"{_env_prefix}__NUM_PY_EXECUTORS", int, default=8
         )
     )
+    quantile_mode: QuantileMode = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__QUANTILE_MODE",
+            QuantileMode.__call__,
+            default=QuantileMode.EXACT,
+        )
+    )
+    approx_quantile_max_centroids: int = dataclasses.field(
+        default_factory=_make_default_factory(
+            f"{_env_prefix}__APPROX_QUANTILE_MAX_CENTROIDS", int, default=1000
+        )
+    )
 
     min_device_size: int | None = None
     spmd_context: SPMDContext | None = None
@@ -875,6 +1147,7 @@ class StreamingExecutor:
                 default_broadcast_limit(self.min_device_size),
             )
         object.__setattr__(self, "cluster", Cluster(self.cluster))
+        object.__setattr__(self, "quantile_mode", QuantileMode(self.quantile_mode))
 
         # Handle dynamic_planning.
         # Can be None, dict, or DynamicPlanningOptions
@@ -919,12 +1192,58 @@ class StreamingExecutor:
             raise TypeError("sink_to_directory must be bool")
         if not isinstance(self.client_device_threshold, float):
             raise TypeError("client_device_threshold must be a float")
+        if not isinstance(self.join_reorder, bool):
+            raise TypeError("join_reorder must be bool")
+        if self.text_source_info_cache_dir is not None and not isinstance(
+            self.text_source_info_cache_dir, str
+        ):
+            raise TypeError("text_source_info_cache_dir must be a str or None")
+        if not isinstance(self.text_source_info_cache_size, int):
+            raise TypeError("text_source_info_cache_size must be an int")
+        if not isinstance(self.plan_cache_size, int):
+            raise TypeError("plan_cache_size must be an int")
+        if self.plan_cache_size < 0:
+            raise ValueError("plan_cache_size must be non-negative")
+        if self.persist_spill_directory is not None and not isinstance(
+            self.persist_spill_directory, str
+        ):
+            raise TypeError("persist_spill_directory must be a str or None")
+        if not isinstance(self.persist_host_limit, int):
+            raise TypeError("persist_host_limit must be an int")
+        if not isinstance(self.result_cache_size, int):
+            raise TypeError("result_cache_size must be an int")
+        if self.result_cache_size < 0:
+            raise ValueError("result_cache_size must be non-negative")
+        if self.admission_budget is not None:
+            if not isinstance(self.admission_budget, int):
+                raise TypeError("admission_budget must be an int or None")
+            if self.admission_budget < 0:
+                raise ValueError("admission_budget must be non-negative")
+        if self.admission_max_concurrent is not None:
+            if not isinstance(self.admission_max_concurrent, int):
+                raise TypeError("admission_max_concurrent must be an int or None")
+            if self.admission_max_concurrent < 1:
+                raise ValueError("admission_max_concurrent must be positive")
+        if self.admission_timeout is not None:
+            if isinstance(self.admission_timeout, bool) or not isinstance(
+                self.admission_timeout, (int, float)
+            ):
+                raise TypeError("admission_timeout must be a float or None")
+            object.__setattr__(self, "admission_timeout", float(self.admission_timeout))
+        if self.profile_output is not None and not isinstance(self.profile_output, str):
+            raise TypeError("profile_output must be a str or None")
+        if self.profile_hints is not None and not isinstance(self.profile_hints, str):
+            raise TypeError("profile_hints must be a str or None")
         if not isinstance(self.max_io_threads, int):
             raise TypeError("max_io_threads must be an int")
         if not isinstance(self.spill_to_pinned_memory, bool):
             raise TypeError("spill_to_pinned_memory must be bool")
         if not isinstance(self.num_py_executors, int):
             raise TypeError("num_py_executors must be an int")
+        if not isinstance(self.approx_quantile_max_centroids, int):
+            raise TypeError("approx_quantile_max_centroids must be an int")
+        if self.approx_quantile_max_centroids < 1:
+            raise ValueError("approx_quantile_max_centroids must be positive")
 
     def __hash__(self) -> int:  # noqa: D105
         # dynamic_planning factory, a dataclass, isn't natively hashable. We'll dump it
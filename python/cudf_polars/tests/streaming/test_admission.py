@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+import polars as pl
+
+from cudf_polars import Translator
+from cudf_polars.engine.admission import (
+    QueryClass,
+    QueryRejectedError,
+    QueryScheduler,
+    admit_query,
+    estimate_query_bytes,
+    query_options,
+)
+from cudf_polars.streaming.statistics import collect_statistics
+from cudf_polars.utils.config import ConfigOptions
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    import contextlib
+    import pathlib
+
+
+def submit(
+    scheduler: QueryScheduler,
+    order: list[str],
+    name: str,
+    query_class: QueryClass,
+    budget: int | None = None,
+) -> threading.Thread:
+    """Submit a query that records its name when admitted."""
+
+    def run() -> None:
+        with scheduler.admit(0, query_class=query_class, budget=budget):
+            order.append(name)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def wait_for_waiting(scheduler: QueryScheduler, count: int) -> None:
+    deadline = time.monotonic() + 10
+    while scheduler.waiting < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_higher_priority_admitted_first() -> None:
+    scheduler = QueryScheduler()
+    order: list[str] = []
+    with scheduler.admit(0):
+        batch = submit(scheduler, order, "batch", QueryClass(priority=0))
+        wait_for_waiting(scheduler, 1)
+        interactive = submit(scheduler, order, "interactive", QueryClass(priority=1))
+        wait_for_waiting(scheduler, 2)
+    for thread in (batch, interactive):
+        thread.join()
+
+    assert order == ["interactive", "batch"]
+    assert (scheduler.admitted, scheduler.rejected) == (3, 0)
+
+
+def test_higher_priority_overtakes_queued_queries_with_budget() -> None:
+    # A budget does not admit queries beyond the scheduler's capacity, where
+    # they would queue on the ranks in submission order instead.
+    scheduler = QueryScheduler()
+    order: list[str] = []
+    with scheduler.admit(0, budget=100):
+        low = [
+            submit(scheduler, order, f"low{i}", QueryClass(priority=0), budget=100)
+            for i in range(2)
+        ]
+        wait_for_waiting(scheduler, 2)
+        high = submit(scheduler, order, "high", QueryClass(priority=1), budget=100)
+        wait_for_waiting(scheduler, 3)
+    for thread in (*low, high):
+        thread.join()
+
+    assert order == ["high", "low0", "low1"]
+
+
+def test_tenants_share_fairly() -> None:
+    scheduler = QueryScheduler()
+    with scheduler.admit(0, query_class=QueryClass(tenant="etl")):
+        time.sleep(0.01)
+    order: list[str] = []
+    with scheduler.admit(0, query_class=QueryClass(tenant="etl")):
+        etl = submit(scheduler, order, "etl", QueryClass(tenant="etl"))
+        wait_for_waiting(scheduler, 1)
+        analyst = submit(scheduler, order, "analyst", QueryClass(tenant="analyst"))
+        wait_for_waiting(scheduler, 2)
+    for thread in (etl, analyst):
+        thread.join()
+
+    assert order == ["analyst", "etl"]
+
+
+def test_query_options_sets_query_class() -> None:
+    scheduler = QueryScheduler()
+    order: list[str] = []
+
+    def run(name: str, priority: int) -> None:
+        with query_options(priority=priority), scheduler.admit(0):
+            order.append(name)
+
+    with scheduler.admit(0):
+        threads = [
+            threading.Thread(target=run, args=("low", -1)),
+            threading.Thread(target=run, args=("high", 5)),
+        ]
+        for i, thread in enumerate(threads, start=1):
+            thread.start()
+            wait_for_waiting(scheduler, i)
+    for thread in threads:
+        thread.join()
+
+    assert order == ["high", "low"]
+
+
+def test_query_over_budget_rejected() -> None:
+    scheduler = QueryScheduler()
+
+    with (
+        pytest.raises(QueryRejectedError, match="exceeds the admission budget"),
+        scheduler.admit(200, budget=100),
+    ):
+        pass
+
+    assert (scheduler.admitted, scheduler.rejected) == (0, 1)
+
+
+def test_queued_query_rejected_after_timeout() -> None:
+    scheduler = QueryScheduler(capacity=2)
+
+    with scheduler.admit(60, budget=100, max_concurrent=None):
+        with (
+            pytest.raises(QueryRejectedError, match="not admitted within"),
+            scheduler.admit(60, budget=100, max_concurrent=None, timeout=0.01),
+        ):
+            pass
+        # Queries that fit are admitted concurrently.
+        with scheduler.admit(40, budget=100, max_concurrent=None, timeout=0):
+            assert scheduler.running == 2
+
+    assert (scheduler.admitted, scheduler.rejected, scheduler.waiting) == (2, 1, 0)
+
+
+def test_estimate_query_bytes(
+    tmp_path: pathlib.Path,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+    pl.DataFrame({"a": range(1_000), "b": range(1_000)}).write_parquet(
+        tmp_path / "data.pq"
+    )
+
+    def estimate(query: pl.LazyFrame, **executor_options: int) -> int:
+        engine = pl.GPUEngine(executor="streaming", executor_options=executor_options)
+        ir = Translator(query._ldf.visit(), engine).translate_ir()
+        config = ConfigOptions.from_polars_engine(engine)
+        return estimate_query_bytes(
+            ir, collect_statistics(ir, config, parquet_stats_executor), config
+        )
+
+    both = estimate(pl.scan_parquet(tmp_path / "data.pq"))
+    one = estimate(pl.scan_parquet(tmp_path / "data.pq").select("a"))
+
+    assert 0 < one < both
+    # Only the partitions read at the same time count towards the peak.
+    streamed = estimate(
+        pl.scan_parquet(tmp_path / "data.pq"),
+        target_partition_size=100,
+        max_io_threads=2,
+    )
+    assert streamed == 200
+
+
+def test_concurrency_capped_at_capacity(tmp_path: pathlib.Path) -> None:
+    pl.DataFrame({"a": range(1_000)}).write_parquet(tmp_path / "data.pq")
+    budget = 1 << 30
+
+    def admit(
+        scheduler: QueryScheduler, **executor_options: int
+    ) -> contextlib.AbstractContextManager[None]:
+        engine = pl.GPUEngine(
+            executor="streaming",
+            executor_options={"admission_timeout": 0, **executor_options},
+        )
+        ir = Translator(
+            pl.scan_parquet(tmp_path / "data.pq")._ldf.visit(), engine
+        ).translate_ir()
+        return admit_query(ir, ConfigOptions.from_polars_engine(engine), scheduler)
+
+    # Queries run one at a time on a cluster that runs one at a time, even
+    # if they fit within the budget.
+    single = QueryScheduler()
+    for options in ({}, {"admission_budget": budget}):
+        with (
+            admit(single, **options),
+            pytest.raises(QueryRejectedError, match="not admitted within"),
+            admit(single, **options),
+        ):
+            pass
+    # Otherwise, up to ``admission_max_concurrent`` queries that fit run.
+    double = QueryScheduler(capacity=2)
+    with admit(double, admission_budget=budget), admit(double):
+        assert double.running == 2
+    with (
+        admit(double, admission_max_concurrent=1),
+        pytest.raises(QueryRejectedError, match="not admitted within"),
+        admit(double, admission_max_concurrent=1),
+    ):
+        pass
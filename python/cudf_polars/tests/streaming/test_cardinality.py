@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import pytest
+
+import polars as pl
+
+import pylibcudf as plc
+
+from cudf_polars.containers import DataType
+from cudf_polars.dsl import expr
+from cudf_polars.streaming.base import ColumnStatistics
+from cudf_polars.streaming.cardinality import (
+    SourceColumnStatistics,
+    distinct_count,
+    equijoin_rows,
+    predicate_selectivity,
+)
+
+INT64 = DataType(pl.Int64())
+BOOL = DataType(pl.Boolean())
+
+SOURCES = {
+    "a": SourceColumnStatistics(ColumnStatistics(0, 100, 0, 99), 1_000),
+    "b": SourceColumnStatistics(ColumnStatistics(500, None, 0.0, 1.0), 1_000),
+}
+
+
+def lookup(name: str) -> SourceColumnStatistics | None:
+    return SOURCES.get(name)
+
+
+def compare(op: plc.binaryop.BinaryOperator, name: str, value: object) -> expr.Expr:
+    return expr.BinOp(BOOL, op, expr.Col(INT64, name), expr.Literal(INT64, value))
+
+
+@pytest.mark.parametrize(
+    "op, value, expected",
+    [
+        (plc.binaryop.BinaryOperator.LESS, 10, 0.1),
+        (plc.binaryop.BinaryOperator.LESS_EQUAL, 10, 0.11),
+        (plc.binaryop.BinaryOperator.GREATER_EQUAL, 90, 0.1),
+        (plc.binaryop.BinaryOperator.GREATER, 200, 0.0),
+        (plc.binaryop.BinaryOperator.EQUAL, 5, 0.01),
+        (plc.binaryop.BinaryOperator.EQUAL, 500, 0.0),
+        (plc.binaryop.BinaryOperator.NOT_EQUAL, 5, 0.99),
+    ],
+)
+def test_comparison_selectivity(
+    op: plc.binaryop.BinaryOperator, value: int, expected: float
+) -> None:
+    assert predicate_selectivity(compare(op, "a", value), lookup) == pytest.approx(
+        expected
+    )
+
+
+def test_selectivity_accounts_for_nulls() -> None:
+    less = compare(plc.binaryop.BinaryOperator.LESS, "b", 0.5)
+    is_null = expr.BooleanFunction(
+        BOOL, expr.BooleanFunction.Name.IsNull, (), expr.Col(INT64, "b")
+    )
+
+    assert predicate_selectivity(less, lookup) == pytest.approx(0.25)
+    assert predicate_selectivity(is_null, lookup) == pytest.approx(0.5)
+
+
+def test_compound_selectivity() -> None:
+    a = compare(plc.binaryop.BinaryOperator.LESS, "a", 50)
+    b = compare(plc.binaryop.BinaryOperator.LESS, "a", 10)
+    unknown = compare(plc.binaryop.BinaryOperator.LESS, "c", 10)
+    both = expr.BinOp(BOOL, plc.binaryop.BinaryOperator.LOGICAL_AND, a, b)
+    either = expr.BinOp(BOOL, plc.binaryop.BinaryOperator.LOGICAL_OR, a, b)
+    negated = expr.BooleanFunction(BOOL, expr.BooleanFunction.Name.Not, (), a)
+
+    assert predicate_selectivity(both, lookup) == pytest.approx(0.05)
+    assert predicate_selectivity(either, lookup) == pytest.approx(0.55)
+    assert predicate_selectivity(negated, lookup) == pytest.approx(0.5)
+    assert predicate_selectivity(unknown, lookup) is None
+    assert predicate_selectivity(
+        expr.BinOp(BOOL, plc.binaryop.BinaryOperator.LOGICAL_AND, a, unknown),
+        lookup,
+    ) == pytest.approx(0.5)
+
+
+def test_literal_on_left_is_flipped() -> None:
+    predicate = expr.BinOp(
+        BOOL,
+        plc.binaryop.BinaryOperator.GREATER,
+        expr.Literal(INT64, 10),
+        expr.Col(INT64, "a"),
+    )
+    assert predicate_selectivity(predicate, lookup) == pytest.approx(0.1)
+
+
+def test_distinct_count_is_capped_by_rows() -> None:
+    assert distinct_count(SOURCES["a"], 10) == 10
+    assert distinct_count(SOURCES["a"], None) == 100
+    assert distinct_count(SOURCES["b"], 10) is None
+    assert distinct_count(None, 10) is None
+
+
+@pytest.mark.parametrize(
+    "how, expected",
+    [
+        ("Inner", 400),
+        ("Semi", 100),
+        ("Anti", 0),
+        ("Left", 400),
+        ("Right", 4_000),
+        ("Full", 4_000),
+    ],
+)
+def test_equijoin_rows(how: str, expected: int) -> None:
+    assert equijoin_rows(how, 100, 4_000, [(100, 1_000)]) == expected
+
+
+def test_equijoin_rows_without_keys() -> None:
+    assert equijoin_rows("Inner", 100, 4_000, []) is None
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from cudf_polars.streaming.benchmarks.compare import (
+    BenchmarkRun,
+    compare_runs,
+    format_comparison,
+    load_run,
+    main,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def serialized_run(
+    run_id: str, durations: dict[int, list[float | None]], gpu: str = "A100"
+) -> dict[str, Any]:
+    """Return a run as serialized by the benchmark runners (None: failed)."""
+    return {
+        "run_id": run_id,
+        "query_set": "pdsh",
+        "scale_factor": 1,
+        "frontend": "spmd",
+        "records": {
+            str(query): [
+                {
+                    "query": query,
+                    "iteration": i,
+                    "duration": duration,
+                    "status": "success",
+                }
+                if duration is not None
+                else {
+                    "query": query,
+                    "iteration": i,
+                    "status": "error",
+                    "traceback": "",
+                }
+                for i, duration in enumerate(timings)
+            ]
+            for query, timings in durations.items()
+        },
+        "hardware": {"gpus": [{"name": gpu}], "cpu": {"model": "cpu"}},
+    }
+
+
+def run(durations: dict[int, list[float | None]], **kwargs: Any) -> BenchmarkRun:
+    return BenchmarkRun.from_dict(serialized_run("run", durations, **kwargs))
+
+
+def test_compare_runs() -> None:
+    baseline = run(
+        {
+            1: [1.0, 1.02, 0.98, 1.01],
+            2: [1.0, 1.02, 0.98, 1.01],
+            3: [1.0, 1.02, 0.98, 1.01],
+            4: [1.0, 1.0],
+            5: [1.0],
+        }
+    )
+    candidate = run(
+        {
+            1: [1.5, 1.52, 1.48, 1.51],
+            2: [0.5, 0.51, 0.49, 0.5],
+            3: [1.0, 1.01, 0.99, 1.02],
+            4: [1.0, None],
+            6: [1.0],
+        },
+        gpu="H100",
+    )
+
+    comparison = compare_runs(baseline, candidate)
+
+    assert {q.query: q.status for q in comparison.queries} == {
+        1: "regressed",
+        2: "improved",
+        3: "unchanged",
+        4: "failed",
+        5: "missing",
+        6: "missing",
+    }
+    assert comparison.regressed
+    assert comparison.queries[0].speedup == pytest.approx(1.0025 / 1.5025)
+    assert comparison.queries[0].low <= comparison.queries[0].speedup
+    assert comparison.geomean is not None
+    assert comparison.geomean.speedup == pytest.approx(
+        ((1.0025 / 1.5025) * (1.0025 / 0.5) * (1.0025 / 1.005)) ** (1 / 3)
+    )
+    assert comparison.warnings == ["GPUs differ: ['A100'] != ['H100']"]
+    assert "geomean" in format_comparison(comparison)
+
+
+def test_small_changes_are_not_flagged() -> None:
+    baseline = run({1: [1.0, 1.1, 0.9, 1.05, 0.95]})
+    candidate = run({1: [1.03, 1.13, 0.93, 1.08, 0.98]})
+
+    comparison = compare_runs(baseline, candidate, threshold=0.05)
+
+    assert comparison.queries[0].status == "unchanged"
+    assert not comparison.regressed
+
+
+@pytest.mark.parametrize(
+    "baseline_durations,candidate_durations,regressed",
+    [
+        ({1: [1.0, 1.0]}, {1: [1.0, None]}, True),
+        ({1: [1.0, None]}, {1: [1.0, 1.0]}, False),
+        ({1: [1.0, 1.0], 2: [1.0, 1.0]}, {1: [1.0, 1.0]}, True),
+        ({1: [1.0, 1.0]}, {1: [1.0, 1.0], 2: [1.0, 1.0]}, False),
+    ],
+    ids=["new-failure", "fixed-failure", "dropped-query", "new-query"],
+)
+def test_failures_and_missing_queries(
+    baseline_durations: dict[int, list[float | None]],
+    candidate_durations: dict[int, list[float | None]],
+    *,
+    regressed: bool,
+) -> None:
+    comparison = compare_runs(run(baseline_durations), run(candidate_durations))
+
+    assert comparison.regressed is regressed
+
+
+def test_compare_main(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "results.jsonl"
+    runs = [
+        serialized_run("aaaa", {1: [1.0, 1.0]}),
+        serialized_run("bbbb", {1: [2.0, 2.0]}),
+    ]
+    path.write_text("".join(json.dumps(r) + "\n" for r in runs))
+
+    assert load_run(path).run_id == "bbbb"
+    assert load_run(path, "aa").run_id == "aaaa"
+    with pytest.raises(ValueError, match="No benchmark run"):
+        load_run(path, "cccc")
+    assert main([str(path), str(path), "--baseline-run", "aa"]) == 1
+    assert main([str(path), str(path), "--candidate-run", "aa"]) == 0
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from cudf_polars.streaming.benchmarks.datagen import PDSH_TABLES, generate
+from cudf_polars.streaming.benchmarks.utils import _infer_scale_factor, get_data
+
+if TYPE_CHECKING:
+    import pathlib
+
+SCALE_FACTOR = 0.001
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    path = tmp_path_factory.mktemp("pdsh")
+    generate(path, SCALE_FACTOR, chunk_rows=100)
+    return path
+
+
+def table(path: pathlib.Path, name: str, suffix: str = ".parquet") -> pl.DataFrame:
+    return get_data(path, name, suffix).collect()
+
+
+def test_cardinalities(dataset: pathlib.Path) -> None:
+    rows = {name: table(dataset, name).height for name in PDSH_TABLES}
+
+    assert {name: n for name, n in rows.items() if name != "lineitem"} == {
+        "region": 5,
+        "nation": 25,
+        "supplier": 10,
+        "customer": 150,
+        "part": 200,
+        "partsupp": 800,
+        "orders": 1_500,
+    }
+    assert 1_500 <= rows["lineitem"] <= 7 * 1_500
+    assert _infer_scale_factor("pdsh", dataset, ".parquet") == SCALE_FACTOR
+
+
+def test_keys(dataset: pathlib.Path) -> None:
+    orders = table(dataset, "orders")
+    lineitem = table(dataset, "lineitem")
+    partsupp = table(dataset, "partsupp")
+
+    assert orders["o_orderkey"].is_unique().all()
+    assert (orders["o_custkey"] % 3 != 0).all()
+    assert orders["o_custkey"].is_between(1, 150).all()
+    assert lineitem.select("l_orderkey", "l_linenumber").is_unique().all()
+    assert partsupp.select("ps_partkey", "ps_suppkey").is_unique().all()
+    # Every line item is of an order, and of a part that its supplier supplies.
+    assert lineitem.join(
+        orders, left_on="l_orderkey", right_on="o_orderkey", how="anti"
+    ).is_empty()
+    assert lineitem.join(
+        partsupp,
+        left_on=["l_partkey", "l_suppkey"],
+        right_on=["ps_partkey", "ps_suppkey"],
+        how="anti",
+    ).is_empty()
+
+
+def test_types(dataset: pathlib.Path) -> None:
+    lineitem = table(dataset, "lineitem")
+
+    assert lineitem.schema["l_extendedprice"] == pl.Decimal(15, 2)
+    assert lineitem.schema["l_shipdate"] == pl.Date()
+    assert (lineitem["l_receiptdate"] > lineitem["l_shipdate"]).all()
+    assert set(lineitem["l_returnflag"]) <= {"R", "A", "N"}
+
+
+def test_deterministic(dataset: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    # The same options give byte-identical files.
+    generate(tmp_path / "same", SCALE_FACTOR, tables=["orders"], chunk_rows=100)
+    assert (tmp_path / "same" / "orders.parquet").read_bytes() == (
+        dataset / "orders.parquet"
+    ).read_bytes()
+
+    # Splitting the work differently gives the same data.
+    paths = generate(
+        tmp_path / "split",
+        SCALE_FACTOR,
+        tables=["lineitem"],
+        files=3,
+        chunk_rows=7,
+        workers=2,
+    )
+    assert len(paths) == 3
+    assert_frame_equal(
+        table(tmp_path / "split", "lineitem", ""), table(dataset, "lineitem")
+    )
+
+    # A different seed gives different data.
+    generate(tmp_path / "seed", SCALE_FACTOR, tables=["lineitem"], seed=1)
+    assert not table(tmp_path / "seed", "lineitem").equals(table(dataset, "lineitem"))
+
+
+def test_float_sorted(tmp_path: pathlib.Path) -> None:
+    generate(
+        tmp_path,
+        SCALE_FACTOR,
+        tables=["orders"],
+        numeric_type="float",
+        sort_by={"orders": ["o_orderdate"]},
+        row_group_size=100,
+        compression="snappy",
+    )
+    orders = table(tmp_path, "orders")
+
+    assert orders.schema["o_totalprice"] == pl.Float64()
+    assert orders["o_orderdate"].is_sorted()
+
+
+def test_unknown_table_raises(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="Unknown PDS-H tables"):
+        generate(tmp_path, SCALE_FACTOR, tables=["store_sales"])
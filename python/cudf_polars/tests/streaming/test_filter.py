@@ -35,8 +35,25 @@ def test_filter_pointwise(df, engine):
     assert_gpu_result_equal(query, engine=engine)
 
 
+@pytest.mark.parametrize(
+    "mask",
+    [
+        pl.col("a") > pl.col("a").max(),
+        pl.col("a") > pl.col("a").mean(),
+        (pl.col("c") - pl.col("c").mean()).abs() <= pl.col("a").median(),
+        (pl.col("a") < pl.len() - 2) & (pl.col("c") != pl.col("c").min()),
+    ],
+)
+def test_filter_scalar_reductions(df, streaming_engine_factory, mask):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise"),
+    )
+    query = df.filter(mask)
+    assert_gpu_result_equal(query, engine=engine)
+
+
 def test_filter_non_pointwise(df, engine):
-    query = df.filter(pl.col("a") > pl.col("a").max())
+    query = df.filter(pl.col("a").rank() > 3)
     with warns_on_spmd(
         engine,
         UserWarning,
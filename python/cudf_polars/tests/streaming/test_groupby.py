@@ -187,7 +187,7 @@ def test_groupby_fallback(df, fallback_mode, spmd_engine_factory):
     )
     match = "Failed to decompose groupby aggs"
 
-    q = df.group_by("y").median()
+    q = df.group_by("y").agg(pl.col("x").product())
 
     if fallback_mode == "silent":
         ctx = contextlib.nullcontext()
@@ -207,6 +207,45 @@ def test_groupby_fallback(df, fallback_mode, spmd_engine_factory):
         assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
 
 
+@pytest.mark.parametrize(
+    "agg",
+    [
+        pl.col("x").median(),
+        pl.col("x").quantile(0.3, interpolation="linear"),
+        pl.col("z").quantile(0.7, interpolation="nearest"),
+    ],
+)
+@pytest.mark.parametrize("keys", [("y",), ("y", "z")])
+def test_groupby_quantile(df, streaming_engine_factory, agg, keys):
+    engine = streaming_engine_factory(StreamingOptions(fallback_mode="raise"))
+    q = df.group_by(*keys).agg(agg)
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+@pytest.mark.parametrize("quantile", [0.0, 1.0])
+def test_groupby_quantile_approximate_bounds(df, streaming_engine_factory, quantile):
+    # The digest tracks the exact min and max of each group
+    engine = streaming_engine_factory(
+        StreamingOptions(fallback_mode="raise", quantile_mode="approximate")
+    )
+    q = df.group_by("y").agg(pl.col("x").quantile(quantile))
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+def test_groupby_median_approximate(df, streaming_engine_factory):
+    engine = streaming_engine_factory(
+        StreamingOptions(
+            fallback_mode="raise",
+            quantile_mode="approximate",
+            approx_quantile_max_centroids=20,
+        )
+    )
+    q = df.group_by("y").agg(pl.col("x").median(), pl.col("value2").median())
+    assert_gpu_result_equal(
+        q, engine=engine, check_row_order=False, check_exact=False, rtol=0.1
+    )
+
+
 def test_groupby_agg_literal(df, streaming_engine):
     q = df.group_by("y").agg(1)
     assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
@@ -252,7 +291,6 @@ def test_groupby_agg_empty(df: pl.LazyFrame, streaming_engine) -> None:
     assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
 
 
-@pytest.mark.filterwarnings("ignore:This slice not supported for multiple partitions.")
 @pytest.mark.parametrize("zlice", [(0, 2), (2, 2), (-2, None)])
 def test_groupby_then_slice(streaming_engine, zlice: tuple[int, int]) -> None:
     df = pl.LazyFrame(
@@ -21,6 +21,7 @@ from cudf_polars.streaming.actor_graph.join import (
 )
 from cudf_polars.streaming.base import PartitionInfo
 from cudf_polars.streaming.parallel import lower_ir_graph
+from cudf_polars.streaming.profile import QueryProfile
 from cudf_polars.streaming.shuffle import Shuffle
 from cudf_polars.streaming.statistics import collect_statistics
 from cudf_polars.testing.asserts import assert_gpu_result_equal
@@ -29,6 +30,19 @@ from cudf_polars.utils.config import ConfigOptions, StreamingExecutor
 
 if TYPE_CHECKING:
     import concurrent.futures
+    import pathlib
+
+    from cudf_polars.streaming.profile import ActorProfile
+
+
+def join_actor(path: pathlib.Path) -> ActorProfile:
+    """The runtime statistics of the single join of a profiled query."""
+    (actor,) = (
+        actor
+        for actor in QueryProfile.load(path).actors.values()
+        if actor.ir_type == "Join"
+    )
+    return actor
 
 
 @pytest.fixture
@@ -190,8 +204,8 @@ def test_join_and_slice(request, zlice, streaming_engine_factory):
         ),
     )
     if streaming_engine.nranks > 1:
-        # The multi-rank fallback for slice doesn't preserve row order
-        # within equal-key groups, so the slice can pick different rows
+        # The multi-rank join doesn't preserve row order within
+        # equal-key groups, so the slice can pick different rows
         # than the CPU baseline.
         request.applymarker(
             pytest.mark.xfail(
@@ -216,23 +230,11 @@ def test_join_and_slice(request, zlice, streaming_engine_factory):
     q = left.join(right, on="a", how="inner").slice(*zlice)
     # Check that we get the correct row count
     # See: https://github.com/rapidsai/cudf/issues/19153
-    with warns_on_spmd(
-        streaming_engine,
-        UserWarning,
-        match="This slice not supported for multiple partitions.",
-        when=zlice in {(2, 2), (-2, None)},
-    ):
-        assert q.collect(engine=streaming_engine).height == q.collect().height
+    assert q.collect(engine=streaming_engine).height == q.collect().height
 
     # Need sort to match order after a join
     q = left.join(right, on="a", how="inner").sort(pl.col("a")).slice(*zlice)
-    with warns_on_spmd(
-        streaming_engine,
-        UserWarning,
-        match="This slice not supported for multiple partitions.",
-        when=zlice == (2, 2),
-    ):
-        assert_gpu_result_equal(q, engine=streaming_engine)
+    assert_gpu_result_equal(q, engine=streaming_engine)
 
 
 @pytest.mark.parametrize("how", ["inner", "semi", "left", "right"])
@@ -283,6 +285,78 @@ def test_multi_key_join_prefilter_preserves_full_join(
     assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "right", "semi", "anti", "full"])
+@pytest.mark.parametrize("nulls_equal", [False, True])
+def test_skewed_join(
+    how, nulls_equal, streaming_engine_factory, tmp_path: pathlib.Path
+) -> None:
+    profile = tmp_path / "profile.json"
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=20,
+            broadcast_limit=1,
+            target_partition_size=10,
+            dynamic_planning={"join_skew_factor": 1.0},
+            profile_output=str(profile),
+        ),
+    )
+    # Half of the fact rows share a single (hot) key, and some are null.
+    fact = pl.LazyFrame(
+        {
+            "key": [0 if i % 2 else (None if i % 5 == 0 else i) for i in range(200)],
+            "data": range(200),
+        }
+    )
+    dim = pl.LazyFrame({"key": [0, 0, None, *range(2, 40)], "val": range(41)})
+    left, right = (dim, fact) if how == "right" else (fact, dim)
+    q = left.join(right, on="key", how=how, nulls_equal=nulls_equal)
+    assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
+    actor = join_actor(profile)
+    if how == "full":
+        # Every build row of a full join must be emitted, so it never
+        # keeps the heavy hitters local.
+        assert not (actor.decision or "").startswith("shuffle_skew_")
+    else:
+        assert (actor.decision or "").startswith("shuffle_skew_")
+        assert actor.extra["join_skew"]["hot_key_count"] >= 1
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "semi", "anti", "full"])
+@pytest.mark.parametrize("sorted_sides", ["both", "left", "right", "none"])
+def test_merge_join(
+    how, sorted_sides, streaming_engine_factory, tmp_path: pathlib.Path
+) -> None:
+    profile = tmp_path / "profile.json"
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=20,
+            broadcast_limit=1,
+            target_partition_size=10,
+            dynamic_planning={},
+            profile_output=str(profile),
+        ),
+    )
+    # Sorted sides arrive range partitioned on the join key.
+    left = pl.LazyFrame(
+        {
+            "key": [(i * 7) % 50 if i % 9 else None for i in range(150)],
+            "a": range(150),
+        }
+    )
+    right = pl.LazyFrame({"key": [(i * 3) % 60 for i in range(100)], "b": range(100)})
+    if sorted_sides in ("both", "left"):
+        left = left.sort("key")
+    if sorted_sides in ("both", "right"):
+        right = right.sort("key")
+    q = left.join(right, on="key", how=how)
+    assert_gpu_result_equal(q, engine=streaming_engine, check_row_order=False)
+    decision = join_actor(profile).decision or ""
+    if sorted_sides == "none":
+        assert not decision.startswith("merge")
+    else:
+        assert decision.startswith("merge")
+
+
 def test_join_prefilter_skips_when_sides_are_similar_size() -> None:
     decision = _select_join_prefilter(
         "Inner",
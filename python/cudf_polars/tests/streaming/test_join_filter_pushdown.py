@@ -35,6 +35,7 @@ from cudf_polars.utils.config import ConfigOptions
 
 if TYPE_CHECKING:
     import concurrent.futures
+    import pathlib
     from typing import Any
 
     from cudf_polars.dsl.ir import IR
@@ -607,6 +608,41 @@ def test_composite_domain_columns_do_not_reconverge_after_join(
     assert_gpu_result_equal(query, engine=engine, check_row_order=False)
 
 
+def test_parquet_statistics_refine_row_estimates(
+    tmp_path: pathlib.Path,
+    engine: SPMDEngine,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+    pl.DataFrame({"o_orderkey": range(1_000)}).write_parquet(tmp_path / "orders.pq")
+    pl.DataFrame({"l_orderkey": [i % 1_000 for i in range(4_000)]}).write_parquet(
+        tmp_path / "lineitem.pq"
+    )
+    query = (
+        pl.scan_parquet(tmp_path / "orders.pq")
+        .filter(pl.col("o_orderkey") < 100)
+        .join(
+            pl.scan_parquet(tmp_path / "lineitem.pq"),
+            left_on="o_orderkey",
+            right_on="l_orderkey",
+        )
+    )
+    root = translate_query(query, engine)
+    stats = collect_statistics(
+        root, ConfigOptions.from_polars_engine(engine), parquet_stats_executor
+    )
+
+    assert isinstance(root, Join)
+    facts = analyze_plan(root, stats)
+    no_stats = analyze_plan(root, StatsCollector())
+
+    # The filter keeps keys [0, 100) of [0, 1000), matching 4 rows each.
+    assert facts.row_estimates[root.children[0]] == 100
+    assert facts.row_estimates[root.children[1]] == 4_000
+    assert facts.row_estimates[root] == 400
+    assert no_stats.row_estimates[root] is None
+    assert_gpu_result_equal(query, engine=engine, check_row_order=False)
+
+
 def test_contains_node_uses_dag_equality(engine: SPMDEngine) -> None:
     query = pl.LazyFrame({"key": range(3)}).filter(pl.col("key") >= 0).slice(0, 2)
     root = translate_query(query, engine)
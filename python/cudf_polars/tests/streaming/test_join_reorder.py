@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import polars as pl
+
+from cudf_polars import Translator
+from cudf_polars.dsl.ir import Join
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.engine.options import StreamingOptions
+from cudf_polars.streaming.base import StatsCollector
+from cudf_polars.streaming.explain import explain_query
+from cudf_polars.streaming.join_reorder import optimize_join_order, reorder_joins
+from cudf_polars.streaming.parallel import remove_cache_nodes
+from cudf_polars.streaming.statistics import collect_statistics
+from cudf_polars.testing.asserts import assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    import pathlib
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.engine.spmd import SPMDEngine
+
+
+@pytest.fixture
+def engine(spmd_engine_factory) -> SPMDEngine:
+    return spmd_engine_factory(
+        StreamingOptions(
+            join_filter_pushdown=None,
+            max_rows_per_partition=1_000,
+            raise_on_fail=True,
+        )
+    )
+
+
+@pytest.fixture
+def star_query(tmp_path: pathlib.Path) -> pl.LazyFrame:
+    """Return a star-schema query that joins its unselective dimension first."""
+    pl.DataFrame(
+        {
+            "f_a": [i % 1_000 for i in range(4_000)],
+            "f_b": [i % 100 for i in range(4_000)],
+            "value": range(4_000),
+        }
+    ).write_parquet(tmp_path / "fact.pq")
+    pl.DataFrame({"a_key": range(1_000), "a_value": range(1_000)}).write_parquet(
+        tmp_path / "dim_a.pq"
+    )
+    pl.DataFrame({"b_key": range(100), "b_value": range(100)}).write_parquet(
+        tmp_path / "dim_b.pq"
+    )
+    return (
+        pl.scan_parquet(tmp_path / "fact.pq")
+        .join(pl.scan_parquet(tmp_path / "dim_a.pq"), left_on="f_a", right_on="a_key")
+        .join(
+            pl.scan_parquet(tmp_path / "dim_b.pq").filter(pl.col("b_key") < 10),
+            left_on="f_b",
+            right_on="b_key",
+        )
+    )
+
+
+def translate_query(query: pl.LazyFrame, engine: SPMDEngine) -> IR:
+    t = Translator(query._ldf.visit(), engine)
+    root = t.translate_ir()
+    assert not t.errors
+    return remove_cache_nodes(root)
+
+
+def join_right_keys(ir: IR) -> list[tuple[str, ...]]:
+    """Return the right keys of the inner joins, from the bottom up."""
+    return [
+        tuple(key.name for key in node.right_on)
+        for node in reversed(list(traversal([ir])))
+        if isinstance(node, Join)
+    ]
+
+
+def test_selective_dimension_joined_first(
+    star_query: pl.LazyFrame,
+    engine: SPMDEngine,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+    root = translate_query(star_query, engine)
+    stats = collect_statistics(
+        root, ConfigOptions.from_polars_engine(engine), parquet_stats_executor
+    )
+    assert join_right_keys(root) == [("a_key",), ("b_key",)]
+
+    optimized, decisions = reorder_joins(root, stats)
+
+    assert join_right_keys(optimized) == [("b_key",), ("a_key",)]
+    assert list(optimized.schema) == list(root.schema)
+    (decision,) = decisions
+    assert decision.original == (("a_key",), ("b_key",))
+    assert decision.chosen == (("b_key",), ("a_key",))
+    assert sum(decision.chosen_rows) < sum(decision.original_rows)
+    assert_gpu_result_equal(star_query, engine=engine, check_row_order=False)
+
+
+def test_no_reorder_without_estimates(
+    star_query: pl.LazyFrame, engine: SPMDEngine
+) -> None:
+    root = translate_query(star_query, engine)
+
+    optimized, decisions = reorder_joins(root, StatsCollector())
+
+    assert optimized is root
+    assert not decisions
+
+
+def test_join_reorder_can_be_disabled(
+    star_query: pl.LazyFrame,
+    engine: SPMDEngine,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+    root = translate_query(star_query, engine)
+    config = ConfigOptions.from_polars_engine(
+        pl.GPUEngine(executor="streaming", executor_options={"join_reorder": False})
+    )
+    stats = collect_statistics(root, config, parquet_stats_executor)
+
+    assert optimize_join_order(root, stats, config) is root
+
+
+def test_snowflake_dimension_follows_its_parent(
+    tmp_path: pathlib.Path,
+    engine: SPMDEngine,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+    pl.DataFrame(
+        {"f_a": [i % 100 for i in range(2_000)], "value": range(2_000)}
+    ).write_parquet(tmp_path / "fact.pq")
+    pl.DataFrame(
+        {"a_key": range(100), "a_c": [i % 50 for i in range(100)]}
+    ).write_parquet(tmp_path / "dim_a.pq")
+    pl.DataFrame({"c_key": range(50), "c_value": range(50)}).write_parquet(
+        tmp_path / "dim_c.pq"
+    )
+    # The (selective) dimension ``c`` can only be joined after ``a``.
+    query = (
+        pl.scan_parquet(tmp_path / "fact.pq")
+        .join(pl.scan_parquet(tmp_path / "dim_a.pq"), left_on="f_a", right_on="a_key")
+        .join(
+            pl.scan_parquet(tmp_path / "dim_c.pq").filter(pl.col("c_key") < 5),
+            left_on="a_c",
+            right_on="c_key",
+        )
+    )
+    root = translate_query(query, engine)
+    stats = collect_statistics(
+        root, ConfigOptions.from_polars_engine(engine), parquet_stats_executor
+    )
+
+    optimized, decisions = reorder_joins(root, stats)
+
+    assert optimized is root
+    assert not decisions
+    assert_gpu_result_equal(query, engine=engine, check_row_order=False)
+
+
+def test_explain_reports_join_reorder(
+    star_query: pl.LazyFrame, engine: SPMDEngine
+) -> None:
+    plan = explain_query(star_query, engine, physical=True)
+
+    assert "JOIN REORDER" in plan
+    assert "after:  ('b_key',)" in plan
@@ -18,7 +18,8 @@ from cudf_polars.engine.options import StreamingOptions
 from cudf_polars.streaming.base import StatsCollector
 from cudf_polars.streaming.parallel import optimize_with_stats
 from cudf_polars.testing.asserts import assert_gpu_result_equal
-from cudf_polars.utils.config import ConfigOptions
+from cudf_polars.testing.engine_utils import warns_on_spmd
+from cudf_polars.utils.config import ConfigOptions, StreamingFallbackMode
 
 
 @pytest.mark.parametrize("column", ["a", "b"])
@@ -54,10 +55,8 @@ def test_rename_concat(streaming_engine) -> None:
     assert_gpu_result_equal(q, engine=streaming_engine)
 
 
-def test_fallback_on_concat_zlice(spmd_engine_factory) -> None:
-    # Pin ``fallback_mode="warn"`` so the spmd-small baseline (which sets
-    # ``SILENT``) doesn't suppress the warning this test asserts on.
-    streaming_engine = spmd_engine_factory(StreamingOptions(fallback_mode="warn"))
+def test_concat_zlice(spmd_engine_factory) -> None:
+    streaming_engine = spmd_engine_factory(StreamingOptions(fallback_mode="raise"))
     q = pl.concat(
         [
             pl.LazyFrame({"a": [1, 2]}),
@@ -65,13 +64,60 @@ def test_fallback_on_concat_zlice(spmd_engine_factory) -> None:
             pl.LazyFrame({"a": [5, 6]}),
         ]
     ).tail(1)
+    assert_gpu_result_equal(q, engine=streaming_engine)
+
+
+@pytest.mark.parametrize(
+    "zlice", [(0, None), (1, 3), (7, 10), (5, None), (-3, None), (-8, 4), (40, 2)]
+)
+def test_slice_multi(zlice, streaming_engine_factory) -> None:
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise")
+    )
+    q = pl.LazyFrame({"a": range(20), "b": range(20, 0, -1)}).slice(*zlice)
+    assert_gpu_result_equal(q, engine=streaming_engine)
+
+
+def test_unpivot_multi(streaming_engine_factory) -> None:
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise")
+    )
+    q = pl.LazyFrame(
+        {"a": range(10), "b": range(10, 20), "c": [1.5, None] * 5, "d": list("ab") * 5}
+    ).unpivot(index=["a", "d"], on="b")
+    assert_gpu_result_equal(q, engine=streaming_engine)
+
 
-    with pytest.raises(
-        UserWarning, match=r"This slice not supported for multiple partitions."
+def test_unpivot_multi_columns_fallback(streaming_engine_factory) -> None:
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=3, fallback_mode=StreamingFallbackMode.WARN
+        )
+    )
+    q = pl.LazyFrame(
+        {"a": range(10), "b": range(10, 20), "c": [1.5, None] * 5, "d": list("ab") * 5}
+    ).unpivot(index=["a", "d"], on=["b", "c"])
+    with warns_on_spmd(
+        streaming_engine,
+        UserWarning,
+        match="unpivot of multiple columns is not supported for multiple partitions",
     ):
         assert_gpu_result_equal(q, engine=streaming_engine)
 
 
+@pytest.mark.parametrize("offset", [0, 7])
+def test_row_index_multi(offset, streaming_engine_factory) -> None:
+    streaming_engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise")
+    )
+    q = (
+        pl.LazyFrame({"a": range(20), "b": range(20, 0, -1)})
+        .filter(pl.col("a") % 3 != 1)
+        .with_row_index(offset=offset)
+    )
+    assert_gpu_result_equal(q, engine=streaming_engine)
+
+
 # ---------------------------------------------------------------------------
 # Tests migrated from tests/streaming/test_parallel.py
 # ---------------------------------------------------------------------------
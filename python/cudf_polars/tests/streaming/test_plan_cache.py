@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import polars as pl
+
+from cudf_polars.dsl.traversal import traversal
+from cudf_polars.engine.options import StreamingOptions
+from cudf_polars.engine.plan_cache import get_plan_cache
+from cudf_polars.streaming.io import StreamingScan
+from cudf_polars.testing.asserts import assert_gpu_result_equal
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+    from cudf_polars.engine.plan_cache import PlanCache
+
+
+@pytest.fixture
+def plan_cache() -> Iterator[PlanCache]:
+    cache = get_plan_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def write_source(path: pathlib.Path, nrows: int) -> None:
+    pl.DataFrame({"a": range(nrows), "b": [i % 7 for i in range(nrows)]}).write_parquet(
+        path
+    )
+
+
+def query(path: pathlib.Path) -> pl.LazyFrame:
+    return pl.scan_parquet(path).group_by("b").agg(pl.col("a").sum())
+
+
+def test_repeated_query_reuses_lowering(
+    tmp_path: pathlib.Path, spmd_engine_factory, plan_cache: PlanCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(max_rows_per_partition=100, raise_on_fail=True)
+    )
+    path = tmp_path / "data.pq"
+    write_source(path, 1_000)
+
+    assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+    assert (plan_cache.hits, plan_cache.misses) == (0, 1)
+
+    assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+    assert (plan_cache.hits, plan_cache.misses) == (1, 1)
+
+    # Rewriting the source changes its statistics, so the plan is lowered again.
+    write_source(path, 2_000)
+    assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+    assert (plan_cache.hits, plan_cache.misses) == (1, 2)
+    assert len(plan_cache) == 2
+
+
+def test_plan_cache_can_be_disabled(
+    tmp_path: pathlib.Path, spmd_engine_factory, plan_cache: PlanCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, plan_cache_size=0, raise_on_fail=True
+        )
+    )
+    path = tmp_path / "data.pq"
+    write_source(path, 1_000)
+
+    for _ in range(2):
+        assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+
+    assert (plan_cache.hits, plan_cache.misses, len(plan_cache)) == (0, 0, 0)
+
+
+def test_plan_cache_evicts_least_recently_used(
+    tmp_path: pathlib.Path, spmd_engine_factory, plan_cache: PlanCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, plan_cache_size=1, raise_on_fail=True
+        )
+    )
+    first, second = tmp_path / "first.pq", tmp_path / "second.pq"
+    write_source(first, 1_000)
+    write_source(second, 1_000)
+
+    for path in (first, second, first):
+        assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+
+    assert (plan_cache.hits, plan_cache.misses, len(plan_cache)) == (0, 3, 1)
+
+
+def test_in_memory_query_is_not_cached(
+    spmd_engine_factory, plan_cache: PlanCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(max_rows_per_partition=100, raise_on_fail=True)
+    )
+    df = pl.LazyFrame({"a": range(1_000), "b": [i % 7 for i in range(1_000)]})
+    q = df.group_by("b").agg(pl.col("a").sum())
+
+    for _ in range(2):
+        assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    assert (plan_cache.hits, plan_cache.misses, len(plan_cache)) == (0, 0, 0)
+
+
+def test_cached_plan_is_not_modified(
+    tmp_path: pathlib.Path, spmd_engine_factory, plan_cache: PlanCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100,
+            parquet_options={"prefetch_file_metadata": True},
+            raise_on_fail=True,
+        )
+    )
+    path = tmp_path / "data.pq"
+    write_source(path, 1_000)
+
+    for _ in range(2):
+        assert_gpu_result_equal(query(path), engine=engine, check_row_order=False)
+
+    assert (plan_cache.hits, plan_cache.misses) == (1, 1)
+    ((lowering, _),) = plan_cache._entries.values()
+    scans = [
+        scan
+        for node in traversal([lowering.lowered])
+        if isinstance(node, StreamingScan)
+        for scan in node.scans
+    ]
+    assert scans
+    # Prefetched metadata is attached to a per-query copy of the plan.
+    assert all(scan.cached_parquet_info is None for scan in scans)
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from cudf_polars.dsl.translate import Translator
+from cudf_polars.engine.options import StreamingOptions
+from cudf_polars.streaming.base import StatsCollector
+from cudf_polars.streaming.join_filter_pushdown import analyze_plan
+from cudf_polars.streaming.profile import ActorProfile, QueryProfile
+from cudf_polars.streaming.statistics import collect_statistics
+from cudf_polars.testing.asserts import assert_gpu_result_equal
+from cudf_polars.utils.config import ConfigOptions
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def query(tmp_path: pathlib.Path) -> pl.LazyFrame:
+    pl.DataFrame(
+        {"key": [i % 100 for i in range(1_000)], "value": range(1_000)}
+    ).write_parquet(tmp_path / "fact.pq")
+    pl.DataFrame(
+        {"key": range(100), "group": [i % 7 for i in range(100)]}
+    ).write_parquet(tmp_path / "dim.pq")
+    return (
+        pl.scan_parquet(tmp_path / "fact.pq")
+        .filter(pl.col("value") % 3 == 0)
+        .join(pl.scan_parquet(tmp_path / "dim.pq"), on="key")
+        .group_by("group")
+        .agg(pl.col("value").sum())
+    )
+
+
+def test_profile_capture_and_replay(
+    tmp_path: pathlib.Path, spmd_engine_factory
+) -> None:
+    q = query(tmp_path)
+    path = tmp_path / "profile.json"
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, profile_output=str(path), raise_on_fail=True
+        )
+    )
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+    profile = QueryProfile.load(path)
+    (root,) = profile.plan.roots
+    assert profile.actors[root].row_count == 7
+    assert profile.wall_time > 0
+    text = profile.explain_analyze()
+    assert "JOIN" in text
+    assert "rows=7 " in text
+    assert QueryProfile.from_dict(json.loads(path.read_text())) == profile
+
+    hints = profile.row_hints()
+    assert 7 in hints.values()
+
+    replay = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, profile_hints=str(path), raise_on_fail=True
+        )
+    )
+    assert_gpu_result_equal(q, engine=replay, check_row_order=False)
+    ir = Translator(q._ldf.visit(), replay).translate_ir()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        stats = collect_statistics(
+            ir, ConfigOptions.from_polars_engine(replay), executor
+        )
+    assert stats.row_hints == hints
+
+
+def test_row_hints_override_estimates() -> None:
+    engine = pl.GPUEngine(raise_on_fail=True, executor="streaming")
+    q = pl.LazyFrame({"a": range(100)}).filter(pl.col("a") > 10)
+    ir = Translator(q._ldf.visit(), engine).translate_ir()
+
+    stats = StatsCollector()
+    assert analyze_plan(ir, stats).row_estimates[ir] != 42
+    stats.row_hints = {ir.get_stable_id(): 42}
+    assert analyze_plan(ir, stats).row_estimates[ir] == 42
+
+    restored = StatsCollector.deserialize(
+        json.loads(json.dumps(stats.serialize(ir))), ir
+    )
+    assert restored.row_hints == stats.row_hints
+
+
+def test_merge_actor_profiles() -> None:
+    actor = ActorProfile("Join", row_count=10, byte_count=80, chunk_count=2)
+    actor.merge(ActorProfile("Join", chunk_count=1, wall_time=2.0, decision="shuffle"))
+    assert (actor.row_count, actor.chunk_count, actor.wall_time) == (10, 3, 2.0)
+    assert actor.decision == "shuffle"
+
+    actor.merge(ActorProfile("Join", row_count=5, byte_count=40), across_ranks=True)
+    assert (actor.row_count, actor.byte_count) == (15, 120)
+
+    duplicated = ActorProfile("Sort", row_count=10, duplicated=True)
+    duplicated.merge(
+        ActorProfile("Sort", row_count=10, duplicated=True), across_ranks=True
+    )
+    assert duplicated.row_count == 10
@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+import polars as pl
+
+from cudf_polars import Translator
+from cudf_polars.engine.options import StreamingOptions
+from cudf_polars.engine.result_cache import _candidate_keys, get_result_cache
+from cudf_polars.testing.asserts import assert_gpu_result_equal
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+    from rapidsmpf.streaming.core.context import Context
+
+    from cudf_polars.dsl.ir import IR
+    from cudf_polars.engine.result_cache import ResultCache
+
+
+@pytest.fixture
+def result_cache() -> Iterator[ResultCache]:
+    cache = get_result_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def write_sources(tmp_path: pathlib.Path, nrows: int) -> None:
+    pl.DataFrame(
+        {"key": [i % 100 for i in range(nrows)], "value": range(nrows)}
+    ).write_parquet(tmp_path / "fact.pq")
+    pl.DataFrame(
+        {"key": range(100), "group": [i % 7 for i in range(100)]}
+    ).write_parquet(tmp_path / "dim.pq")
+
+
+def shared_join(tmp_path: pathlib.Path) -> pl.LazyFrame:
+    return (
+        pl.scan_parquet(tmp_path / "fact.pq")
+        .filter(pl.col("value") % 3 == 0)
+        .join(pl.scan_parquet(tmp_path / "dim.pq"), on="key")
+    )
+
+
+def queries(tmp_path: pathlib.Path) -> list[pl.LazyFrame]:
+    joined = shared_join(tmp_path)
+    return [
+        joined.group_by("group").agg(pl.col("value").sum()),
+        joined.group_by("group").agg(pl.col("value").max()),
+        joined.group_by("group").agg(pl.col("value").min()),
+    ]
+
+
+def test_shared_subplan_result_reused(
+    tmp_path: pathlib.Path, spmd_engine_factory, result_cache: ResultCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, result_cache_size=2**30, raise_on_fail=True
+        )
+    )
+    write_sources(tmp_path, 1_000)
+    first, second, third = queries(tmp_path)
+
+    assert_gpu_result_equal(first, engine=engine, check_row_order=False)
+    assert (result_cache.hits, result_cache.misses, len(result_cache)) == (0, 0, 0)
+
+    # The join is shared with the first query, so its result is cached.
+    assert_gpu_result_equal(second, engine=engine, check_row_order=False)
+    assert (result_cache.hits, result_cache.misses, len(result_cache)) == (0, 1, 1)
+
+    assert_gpu_result_equal(third, engine=engine, check_row_order=False)
+    assert (result_cache.hits, result_cache.misses, len(result_cache)) == (1, 1, 1)
+    assert result_cache.nbytes > 0
+
+    # Rewriting a source changes the sub-plan's fingerprint.
+    write_sources(tmp_path, 2_000)
+    assert_gpu_result_equal(first, engine=engine, check_row_order=False)
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+
+def test_result_cache_evicts_beyond_budget(
+    tmp_path: pathlib.Path, spmd_engine_factory, result_cache: ResultCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=100, result_cache_size=1, raise_on_fail=True
+        )
+    )
+    write_sources(tmp_path, 1_000)
+
+    for query in queries(tmp_path):
+        assert_gpu_result_equal(query, engine=engine, check_row_order=False)
+
+    # Every result is larger than the budget, so it is dropped after use.
+    assert (result_cache.hits, result_cache.misses, len(result_cache)) == (0, 2, 0)
+
+
+def test_result_cache_disabled_by_default(
+    tmp_path: pathlib.Path, spmd_engine_factory, result_cache: ResultCache
+) -> None:
+    engine = spmd_engine_factory(
+        StreamingOptions(max_rows_per_partition=100, raise_on_fail=True)
+    )
+    write_sources(tmp_path, 1_000)
+
+    for query in queries(tmp_path):
+        assert_gpu_result_equal(query, engine=engine, check_row_order=False)
+
+    assert (result_cache.hits, result_cache.misses, len(result_cache)) == (0, 0, 0)
+
+
+def test_candidate_keys(tmp_path: pathlib.Path) -> None:
+    write_sources(tmp_path, 1_000)
+    engine = pl.GPUEngine(executor="streaming")
+
+    def translate(q: pl.LazyFrame) -> IR:
+        return Translator(q._ldf.visit(), engine).translate_ir()
+
+    ir = translate(shared_join(tmp_path))
+    keys = _candidate_keys(ir, 0, 1)
+    assert len(keys) == 1
+    # Results are only shared between queries of the same rank layout.
+    assert keys.keys() == _candidate_keys(ir, 0, 2).keys()
+    assert set(keys.values()).isdisjoint(_candidate_keys(ir, 0, 2).values())
+    assert set(keys.values()).isdisjoint(_candidate_keys(ir, 1, 2).values())
+
+    # Sub-plans scanning in-memory frames are never candidates.
+    in_memory = pl.LazyFrame({"key": range(10)}).join(
+        pl.scan_parquet(tmp_path / "dim.pq"), on="key"
+    )
+    assert _candidate_keys(translate(in_memory), 0, 1) == {}
+
+
+def test_clear_only_drops_engine_results(result_cache: ResultCache) -> None:
+    first, second = cast("Context", object()), cast("Context", object())
+    for ctx in (first, second):
+        result_cache._entries[id(ctx)] = OrderedDict()
+        result_cache._seen[id(ctx)] = OrderedDict({hash(ctx): None})
+
+    result_cache.clear(first)
+
+    assert id(first) not in result_cache._seen
+    assert id(second) in result_cache._seen
@@ -330,3 +330,52 @@ def test_over_in_filter_unsupported(request, streaming_engine_factory) -> None:
         match=r"over\(...\) inside filter is not supported for multiple partitions.*",
     ):
         assert_gpu_result_equal(q, engine=engine)
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "none"])
+@pytest.mark.parametrize("period", ["1i", "3i", "10i"])
+def test_rolling_ir_multi_partition(streaming_engine_factory, closed, period):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise"),
+    )
+    df = pl.LazyFrame(
+        {
+            "orderby": [1, 2, 2, 4, 5, 8, 9, 9, 9, 12, 13, 20],
+            "values": range(12),
+        }
+    )
+    q = df.rolling("orderby", period=period, closed=closed).agg(
+        pl.col("values").sum().alias("sum"),
+        pl.col("values").max().alias("max"),
+        pl.len(),
+    )
+    assert_gpu_result_equal(q, engine=engine, check_row_order=True)
+
+
+def test_rolling_ir_grouped_multi_partition(streaming_engine_factory):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=2, fallback_mode="warn"),
+    )
+    df = pl.LazyFrame(
+        {
+            "keys": [1, None, 2, 1, 2, None, 1, 2],
+            "orderby": [10, 2, -11, 11, -5, 3, 14, -4],
+            "values": [1, 2, 3, 4, 5, 6, 7, 8],
+        }
+    )
+    q = df.rolling("orderby", period="5i", group_by="keys").agg(pl.col("values").sum())
+    assert_gpu_result_equal(q, engine=engine, check_row_order=False)
+
+
+def test_rolling_ir_look_ahead_fallback(streaming_engine_factory):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="warn"),
+    )
+    df = pl.LazyFrame({"orderby": range(10), "values": range(10)})
+    q = df.rolling("orderby", period="3i", offset="0i").agg(pl.col("values").sum())
+    with warns_on_spmd(
+        engine,
+        UserWarning,
+        match="Rolling windows that extend past the current row",
+    ):
+        assert_gpu_result_equal(q, engine=engine, check_row_order=True)
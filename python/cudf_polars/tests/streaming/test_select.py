@@ -58,8 +58,8 @@ def test_select_reduce_fallback(df, spmd_engine_factory, fallback_mode):
 
     query = df.select(
         (pl.col("a") + pl.col("b")).max(),
-        # NOTE: We don't support `median` yet
-        (pl.col("a") * 2 + pl.col("b")).alias("d").median(),
+        # NOTE: We don't support `product` yet
+        (pl.col("a") * 2 + pl.col("b")).alias("d").product(),
     )
 
     if fallback_mode == "silent":
@@ -124,6 +124,38 @@ def test_select_aggs(df, engine, aggs):
     assert_gpu_result_equal(query, engine=engine)
 
 
+@pytest.mark.parametrize(
+    "aggs",
+    [
+        (pl.col("a").median(),),
+        (pl.col("a").quantile(0.25, interpolation="lower"), pl.col("c").median()),
+        ((pl.col("a") + pl.col("c")).quantile(0.6) - pl.col("b").max(),),
+    ],
+)
+def test_select_quantile(df, streaming_engine_factory, aggs):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="raise"),
+    )
+    query = df.select(*aggs)
+    assert_gpu_result_equal(query, engine=engine)
+
+
+def test_select_quantile_approximate(df, streaming_engine_factory):
+    engine = streaming_engine_factory(
+        StreamingOptions(
+            max_rows_per_partition=3,
+            fallback_mode="raise",
+            quantile_mode="approximate",
+        ),
+    )
+    query = df.select(
+        pl.col("a").quantile(0.0),
+        pl.col("c").quantile(1.0),
+        pl.col("b").median(),
+    )
+    assert_gpu_result_equal(query, engine=engine)
+
+
 @pytest.mark.parametrize(
     "aggs",
     [
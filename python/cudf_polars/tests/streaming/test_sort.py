@@ -9,6 +9,7 @@ import polars as pl
 
 from cudf_polars.engine.options import StreamingOptions
 from cudf_polars.testing.asserts import assert_gpu_result_equal
+from cudf_polars.testing.engine_utils import warns_on_spmd
 
 
 @pytest.fixture
@@ -117,11 +118,7 @@ def test_sort_tail(df, engine):
 def test_sort_slice(df, engine, offset):
     # Slice in the middle, which distributed sorts need to be careful with
     q = df.sort(by=["y", "z"]).slice(offset, 2)
-    with pytest.raises(
-        NotImplementedError,
-        match=r"This slice not supported for multiple partitions.",
-    ):
-        assert_gpu_result_equal(q, engine=engine)
+    assert_gpu_result_equal(q, engine=engine)
 
 
 def test_sort_after_sparse_join(streaming_engine_factory):
@@ -149,3 +146,76 @@ def test_sort_by_renamed_join_column(streaming_engine_factory):
         "ORDER BY df2.text"
     )
     assert_gpu_result_equal(q, engine=engine)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("nulls_last", [False, True])
+def test_merge_sorted(engine, descending, nulls_last):
+    left = pl.LazyFrame(
+        {
+            "key": [5, None, 1, 9, 3, 3, 12, 7, 1, 20],
+            "value": range(10),
+        }
+    ).sort("key", descending=descending, nulls_last=nulls_last)
+    right = pl.LazyFrame(
+        {
+            "key": [4, 3, None, 8, 1, 15, 3],
+            "value": range(10, 17),
+            "extra": range(7),
+        }
+    ).sort("key", descending=descending, nulls_last=nulls_last)
+    q = left.merge_sorted(right, key="key")
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_merge_sorted_presorted(engine):
+    # Inputs that are already sorted (in ascending order) are not Sort nodes.
+    left = pl.LazyFrame(
+        {
+            "key": [None, 1, 1, 3, 3, 5, 7, 9, 12, 20],
+            "value": range(10),
+        }
+    )
+    right = pl.LazyFrame(
+        {
+            "key": [None, 1, 3, 3, 4, 8, 15],
+            "value": range(10, 17),
+            "extra": range(7),
+        }
+    )
+    q = left.merge_sorted(right, key="key")
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_merge_sorted_equal_keys_multi_rank(engine):
+    if engine.nranks < 2:
+        pytest.skip("Positions only collide across 2+ ranks")
+    # Many equal keys on both sides: the rows of each side must keep
+    # their input order within every key.
+    left = pl.LazyFrame({"key": [1] * 12 + [2] * 12, "value": range(24)})
+    right = pl.LazyFrame({"key": [1] * 9 + [2] * 9, "value": range(100, 118)})
+    q = left.merge_sorted(right, key="key")
+    assert_gpu_result_equal(q, engine=engine, check_row_order=True)
+
+
+def test_merge_sorted_sliced(engine):
+    left = pl.LazyFrame({"a": [1, 2, 1, 2, 1, 3], "b": range(6)}).sort("a")
+    right = pl.LazyFrame({"a": [2, 1, 1], "b": range(3)}).sort("a")
+    q = left.slice(2, 3).merge_sorted(right, key="a")
+    assert_gpu_result_equal(q, engine=engine)
+
+
+def test_merge_sorted_other_sort_key_fallback(streaming_engine_factory):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=3, fallback_mode="warn"),
+    )
+    # Sorting by "b" sorts by "a" too, but "a" is not the leading sort key.
+    left = pl.LazyFrame({"a": [3, 1, 2, 5, 4, 1], "b": [30, 10, 20, 50, 40, 10]})
+    right = pl.LazyFrame({"a": [2, 1, 1], "b": [20, 10, 10]})
+    q = left.sort("b").merge_sorted(right.sort("a"), key="a")
+    with warns_on_spmd(
+        engine,
+        UserWarning,
+        match="merge_sorted is only supported for multiple partitions",
+    ):
+        assert_gpu_result_equal(q, engine=engine)
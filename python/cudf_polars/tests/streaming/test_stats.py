@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import pickle
+import struct
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, ClassVar, cast
 
 import pytest
@@ -23,13 +26,22 @@ from cudf_polars.dsl.ir import (
     Projection,
 )
 from cudf_polars.engine.options import StreamingOptions
-from cudf_polars.streaming.base import SerializedDataSourceInfo, StatsCollector
+from cudf_polars.streaming.base import (
+    ColumnStatistics,
+    SerializedDataSourceInfo,
+    StatsCollector,
+)
 from cudf_polars.streaming.io import (
+    CSVSourceInfo,
     DataFrameSourceInfo,
+    NDJSONSourceInfo,
     ParquetMetadata,
     ParquetSourceInfo,
     _build_parquet_source,
+    _build_text_source,
     _clear_source_info_cache,
+    _column_statistics,
+    _text_reader_options,
 )
 from cudf_polars.streaming.statistics import collect_statistics
 from cudf_polars.testing.asserts import assert_gpu_result_equal
@@ -141,6 +153,85 @@ def test_base_stats_parquet(
         assert source.column_storage_size("y") is None
 
 
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+@pytest.mark.parametrize("n_files", [1, 3])
+def test_base_stats_text(
+    tmp_path,
+    df_and_schema: tuple[pl.DataFrame, Schema],
+    fmt,
+    n_files,
+    stats_engine,
+    parquet_stats_executor: concurrent.futures.ThreadPoolExecutor,
+):
+    _clear_source_info_cache()
+    df, _schema = df_and_schema
+    make_partitioned_source(df, tmp_path, fmt, n_files=n_files)
+    q = (pl.scan_csv if fmt == "csv" else pl.scan_ndjson)(tmp_path)
+    ir = Translator(q._ldf.visit(), stats_engine).translate_ir()
+    stats = collect_statistics(
+        ir, ConfigOptions.from_polars_engine(stats_engine), parquet_stats_executor
+    )
+    source = stats.scan_stats[ir]
+
+    # Small files are sampled in full, so the row count is exact
+    assert source.type == fmt
+    assert source.row_count == df.height
+    for col in ("x", "y", "z"):
+        size = source.column_storage_size(col)
+        assert size is not None
+        assert size > 0
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_text_source_info_extrapolates(
+    tmp_path: pathlib.Path,
+    df_and_schema: tuple[pl.DataFrame, Schema],
+    stats_engine,
+    fmt,
+) -> None:
+    _clear_source_info_cache()
+    df, schema = df_and_schema
+    make_partitioned_source(df, tmp_path, fmt, n_files=4)
+    q = (pl.scan_csv if fmt == "csv" else pl.scan_ndjson)(tmp_path)
+    ir = Translator(q._ldf.visit(), stats_engine).translate_ir()
+    info = _build_text_source(
+        fmt,
+        tuple(ir.paths),
+        frozenset(["x", "y"]),
+        tuple(schema.items()),
+        _text_reader_options(ir),
+        max_file_samples=2,
+        sample_size=1_024,
+    )
+
+    assert info.row_count is not None
+    assert df.height / 2 < info.row_count < df.height * 2
+    assert info.column_storage_size("x") is not None
+    assert info.column_storage_size("z") is None
+
+
+def test_text_source_info_unsampleable(tmp_path: pathlib.Path, stats_engine) -> None:
+    _clear_source_info_cache()
+    df = pl.DataFrame({"x": range(100)})
+    df.write_csv(tmp_path / "data.csv")
+    path = tmp_path / "data.csv.gz"
+    path.write_bytes(gzip.compress((tmp_path / "data.csv").read_bytes()))
+    q = pl.scan_csv(tmp_path / "data.csv")
+    ir = Translator(q._ldf.visit(), stats_engine).translate_ir()
+    args = (
+        (str(path),),
+        frozenset(["x"]),
+        tuple((name, DataType(dtype)) for name, dtype in df.schema.items()),
+    )
+
+    # Compressed files, and samples that cannot be decoded, get no
+    # statistics instead of failing the query.
+    info = _build_text_source("csv", *args, _text_reader_options(ir))
+    assert info.row_count is None
+    info = _build_text_source("csv", *args, ())
+    assert info.row_count is None
+
+
 def test_parquet_source_info_uses_decoded_dtype_floor(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -160,11 +251,13 @@ def test_parquet_source_info_uses_decoded_dtype_floor(
             "already_large": 20_000,
         }
         num_row_groups_per_file = (1, 1)
+        column_chunks: ClassVar[dict[str, list[object]]] = {}
 
         def __init__(self, paths: tuple[str, ...], max_footer_samples: int) -> None:
             self.paths = paths
             self.max_footer_samples = max_footer_samples
             self.sampled_file_count = 1
+            self.sampled_row_count = 1_000
             self.total_file_count = len(paths)
 
     sampled_cols: list[str] = []
@@ -238,6 +331,95 @@ def test_parquet_round_trip() -> None:
     assert restored.per_file_means == info.per_file_means
 
 
+def test_parquet_round_trip_column_statistics() -> None:
+    info = ParquetSourceInfo(
+        1000,
+        {"x": 200},
+        column_stats={"x": ColumnStatistics(10, 990, 0, 989)},
+    )
+    restored = ParquetSourceInfo.deserialize(json.loads(json.dumps(info.serialize())))
+
+    assert restored.column_statistics("x") == ColumnStatistics(10, 990, 0, 989)
+    assert restored.column_statistics("y") is None
+
+
+@pytest.mark.parametrize("n_files", [1, 3])
+def test_parquet_column_statistics(tmp_path: pathlib.Path, n_files: int) -> None:
+    _clear_source_info_cache()
+    df = pl.DataFrame(
+        {
+            "x": range(3_000),
+            "y": ["cat", "dog", "fish"] * 1_000,
+            "z": [1.0, 2.0, None, 4.0, 5.0] * 600,
+        }
+    )
+    make_partitioned_source(df, tmp_path, "parquet", n_files=n_files)
+    q = pl.scan_parquet(tmp_path)
+    ir = Translator(q._ldf.visit(), pl.GPUEngine()).translate_ir()
+    info = _build_parquet_source(
+        tuple(ir.paths),
+        frozenset(["x", "y", "z"]),
+        tuple(ir.schema.items()),
+        max_footer_samples=3,
+        max_row_group_samples=0,
+    )
+
+    x = info.column_statistics("x")
+    assert x == ColumnStatistics(
+        null_count=0, distinct_count=3_000, min_value=0, max_value=2_999
+    )
+    y = info.column_statistics("y")
+    assert y is not None
+    assert y.null_count == 0
+    assert y.min_value is None
+    z = info.column_statistics("z")
+    assert z is not None
+    assert z.null_count == 600
+    assert (z.min_value, z.max_value) == (1.0, 5.0)
+    assert DataFrameSourceInfo(10).column_statistics("x") is None
+
+
+def _chunk(
+    num_values: int,
+    distinct_count: int | None,
+    bounds: tuple[int, int],
+    *,
+    deprecated: bool = False,
+) -> plc.io.parquet_metadata.ColumnChunkMetaData:
+    lo, hi = (struct.pack("<q", v) for v in bounds)
+    chunk = SimpleNamespace(
+        num_values=num_values,
+        statistics=SimpleNamespace(
+            null_count=0,
+            distinct_count=distinct_count,
+            min_value=None if deprecated else lo,
+            max_value=None if deprecated else hi,
+            min=lo if deprecated else None,
+            max=hi if deprecated else None,
+        ),
+    )
+    return cast("plc.io.parquet_metadata.ColumnChunkMetaData", chunk)
+
+
+def test_parquet_column_statistics_chunks() -> None:
+    int64 = DataType(pl.Int64())
+    chunks = [_chunk(100, 60, (0, 59)), _chunk(100, 70, (50, 119))]
+    stats = _column_statistics(chunks, int64, sampled_row_count=200, row_count=200)
+    assert stats == ColumnStatistics(0, 130, 0, 119)
+    # The summed distinct count is capped at the row count.
+    stats = _column_statistics(chunks, int64, sampled_row_count=200, row_count=100)
+    assert stats.distinct_count == 100
+
+    deprecated = [_chunk(100, None, (-5, 5), deprecated=True)]
+    stats = _column_statistics(deprecated, int64, sampled_row_count=100, row_count=100)
+    assert (stats.min_value, stats.max_value) == (-5, 5)
+    # Deprecated statistics are ordered as signed values.
+    stats = _column_statistics(
+        deprecated, DataType(pl.UInt64()), sampled_row_count=100, row_count=100
+    )
+    assert (stats.min_value, stats.max_value) == (None, None)
+
+
 def test_parquet_round_trip_empty() -> None:
     info = ParquetSourceInfo(None, {})
     data = info.serialize()
@@ -290,6 +472,96 @@ def test_parquet_source_info_omits_footers_when_paths_are_sampled(
     assert info.cached_parquet_info is None
 
 
+def test_parquet_source_info_persistent_cache(
+    tmp_path: pathlib.Path,
+    df_and_schema: tuple[pl.DataFrame, Schema],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _clear_source_info_cache()
+    df, schema = df_and_schema
+    data_dir = tmp_path / "data"
+    cache_dir = tmp_path / "cache"
+    data_dir.mkdir()
+    make_partitioned_source(df, data_dir, "parquet", n_files=2)
+    paths = tuple(str(p) for p in sorted(data_dir.iterdir()))
+    args = (paths, frozenset(df.columns), tuple(schema.items()), 3, 0)
+
+    info = _build_parquet_source(*args, cache_dir=str(cache_dir), cache_size=2**20)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # A new process (empty in-memory cache) reuses the on-disk entry
+    # without reading any footers.
+    _clear_source_info_cache()
+    with monkeypatch.context() as m:
+        m.setattr(
+            ParquetSourceInfo,
+            "from_paths",
+            classmethod(lambda *args: pytest.fail("footers were re-read")),
+        )
+        cached = _build_parquet_source(
+            *args, cache_dir=str(cache_dir), cache_size=2**20
+        )
+    assert cached.row_count == info.row_count
+    assert cached.per_file_means == info.per_file_means
+
+    # Overwriting a file invalidates both the in-memory and on-disk entries
+    df.head(10).write_parquet(paths[0])
+    _clear_source_info_cache()
+    updated = _build_parquet_source(*args, cache_dir=str(cache_dir), cache_size=2**20)
+    assert updated.row_count == df.height // 2 + 10
+    assert _build_parquet_source(*args).row_count == updated.row_count
+
+
+def test_parquet_source_info_cache_evicts(
+    tmp_path: pathlib.Path,
+    df_and_schema: tuple[pl.DataFrame, Schema],
+) -> None:
+    _clear_source_info_cache()
+    df, schema = df_and_schema
+    data_dir = tmp_path / "data"
+    cache_dir = tmp_path / "cache"
+    data_dir.mkdir()
+    make_partitioned_source(df, data_dir, "parquet", n_files=1)
+    paths = tuple(str(p) for p in sorted(data_dir.iterdir()))
+    _build_parquet_source(
+        paths,
+        frozenset(["x"]),
+        tuple(schema.items()),
+        3,
+        0,
+        cache_dir=str(cache_dir),
+        cache_size=0,
+    )
+    # A zero-byte budget never persists anything
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+    budget = 2**20
+    for cols in (["x"], ["y"], ["z"]):
+        _build_parquet_source(
+            paths,
+            frozenset(cols),
+            tuple(schema.items()),
+            3,
+            0,
+            cache_dir=str(cache_dir),
+            cache_size=budget,
+        )
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 3
+    # Shrink the budget so that only the most recent entry fits
+    budget = max(p.stat().st_size for p in entries)
+    _build_parquet_source(
+        paths,
+        frozenset(["x", "y"]),
+        tuple(schema.items()),
+        3,
+        0,
+        cache_dir=str(cache_dir),
+        cache_size=budget,
+    )
+    assert sum(p.stat().st_size for p in cache_dir.iterdir()) <= budget
+
+
 def test_parquet_metadata_reads_footers(
     tmp_path: pathlib.Path,
     df_and_schema: tuple[pl.DataFrame, Schema],
@@ -356,6 +628,20 @@ def test_parquet_deserialize_wrong_type() -> None:
         ParquetSourceInfo.deserialize(data)
 
 
+@pytest.mark.parametrize("info_type", [CSVSourceInfo, NDJSONSourceInfo])
+def test_text_round_trip(info_type) -> None:
+    info = info_type(1000, {"x": 200, "y": 400})
+    data = json.loads(json.dumps(info.serialize()))
+    restored = info_type.deserialize(data)
+
+    assert restored.type == info.type
+    assert restored.row_count == info.row_count
+    assert restored.per_file_means == info.per_file_means
+
+    with pytest.raises(ValueError, match=f"Expected {info_type.__name__}"):
+        info_type.deserialize(ParquetSourceInfo(1000, {}).serialize())
+
+
 def test_dataframe_deserialize_wrong_type() -> None:
     data = ParquetSourceInfo(1000, {"x": 200}).serialize()
     with pytest.raises(ValueError, match="Expected DataFrameSourceInfo"):
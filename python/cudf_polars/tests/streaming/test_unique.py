@@ -11,7 +11,6 @@ from polars.testing import assert_frame_equal
 from cudf_polars.engine.options import StreamingOptions
 from cudf_polars.streaming.explain import explain_query
 from cudf_polars.testing.asserts import assert_gpu_result_equal
-from cudf_polars.testing.engine_utils import warns_on_spmd
 
 
 @pytest.fixture(scope="module")
@@ -25,7 +24,6 @@ def df():
     )
 
 
-@pytest.mark.filterwarnings("ignore:Unsupported unique options for multiple partitions")
 @pytest.mark.parametrize("subset", [None, ("y",), ("y", "z")])
 @pytest.mark.parametrize("keep", ["first", "last", "any", "none"])
 @pytest.mark.parametrize("maintain_order", [True, False])
@@ -42,6 +40,20 @@ def test_unique(df, streaming_engine_factory, keep, subset, maintain_order):
     assert_gpu_result_equal(q, engine=engine, check_row_order=check_row_order)
 
 
+@pytest.mark.parametrize("subset", [None, ("x",)])
+@pytest.mark.parametrize("zlice", [None, "head", "tail"])
+def test_unique_keep_none_maintain_order(streaming_engine_factory, subset, zlice):
+    engine = streaming_engine_factory(
+        StreamingOptions(max_rows_per_partition=7, fallback_mode="raise"),
+    )
+    x = [*range(30, 0, -1), 3, 17, 8, 3, 25, 12]
+    df = pl.LazyFrame({"x": x, "y": [v % 4 for v in x]})
+    q = df.unique(subset=subset, keep="none", maintain_order=True)
+    if zlice is not None:
+        q = getattr(q, zlice)(5)
+    assert_gpu_result_equal(q, engine=engine, check_row_order=True)
+
+
 @pytest.mark.parametrize("maintain_order", [True, False])
 def test_unique_select(df, streaming_engine_factory, maintain_order):
     engine = streaming_engine_factory(
@@ -90,12 +102,17 @@ def test_unique_head_tail(keep, zlice, streaming_engine_factory):
     )
 
 
-def test_unique_complex_slice_fallback(df, streaming_engine_factory):
-    """Test that unique with complex slice (offset >= 1) falls back correctly."""
-    engine = streaming_engine_factory(StreamingOptions(fallback_mode="warn"))
-    # unique().slice(offset=5, length=10) has zlice[0] >= 1, triggering fallback
+def test_unique_complex_slice(df, streaming_engine_factory):
+    """Test that unique with complex slice (offset >= 1) doesn't fall back."""
+    engine = streaming_engine_factory(StreamingOptions(fallback_mode="raise"))
     q = df.unique(subset=("y",), keep="any").slice(5, 10)
-    with warns_on_spmd(engine, UserWarning, match="Complex slice not supported"):
-        result = q.collect(engine=engine)
-    # Just verify the fallback produces valid output with expected shape
+    result = q.collect(engine=engine)
+    # keep="any" without maintain_order picks arbitrary rows
     assert result.shape == (10, 3)
+
+
+@pytest.mark.parametrize("zlice", [(3, 4), (-4, None)])
+def test_unique_maintain_order_complex_slice(df, streaming_engine_factory, zlice):
+    engine = streaming_engine_factory(StreamingOptions(fallback_mode="raise"))
+    q = df.unique(subset=("y",), keep="first", maintain_order=True).slice(*zlice)
+    assert_gpu_result_equal(q, engine=engine)
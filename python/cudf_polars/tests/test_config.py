@@ -288,6 +288,33 @@ def test_validate_cluster() -> None:
         )
 
 
+def test_validate_quantile_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = ConfigOptions.from_polars_engine(pl.GPUEngine(executor="streaming"))
+    assert config.executor.name == "streaming"
+    assert config.executor.quantile_mode == "exact"
+
+    with monkeypatch.context() as m:
+        m.setenv("CUDF_POLARS__EXECUTOR__QUANTILE_MODE", "approximate")
+        config = ConfigOptions.from_polars_engine(pl.GPUEngine(executor="streaming"))
+        assert config.executor.name == "streaming"
+        assert config.executor.quantile_mode == "approximate"
+
+    with pytest.raises(ValueError, match="'foo' is not a valid QuantileMode"):
+        ConfigOptions.from_polars_engine(
+            pl.GPUEngine(
+                executor="streaming",
+                executor_options={"quantile_mode": "foo"},
+            )
+        )
+    with pytest.raises(ValueError, match="approx_quantile_max_centroids must be"):
+        ConfigOptions.from_polars_engine(
+            pl.GPUEngine(
+                executor="streaming",
+                executor_options={"approx_quantile_max_centroids": 0},
+            )
+        )
+
+
 @pytest.mark.parametrize(
     "option",
     [
@@ -299,6 +326,19 @@ def test_validate_cluster() -> None:
         "max_io_threads",
         "spill_to_pinned_memory",
         "num_py_executors",
+        "approx_quantile_max_centroids",
+        "join_reorder",
+        "text_source_info_cache_dir",
+        "text_source_info_cache_size",
+        "plan_cache_size",
+        "persist_spill_directory",
+        "persist_host_limit",
+        "result_cache_size",
+        "admission_budget",
+        "admission_max_concurrent",
+        "admission_timeout",
+        "profile_output",
+        "profile_hints",
     ],
 )
 def test_validate_streaming_executor_options(option: str) -> None:
@@ -336,6 +376,8 @@ def test_parquet_options_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
         m.setenv("CUDF_POLARS__PARQUET_OPTIONS__USE_RAPIDSMPF_NATIVE", "0")
         m.setenv("CUDF_POLARS__PARQUET_OPTIONS__PREFETCH_FILE_METADATA", "1")
         m.setenv("CUDF_POLARS__PARQUET_OPTIONS__USE_JIT_FILTER", "1")
+        m.setenv("CUDF_POLARS__PARQUET_OPTIONS__SOURCE_INFO_CACHE_DIR", "/tmp/cache")
+        m.setenv("CUDF_POLARS__PARQUET_OPTIONS__SOURCE_INFO_CACHE_SIZE", "1024")
 
         # Test default
         engine = pl.GPUEngine()
@@ -349,6 +391,8 @@ def test_parquet_options_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
         assert config.parquet_options.use_rapidsmpf_native is False
         assert config.parquet_options.prefetch_file_metadata is True
         assert config.parquet_options.use_jit_filter is True
+        assert config.parquet_options.source_info_cache_dir == "/tmp/cache"
+        assert config.parquet_options.source_info_cache_size == 1024
 
     with monkeypatch.context() as m:
         m.setenv("CUDF_POLARS__PARQUET_OPTIONS__CHUNKED", "foo")
@@ -455,6 +499,8 @@ def test_fallback_mode_default(monkeypatch: pytest.MonkeyPatch) -> None:
         "use_rapidsmpf_native",
         "prefetch_file_metadata",
         "use_jit_filter",
+        "source_info_cache_dir",
+        "source_info_cache_size",
     ],
 )
 def test_validate_parquet_options(option: str) -> None:
@@ -615,6 +661,7 @@ def test_dynamic_planning_defaults() -> None:
     assert config.executor.dynamic_planning.join_prefilter_threshold == 0.5
     assert config.executor.dynamic_planning.join_prefilter_max_key_columns == 1
     assert not config.executor.dynamic_planning.join_prefilter_trace
+    assert config.executor.dynamic_planning.join_skew_factor == 4.0
     assert config.executor.join_filter_pushdown is not None
     assert config.executor.join_filter_pushdown.threshold == 0.5
     assert not config.executor.join_filter_pushdown.trace
@@ -776,6 +823,23 @@ def test_validate_join_prefilter_trace() -> None:
         )
 
 
+def test_validate_join_skew_factor() -> None:
+    with pytest.raises(TypeError, match="join_skew_factor must be a float or int"):
+        ConfigOptions.from_polars_engine(
+            pl.GPUEngine(
+                executor="streaming",
+                executor_options={"dynamic_planning": {"join_skew_factor": "bad"}},
+            )
+        )
+    with pytest.raises(ValueError, match="join_skew_factor must be non-negative"):
+        ConfigOptions.from_polars_engine(
+            pl.GPUEngine(
+                executor="streaming",
+                executor_options={"dynamic_planning": {"join_skew_factor": -1}},
+            )
+        )
+
+
 def test_validate_join_filter_pushdown_options() -> None:
     with pytest.raises(TypeError, match="threshold must be"):
         ConfigOptions.from_polars_engine(
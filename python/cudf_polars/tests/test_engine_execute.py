@@ -14,6 +14,7 @@ import pytest
 import polars as pl
 from polars.testing.asserts import assert_frame_equal
 
+from cudf_polars.containers import DataFrame
 from cudf_polars.dsl.translate import Translator
 from cudf_polars.engine import persisted_result, rank_local_store
 from cudf_polars.engine.persisted_result import (
@@ -21,6 +22,7 @@ from cudf_polars.engine.persisted_result import (
     PersistedSource,
     _PersistedLoader,
 )
+from cudf_polars.utils.cuda_stream import get_cuda_stream
 
 
 def _source_lf() -> pl.LazyFrame:
@@ -103,17 +105,25 @@ def test_evaluate_and_persist_deduplicate_replicated(
         persisted_result, "evaluate_on_rank", lambda *a, **k: (evaluated, metadata)
     )
     monkeypatch.setattr(persisted_result, "drop_if_replicated", _fake_drop)
-    monkeypatch.setattr(rank_local_store, "open_store", lambda uid: _Store())
+    monkeypatch.setattr(
+        rank_local_store, "open_store", lambda uid, br, **kwargs: _Store()
+    )
 
     # comm.rank != 0 is where drop_if_replicated would empty a duplicated output.
     comm = types.SimpleNamespace(rank=1)
+    ctx = types.SimpleNamespace(br=lambda: None)
+    config_options = types.SimpleNamespace(
+        executor=types.SimpleNamespace(
+            persist_host_limit=0, persist_spill_directory=None
+        )
+    )
     persisted_result.evaluate_and_persist(
         "uid",
-        None,
+        ctx,
         comm,
         None,
         None,
-        None,
+        config_options,
         uuid.uuid4(),
         deduplicate_replicated=deduplicate_replicated,
     )
@@ -157,6 +167,84 @@ def test_persisted_source_output_duplicated_reflects_store(duplicated):
         rank_local_store.close_store(uid)
 
 
+@pytest.mark.parametrize("spill_to_disk", [False, True])
+def test_rank_local_store_spills_oldest_partition(tmp_path, spill_to_disk):
+    """Spilling moves the oldest partitions off the device; a scan reads them back."""
+    first = pl.DataFrame({"a": list(range(100))})
+    second = pl.DataFrame({"a": list(range(100, 200))})
+    store = rank_local_store.RankLocalStore(
+        host_limit=0, spill_directory=str(tmp_path) if spill_to_disk else None
+    )
+    first_id, second_id = uuid.uuid4(), uuid.uuid4()
+    store.put(
+        first_id,
+        0,
+        DataFrame.from_polars(first, stream=get_cuda_stream()),
+        duplicated=False,
+    )
+    store.put(
+        second_id,
+        0,
+        DataFrame.from_polars(second, stream=get_cuda_stream()),
+        duplicated=False,
+    )
+    try:
+        assert store._spill(1) > 0
+        stats = store.statistics()
+        assert stats.spilled_to_host == 1
+        assert stats.spilled_to_disk == int(spill_to_disk)
+        assert stats.device_bytes > 0
+        if spill_to_disk:
+            assert stats.host_bytes == 0
+            assert stats.disk_bytes > 0
+        else:
+            assert stats.host_bytes > 0
+            assert stats.disk_bytes == 0
+
+        spilled = store.pop(first_id, 0)
+        assert isinstance(spilled, pl.DataFrame)
+        assert_frame_equal(spilled, first)
+        resident = store.pop(second_id, 0)
+        assert isinstance(resident, DataFrame)
+        assert_frame_equal(resident.to_polars(), second)
+        stats = store.statistics()
+        assert stats.unspilled == 1
+        assert stats.device_bytes == stats.host_bytes == stats.disk_bytes == 0
+        assert not list(tmp_path.rglob("*.arrow"))
+    finally:
+        store.close()
+
+
+def test_rank_local_store_spill_is_not_reentrant(monkeypatch):
+    """A spill request made while copying a partition to the host frees nothing."""
+    store = rank_local_store.RankLocalStore(host_limit=0)
+    for _ in range(2):
+        store.put(
+            uuid.uuid4(),
+            0,
+            DataFrame.from_polars(
+                pl.DataFrame({"a": list(range(100))}), stream=get_cuda_stream()
+            ),
+            duplicated=False,
+        )
+    to_polars = DataFrame.to_polars
+    nested = []
+
+    def to_polars_and_spill(self):
+        nested.append(store._spill(1 << 30))
+        return to_polars(self)
+
+    monkeypatch.setattr(DataFrame, "to_polars", to_polars_and_spill)
+    try:
+        assert store._spill(1) > 0
+        assert nested == [0]
+        assert store.statistics().spilled_to_host == 1
+        # The flag is reset once the outer spill returns.
+        assert store._spill(1) > 0
+    finally:
+        store.close()
+
+
 def test_execute_lazy_roundtrip(streaming_engine):
     """execute().lazy() round-trips through the producing engine."""
     lf = _source_lf()
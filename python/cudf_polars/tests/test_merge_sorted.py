@@ -59,3 +59,14 @@ def test_merge_sorted_with_nulls(engine: pl.GPUEngine, descending):
     ).sort("age", descending=descending)
     q = df0.merge_sorted(df1, key="age")
     assert_gpu_result_equal(q, engine=engine)
+
+
+def test_merge_sorted_presorted(engine: pl.GPUEngine):
+    df0 = pl.LazyFrame(
+        {"name": ["john", "bob", "steve", "elise"], "age": [None, 18, 42, 44]}
+    )
+    df1 = pl.LazyFrame(
+        {"name": ["thomas", "anna", "steve"], "age": [20, 21, 42]},
+    )
+    q = df0.merge_sorted(df1, key="age")
+    assert_gpu_result_equal(q, engine=engine)
@@ -8,6 +8,7 @@ from pylibcudf.libcudf.io.parquet_schema cimport (
     FileMetaData as cpp_FileMetaData,
     RowGroup as cpp_RowGroup,
     SortingColumn as cpp_SortingColumn,
+    Statistics as cpp_Statistics,
 )
 from pylibcudf.libcudf.io.parquet_metadata cimport(
     parquet_metadata,
@@ -82,6 +83,12 @@ cdef class ColumnChunk:
     @staticmethod
     cdef ColumnChunk from_cpp(cpp_ColumnChunk column_chunk)
 
+cdef class Statistics:
+    cdef cpp_Statistics c_obj
+
+    @staticmethod
+    cdef Statistics from_cpp(cpp_Statistics statistics)
+
 cdef class ColumnChunkMetaData:
     cdef cpp_ColumnChunkMetaData c_obj
 
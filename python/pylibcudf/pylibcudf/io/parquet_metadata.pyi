@@ -18,6 +18,7 @@ __all__ = [
     "ParquetSchema",
     "RowGroup",
     "SortingColumn",
+    "Statistics",
     "read_parquet_footers",
     "read_parquet_metadata",
 ]
@@ -81,6 +82,20 @@ class ColumnChunk:
     @property
     def meta_data(self) -> ColumnChunkMetaData: ...
 
+class Statistics:
+    @property
+    def null_count(self) -> int | None: ...
+    @property
+    def distinct_count(self) -> int | None: ...
+    @property
+    def min_value(self) -> bytes | None: ...
+    @property
+    def max_value(self) -> bytes | None: ...
+    @property
+    def min(self) -> bytes | None: ...
+    @property
+    def max(self) -> bytes | None: ...
+
 class ColumnChunkMetaData:
     @property
     def path_in_schema(self) -> list[str]: ...
@@ -90,6 +105,8 @@ class ColumnChunkMetaData:
     def total_uncompressed_size(self) -> int: ...
     @property
     def total_compressed_size(self) -> int: ...
+    @property
+    def statistics(self) -> Statistics: ...
 
 class RowGroup:
     @property
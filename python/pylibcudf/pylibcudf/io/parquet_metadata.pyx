@@ -3,6 +3,7 @@
 
 from libc.stdint cimport uint8_t
 from libcpp.memory cimport make_unique, unique_ptr
+from libcpp.optional cimport optional
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
@@ -20,6 +21,7 @@ from pylibcudf.libcudf.io.parquet_schema cimport (
     FileMetaData as cpp_FileMetaData,
     RowGroup as cpp_RowGroup,
     SortingColumn as cpp_SortingColumn,
+    Statistics as cpp_Statistics,
 )
 from pylibcudf.libcudf.utilities.span cimport host_span
 from pylibcudf.types cimport DataType
@@ -36,6 +38,7 @@ __all__ = [
     "ParquetSchema",
     "RowGroup",
     "SortingColumn",
+    "Statistics",
     "read_parquet_footers",
     "read_parquet_metadata",
 ]
@@ -352,6 +355,64 @@ cdef class ColumnChunk:
         return ColumnChunkMetaData.from_cpp(self.c_obj.meta_data)
 
 
+cdef bytes _optional_bytes(optional[vector[uint8_t]] value):
+    if not value.has_value():
+        return None
+    cdef vector[uint8_t] data = value.value()
+    return bytes(data)
+
+
+cdef class Statistics:
+    """Statistics of a column chunk.
+
+    Minimum and maximum values are in the PLAIN encoding of the column's
+    physical type.
+    """
+
+    def __init__(self):
+        raise ValueError("Statistics cannot be constructed directly")
+
+    @staticmethod
+    cdef Statistics from_cpp(cpp_Statistics statistics):
+        cdef Statistics result = Statistics.__new__(Statistics)
+        result.c_obj = statistics
+        return result
+
+    @property
+    def null_count(self):
+        """Optional count of null values."""
+        if not self.c_obj.null_count.has_value():
+            return None
+        return self.c_obj.null_count.value()
+
+    @property
+    def distinct_count(self):
+        """Optional count of distinct values."""
+        if not self.c_obj.distinct_count.has_value():
+            return None
+        return self.c_obj.distinct_count.value()
+
+    @property
+    def min_value(self):
+        """Optional encoded minimum value."""
+        return _optional_bytes(self.c_obj.min_value)
+
+    @property
+    def max_value(self):
+        """Optional encoded maximum value."""
+        return _optional_bytes(self.c_obj.max_value)
+
+    @property
+    def min(self):
+        """Optional deprecated encoded minimum, ordered as signed values."""
+        return _optional_bytes(self.c_obj.min)
+
+    @property
+    def max(self):
+        """Optional deprecated encoded maximum, ordered as signed values."""
+        return _optional_bytes(self.c_obj.max)
+
+
 cdef class ColumnChunkMetaData:
     """Metadata payload for a column chunk."""
 
@@ -387,6 +448,11 @@ cdef class ColumnChunkMetaData:
         """Total compressed page bytes for this chunk."""
         return self.c_obj.total_compressed_size
 
+    @property
+    def statistics(self):
+        """Statistics for this chunk."""
+        return Statistics.from_cpp(self.c_obj.statistics)
+
 
 cdef class RowGroup:
     """Parquet row group metadata."""
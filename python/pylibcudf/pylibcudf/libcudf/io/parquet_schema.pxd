@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION.
 # SPDX-License-Identifier: Apache-2.0
 
-from libc.stdint cimport int16_t, int32_t, int64_t
+from libc.stdint cimport int16_t, int32_t, int64_t, uint8_t
 from libcpp.optional cimport optional
 from libcpp.string cimport string
 from libcpp.vector cimport vector
@@ -14,6 +14,16 @@ cdef extern from "cudf/io/parquet_schema.hpp" namespace "cudf::io::parquet" nogi
         bint descending
         bint nulls_first
 
+    cdef cppclass Statistics:
+        optional[vector[uint8_t]] max
+        optional[vector[uint8_t]] min
+        optional[int64_t] null_count
+        optional[int64_t] distinct_count
+        optional[vector[uint8_t]] max_value
+        optional[vector[uint8_t]] min_value
+        optional[bint] is_max_value_exact
+        optional[bint] is_min_value_exact
+
     cdef cppclass ColumnChunkMetaData:
         vector[string] path_in_schema
         int64_t num_values
@@ -22,6 +32,7 @@ cdef extern from "cudf/io/parquet_schema.hpp" namespace "cudf::io::parquet" nogi
         int64_t data_page_offset
         int64_t index_page_offset
         int64_t dictionary_page_offset
+        Statistics statistics
 
     cdef cppclass ColumnChunk:
         string file_path
@@ -8,6 +8,7 @@ from pylibcudf.libcudf.column.column cimport column
 from pylibcudf.libcudf.column.column_view cimport column_view
 from pylibcudf.libcudf.table.table cimport table
 from pylibcudf.libcudf.table.table_view cimport table_view
+from pylibcudf.libcudf.tdigest.tdigest_column_view cimport tdigest_column_view
 from pylibcudf.libcudf.types cimport (
     interpolation,
     null_order,
@@ -41,3 +42,10 @@ cdef extern from "cudf/quantiles.hpp" namespace "cudf" nogil:
         cudaStream_t stream,
         device_async_resource_ref mr
     ) except +libcudf_exception_handler
+
+    cdef unique_ptr[column] percentile_approx (
+        tdigest_column_view input,
+        column_view percentiles,
+        cudaStream_t stream,
+        device_async_resource_ref mr
+    ) except +libcudf_exception_handler
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION.
+# SPDX-License-Identifier: Apache-2.0
+from pylibcudf.exception_handler cimport libcudf_exception_handler
+from pylibcudf.libcudf.column.column_view cimport column_view
+
+
+cdef extern from "cudf/tdigest/tdigest_column_view.hpp" \
+        namespace "cudf::tdigest" nogil:
+    cdef cppclass tdigest_column_view:
+        tdigest_column_view(
+            const column_view& tdigest_column
+        ) except +libcudf_exception_handler
+        tdigest_column_view(
+            const tdigest_column_view&
+        ) except +libcudf_exception_handler
+        column_view parent() except +libcudf_exception_handler
+        column_view means() except +libcudf_exception_handler
+        column_view weights() except +libcudf_exception_handler
@@ -28,3 +28,10 @@ cpdef Table quantiles(
     object stream = *,
     DeviceMemoryResource mr = *,
 )
+
+cpdef Column percentile_approx(
+    Column input,
+    Column percentiles,
+    object stream = *,
+    DeviceMemoryResource mr = *,
+)
@@ -8,11 +8,13 @@ from libcpp.vector cimport vector
 from pylibcudf.libcudf.column.column cimport column
 from pylibcudf.libcudf.column.column_view cimport column_view
 from pylibcudf.libcudf.quantiles cimport (
+    percentile_approx as cpp_percentile_approx,
     quantile as cpp_quantile,
     quantiles as cpp_quantiles,
 )
 from pylibcudf.libcudf.table.table cimport table
 from pylibcudf.libcudf.table.table_view cimport table_view
+from pylibcudf.libcudf.tdigest.tdigest_column_view cimport tdigest_column_view
 from pylibcudf.libcudf.types cimport null_order, order, sorted
 from rmm.pylibrmm.memory_resource cimport DeviceMemoryResource
 from rmm.pylibrmm.stream cimport Stream
@@ -23,7 +25,7 @@ from .types cimport interpolation
 from .utils cimport _get_stream, _get_memory_resource
 from cuda.bindings.cyruntime cimport cudaStream_t
 
-__all__ = ["quantile", "quantiles"]
+__all__ = ["percentile_approx", "quantile", "quantiles"]
 
 cpdef Column quantile(
     Column input,
@@ -178,3 +180,48 @@ cpdef Table quantiles(
         )
 
     return Table.from_libcudf(move(c_result), _stream, mr)
+
+
+cpdef Column percentile_approx(
+    Column input,
+    Column percentiles,
+    object stream=None,
+    DeviceMemoryResource mr=None,
+):
+    """Calculate approximate percentiles on a tdigest column.
+
+    For details see :cpp:func:`percentile_approx`.
+
+    Parameters
+    ----------
+    input: Column
+        A tdigest column, as produced by the ``tdigest`` and
+        ``merge_tdigest`` aggregations. One tdigest per row.
+    percentiles: Column
+        A FLOAT64 column of the desired percentiles in range [0, 1].
+    stream : Stream | None
+        CUDA stream on which to perform the operation.
+
+    Returns
+    -------
+    Column
+        A LIST column of FLOAT64 where each row holds the requested
+        percentiles of the corresponding tdigest.
+    """
+    cdef unique_ptr[column] c_result
+
+    cdef Stream _stream = _get_stream(stream)
+    cdef cudaStream_t _cs = _stream.view().value()
+    mr = _get_memory_resource(mr)
+
+    cdef column_view c_input = input.view()
+    cdef column_view c_percentiles = percentiles.view()
+    with nogil:
+        c_result = cpp_percentile_approx(
+            tdigest_column_view(c_input),
+            c_percentiles,
+            _cs,
+            mr.get_mr()
+        )
+
+    return Column.from_libcudf(move(c_result), _stream, mr)
@@ -434,6 +434,21 @@ def test_file_metadata_from_bytes(
     assert metadata_from_footer_only.num_rows == pa_table.num_rows
 
 
+def test_column_chunk_statistics(tmp_path) -> None:
+    path = tmp_path / "stats.parquet"
+    pq.write_table(
+        pa.table({"a": pa.array([3, None, 1, 7], type=pa.int64())}), path
+    )
+    (footer,) = plc.io.parquet_metadata.read_parquet_footers(
+        plc.io.SourceInfo([str(path)])
+    )
+    (chunk,) = footer.row_groups[0].columns
+    stats = chunk.meta_data.statistics
+    assert stats.null_count == 1
+    assert int.from_bytes(stats.min_value, "little", signed=True) == 1
+    assert int.from_bytes(stats.max_value, "little", signed=True) == 7
+
+
 def test_file_metadata_from_bytes_empty() -> None:
     with pytest.raises(RuntimeError, match="Cannot initialize schema"):
         plc.io.parquet_metadata.FileMetaData.from_bytes(memoryview(b""))
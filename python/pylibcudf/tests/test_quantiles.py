@@ -231,3 +231,21 @@ def test_quantiles_q_array_like(plc_tbl_data, q):
     pa_tbl_data = plc_tbl_data.to_arrow(["a", "b"])
     expect = _pyarrow_quantiles(pa_tbl_data, q=q)
     assert_table_eq(expect, got)
+
+
+def test_percentile_approx():
+    keys = plc.Column.from_arrow(pa.array([0, 0, 0, 0], type=pa.int32()))
+    values = plc.Column.from_arrow(
+        pa.array([3.0, 10.0, 1.0, 30.0], type=pa.float64())
+    )
+    _, (result,) = plc.groupby.GroupBy(plc.Table([keys])).aggregate(
+        [plc.groupby.GroupByRequest(values, [plc.aggregation.tdigest(1000)])]
+    )
+    (tdigest,) = result.columns()
+    got = plc.quantiles.percentile_approx(
+        tdigest,
+        plc.Column.from_arrow(pa.array([0.0, 1.0], type=pa.float64())),
+    )
+    # The extreme percentiles of a tdigest are exact.
+    expect = pa.array([[1.0, 30.0]], type=pa.list_(pa.float64()))
+    assert_column_eq(expect, got)